@@ -0,0 +1,63 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Builds the synapse expander as a shared library for the host, so that the
+# data written for on-machine generation can be expanded and checked without
+# a board.  The generators use the fixed-point types of ISO/IEC TR 18037,
+# which gcc only supports on ARM, so this needs clang (with -ffixed-point).
+
+# If SPINN_DIRS is not defined, this is an error!
+ifndef SPINN_DIRS
+    $(error SPINN_DIRS is not set.  Please define SPINN_DIRS (possibly by running "source setup" in the spinnaker package folder))
+endif
+# If NEURAL_MODELLING_DIRS is not defined, this is an error!
+ifndef NEURAL_MODELLING_DIRS
+    $(error NEURAL_MODELLING_DIRS is not set.  Please define NEURAL_MODELLING_DIRS (possibly by running "source setup" in the sPyNNaker folder))
+endif
+
+# The sources of the random number generators and fixed-point support, which
+# are otherwise linked from the ARM build of spinn_common
+SPINN_COMMON_DIRS ?= $(SPINN_DIRS)/../spinn_common
+SPINN_COMMON_SOURCES ?= random.c normal.c stdfix-full-iso.c
+
+HOST_CC ?= clang
+HOST_CFLAGS ?= -O2 -Wall
+
+LIBRARY = synapse_expander_host.so
+SRC_DIR := $(NEURAL_MODELLING_DIRS)/src/
+OUTPUT_DIR := $(abspath $(NEURAL_MODELLING_DIRS)/../spynnaker/pyNN/model_binaries)/
+SOURCES = synapse_expander/rng.c \
+          synapse_expander/common_kernel.c \
+          synapse_expander/param_generator.c \
+          synapse_expander/connection_generator.c \
+          synapse_expander/matrix_generator.c \
+          synapse_expander/synapse_expander.c \
+          synapse_expander/host/host_support.c
+
+# The host stand-ins must be found before the SpiNNaker headers they replace
+INCLUDES = -I $(SRC_DIR)synapse_expander/host \
+           -I $(SRC_DIR) \
+           -I $(SPINN_COMMON_DIRS)/include \
+           -I $(SPINN_DIRS)/include
+
+$(OUTPUT_DIR)$(LIBRARY): $(SOURCES:%=$(SRC_DIR)%) \
+        $(SPINN_COMMON_SOURCES:%=$(SPINN_COMMON_DIRS)/src/%)
+	$(HOST_CC) $(HOST_CFLAGS) -ffixed-point -fPIC -shared \
+	    -DSYNAPSE_EXPANDER_HOST $(INCLUDES) -o $@ $^
+
+clean:
+	$(RM) $(OUTPUT_DIR)$(LIBRARY)
+
+.PHONY: clean
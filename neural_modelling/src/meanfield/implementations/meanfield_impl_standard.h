@@ -92,6 +92,56 @@ static synapse_param_t *neuron_synapse_shaping_params;
 //! The number of steps to run per timestep
 static uint n_steps_per_timestep;
 
+//! \brief Where to send the firing rate of each meanfield so that it drives
+//!     the rate of a Poisson source
+typedef struct rate_output_t {
+    //! Whether the rates are to be sent at all
+    uint32_t has_key;
+    //! The key to send the rates with; the ID of the source is ORed with this
+    uint32_t key;
+    //! The ID of the Poisson source driven by the first meanfield on the core
+    uint32_t first_source_id;
+    //! The scale to apply to Ve to get the rate of the Poisson source in Hz
+    REAL scale;
+} rate_output_t;
+
+//! Where to send the firing rates, if anywhere
+static rate_output_t rate_output;
+
+//! \brief Where to send the state of each meanfield live to the host
+typedef struct state_output_t {
+    //! Whether the state is to be sent at all
+    uint32_t has_key;
+    //! \brief The key to send the state with; the index of the variable
+    //!     times n_neurons plus the ID of the meanfield is ORed with this
+    uint32_t key;
+    //! The ID of the first meanfield on the core in the whole population
+    uint32_t first_neuron_id;
+    //! The number of meanfields in the whole population
+    uint32_t n_neurons;
+    //! The number of time steps between each value sent
+    uint32_t interval;
+    //! A bit for each recorded variable that is to be sent
+    uint32_t variables;
+} state_output_t;
+
+//! Where to send the state live, if anywhere
+static state_output_t state_output;
+
+//! \brief Send the value of a variable of a meanfield live to the host, if
+//!     that variable is being sent
+//! \param[in] variable_index: The recording index of the variable
+//! \param[in] meanfield_index: The index of the meanfield on this core
+//! \param[in] value: The value to send
+static inline void send_state(
+        uint32_t variable_index, uint32_t meanfield_index, state_t value) {
+    if (state_output.variables & (1 << variable_index)) {
+        uint32_t id = (variable_index * state_output.n_neurons) +
+                state_output.first_neuron_id + meanfield_index;
+        spin1_send_mc_packet(state_output.key | id, bitsk(value), WITH_PAYLOAD);
+    }
+}
+
 /*
 static inline void test(uint32_t time) {
     for (uint32_t i = N_RECORDED_VARS; i > 0; i--) {
@@ -316,6 +366,24 @@ static void neuron_impl_load_neuron_parameters(
         next += n_words_needed(n_meanfields * sizeof(additional_input_t));
     }
 
+    log_debug("reading rate output parameters");
+    spin1_memcpy(&rate_output, &address[next], sizeof(rate_output_t));
+    next += n_words_needed(sizeof(rate_output_t));
+    if (rate_output.has_key) {
+        log_info("Sending rates with key 0x%08x from source %u, scale %k",
+                rate_output.key, rate_output.first_source_id,
+                rate_output.scale);
+    }
+
+    log_debug("reading state output parameters");
+    spin1_memcpy(&state_output, &address[next], sizeof(state_output_t));
+    next += n_words_needed(sizeof(state_output_t));
+    if (state_output.has_key) {
+        log_info("Sending variables 0x%x live with key 0x%08x every %u steps",
+                state_output.variables, state_output.key,
+                state_output.interval);
+    }
+
     meanfield_model_set_global_neuron_params(global_parameters);
 
 #if LOG_LEVEL >= LOG_DEBUG
@@ -433,6 +501,26 @@ static void neuron_impl_do_timestep_update(
                         VI_RECORDING_INDEX, meanfield_index, firing_rate_Vi);
                 neuron_recording_record_accum(
                         W_RECORDING_INDEX, meanfield_index, adaptation_W);
+
+                // Drive the rate of the matching Poisson source, if any
+                if (rate_output.has_key) {
+                    REAL rate = firing_rate_Ve * rate_output.scale;
+                    spin1_send_mc_packet(
+                            rate_output.key |
+                            (rate_output.first_source_id + meanfield_index),
+                            bitsk(rate), WITH_PAYLOAD);
+                }
+
+                // Send the state live to the host, if requested
+                if (state_output.has_key &&
+                        (time % state_output.interval) == 0) {
+                    send_state(VE_RECORDING_INDEX, meanfield_index,
+                            firing_rate_Ve);
+                    send_state(VI_RECORDING_INDEX, meanfield_index,
+                            firing_rate_Vi);
+                    send_state(W_RECORDING_INDEX, meanfield_index,
+                            adaptation_W);
+                }
                 /*neuron_recording_record_accum(
                         GSYN_EXC_RECORDING_INDEX, meanfield_index, total_exc);
                 neuron_recording_record_accum(
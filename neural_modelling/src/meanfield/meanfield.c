@@ -28,6 +28,8 @@
 
 #include "tdma_processing.h"
 #include <debug.h>
+#include <profiler.h>
+#include "../meanfield/profile_tags.h"
 #include "../meanfield/implementations/meanfield_impl.h"
 #include "../meanfield/meanfield_recording.h"
 #include "../meanfield/plasticity/synapse_dynamics.h"
@@ -177,7 +179,11 @@ void neuron_do_timestep_update(timer_t time, uint timer_count) { // EXPORTED
     // Prepare recording for the next timestep
     neuron_recording_setup_for_next_recording();
 
+    profiler_write_entry_disable_irq_fiq(
+            PROFILER_ENTER | PROFILER_NEURON_UPDATE);
     neuron_impl_do_timestep_update(timer_count, time, n_neurons);
+    profiler_write_entry_disable_irq_fiq(
+            PROFILER_EXIT | PROFILER_NEURON_UPDATE);
 
     log_debug("time left of the timer after tdma is %d", tc[T1_COUNT]);
 
@@ -25,5 +25,6 @@ enum profiler_tags_e {
     PROFILER_DMA_READ,                  //!< DMA read
     PROFILER_INCOMING_SPIKE,            //!< incoming spike handling
     PROFILER_PROCESS_FIXED_SYNAPSES,    //!< fixed synapse processing
-    PROFILER_PROCESS_PLASTIC_SYNAPSES   //!< plastic synapse processing
+    PROFILER_PROCESS_PLASTIC_SYNAPSES,  //!< plastic synapse processing
+    PROFILER_NEURON_UPDATE              //!< update of the meanfield states
 };
@@ -0,0 +1,39 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/**
+ * \file
+ * \brief Values shared between the from-list connection generator and the
+ *        from-list parameter generator
+ */
+
+#ifndef INCLUDED_COMMON_FROM_LIST_H
+#define INCLUDED_COMMON_FROM_LIST_H
+
+#include <common-typedefs.h>
+
+/**
+ * \brief The index into the table of values of each connection in the row
+ *        last generated by the from-list connection generator.
+ *
+ * The parameter generators for the weights and delays of a row are always
+ * called after the connection generator has made the row, so they read the
+ * values of the row from here.
+ */
+extern uint32_t *from_list_value_indices;
+
+#endif // INCLUDED_COMMON_FROM_LIST_H
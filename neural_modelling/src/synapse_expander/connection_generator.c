@@ -32,6 +32,7 @@
 #include "connection_generators/connection_generator_fixed_pre.h"
 #include "connection_generators/connection_generator_fixed_post.h"
 #include "connection_generators/connection_generator_kernel.h"
+#include "connection_generators/connection_generator_from_list.h"
 
 //! \brief Known "hashes" of connection generators
 //!
@@ -44,6 +45,7 @@ enum {
     FIXED_PRE,             //!< Fixed pre-size connection generator
     FIXED_POST,            //!< Fixed post-size connection generator
     KERNEL,                //!< Convolution kernel connection generator
+    FROM_LIST,             //!< From-list connection generator
     N_CONNECTION_GENERATORS//!< The number of known generators
 };
 
@@ -97,7 +99,11 @@ static const connection_generator_info connection_generators[] = {
     {KERNEL,
             connection_generator_kernel_initialise,
             connection_generator_kernel_generate,
-            connection_generator_kernel_free}
+            connection_generator_kernel_free},
+    {FROM_LIST,
+            connection_generator_from_list_initialise,
+            connection_generator_from_list_generate,
+            connection_generator_from_list_free}
 };
 
 connection_generator_t connection_generator_init(
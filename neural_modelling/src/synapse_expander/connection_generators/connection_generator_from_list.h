@@ -0,0 +1,213 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/**
+ * \file
+ * \brief From-List Connection generator implementation
+ *
+ * The connections of the list between a pre-slice and a post-slice are
+ * given as a row per pre-neuron.  Each row is the number of connections
+ * followed by the sorted targets of the connections, each as the difference
+ * from the last (the first from the start of the post-slice), and, where the
+ * list has weights or delays, the index of the values of each connection
+ * into the table of the distinct values of the connections between the
+ * slices, which is given to the from-list parameter generator.  All numbers
+ * are variable-length, with 7 bits per byte and the top bit of each byte set
+ * when another byte follows.
+ */
+
+#include <synapse_expander/generator_types.h>
+#include <synapse_expander/common_from_list.h>
+
+uint32_t *from_list_value_indices = NULL;
+
+//! The parameters that can be copied from SDRAM
+struct from_list_params {
+    //! The number of rows in the list; zero if there are no connections
+    uint32_t n_rows;
+    //! The pre-neuron of the first row
+    uint32_t pre_lo;
+    //! Whether each connection has an index into the table of values
+    uint32_t has_values;
+    //! The number of bytes of rows, which follow in SDRAM padded to a word
+    uint32_t n_bytes;
+};
+
+//! The data to be passed around
+struct from_list {
+    //! The parameters of the list
+    struct from_list_params params;
+    //! The start of the rows in SDRAM
+    const uint8_t *rows;
+    //! The start of the next row to be read
+    const uint8_t *next;
+    //! The index of the next row to be read
+    uint32_t next_row;
+    //! Space for the value indices of a row
+    uint32_t *value_indices;
+    //! The number of value indices there is space for
+    uint32_t max_value_indices;
+};
+
+/**
+ * \brief Read a variable-length number from the rows
+ * \param[in,out] bytes: The position to read from; updated to just after the
+ *                       number
+ * \return The number read
+ */
+static inline uint32_t from_list_read(const uint8_t **bytes) {
+    uint32_t value = 0;
+    uint32_t shift = 0;
+    uint8_t byte;
+    do {
+        byte = *(*bytes)++;
+        value |= (byte & 0x7F) << shift;
+        shift += 7;
+    } while (byte & 0x80);
+    return value;
+}
+
+/**
+ * \brief Initialise the from-list connection generator
+ * \param[in,out] region: Region to read parameters from.  Should be updated
+ *                        to position just after parameters after calling.
+ * \return A data item to be passed in to other functions later on
+ */
+static void *connection_generator_from_list_initialise(address_t *region) {
+    struct from_list *obj = spin1_malloc(sizeof(struct from_list));
+
+    // Copy the parameters in, and leave the rows in SDRAM
+    struct from_list_params *params_sdram = (void *) *region;
+    obj->params = *params_sdram++;
+    obj->rows = (const uint8_t *) params_sdram;
+    obj->next = obj->rows;
+    obj->next_row = 0;
+    obj->value_indices = NULL;
+    obj->max_value_indices = 0;
+    *region = (void *) (obj->rows + ((obj->params.n_bytes + 3) & ~3));
+
+    log_debug("From list connector, n_rows = %u, pre_lo = %u, "
+            "has_values = %u, n_bytes = %u", obj->params.n_rows,
+            obj->params.pre_lo, obj->params.has_values, obj->params.n_bytes);
+
+    return obj;
+}
+
+/**
+ * \brief Free the from-list connection generator
+ * \param[in] generator: The generator to free
+ */
+static void connection_generator_from_list_free(void *generator) {
+    struct from_list *obj = generator;
+    if (from_list_value_indices == obj->value_indices) {
+        from_list_value_indices = NULL;
+    }
+    if (obj->value_indices != NULL) {
+        sark_free(obj->value_indices);
+    }
+    sark_free(generator);
+}
+
+/**
+ * \brief Move to the start of a row of the list
+ * \param[in,out] obj: The generator
+ * \param[in] row: The row to move to
+ */
+static void from_list_seek(struct from_list *obj, uint32_t row) {
+    // Rows are normally read in order, but start again if not
+    if (row < obj->next_row) {
+        obj->next = obj->rows;
+        obj->next_row = 0;
+    }
+    uint32_t n_per_connection = obj->params.has_values ? 2 : 1;
+    while (obj->next_row < row) {
+        uint32_t n_values = from_list_read(&obj->next) * n_per_connection;
+        for (uint32_t i = 0; i < n_values; i++) {
+            from_list_read(&obj->next);
+        }
+        obj->next_row++;
+    }
+}
+
+/**
+ * \brief Generate connections with the from-list connection generator
+ * \param[in] generator: The generator to use to generate connections
+ * \param[in] pre_slice_start: The start of the slice of the pre-population
+ *                             being generated
+ * \param[in] pre_slice_count: The number of neurons in the slice of the
+ *                             pre-population being generated
+ * \param[in] pre_neuron_index: The index of the neuron in the pre-population
+ *                              being generated
+ * \param[in] post_slice_start: The start of the slice of the post-population
+ *                              being generated
+ * \param[in] post_slice_count: The number of neurons in the slice of the
+ *                              post-population being generated
+ * \param[in] max_row_length: The maximum number of connections to generate
+ * \param[in,out] indices: An array into which the core-relative post-indices
+ *                         should be placed.  This will be initialised to be
+ *                         \p max_row_length in size
+ * \return The number of connections generated
+ */
+static uint32_t connection_generator_from_list_generate(
+        void *generator, UNUSED uint32_t pre_slice_start,
+        UNUSED uint32_t pre_slice_count, uint32_t pre_neuron_index,
+        UNUSED uint32_t post_slice_start, UNUSED uint32_t post_slice_count,
+        uint32_t max_row_length, uint16_t *indices) {
+    struct from_list *obj = generator;
+
+    // If not in the rows of the list, then don't generate
+    if ((pre_neuron_index < obj->params.pre_lo) ||
+            (pre_neuron_index - obj->params.pre_lo >= obj->params.n_rows)) {
+        return 0;
+    }
+    from_list_seek(obj, pre_neuron_index - obj->params.pre_lo);
+
+    uint32_t n_connections = from_list_read(&obj->next);
+    if (n_connections > max_row_length) {
+        log_error("Row of %u connections is longer than the maximum of %u",
+                n_connections, max_row_length);
+        rt_error(RTE_SWERR);
+    }
+
+    // Make sure there is space for the value indices of the row
+    if (obj->params.has_values && n_connections > obj->max_value_indices) {
+        if (obj->value_indices != NULL) {
+            sark_free(obj->value_indices);
+        }
+        obj->value_indices = spin1_malloc(max_row_length * sizeof(uint32_t));
+        if (obj->value_indices == NULL) {
+            log_error("Could not allocate space for %u value indices",
+                    max_row_length);
+            rt_error(RTE_MALLOC);
+        }
+        obj->max_value_indices = max_row_length;
+    }
+
+    // Read the targets, and the value indices if present
+    uint32_t post_index = 0;
+    for (uint32_t i = 0; i < n_connections; i++) {
+        post_index += from_list_read(&obj->next);
+        indices[i] = post_index;
+        if (obj->params.has_values) {
+            obj->value_indices[i] = from_list_read(&obj->next);
+        }
+    }
+    obj->next_row++;
+    from_list_value_indices = obj->value_indices;
+
+    return n_connections;
+}
@@ -0,0 +1,45 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/**
+ * \file
+ * \brief Data specification regions for the host build of the synapse
+ *        expander
+ */
+#ifndef __HOST_DATA_SPECIFICATION_H__
+#define __HOST_DATA_SPECIFICATION_H__
+
+#include <common-typedefs.h>
+
+//! The regions of a core, as given to the host build by the caller
+typedef struct data_specification_metadata_t {
+    //! The address of each region, by region identifier
+    address_t *regions;
+} data_specification_metadata_t;
+
+/**
+ * \brief Get the address of a region
+ * \param[in] region: The identifier of the region
+ * \param[in] ds_regions: The regions of the core
+ * \return The address of the region
+ */
+static inline address_t data_specification_get_region(
+        uint32_t region, data_specification_metadata_t *ds_regions) {
+    return ds_regions->regions[region];
+}
+
+#endif // __HOST_DATA_SPECIFICATION_H__
@@ -0,0 +1,32 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/**
+ * \file
+ * \brief Run-time support for the host build of the synapse expander
+ */
+#ifndef __HOST_SUPPORT_H__
+#define __HOST_SUPPORT_H__
+
+#include <setjmp.h>
+#include <spin1_api.h>
+
+//! \brief Where rt_error() returns to, with the error code; set by the
+//!        entry point of the host build
+extern jmp_buf host_rt_error_jump;
+
+#endif // __HOST_SUPPORT_H__
@@ -0,0 +1,45 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/**
+ * \file
+ * \brief Logging for the host build of the synapse expander.
+ *
+ * The messages use the SpiNNaker format specifiers (such as `%k` for an
+ * accum), which the host C library doesn't understand, so they are dropped;
+ * errors are reported through the run-time error code instead.
+ */
+#ifndef __HOST_LOG_H__
+#define __HOST_LOG_H__
+
+// The logging of spinn_common brings in the fixed-point conversions, which
+// the generators rely on
+#include <stdfix-full-iso.h>
+
+//! Drop a debug message
+#define log_debug(message, ...) do { } while (0)
+
+//! Drop an information message
+#define log_info(message, ...) do { } while (0)
+
+//! Drop a warning message
+#define log_warning(message, ...) do { } while (0)
+
+//! Drop an error message
+#define log_error(message, ...) do { } while (0)
+
+#endif // __HOST_LOG_H__
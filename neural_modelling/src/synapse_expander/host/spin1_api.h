@@ -0,0 +1,76 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/**
+ * \dir
+ * \brief Stand-ins for the SpiNNaker run-time used by the host build of the
+ *        synapse expander
+ * \file
+ * \brief The parts of the SpiNNaker API used by the synapse expander,
+ *        implemented on the host C library
+ */
+#ifndef __HOST_SPIN1_API_H__
+#define __HOST_SPIN1_API_H__
+
+#include <stdint.h>
+#include <stdlib.h>
+
+//! The unsigned type used by the SpiNNaker API
+typedef unsigned int uint;
+
+//! Run-time error codes, numbered as on the machine
+enum {
+    RTE_NONE,   //!< No error
+    RTE_RESET,  //!< Branch through zero
+    RTE_UNDEF,  //!< Undefined instruction
+    RTE_SVC,    //!< Undefined SVC or no handler
+    RTE_PABT,   //!< Prefetch abort
+    RTE_DABT,   //!< Data abort
+    RTE_IRQ,    //!< Unhandled IRQ
+    RTE_FIQ,    //!< Unhandled FIQ
+    RTE_VIC,    //!< Unconfigured VIC vector
+    RTE_ABORT,  //!< Generic user abort
+    RTE_MALLOC, //!< malloc failure
+    RTE_DIV0,   //!< Divide by zero
+    RTE_EVENT,  //!< Event startup failure
+    RTE_SWERR,  //!< Fatal software error
+};
+
+//! Flag for SDRAM heap allocations; meaningless on the host
+#define ALLOC_LOCK 1
+
+//! Allocate from "DTCM"
+#define spin1_malloc(size) malloc(size)
+
+//! Free memory allocated by spin1_malloc()
+#define sark_free(ptr) free(ptr)
+
+//! Allocate from the "SDRAM" heap
+#define sark_xalloc(heap, size, tag, flag) malloc(size)
+
+//! Free memory allocated by sark_xalloc()
+#define sark_xfree(heap, ptr, flag) free(ptr)
+
+/**
+ * \brief Stop with a run-time error. On the host, this returns to the entry
+ *        point of the expander with the error code rather than stopping the
+ *        process.
+ * \param[in] code: The run-time error code
+ */
+void rt_error(uint code, ...) __attribute__((noreturn));
+
+#endif // __HOST_SPIN1_API_H__
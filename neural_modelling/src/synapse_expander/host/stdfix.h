@@ -0,0 +1,35 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/**
+ * \file
+ * \brief The fixed-point keywords of ISO/IEC TR 18037, which clang supports
+ *        with -ffixed-point but, unlike gcc, without a header to name them
+ */
+#ifndef __HOST_STDFIX_H__
+#define __HOST_STDFIX_H__
+
+//! Fixed-point type with no integer part
+#define fract _Fract
+
+//! Fixed-point type with an integer part
+#define accum _Accum
+
+//! Saturating fixed-point type qualifier
+#define sat _Sat
+
+#endif // __HOST_STDFIX_H__
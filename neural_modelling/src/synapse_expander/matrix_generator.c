@@ -172,7 +172,8 @@ static inline uint16_t rescale_delay(accum delay, accum timestep_per_delay) {
 }
 
 //! \brief Rescales a weight to account for weight granularity and
-//!     type-converts it
+//!     type-converts it, rounding to the nearest integer (and halves to
+//!     even) as the host does, and saturating at the largest weight
 //! \param[in] weight: the weight to rescale
 //! \param[in] weight_scale: The weight scaling factor
 //! \return the rescaled weight
@@ -180,11 +181,22 @@ static inline uint16_t rescale_weight(accum weight, unsigned long accum weight_s
     if (weight < 0) {
         weight = -weight;
     }
-    accum weight_scaled = weight * weight_scale;
+    unsigned long accum weight_scaled =
+            (unsigned long accum) weight * weight_scale;
+    if (weight_scaled >= (unsigned long accum) UINT16_MAX) {
+        log_debug("Saturated weight %k to %u (scale is %k)",
+                (accum) weight, UINT16_MAX, weight_scale);
+        return UINT16_MAX;
+    }
     uint16_t weight_int = (uint16_t) weight_scaled;
+    unsigned long accum remainder =
+            weight_scaled - (unsigned long accum) weight_int;
+    if (remainder > 0.5ulk || (remainder == 0.5ulk && (weight_int & 1))) {
+        weight_int++;
+    }
     if (weight_scaled != weight_int) {
         log_debug("Rounded weight %k to %u (scale is %k)",
-                weight_scaled, weight_int, weight_scale);
+                (accum) weight_scaled, weight_int, weight_scale);
     }
     return weight_int;
 }
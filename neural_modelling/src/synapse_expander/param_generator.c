@@ -31,6 +31,7 @@
 #include "param_generators/param_generator_normal_clipped_to_boundary.h"
 #include "param_generators/param_generator_exponential.h"
 #include "param_generators/param_generator_kernel.h"
+#include "param_generators/param_generator_from_list.h"
 
 //! The "hashes" for parameter generators
 enum {
@@ -48,8 +49,10 @@ enum {
     EXPONENTIAL,
     //! A parameter that is used with a convolution kernel connector
     KERNEL,
+    //! A parameter that is looked up in a table by a from-list connector
+    FROM_LIST,
     //! The number of known generators
-    N_PARAM_GENERATORS = 7
+    N_PARAM_GENERATORS = 8
 };
 
 /**
@@ -110,6 +113,10 @@ static const struct param_generator_info param_generators[] = {
             param_generator_kernel_initialize,
             param_generator_kernel_generate,
             param_generator_kernel_free},
+    {FROM_LIST,
+            param_generator_from_list_initialize,
+            param_generator_from_list_generate,
+            param_generator_from_list_free},
 };
 
 param_generator_t param_generator_init(uint32_t hash, address_t *in_region) {
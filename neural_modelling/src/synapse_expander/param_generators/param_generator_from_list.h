@@ -0,0 +1,79 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/**
+ * \file
+ * \brief Parameter generator implementation for values from a list
+ */
+#include <stdfix.h>
+#include <spin1_api.h>
+#include <synapse_expander/common_from_list.h>
+#include <synapse_expander/generator_types.h>
+
+//! The table of values of the connections of a list
+struct param_generator_from_list {
+    //! The number of values in the table
+    uint32_t n_values;
+    //! The values, left in SDRAM
+    accum *values;
+};
+
+/**
+ * \brief How to initialise the from-list parameter generator
+ * \param[in,out] region: Region to read setup from.  Should be updated
+ *                        to position just after parameters after calling.
+ * \return A data item to be passed in to other functions later on
+ */
+static void *param_generator_from_list_initialize(address_t *region) {
+    struct param_generator_from_list *obj =
+            spin1_malloc(sizeof(struct param_generator_from_list));
+    address_t params_sdram = *region;
+    obj->n_values = *params_sdram++;
+    obj->values = (accum *) params_sdram;
+    *region = params_sdram + obj->n_values;
+
+    log_debug("From list param generator; n_values = %u", obj->n_values);
+
+    return obj;
+}
+
+/**
+ * \brief How to free any data for the from-list parameter generator
+ * \param[in] generator: The generator to free
+ */
+static void param_generator_from_list_free(void *generator) {
+    sark_free(generator);
+}
+
+/**
+ * \brief How to generate values with the from-list parameter generator
+ * \param[in] generator: The generator to use to generate values
+ * \param[in] n_indices: The number of values to generate
+ * \param[in] pre_neuron_index: The index of the neuron in the pre-population
+ *                              being generated
+ * \param[in] indices: The \p n_indices post-neuron indices for each connection
+ * \param[out] values: An array into which to place the values; will be
+ *                     \p n_indices in size
+ */
+static void param_generator_from_list_generate(
+        void *generator, uint32_t n_indices, UNUSED uint32_t pre_neuron_index,
+        UNUSED uint16_t *indices, accum *values) {
+    struct param_generator_from_list *obj = generator;
+    for (uint32_t i = 0; i < n_indices; i++) {
+        values[i] = obj->values[from_list_value_indices[i]];
+    }
+}
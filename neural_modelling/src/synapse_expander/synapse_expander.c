@@ -29,6 +29,9 @@
 #include <data_specification.h>
 #include <debug.h>
 #include "common_mem.h"
+#ifdef SYNAPSE_EXPANDER_HOST
+#include "host/host_support.h"
+#endif
 
 //! The configuration of the connection builder
 struct connection_builder_config {
@@ -191,6 +194,29 @@ static bool run_synapse_expander(data_specification_metadata_t *ds_regions,
     return true;
 }
 
+#ifdef SYNAPSE_EXPANDER_HOST
+/**
+ * \brief Entry point of the host build, which expands the synapses into
+ *        memory given by the caller rather than the regions of a core
+ * \param[in] regions: The address of each region, by region identifier; only
+ *                     the synaptic matrix region is used
+ * \param[in] params_address: The address of the expander parameters
+ * \return RTE_NONE on success, or the run-time error code the expander would
+ *         have stopped with on the machine
+ */
+uint32_t synapse_expander_host_run(
+        address_t *regions, address_t params_address) {
+    data_specification_metadata_t ds_regions = {regions};
+    uint32_t code = setjmp(host_rt_error_jump);
+    if (code != RTE_NONE) {
+        return code;
+    }
+    if (!run_synapse_expander(&ds_regions, params_address)) {
+        return RTE_ABORT;
+    }
+    return RTE_NONE;
+}
+#else
 //! Entry point
 void c_main(void) {
     sark_cpu_state(CPU_STATE_RUN);
@@ -217,3 +243,4 @@ void c_main(void) {
 
     log_info("Finished On Machine Connectors!");
 }
+#endif
@@ -59,7 +59,7 @@ if os.environ.get('READTHEDOCS', None) != 'True':
 
 # Build a list of all project modules, as well as supplementary files
 extensions = {".aplx", ".boot", ".cfg", ".json", ".sql", ".template", ".xml",
-              ".xsd", ".dict"}
+              ".xsd", ".dict", ".so"}
 packages = []
 package_data = defaultdict(list)
 
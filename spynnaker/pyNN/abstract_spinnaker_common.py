@@ -29,6 +29,8 @@ from spynnaker.pyNN import extra_algorithms, model_binaries
 from spynnaker.pyNN.config_setup import CONFIG_FILE_NAME, setup_configs
 from spynnaker.pyNN.utilities import constants
 from spynnaker.pyNN.utilities.extracted_data import ExtractedData
+from spynnaker.pyNN.utilities.mapping_change_tracker import (
+    MappingChangeTracker)
 from spynnaker import __version__ as version
 
 logger = FormatAdapter(logging.getLogger(__name__))
@@ -42,8 +44,10 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase):
         "__edge_count",
         "__id_counter",
         "__live_spike_recorder",
+        "__mapping_change_tracker",
         "__min_delay",
         "__neurons_per_core_set",
+        "__run_window",
         "_populations",
         "_projections"]
 
@@ -106,6 +110,10 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase):
         self.__command_edge_count = 0
         self.__live_spike_recorder = dict()
 
+        # the vertices changed between runs, to keep the placements of the
+        # others when they are mapped again
+        self.__mapping_change_tracker = MappingChangeTracker()
+
         # create XML path for where to locate sPyNNaker related functions when
         # using auto pause and resume
         extra_algorithm_xml_path = list()
@@ -120,6 +128,9 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase):
 
         self.__neurons_per_core_set = set()
 
+        # the times that the current or last run started and ended at
+        self.__run_window = (0.0, None)
+
         versions = [("sPyNNaker", version)]
         if front_end_versions is not None:
             versions.extend(front_end_versions)
@@ -138,6 +149,8 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase):
         extra_mapping_inputs = dict()
         extra_mapping_inputs["SynapticExpanderReadIOBuf"] = \
             get_config_bool("Reports", "write_expander_iobuf")
+        extra_mapping_inputs["MappingChangeTracker"] = \
+            self.__mapping_change_tracker
         if user_extra_mapping_inputs is not None:
             extra_mapping_inputs.update(user_extra_mapping_inputs)
 
@@ -255,6 +268,13 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase):
 
         :param bool reset_flags:
         """
+        # Find what has changed before the flags are reset by the check
+        if reset_flags and get_config_bool(
+                "Mapping", "keep_unchanged_placements"):
+            self.__mapping_change_tracker.record_changes(
+                self.original_application_graph, self._populations,
+                self._projections, self._placements)
+
         changed, data_changed = super()._detect_if_graph_has_changed(
             reset_flags)
 
@@ -280,6 +300,16 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase):
         """
         return self.__min_delay
 
+    @property
+    def run_window(self):
+        """ The time in milliseconds that the current (or last) run started\
+            at, and the time that it ends at, or None if it runs until it is\
+            stopped.
+
+        :rtype: tuple(float, float or None)
+        """
+        return self.__run_window
+
     def add_application_vertex(self, vertex):
         if isinstance(vertex, CommandSender):
             self._command_sender = vertex
@@ -340,6 +370,12 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase):
         for projection in self._projections:
             projection._clear_cache()
 
+        # Note the window of the run, so that spike sources only read the
+        # spikes that they will send in it
+        current_time = self.get_current_time()
+        self.__run_window = (current_time, None if run_time is None else (
+            current_time + run_time))
+
         if (get_config_bool("Reports", "reports_enabled") and
                 get_config_bool(
                     "Reports", "write_redundant_packet_count_report") and
@@ -348,6 +384,12 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase):
                     "Reports", "writeProvenanceData")):
             self.extend_extra_post_run_algorithms(
                 ["RedundantPacketCountReport"])
+        if (get_config_bool("Reports", "reports_enabled") and
+                get_config_bool("Reports", "write_spike_traffic_report") and
+                not self._use_virtual_board and run_time is not None and
+                not self._has_ran and get_config_bool(
+                    "Reports", "writeProvenanceData")):
+            self.extend_extra_post_run_algorithms(["SpikeTrafficReport"])
 
         super().run(run_time, sync_time)
         for projection in self._projections:
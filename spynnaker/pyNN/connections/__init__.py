@@ -15,11 +15,23 @@
 
 from .ethernet_command_connection import EthernetCommandConnection
 from .ethernet_control_connection import EthernetControlConnection
+from .spynnaker_async_database_connection import (
+    SpynnakerAsyncDatabaseConnection)
+from .spynnaker_async_ethernet_control_connection import (
+    SpynnakerAsyncEthernetControlConnection)
+from .spynnaker_async_live_connection import (
+    LiveSpikeBatch, SpynnakerAsyncLiveConnection)
 from .spynnaker_live_spikes_connection import SpynnakerLiveSpikesConnection
+from .spynnaker_meanfield_state_connection import (
+    MeanfieldStateBuffers, SpynnakerMeanfieldStateConnection)
 from .spynnaker_poisson_control_connection import (
     SpynnakerPoissonControlConnection)
 
 __all__ = [
     "EthernetCommandConnection", "EthernetControlConnection",
-    "SpynnakerLiveSpikesConnection", "SpynnakerPoissonControlConnection"
+    "LiveSpikeBatch", "MeanfieldStateBuffers",
+    "SpynnakerAsyncDatabaseConnection",
+    "SpynnakerAsyncEthernetControlConnection", "SpynnakerAsyncLiveConnection",
+    "SpynnakerLiveSpikesConnection", "SpynnakerMeanfieldStateConnection",
+    "SpynnakerPoissonControlConnection"
 ]
@@ -0,0 +1,216 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinnman.messages.eieio import EIEIOType
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+# The size of the header of an EIEIO data message without prefixes
+_HEADER_BYTES = 2
+
+# The maximum number of events of each type that will fit in a packet,
+# and the type to store the key and payload of each event as
+_EVENT_FORMATS = {
+    EIEIOType.KEY_16_BIT: (127, "<u2", 1),
+    EIEIOType.KEY_32_BIT: (63, "<u4", 1),
+    EIEIOType.KEY_PAYLOAD_32_BIT: (31, "<u4", 2)}
+
+# The type to read the keys and payloads of each type of message as
+_READ_FORMATS = {
+    EIEIOType.KEY_16_BIT.value: ("<u2", False),
+    EIEIOType.KEY_PAYLOAD_16_BIT.value: ("<u2", True),
+    EIEIOType.KEY_32_BIT.value: ("<u4", False),
+    EIEIOType.KEY_PAYLOAD_32_BIT.value: ("<u4", True)}
+
+# Flags in the upper byte of the header of an EIEIO data message
+_PREFIX_FLAG = 1 << 7
+_PREFIX_UPPER_FLAG = 1 << 6
+_PAYLOAD_PREFIX_FLAG = 1 << 5
+_TIMESTAMP_FLAG = 1 << 4
+
+
+class EncodedEIEIOMessage(object):
+    """ An EIEIO message that has already been encoded
+    """
+
+    __slots__ = ["__bytestring"]
+
+    def __init__(self, bytestring):
+        """
+        :param bytes bytestring: The encoded message
+        """
+        self.__bytestring = bytestring
+
+    @property
+    def bytestring(self):
+        """ The encoded message
+
+        :rtype: bytes
+        """
+        return self.__bytestring
+
+
+class EIEIOEventPacker(object):
+    """ Packs arrays of keys, and optionally payloads, into as few EIEIO\
+        data messages as possible, encoding all of the events at once.
+
+    The messages are built in a buffer that is kept between calls, so that\
+    sending a similar number of events each time does not allocate any\
+    more memory for packing.
+    """
+
+    __slots__ = ["__buffer"]
+
+    def __init__(self):
+        self.__buffer = None
+
+    def pack(self, keys, payloads=None, full_keys=True):
+        """ Pack events into EIEIO data messages
+
+        :param ~numpy.ndarray keys: The key of each event
+        :param payloads: The 32-bit payload of each event, or None for none
+        :type payloads: ~numpy.ndarray or None
+        :param bool full_keys:
+            True to send 32-bit keys, or False to send 16-bit keys
+        :return: The messages, each with as many events as will fit
+        :rtype: list(EncodedEIEIOMessage)
+        """
+        keys = numpy.asarray(keys)
+        if payloads is None:
+            eieio_type = EIEIOType.KEY_32_BIT
+            if not full_keys:
+                eieio_type = EIEIOType.KEY_16_BIT
+        elif full_keys:
+            eieio_type = EIEIOType.KEY_PAYLOAD_32_BIT
+        else:
+            raise ConfigurationException(
+                "Payloads can only be sent with full keys")
+        max_events, word_type, words_per_event = _EVENT_FORMATS[eieio_type]
+
+        # Interleave the keys and payloads into words
+        n_events = len(keys)
+        if not n_events:
+            return []
+        words = numpy.empty((n_events, words_per_event), dtype=word_type)
+        words[:, 0] = keys & numpy.iinfo(word_type).max
+        if payloads is not None:
+            payloads = numpy.asarray(payloads)
+            if len(payloads) != n_events:
+                raise ConfigurationException(
+                    "There must be one payload for each key")
+            words[:, 1] = payloads & 0xFFFFFFFF
+        event_bytes = words.itemsize * words_per_event
+
+        # Fill in the headers and then copy the full packets in one go
+        n_packets = -(-n_events // max_events)
+        n_full = n_events // max_events
+        buffer = self.__get_buffer(
+            n_packets, _HEADER_BYTES + max_events * event_bytes)
+        counts = numpy.full(n_packets, max_events, dtype="uint8")
+        counts[-1] = n_events - (n_packets - 1) * max_events
+        buffer[:, 0] = counts
+        buffer[:, 1] = eieio_type.value << 2
+        data = words.view("uint8").reshape(-1)
+        full_bytes = n_full * max_events * event_bytes
+        if n_full:
+            buffer[:n_full, _HEADER_BYTES:] = data[:full_bytes].reshape(
+                n_full, -1)
+        if n_full < n_packets:
+            remaining = data[full_bytes:]
+            buffer[n_full, _HEADER_BYTES:_HEADER_BYTES + len(remaining)] = (
+                remaining)
+
+        sizes = _HEADER_BYTES + counts.astype("int64") * event_bytes
+        return [EncodedEIEIOMessage(buffer[i, :sizes[i]].tobytes())
+                for i in range(n_packets)]
+
+    def __get_buffer(self, n_packets, packet_bytes):
+        """ Get a buffer big enough for the given number of packets, making\
+            a new one only if the current one is too small
+
+        :param int n_packets: The number of packets
+        :param int packet_bytes: The maximum size of each packet
+        :rtype: ~numpy.ndarray
+        """
+        if (self.__buffer is None or self.__buffer.shape[0] < n_packets or
+                self.__buffer.shape[1] != packet_bytes):
+            n_rows = n_packets
+            if self.__buffer is not None:
+                n_rows = max(n_packets, self.__buffer.shape[0])
+            self.__buffer = numpy.zeros((n_rows, packet_bytes), dtype="uint8")
+        return self.__buffer[:n_packets]
+
+
+def unpack_events(data, offset=0):
+    """ Unpack all the events of an EIEIO data message at once
+
+    :param bytes data: The message
+    :param int offset: Where the message starts in the data
+    :return: The time of the events if the payload prefix is a time stamp
+        (otherwise None), the keys, and the payloads (or None if there are
+        none), or None if the message is not a data message
+    :rtype: tuple(int or None, ~numpy.ndarray, ~numpy.ndarray or None) or None
+    """
+    count = data[offset]
+    flags = data[offset + 1]
+    if flags & (_PREFIX_FLAG | _PREFIX_UPPER_FLAG) == _PREFIX_UPPER_FLAG:
+        # This is a command message
+        return None
+    word_type, has_payloads = _READ_FORMATS[(flags >> 2) & 0x3]
+    word_size = numpy.dtype(word_type).itemsize
+    pos = offset + _HEADER_BYTES
+
+    key_prefix = 0
+    if flags & _PREFIX_FLAG:
+        key_prefix = int.from_bytes(data[pos:pos + 2], "little")
+        if flags & _PREFIX_UPPER_FLAG:
+            key_prefix <<= 16
+        pos += 2
+    payload_prefix = None
+    if flags & _PAYLOAD_PREFIX_FLAG:
+        payload_prefix = int.from_bytes(data[pos:pos + word_size], "little")
+        pos += word_size
+
+    words = numpy.frombuffer(
+        data, dtype=word_type, count=count * (1 + has_payloads),
+        offset=pos).astype("uint32").reshape(count, -1)
+    keys = words[:, 0] | key_prefix
+    payloads = None
+    if has_payloads:
+        payloads = words[:, 1]
+        if payload_prefix is not None:
+            payloads = payloads | payload_prefix
+    time = None
+    if flags & _TIMESTAMP_FLAG and not has_payloads:
+        time = payload_prefix
+    return time, keys, payloads
+
+
+def get_atom_keys(db_reader, label):
+    """ Get the key of each atom of a vertex as an array indexed by atom ID
+
+    :param ~spinn_front_end_common.utilities.database.DatabaseReader \
+            db_reader:
+        The reader of the database
+    :param str label: The label of the vertex
+    :rtype: ~numpy.ndarray
+    """
+    mapping = db_reader.get_atom_id_to_key_mapping(label)
+    if not mapping:
+        return numpy.zeros(0, dtype="uint32")
+    atom_ids = numpy.fromiter(mapping.keys(), dtype="int64")
+    keys = numpy.zeros(numpy.max(atom_ids) + 1, dtype="uint32")
+    keys[atom_ids] = numpy.fromiter(mapping.values(), dtype="int64")
+    return keys
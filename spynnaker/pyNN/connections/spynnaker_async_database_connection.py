@@ -0,0 +1,211 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import logging
+from spinn_utilities.log import FormatAdapter
+from spinnman.constants import EIEIO_COMMAND_IDS as CMDS
+from spinnman.exceptions import SpinnmanInvalidPacketException
+from spinnman.messages.eieio.command_messages import EIEIOCommandHeader
+from spinn_front_end_common.utilities.constants import NOTIFY_PORT
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# The size of the header of an EIEIO command message
+_COMMAND_HEADER_BYTES = 2
+
+
+class _NotificationDatagramProtocol(asyncio.DatagramProtocol):
+    """ Queues the notifications received from the toolchain
+    """
+
+    __slots__ = ["__messages"]
+
+    def __init__(self, messages):
+        self.__messages = messages
+
+    def datagram_received(self, data, addr):
+        self.__messages.put_nowait((data, addr))
+
+    def error_received(self, exc):
+        logger.warning("Error on database connection: {}", exc)
+
+    def connection_lost(self, exc):
+        self.__messages.put_nowait(None)
+
+
+class SpynnakerAsyncDatabaseConnection(object):
+    """ A connection that takes part in the notifications of the toolchain\
+        from within an asyncio event loop, in place of the threaded\
+        :py:class:`~spinn_front_end_common.utilities.database.DatabaseConnection`.
+
+    The toolchain says when the database has been written, waits for the\
+    reading of the database to be confirmed, and then says when the\
+    simulation starts or resumes and when it stops or pauses.  Each run\
+    goes through the same steps::
+
+        path = await notifications.wait_for_database()
+        with DatabaseReader(path) as db_reader:
+            live_connection.read_database(db_reader, ...)
+        notifications.confirm_database_read()
+        await notifications.wait_for_start()
+        ...
+        await notifications.wait_for_stop()
+
+    :py:meth:`SpynnakerAsyncLiveConnection.read_database_when_ready` does\
+    the first three steps.
+    """
+
+    __slots__ = [
+        # The local host to listen on
+        "__local_host",
+        # The local port to listen on
+        "__local_port",
+        # The notifications received and not yet waited for
+        "__messages",
+        # The address to confirm the reading of the database to
+        "__toolchain_address",
+        # The transport of the connection, or None if not open
+        "__transport"]
+
+    def __init__(self, local_host=None, local_port=NOTIFY_PORT):
+        """
+        :param str local_host:
+            Optional specification of the local hostname or IP address of the
+            interface to listen on
+        :param int local_port:
+            Optional specification of the local port to listen on; this must
+            match the port that the toolchain sends notifications to (19999
+            by default)
+        """
+        self.__local_host = local_host
+        self.__local_port = local_port
+        self.__messages = None
+        self.__toolchain_address = None
+        self.__transport = None
+
+    async def open(self, loop=None):
+        """ Start listening for notifications
+
+        :param loop: The event loop to run in, or None for the current one
+        :type loop: ~asyncio.AbstractEventLoop or None
+        """
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self.__messages = asyncio.Queue()
+        self.__transport, _ = await loop.create_datagram_endpoint(
+            lambda: _NotificationDatagramProtocol(self.__messages),
+            local_addr=(self.__local_host or "0.0.0.0",
+                        self.__local_port or 0))
+
+    def close(self):
+        """ Stop listening; anything waiting for a notification is told\
+            that the connection has closed
+        """
+        if self.__transport is not None:
+            self.__transport.close()
+            self.__transport = None
+
+    @property
+    def local_port(self):
+        """ The port that the connection is listening on
+
+        :rtype: int
+        :raises ConfigurationException:
+            If the connection is not open and no port was given
+        """
+        if self.__transport is None:
+            if not self.__local_port:
+                raise ConfigurationException(
+                    "The connection must be opened before the port it was"
+                    " given is known")
+            return self.__local_port
+        return self.__transport.get_extra_info("sockname")[1]
+
+    async def wait_for_database(self):
+        """ Wait for the toolchain to say that the database has been written
+
+        :return: The path of the database, or None if there is no database
+        :rtype: str or None
+        :raises ConfigurationException: If the connection is closed
+        :raises ~spinnman.exceptions.SpinnmanInvalidPacketException:
+            If a different notification is received
+        """
+        data, address = await self.__receive(CMDS.DATABASE_CONFIRMATION)
+        self.__toolchain_address = address
+        if len(data) > _COMMAND_HEADER_BYTES:
+            return data[_COMMAND_HEADER_BYTES:].decode("utf-8")
+        logger.warning("Database path was empty - assuming no database")
+        return None
+
+    def confirm_database_read(self):
+        """ Tell the toolchain that the database has been read, so that the\
+            simulation can go on
+
+        :raises ConfigurationException:
+            If there is no database to confirm the reading of
+        """
+        if self.__toolchain_address is None or self.__transport is None:
+            raise ConfigurationException(
+                "There is no database notification to confirm")
+        self.__transport.sendto(
+            EIEIOCommandHeader(CMDS.DATABASE_CONFIRMATION.value).bytestring,
+            self.__toolchain_address)
+        self.__toolchain_address = None
+
+    async def wait_for_start(self):
+        """ Wait for the toolchain to say that the simulation has started\
+            or resumed
+
+        :raises ConfigurationException: If the connection is closed
+        :raises ~spinnman.exceptions.SpinnmanInvalidPacketException:
+            If a different notification is received
+        """
+        await self.__receive(CMDS.START_RESUME_NOTIFICATION)
+
+    async def wait_for_stop(self):
+        """ Wait for the toolchain to say that the simulation has stopped\
+            or paused
+
+        :raises ConfigurationException: If the connection is closed
+        :raises ~spinnman.exceptions.SpinnmanInvalidPacketException:
+            If a different notification is received
+        """
+        await self.__receive(CMDS.STOP_PAUSE_NOTIFICATION)
+
+    async def __receive(self, command):
+        """ Wait for a notification
+
+        :param ~spinnman.constants.EIEIO_COMMAND_IDS command:
+            The notification expected
+        :return: The message and the address it came from
+        :rtype: tuple(bytes, tuple)
+        """
+        if self.__messages is None:
+            raise ConfigurationException("The connection is not open")
+        message = await self.__messages.get()
+        if message is None:
+            # Leave the closing for anything else that is waiting
+            self.__messages.put_nowait(None)
+            raise ConfigurationException("The connection has been closed")
+        data, address = message
+        command_code = EIEIOCommandHeader.from_bytestring(data, 0).command
+        if command_code != command.value:
+            raise SpinnmanInvalidPacketException(
+                "command_code",
+                "expected the {} command code now, and received {}".format(
+                    command.name, command_code))
+        return data, address
@@ -0,0 +1,93 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.overrides import overrides
+from spinnman.constants import SCP_SCAMP_PORT
+from spinn_front_end_common.utility_models import MultiCastCommand
+from .spynnaker_async_live_connection import SpynnakerAsyncLiveConnection
+
+
+class SpynnakerAsyncEthernetControlConnection(SpynnakerAsyncLiveConnection):
+    """ A connection that translates the Ethernet control messages received\
+        from populations within an asyncio event loop, as\
+        :py:class:`EthernetControlConnection` does with a thread.
+
+    The batches received from the populations have the keys of the\
+    messages in place of neuron IDs, as the translators need the keys.\
+    :py:meth:`translate` passes each message to the translator of its\
+    population until the connection is closed.
+    """
+
+    __slots__ = [
+        # The translator of each population by label
+        "__translators"]
+
+    def __init__(self, local_host=None, local_port=None, strip_sdp=True):
+        """
+        :param str local_host:
+            Optional specification of the local hostname or IP address of the
+            interface to listen on
+        :param int local_port:
+            Optional specification of the local port to listen on; this must
+            match the port that the live output was activated with
+        :param bool strip_sdp:
+            Whether the live output was activated with the SDP header removed
+        """
+        super().__init__(local_host, local_port, strip_sdp)
+        self.__translators = dict()
+
+    def add_translator(self, label, translator):
+        """ Add a population whose messages are to be translated; its keys\
+            are found by :py:meth:`read_database`, or can be added with\
+            :py:meth:`add_receive_label`
+
+        :param str label: The label of the population
+        :param AbstractEthernetTranslator translator:
+            The translator of multicast to control commands
+        """
+        self.__translators[label] = translator
+
+    @overrides(SpynnakerAsyncLiveConnection.add_receive_label)
+    def add_receive_label(self, label, key_to_atom_id):
+        # The keys are kept as they are for the translators
+        super().add_receive_label(label, {key: key for key in key_to_atom_id})
+
+    @overrides(SpynnakerAsyncLiveConnection.read_database)
+    def read_database(
+            self, db_reader, send_labels=(), receive_labels=(),
+            board_port=SCP_SCAMP_PORT):
+        receive_labels = list(receive_labels)
+        receive_labels.extend(
+            label for label in self.__translators
+            if label not in receive_labels)
+        super().read_database(
+            db_reader, send_labels, receive_labels, board_port)
+
+    async def translate(self):
+        """ Pass each message received to the translator of its population\
+            until the connection is closed
+        """
+        async for batch in self:
+            translator = self.__translators.get(batch.label)
+            if translator is None:
+                continue
+            if batch.payloads is None:
+                for key in batch.neuron_ids:
+                    translator.translate_control_packet(
+                        MultiCastCommand(int(key)))
+            else:
+                for key, payload in zip(batch.neuron_ids, batch.payloads):
+                    translator.translate_control_packet(
+                        MultiCastCommand(int(key), int(payload)))
@@ -0,0 +1,369 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import logging
+from collections import defaultdict, namedtuple
+import numpy
+from spinn_utilities.log import FormatAdapter
+from spinnman.constants import SCP_SCAMP_PORT
+from spinnman.messages.sdp import SDPFlag, SDPHeader
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities.database import DatabaseReader
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from .eieio_event_packer import EIEIOEventPacker, get_atom_keys, unpack_events
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# The SDP port that the injector cores listen to for events
+_INJECTION_SDP_PORT = 1
+
+# The padding and SDP header that comes before each message sent to or
+# received from a board without the SDP header stripped
+_SDP_HEADER_BYTES = 10
+
+#: A batch of events received from a single population in one packet
+LiveSpikeBatch = namedtuple(
+    "LiveSpikeBatch", ["label", "time", "neuron_ids", "payloads"])
+
+
+class _LiveDatagramProtocol(asyncio.DatagramProtocol):
+    """ Passes datagrams and flow control on to the connection
+    """
+
+    __slots__ = ["__connection"]
+
+    def __init__(self, connection):
+        self.__connection = connection
+
+    def datagram_received(self, data, addr):
+        self.__connection._receive(data)
+
+    def error_received(self, exc):
+        logger.warning("Error on live connection: {}", exc)
+
+    def pause_writing(self):
+        self.__connection._set_writable(False)
+
+    def resume_writing(self):
+        self.__connection._set_writable(True)
+
+    def connection_lost(self, exc):
+        self.__connection._connection_lost()
+
+
+class SpynnakerAsyncLiveConnection(object):
+    """ A connection for receiving and sending live spikes and Poisson rates\
+        from and to SpiNNaker from within an asyncio event loop.
+
+    Received packets are decoded in the event loop and can be read with\
+    ``async for batch in connection``, and sending can be awaited, so no\
+    thread is needed to handle each packet.  The targets of the connection\
+    are set up by :py:meth:`read_database` once the database has been\
+    written, or directly with :py:meth:`add_send_target` and\
+    :py:meth:`add_receive_label`; :py:meth:`read_database_when_ready`\
+    reads the database when the toolchain says it is ready.  The live\
+    output of the populations to be received must be activated with the\
+    host and port of this connection.
+    """
+
+    __slots__ = [
+        "__batches",
+        "__local_host",
+        "__local_port",
+        "__packer",
+        "__receive_atoms",
+        "__receive_keys",
+        "__receive_label_ids",
+        "__receive_labels",
+        "__send_keys",
+        "__send_next_core",
+        "__send_targets",
+        "__strip_sdp",
+        "__transport",
+        "__writable"]
+
+    def __init__(self, local_host=None, local_port=None, strip_sdp=True):
+        """
+        :param str local_host:
+            Optional specification of the local hostname or IP address of the
+            interface to listen on
+        :param int local_port:
+            Optional specification of the local port to listen on; this must
+            match the port that the live output was activated with
+        :param bool strip_sdp:
+            Whether the live output was activated with the SDP header removed
+        """
+        self.__local_host = local_host
+        self.__local_port = local_port
+        self.__strip_sdp = strip_sdp
+        self.__packer = EIEIOEventPacker()
+        self.__send_targets = defaultdict(list)
+        self.__send_next_core = dict()
+        self.__send_keys = dict()
+        self.__receive_labels = list()
+        self.__receive_keys = numpy.zeros(0, dtype="uint32")
+        self.__receive_atoms = numpy.zeros(0, dtype="uint32")
+        self.__receive_label_ids = numpy.zeros(0, dtype="uint32")
+        self.__transport = None
+        self.__batches = None
+        self.__writable = None
+
+    async def open(self, loop=None):
+        """ Start listening for packets and allow sending
+
+        :param loop: The event loop to run in, or None for the current one
+        :type loop: ~asyncio.AbstractEventLoop or None
+        """
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self.__batches = asyncio.Queue()
+        self.__writable = asyncio.Event()
+        self.__writable.set()
+        self.__transport, _ = await loop.create_datagram_endpoint(
+            lambda: _LiveDatagramProtocol(self),
+            local_addr=(self.__local_host or "0.0.0.0",
+                        self.__local_port or 0))
+
+    def close(self):
+        """ Stop listening and sending; any ``async for`` over the\
+            connection will finish once the batches already received have\
+            been read
+        """
+        if self.__transport is not None:
+            self.__transport.close()
+            self.__transport = None
+
+    @property
+    def local_port(self):
+        """ The port that the connection is listening on
+
+        :rtype: int
+        :raises ConfigurationException:
+            If the connection is not open and no port was given, as the port
+            is then chosen when it is opened
+        """
+        if self.__transport is None:
+            if not self.__local_port:
+                raise ConfigurationException(
+                    "The connection must be opened before the port it was"
+                    " given is known")
+            return self.__local_port
+        return self.__transport.get_extra_info("sockname")[1]
+
+    def add_send_target(
+            self, label, x, y, p, board_address, atom_keys,
+            board_port=SCP_SCAMP_PORT):
+        """ Add a core of a population that events can be sent to; a\
+            population on more than one core has this called for each core,\
+            and the packets sent to it are shared between them
+
+        :param str label: The label of the population or control vertex
+        :param int x: The x-coordinate of the chip of the injecting core
+        :param int y: The y-coordinate of the chip of the injecting core
+        :param int p: The injecting core
+        :param str board_address: The address of the board to send to
+        :param ~numpy.ndarray atom_keys: The key of each atom
+        :param int board_port: The port on the board to send to
+        """
+        header = SDPHeader(
+            flags=SDPFlag.REPLY_NOT_EXPECTED, tag=0,
+            destination_port=_INJECTION_SDP_PORT, destination_cpu=p,
+            destination_chip_x=x, destination_chip_y=y, source_port=0,
+            source_cpu=0, source_chip_x=0, source_chip_y=0)
+        self.__send_targets[label].append(
+            (b"\0\0" + header.bytestring, (board_address, board_port)))
+        self.__send_next_core[label] = 0
+        self.__send_keys[label] = numpy.asarray(atom_keys, dtype="uint32")
+
+    def add_receive_label(self, label, key_to_atom_id):
+        """ Add a population that events can be received from
+
+        :param str label: The label of the population
+        :param dict(int,int) key_to_atom_id:
+            The mapping from the keys sent by the population to its atoms
+        """
+        keys = numpy.fromiter(key_to_atom_id.keys(), dtype="uint32")
+        atoms = numpy.fromiter(key_to_atom_id.values(), dtype="uint32")
+        label_ids = numpy.full(
+            len(keys), len(self.__receive_labels), dtype="uint32")
+        self.__receive_labels.append(label)
+
+        # Keep all the keys sorted together so a packet is looked up at once
+        keys = numpy.concatenate([self.__receive_keys, keys])
+        order = numpy.argsort(keys, kind="stable")
+        self.__receive_keys = keys[order]
+        self.__receive_atoms = numpy.concatenate(
+            [self.__receive_atoms, atoms])[order]
+        self.__receive_label_ids = numpy.concatenate(
+            [self.__receive_label_ids, label_ids])[order]
+
+    def read_database(
+            self, db_reader, send_labels=(), receive_labels=(),
+            board_port=SCP_SCAMP_PORT):
+        """ Set up the targets of the connection from the database
+
+        :param ~spinn_front_end_common.utilities.database.DatabaseReader \
+                db_reader:
+            The reader of the database
+        :param iterable(str) send_labels:
+            The labels of the populations (or Poisson control vertices) to
+            send to
+        :param iterable(str) receive_labels:
+            The labels of the populations to receive from
+        :param int board_port: The port on the boards to send to
+        :raises ConfigurationException:
+            If a population to send to is not in the database
+        """
+        for label in send_labels:
+            placements = db_reader.get_placements(label)
+            if not placements:
+                raise ConfigurationException(
+                    "{} is not placed on any core".format(label))
+            atom_keys = get_atom_keys(db_reader, label)
+            for x, y, p in placements:
+                self.add_send_target(
+                    label, x, y, p, db_reader.get_ip_address(x, y),
+                    atom_keys, board_port)
+        for label in receive_labels:
+            self.add_receive_label(
+                label, db_reader.get_key_to_atom_id_mapping(label))
+
+    async def read_database_when_ready(
+            self, notifications, send_labels=(), receive_labels=(),
+            board_port=SCP_SCAMP_PORT):
+        """ Wait for the toolchain to write the database, set up the targets\
+            of the connection from it, and confirm that it has been read so\
+            that the simulation can go on
+
+        :param SpynnakerAsyncDatabaseConnection notifications:
+            The open connection that the toolchain notifies
+        :param iterable(str) send_labels:
+            The labels of the populations (or Poisson control vertices) to
+            send to
+        :param iterable(str) receive_labels:
+            The labels of the populations to receive from
+        :param int board_port: The port on the boards to send to
+        :raises ConfigurationException:
+            If a population to send to is not in the database
+        """
+        database_path = await notifications.wait_for_database()
+        if database_path is not None:
+            with DatabaseReader(database_path) as db_reader:
+                self.read_database(
+                    db_reader, send_labels, receive_labels, board_port)
+        notifications.confirm_database_read()
+
+    async def send_spikes_array(self, label, neuron_ids, send_full_keys=False):
+        """ Send a number of spikes, packing as many into each packet as\
+            will fit
+
+        :param str label:
+            The label of the population from which the spikes will originate
+        :param ~numpy.ndarray neuron_ids: The IDs of the neurons sending spikes
+        :param bool send_full_keys: Determines whether to send full 32-bit
+            keys, or whether to send 16-bit neuron IDs directly
+        :raises ConfigurationException:
+            If neuron IDs are sent to a population on more than one core
+        """
+        keys = numpy.asarray(neuron_ids, dtype="int64")
+        if send_full_keys:
+            keys = self.__send_keys[self.__check_target(label)][keys]
+        elif len(self.__send_targets[self.__check_target(label)]) > 1:
+            # A core makes the keys of neuron IDs from its own keys, so a
+            # neuron ID means a different neuron on each core
+            raise ConfigurationException(
+                "{} is on more than one core, so its spikes must be sent with"
+                " full keys".format(label))
+        for message in self.__packer.pack(keys, full_keys=send_full_keys):
+            await self.__send(label, message.bytestring)
+
+    async def set_rates_array(self, label, neuron_ids, rates):
+        """ Set the rates of a number of Poisson neurons, packing as many\
+            into each packet as will fit
+
+        :param str label: The label of the Poisson control vertex
+        :param ~numpy.ndarray neuron_ids: The neuron IDs to set the rates of
+        :param ~numpy.ndarray rates: The rates to set in Hz, one per neuron
+        """
+        keys = self.__send_keys[self.__check_target(label)][
+            numpy.asarray(neuron_ids, dtype="int64")]
+        payloads = DataType.S1615.encode_as_numpy_int_array(
+            numpy.asarray(rates, dtype="float64"))
+        for message in self.__packer.pack(keys, payloads):
+            await self.__send(label, message.bytestring)
+
+    def __check_target(self, label):
+        if not self.__send_targets.get(label):
+            raise ConfigurationException(
+                "{} has not been added as a target".format(label))
+        return label
+
+    async def __send(self, label, data):
+        if self.__transport is None:
+            raise ConfigurationException("The connection is not open")
+        if not self.__writable.is_set():
+            await self.__writable.wait()
+        # A full key is sent on by whichever core gets it, so the packets
+        # are shared between the cores in turn
+        cores = self.__send_targets[self.__check_target(label)]
+        core = self.__send_next_core[label]
+        self.__send_next_core[label] = (core + 1) % len(cores)
+        prefix, address = cores[core]
+        self.__transport.sendto(prefix + data, address)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        batch = await self.__batches.get()
+        if batch is None:
+            raise StopAsyncIteration
+        return batch
+
+    def _receive(self, data):
+        """ Decode a packet and queue a batch for each population in it
+
+        :param bytes data: The packet
+        """
+        offset = 0 if self.__strip_sdp else _SDP_HEADER_BYTES
+        events = unpack_events(data, offset)
+        if events is None or not len(self.__receive_keys):
+            return
+        time, keys, payloads = events
+        index = numpy.minimum(
+            numpy.searchsorted(self.__receive_keys, keys),
+            len(self.__receive_keys) - 1)
+        known = self.__receive_keys[index] == keys
+        index = index[known]
+        if payloads is not None:
+            payloads = payloads[known]
+        label_ids = self.__receive_label_ids[index]
+        for label_id in numpy.unique(label_ids):
+            in_label = label_ids == label_id
+            self.__batches.put_nowait(LiveSpikeBatch(
+                self.__receive_labels[label_id], time,
+                self.__receive_atoms[index[in_label]],
+                None if payloads is None else payloads[in_label]))
+
+    def _set_writable(self, writable):
+        if writable:
+            self.__writable.set()
+        else:
+            self.__writable.clear()
+
+    def _connection_lost(self):
+        self.__writable.set()
+        self.__batches.put_nowait(None)
@@ -13,8 +13,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
+from spinn_utilities.overrides import overrides
 from spinn_front_end_common.utilities.connections import LiveEventConnection
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from .eieio_event_packer import EIEIOEventPacker, get_atom_keys
 
 # The maximum number of 32-bit keys that will fit in a packet
 _MAX_FULL_KEYS_PER_PACKET = 63
@@ -26,7 +30,10 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
     """ A connection for receiving and sending live spikes from and to\
         SpiNNaker
     """
-    __slots__ = []
+    __slots__ = [
+        "__atom_keys",
+        "__key_labels",
+        "__packer"]
 
     def __init__(self, receive_labels=None, send_labels=None, local_host=None,
                  local_port=NOTIFY_PORT,
@@ -45,9 +52,24 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
             by default)
         """
         # pylint: disable=too-many-arguments
+        self.__atom_keys = dict()
+        self.__key_labels = set()
+        if send_labels is not None:
+            self.__key_labels.update(send_labels)
+        self.__packer = EIEIOEventPacker()
         super().__init__(
             live_packet_gather_label, receive_labels, send_labels,
             local_host, local_port)
+        self.add_database_callback(self.__read_atom_keys)
+
+    def __read_atom_keys(self, db_reader):
+        for label in self.__key_labels:
+            self.__atom_keys[label] = get_atom_keys(db_reader, label)
+
+    @overrides(LiveEventConnection.add_send_label)
+    def add_send_label(self, label):
+        super().add_send_label(label)
+        self.__key_labels.add(label)
 
     def send_spike(self, label, neuron_id, send_full_keys=False):
         """ Send a spike from a single neuron
@@ -72,3 +94,26 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
             whether to send 16-bit neuron IDs directly
         """
         self.send_events(label, neuron_ids, send_full_keys)
+
+    def send_spikes_array(self, label, neuron_ids, send_full_keys=False):
+        """ Send a number of spikes given as an array, encoding all of the\
+            spikes at once and packing as many into each packet as will fit
+
+        :param str label:
+            The label of the population from which the spikes will originate
+        :param ~numpy.ndarray neuron_ids: The IDs of the neurons sending spikes
+        :param bool send_full_keys: Determines whether to send full 32-bit
+            keys, getting the key for each neuron from the database, or
+            whether to send 16-bit neuron IDs directly
+        :raises ConfigurationException:
+            If full keys are requested before the database has been read
+        """
+        keys = numpy.asarray(neuron_ids, dtype="int64")
+        if send_full_keys:
+            if label not in self.__atom_keys:
+                raise ConfigurationException(
+                    "The keys of {} are not known until the simulation has "
+                    "started".format(label))
+            keys = self.__atom_keys[label][keys]
+        for message in self.__packer.pack(keys, full_keys=send_full_keys):
+            self.send_eieio_message(message, label)
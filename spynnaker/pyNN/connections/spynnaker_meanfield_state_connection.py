@@ -0,0 +1,210 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.models.neuron.implementations import (
+    MeanfieldImplStandard)
+from spynnaker.pyNN.utilities.utility_calls import get_n_bits
+from .eieio_event_packer import unpack_events
+from .spynnaker_async_live_connection import (
+    SpynnakerAsyncLiveConnection, _SDP_HEADER_BYTES)
+
+# The variables that can be sent, in the order of their keys
+_ALL_VARIABLES = MeanfieldImplStandard._RECORDABLES  # pylint: disable=W0212
+
+
+class MeanfieldStateBuffers(object):
+    """ Ring buffers that hold the most recent values of some of the\
+        variables of a population of meanfields as they arrive live.
+
+    Sample *s* of a variable is the value at time step *s* times the\
+    interval that the live output was activated with, counting from the\
+    start of the simulation.
+    """
+
+    __slots__ = [
+        "__counts",
+        "__key_mask",
+        "__n_neurons",
+        "__n_samples",
+        "__slots_of_variables",
+        "__values",
+        "__variables"]
+
+    def __init__(self, n_neurons, variables=None, n_samples=1000):
+        """
+        :param int n_neurons: The number of meanfields in the population
+        :param list(str) variables:
+            The variables to keep, or None for all that can be sent
+        :param int n_samples: The number of samples to keep of each variable
+        """
+        if variables is None:
+            variables = _ALL_VARIABLES
+        unknown = set(variables) - set(_ALL_VARIABLES)
+        if unknown:
+            raise ConfigurationException(
+                "Unknown variables {}".format(sorted(unknown)))
+        self.__variables = list(variables)
+        self.__n_neurons = n_neurons
+        self.__n_samples = n_samples
+
+        # The key of each value is the index of the variable times the number
+        # of meanfields plus the meanfield ID, added to an aligned base key
+        self.__key_mask = (
+            1 << get_n_bits(len(_ALL_VARIABLES) * n_neurons)) - 1
+        self.__slots_of_variables = numpy.full(
+            len(_ALL_VARIABLES), -1, dtype="int64")
+        for slot, variable in enumerate(self.__variables):
+            self.__slots_of_variables[_ALL_VARIABLES.index(variable)] = slot
+
+        self.__values = numpy.full(
+            (len(self.__variables), n_samples, n_neurons), numpy.nan)
+        self.__counts = numpy.zeros(
+            (len(self.__variables), n_neurons), dtype="int64")
+
+    @property
+    def variables(self):
+        """ The variables being kept
+
+        :rtype: list(str)
+        """
+        return self.__variables
+
+    def add_events(self, keys, payloads):
+        """ Add the values from a batch of received events
+
+        :param ~numpy.ndarray keys: The key of each event
+        :param ~numpy.ndarray payloads: The S1615 payload of each event
+        """
+        offsets = numpy.asarray(keys, dtype="int64") & self.__key_mask
+        variable_ids, neuron_ids = numpy.divmod(offsets, self.__n_neurons)
+        known = variable_ids < len(_ALL_VARIABLES)
+        slots = numpy.full(len(offsets), -1, dtype="int64")
+        slots[known] = self.__slots_of_variables[variable_ids[known]]
+        kept = slots >= 0
+        slots = slots[kept]
+        neuron_ids = neuron_ids[kept]
+        values = (numpy.asarray(payloads, dtype="uint32")[kept].view("int32")
+                  / float(DataType.S1615.scale))
+
+        # A batch may hold more than one value of a meanfield; each goes in
+        # the next sample after the one before it
+        cells = slots * self.__n_neurons + neuron_ids
+        order = numpy.argsort(cells, kind="stable")
+        sorted_cells = cells[order]
+        rank = numpy.empty(len(cells), dtype="int64")
+        rank[order] = numpy.arange(len(cells)) - numpy.searchsorted(
+            sorted_cells, sorted_cells, side="left")
+        counts = self.__counts.reshape(-1)
+        samples = counts[cells] + rank
+        self.__values[slots, samples % self.__n_samples, neuron_ids] = values
+        counts += numpy.bincount(cells, minlength=len(counts))
+
+    def n_received(self, variable):
+        """ Get the number of values received for each meanfield
+
+        :param str variable: The variable to get the count of
+        :rtype: ~numpy.ndarray
+        """
+        return self.__counts[self.__variables.index(variable)].copy()
+
+    def latest(self, variable):
+        """ Get the most recent value of each meanfield, or NaN for those\
+            that have not yet been received
+
+        :param str variable: The variable to get the values of
+        :rtype: ~numpy.ndarray
+        """
+        slot = self.__variables.index(variable)
+        counts = self.__counts[slot]
+        latest = self.__values[
+            slot, (counts - 1) % self.__n_samples,
+            numpy.arange(self.__n_neurons)]
+        return numpy.where(counts > 0, latest, numpy.nan)
+
+    def history(self, variable):
+        """ Get the samples still held of each meanfield, oldest first
+
+        :param str variable: The variable to get the values of
+        :return: The sample numbers, and the values of each sample of each
+            meanfield, with NaN for values that have not been received or
+            have been overwritten
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        slot = self.__variables.index(variable)
+        counts = self.__counts[slot]
+        end = int(numpy.max(counts)) if len(counts) else 0
+        samples = numpy.arange(max(end - self.__n_samples, 0), end)
+        values = self.__values[slot, samples % self.__n_samples, :]
+        held = ((samples[:, None] < counts[None, :]) &
+                (samples[:, None] >= counts[None, :] - self.__n_samples))
+        return samples, numpy.where(held, values, numpy.nan)
+
+
+class SpynnakerMeanfieldStateConnection(SpynnakerAsyncLiveConnection):
+    """ An asyncio connection that receives the state of a population of\
+        meanfields live and keeps it in ring buffers, from which a\
+        dashboard can read it at any time while the simulation runs.
+
+    The live output must have been activated with\
+    ``activate_live_state_output_for`` with the host and port of this\
+    connection.
+    """
+
+    __slots__ = [
+        "__buffers",
+        "__offset"]
+
+    def __init__(
+            self, n_neurons, variables=None, n_samples=1000, local_host=None,
+            local_port=None, strip_sdp=True):
+        """
+        :param int n_neurons: The number of meanfields in the population
+        :param list(str) variables:
+            The variables to keep, or None for all that can be sent
+        :param int n_samples: The number of samples to keep of each variable
+        :param str local_host:
+            Optional specification of the local hostname or IP address of the
+            interface to listen on
+        :param int local_port:
+            Optional specification of the local port to listen on; this must
+            match the port that the live output was activated with
+        :param bool strip_sdp:
+            Whether the live output was activated with the SDP header removed
+        """
+        # pylint: disable=too-many-arguments
+        super().__init__(local_host, local_port, strip_sdp)
+        self.__buffers = MeanfieldStateBuffers(n_neurons, variables, n_samples)
+        self.__offset = 0 if strip_sdp else _SDP_HEADER_BYTES
+
+    @property
+    def buffers(self):
+        """ The buffers that the state is received into
+
+        :rtype: MeanfieldStateBuffers
+        """
+        return self.__buffers
+
+    @overrides(SpynnakerAsyncLiveConnection._receive)
+    def _receive(self, data):
+        events = unpack_events(data, self.__offset)
+        if events is None:
+            return
+        _time, keys, payloads = events
+        if payloads is not None:
+            self.__buffers.add_events(keys, payloads)
@@ -13,19 +13,23 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 from spinn_utilities.overrides import overrides
 from data_specification.enums import DataType
 from spinn_front_end_common.utilities.connections import LiveEventConnection
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
 import functools
+from .eieio_event_packer import EIEIOEventPacker, get_atom_keys
 
 
 class SpynnakerPoissonControlConnection(LiveEventConnection):
     __slots__ = [
+        "__atom_keys",
         "__control_label_extension",
         "__control_label_to_label",
-        "__label_to_control_label"]
+        "__label_to_control_label",
+        "__packer"]
 
     def __init__(
             self, poisson_labels=None, local_host=None, local_port=NOTIFY_PORT,
@@ -43,6 +47,8 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
             The extra name added to the label of each Poisson source
         """
         self.__control_label_extension = control_label_extension
+        self.__atom_keys = dict()
+        self.__packer = EIEIOEventPacker()
 
         control_labels = None
         self.__control_label_to_label = dict()
@@ -62,6 +68,11 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
         super().__init__(
             live_packet_gather_label=None, send_labels=control_labels,
             local_host=local_host, local_port=local_port)
+        self.add_database_callback(self.__read_atom_keys)
+
+    def __read_atom_keys(self, db_reader):
+        for control in self.__control_label_to_label:
+            self.__atom_keys[control] = get_atom_keys(db_reader, control)
 
     def add_poisson_label(self, label):
         """
@@ -145,3 +156,26 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
         atom_ids_and_payloads = [(nid, datatype.encode_as_int(rate))
                                  for nid, rate in neuron_id_rates]
         self.send_events_with_payloads(control, atom_ids_and_payloads)
+
+    def set_rates_array(self, label, neuron_ids, rates):
+        """ Set the rates of multiple Poisson neurons within a Poisson source\
+            from arrays, encoding all of the rates at once and packing as\
+            many into each packet as will fit
+
+        :param str label: The label of the Population to set the rates of
+        :param ~numpy.ndarray neuron_ids: The neuron IDs to set the rates of
+        :param ~numpy.ndarray rates: The rates to set in Hz, one per neuron
+        :raises ConfigurationException:
+            If the rates are set before the simulation has started
+        """
+        control = self.__control_label(label)
+        if control not in self.__atom_keys:
+            raise ConfigurationException(
+                "The keys of {} are not known until the simulation has "
+                "started".format(label))
+        keys = self.__atom_keys[control][
+            numpy.asarray(neuron_ids, dtype="int64")]
+        payloads = DataType.S1615.encode_as_numpy_int_array(
+            numpy.asarray(rates, dtype="float64"))
+        for message in self.__packer.pack(keys, payloads):
+            self.send_eieio_message(message, control)
@@ -16,6 +16,8 @@ from .connection_holder_finisher import finish_connection_holders
 from .graph_edge_weight_updater import GraphEdgeWeightUpdater
 from .on_chip_bit_field_generator import OnChipBitFieldGenerator
 from .redundant_packet_count_report import RedundantPacketCountReport
+from .spike_traffic_report import (
+    HotSpot, SpikeTraffic, SpikeTrafficReport, hot_spots, spike_traffic)
 from .spynnaker_connection_holder_generations import (
     SpYNNakerConnectionHolderGenerator)
 from .spynnaker_data_specification_writer import (
@@ -29,18 +31,40 @@ from .spynnaker_neuron_network_specification_report import (
 from .spynnaker_synaptic_matrix_report import SpYNNakerSynapticMatrixReport
 from .synapse_expander import synapse_expander
 from .delay_support_adder import DelaySupportAdder
+from .delay_planner import (
+    DelayOption, DelayPlan, DelayPlanner, write_delay_plan_report)
+from .key_grouper import (
+    KeyGroup, KeyGrouper, KeyGroupRoutes, compress_router_tables,
+    count_key_group_routes, write_key_group_report)
+from .key_group_report import KeyGroupReport
 
 __all__ = [
     "AbstractMachineBitFieldRouterCompressor",
+    "DelayOption",
+    "DelayPlan",
+    "DelayPlanner",
     "DelaySupportAdder",
+    "compress_router_tables",
+    "count_key_group_routes",
     "finish_connection_holders",
     "GraphEdgeWeightUpdater",
+    "HotSpot",
+    "hot_spots",
+    "KeyGroup",
+    "KeyGrouper",
+    "KeyGroupReport",
+    "KeyGroupRoutes",
     "OnChipBitFieldGenerator",
     "RedundantPacketCountReport",
+    "spike_traffic",
+    "SpikeTraffic",
+    "SpikeTrafficReport",
     "SpYNNakerConnectionHolderGenerator",
     "SpynnakerDataSpecificationWriter",
     "SpynnakerMachineBitFieldPairRouterCompressor",
     "SpynnakerMachineBitFieldUnorderedRouterCompressor",
     "SpYNNakerNeuronGraphNetworkSpecificationReport",
     "SpYNNakerSynapticMatrixReport",
-    "synapse_expander"]
+    "synapse_expander",
+    "write_delay_plan_report",
+    "write_key_group_report"]
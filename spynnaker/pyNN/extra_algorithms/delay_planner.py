@@ -0,0 +1,340 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import math
+import os
+from collections import defaultdict, namedtuple
+from spinn_utilities.log import FormatAdapter
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.utilities.globals_variables import (
+    machine_time_step_ms, report_default_directory)
+from spynnaker.pyNN.extra_algorithms.splitter_components import (
+    AbstractSpynnakerSplitterDelay, SplitterAbstractPopulationVertexSlice)
+from spynnaker.pyNN.models.neural_projections import (
+    ProjectionApplicationEdge)
+from spynnaker.pyNN.models.utility_models.delays import DelayExtensionVertex
+from spynnaker.pyNN.utilities.utility_calls import get_n_bits
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# The name of the report of the delay plans
+_REPORT_NAME = "delay_plan.rpt"
+
+# The most bits of neuron index, synapse type and delay that the ring buffers
+# of a core may use; this is what the default of 16 delays uses for 256
+# neurons with 2 synapse types
+_MAX_RING_BUFFER_BITS = 13
+
+#: One way of providing the delays of a group of populations: the delay that
+#: their cores support themselves, which is also the delay of each stage of
+#: the delay extensions, and what that costs
+DelayOption = namedtuple(
+    "DelayOption",
+    ["delay_per_stage", "n_atoms_per_core", "n_post_cores", "n_delay_cores",
+     "n_delay_stages", "n_delayed_rows", "n_empty_delayed_rows"])
+
+#: The delay chosen for a group of populations that share delay extensions;
+#: chosen is None if the delays cannot be planned
+DelayPlan = namedtuple(
+    "DelayPlan",
+    ["app_vertices", "max_delay_ms", "options", "chosen", "reason"])
+
+
+class DelayPlanner(object):
+    """ Chooses the delay that the cores of each population support\
+        themselves, and so the delay of each stage of the delay extensions\
+        feeding them, from the delays of the incoming projections.
+
+    A larger delay on the cores of a population needs more ring buffer\
+    space, and so fewer neurons on each core, but needs fewer delay stages,\
+    and so fewer delayed rows; when it covers all the delays, no delay\
+    extension cores are needed at all.  The delay that needs the fewest\
+    cores in total is chosen, and then the one with the fewest delayed\
+    rows.  Populations that share a source needing a delay extension are\
+    planned together, as their delay extension can only have one delay\
+    per stage.  Only populations split by\
+    :py:class:`SplitterAbstractPopulationVertexSlice` are planned.
+    """
+
+    __slots__ = []
+
+    def plan(self, app_graph):
+        """ Plan the delays of the populations in a graph
+
+        :param ~pacman.model.graphs.application.ApplicationGraph app_graph:
+            The graph to plan the delays of
+        :rtype: list(DelayPlan)
+        """
+        default_delay = AbstractSpynnakerSplitterDelay.MAX_SUPPORTED_DELAY_TICS
+        time_step_ms = machine_time_step_ms()
+
+        # Find the projections into each population that need delays longer
+        # than the population supports now
+        edges_by_post = defaultdict(list)
+        for partition in app_graph.outgoing_edge_partitions:
+            for app_edge in partition.edges:
+                if isinstance(app_edge, ProjectionApplicationEdge):
+                    edges_by_post[app_edge.post_vertex].append(app_edge)
+        plannable = dict()
+        fixed_pre_vertices = set()
+        for post_vertex, app_edges in edges_by_post.items():
+            splitter = post_vertex.splitter
+            if not isinstance(splitter, AbstractSpynnakerSplitterDelay):
+                continue
+            if isinstance(splitter, SplitterAbstractPopulationVertexSlice):
+                max_delay_steps = default_delay
+            else:
+                max_delay_steps = splitter.max_support_delay()
+            delayed = [
+                app_edge for app_edge in app_edges
+                if self.__get_max_delay_ms(app_edge) >
+                max_delay_steps * time_step_ms]
+            if not delayed:
+                continue
+            if isinstance(splitter, SplitterAbstractPopulationVertexSlice):
+                plannable[post_vertex] = delayed
+            else:
+                fixed_pre_vertices.update(
+                    app_edge.pre_vertex for app_edge in delayed)
+
+        plans = list()
+        for group in self.__groups(plannable):
+            app_edges = [app_edge for post_vertex in group
+                         for app_edge in plannable[post_vertex]]
+            max_delay_ms = max(
+                self.__get_max_delay_ms(app_edge) for app_edge in app_edges)
+            if any(app_edge.pre_vertex in fixed_pre_vertices
+                   for app_edge in app_edges):
+                plans.append(DelayPlan(
+                    group, max_delay_ms, [], None,
+                    "a source is also delayed to a population whose delay is"
+                    " fixed by its splitter"))
+            else:
+                plans.append(self.__plan_group(
+                    group, app_edges, max_delay_ms, default_delay,
+                    time_step_ms))
+        return plans
+
+    @staticmethod
+    def apply(plan):
+        """ Make the populations of a plan use the delay chosen, until their\
+            splitters are reset
+
+        :param DelayPlan plan: The plan to apply
+        """
+        if plan.chosen is None:
+            return
+        for app_vertex, n_atoms_per_core in zip(
+                plan.app_vertices, plan.chosen.n_atoms_per_core):
+            if n_atoms_per_core >= app_vertex.get_max_atoms_per_core():
+                n_atoms_per_core = None
+            app_vertex.splitter.set_max_support_delay(
+                plan.chosen.delay_per_stage, n_atoms_per_core)
+
+    @staticmethod
+    def __get_max_delay_ms(app_edge):
+        """
+        :param ProjectionApplicationEdge app_edge:
+        :rtype: float
+        """
+        return max(
+            synapse_info.synapse_dynamics.get_delay_maximum(
+                synapse_info.connector, synapse_info)
+            for synapse_info in app_edge.synapse_information)
+
+    @staticmethod
+    def __groups(plannable):
+        """ Group the populations that share delayed sources
+
+        :param dict(AbstractPopulationVertex,list) plannable:
+            The delayed edges into each population to plan
+        :rtype: iterable(list(AbstractPopulationVertex))
+        """
+        post_vertices_by_pre = defaultdict(list)
+        for post_vertex, app_edges in plannable.items():
+            for app_edge in app_edges:
+                post_vertices_by_pre[app_edge.pre_vertex].append(post_vertex)
+        seen = set()
+        for post_vertex in plannable:
+            if post_vertex in seen:
+                continue
+            seen.add(post_vertex)
+            group = list()
+            to_visit = [post_vertex]
+            while to_visit:
+                vertex = to_visit.pop()
+                group.append(vertex)
+                for app_edge in plannable[vertex]:
+                    for other in post_vertices_by_pre[app_edge.pre_vertex]:
+                        if other not in seen:
+                            seen.add(other)
+                            to_visit.append(other)
+            yield group
+
+    def __plan_group(
+            self, group, app_edges, max_delay_ms, default_delay,
+            time_step_ms):
+        """ Try each delay from the default upwards, until one covers all\
+            the delays or the ring buffers of a core cannot be made large\
+            enough even with one neuron on each core
+
+        :rtype: DelayPlan
+        """
+        n_synapse_bits = max(
+            get_n_bits(post_vertex.neuron_impl.get_n_synapse_types())
+            for post_vertex in group)
+        options = list()
+        delay_per_stage = default_delay
+        while True:
+            option = self.__get_option(
+                group, app_edges, delay_per_stage, delay_per_stage ==
+                default_delay, n_synapse_bits, time_step_ms)
+            if option is not None:
+                options.append(option)
+            if (delay_per_stage * time_step_ms >= max_delay_ms or
+                    get_n_bits(delay_per_stage * 2) + n_synapse_bits >
+                    _MAX_RING_BUFFER_BITS):
+                break
+            delay_per_stage *= 2
+
+        if not options:
+            return DelayPlan(
+                group, max_delay_ms, options, None,
+                "no delay that a core can support can be extended far"
+                " enough")
+        chosen = min(options, key=lambda option: (
+            option.n_post_cores + option.n_delay_cores,
+            option.n_delayed_rows, option.delay_per_stage))
+        if chosen.delay_per_stage == default_delay:
+            reason = "the default delay needs the fewest cores"
+        elif chosen.n_delay_cores == 0:
+            reason = "a delay of {} covers all the delays, so no delay" \
+                " extensions are needed".format(chosen.delay_per_stage)
+        else:
+            reason = "a delay of {} needs the fewest cores and delayed" \
+                " rows".format(chosen.delay_per_stage)
+        return DelayPlan(group, max_delay_ms, options, chosen, reason)
+
+    @staticmethod
+    def __get_option(
+            group, app_edges, delay_per_stage, is_default, n_synapse_bits,
+            time_step_ms):
+        """ Work out the cost of a delay per stage, if it can be used
+
+        :rtype: DelayOption or None
+        """
+        stage_ms = delay_per_stage * time_step_ms
+        max_extended_ms = (
+            DelayExtensionVertex.get_max_delay_ticks_supported(
+                delay_per_stage) + delay_per_stage) * time_step_ms
+
+        # The neurons per core are limited by the size of the ring buffers,
+        # except at the default delay, which the cores support already
+        n_atoms_per_core = list()
+        n_post_cores = 0
+        post_slices = dict()
+        for post_vertex in group:
+            n_atoms = min(
+                post_vertex.get_max_atoms_per_core(), post_vertex.n_atoms)
+            if not is_default:
+                n_atoms = min(n_atoms, 2 ** (
+                    _MAX_RING_BUFFER_BITS - get_n_bits(delay_per_stage) -
+                    n_synapse_bits))
+            n_atoms_per_core.append(n_atoms)
+            n_post_cores += int(math.ceil(post_vertex.n_atoms / n_atoms))
+            post_slices[post_vertex] = Slice(0, n_atoms - 1)
+
+        # Each source with a delay longer than the stage needs as many delay
+        # extension cores as it has cores, with enough stages for the
+        # longest delay; each stage has a delayed row for each source neuron
+        stages_by_pre = dict()
+        n_delayed_rows = 0
+        n_empty_delayed_rows = 0
+        for app_edge in app_edges:
+            edge_max_ms = DelayPlanner.__get_max_delay_ms(app_edge)
+            if edge_max_ms > max_extended_ms:
+                return None
+            n_stages = int(math.ceil(edge_max_ms / stage_ms)) - 1
+            if n_stages <= 0:
+                continue
+            pre_vertex = app_edge.pre_vertex
+            stages_by_pre[pre_vertex] = max(
+                n_stages, stages_by_pre.get(pre_vertex, 0))
+            n_delayed_rows += n_stages * pre_vertex.n_atoms
+            # The delays are whole time steps, so the range of each stage
+            # is taken from half a time step past its ends to be safe from
+            # rounding
+            for stage in range(1, n_stages + 1):
+                if not any(
+                        synapse_info.connector
+                        .get_n_connections_from_pre_vertex_maximum(
+                            post_slices[app_edge.post_vertex], synapse_info,
+                            (stage * delay_per_stage + 0.5) * time_step_ms,
+                            ((stage + 1) * delay_per_stage + 0.5) *
+                            time_step_ms)
+                        for synapse_info in app_edge.synapse_information):
+                    n_empty_delayed_rows += pre_vertex.n_atoms
+        n_delay_cores = sum(
+            int(math.ceil(pre_vertex.n_atoms /
+                          pre_vertex.get_max_atoms_per_core()))
+            for pre_vertex in stages_by_pre)
+
+        return DelayOption(
+            delay_per_stage, n_atoms_per_core, n_post_cores, n_delay_cores,
+            max(stages_by_pre.values(), default=0), n_delayed_rows,
+            n_empty_delayed_rows)
+
+
+def write_delay_plan_report(plans):
+    """ Write a report of the delays planned for populations and the other\
+        delays that were considered
+
+    :param list(DelayPlan) plans: The plans made
+    """
+    file_name = os.path.join(report_default_directory(), _REPORT_NAME)
+    try:
+        with open(file_name, "w") as f:
+            for plan in plans:
+                _write_plan(f, plan)
+    except IOError:
+        logger.exception("Could not write the delay plan report {}",
+                         file_name)
+
+
+def _write_plan(f, plan):
+    """
+    :param ~io.TextIOBase f:
+    :param DelayPlan plan:
+    """
+    f.write("Populations {} (delays up to {}ms):\n".format(
+        ", ".join(vertex.label for vertex in plan.app_vertices),
+        plan.max_delay_ms))
+    if plan.chosen is None:
+        f.write("    Not planned: {}\n".format(plan.reason))
+    else:
+        f.write("    Chose a delay of {} time steps: {}\n".format(
+            plan.chosen.delay_per_stage, plan.reason))
+    for option in plan.options:
+        f.write(
+            "        Delay {}: {} neurons per core, {} population cores,"
+            " {} delay extension cores, {} delay stages, {} delayed rows"
+            " of which {} are in empty stages\n".format(
+                option.delay_per_stage,
+                "/".join(str(n) for n in option.n_atoms_per_core),
+                option.n_post_cores, option.n_delay_cores,
+                option.n_delay_stages, option.n_delayed_rows,
+                option.n_empty_delayed_rows))
+    f.write("\n")
@@ -15,11 +15,14 @@
 import logging
 import math
 
+from spinn_utilities.config_holder import get_config_bool
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.progress_bar import ProgressBar
 from spinn_front_end_common.utilities.globals_variables import (
     machine_time_step_ms)
 from spynnaker.pyNN.exceptions import DelayExtensionException
+from spynnaker.pyNN.extra_algorithms.delay_planner import (
+    DelayPlanner, write_delay_plan_report)
 from spynnaker.pyNN.extra_algorithms.splitter_components import (
     AbstractSpynnakerSplitterDelay, SplitterDelayVertexSlice)
 from spynnaker.pyNN.models.neural_projections import (
@@ -76,6 +79,10 @@ class DelaySupportAdder(object):
             the app graph
         """
 
+        # choose the delays of the populations before they are used below
+        if get_config_bool("Simulation", "plan_delays"):
+            self._plan_delays(app_graph)
+
         # progress abr and data holders
         progress = ProgressBar(
             len(list(app_graph.outgoing_edge_partitions)),
@@ -109,6 +116,20 @@ class DelaySupportAdder(object):
         # avoids mutating the list of outgoing partitions. add them afterwards
         self._add_new_app_edges(app_graph)
 
+    @staticmethod
+    def _plan_delays(app_graph):
+        """ choose the delays that the populations support themselves from\
+            the delays of their incoming projections, and report the choices.
+
+        :param ApplicationGraph app_graph: app graph
+        :rtype: None
+        """
+        plans = DelayPlanner().plan(app_graph)
+        for plan in plans:
+            DelayPlanner.apply(plan)
+        if plans and get_config_bool("Reports", "write_delay_plan_report"):
+            write_delay_plan_report(plans)
+
     def _add_new_app_edges(self, app_graph):
         """ adds new edges to the app graph. avoids mutating the arrays being\
             iterated over previously.
@@ -0,0 +1,45 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.config_holder import get_config_bool
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+from .key_grouper import write_key_group_report
+
+
+class KeyGroupReport(object):
+    """ Reports the populations sharing blocks of keys, if any, and the\
+        routing table entries of each chip before and after compression
+    """
+
+    __slots__ = []
+
+    def __call__(self, app_graph, router_tables):
+        """
+        :param ~pacman.model.graphs.application.ApplicationGraph app_graph:
+            The graph of the populations
+        :param ~pacman.model.routing_tables.MulticastRoutingTables \
+                router_tables:
+            The routing tables before compression
+        """
+        if not get_config_bool("Reports", "write_key_group_report"):
+            return
+
+        key_groups = list()
+        for app_vertex in app_graph.vertices:
+            if (isinstance(app_vertex, AbstractPopulationVertex) and
+                    app_vertex.key_group is not None and
+                    app_vertex.key_group not in key_groups):
+                key_groups.append(app_vertex.key_group)
+        write_key_group_report(key_groups, router_tables)
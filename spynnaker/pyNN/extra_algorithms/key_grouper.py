@@ -0,0 +1,300 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import os
+from collections import defaultdict, namedtuple
+from spinn_utilities.config_holder import get_config_int
+from spinn_utilities.log import FormatAdapter
+from pacman.model.constraints.key_allocator_constraints import (
+    FixedKeyAndMaskConstraint)
+from pacman.model.routing_info import BaseKeyAndMask
+from pacman.operations.router_compressors.pair_compressor import (
+    PairCompressor)
+from pacman.utilities.constants import FULL_MASK, BITS_IN_KEY
+from spinn_front_end_common.abstract_models import (
+    AbstractProvidesOutgoingPartitionConstraints)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utilities.globals_variables import (
+    report_default_directory)
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# The name of the report of the key groups
+_REPORT_NAME = "key_groups.rpt"
+
+#: A block of keys shared by small populations with the same targets; each
+#: member has the keys from the base key plus its index times the stride
+KeyGroup = namedtuple("KeyGroup", ["key", "mask", "stride", "members"])
+
+#: The routing table entries that match the keys of a key group on a chip,
+#: before and after the table is compressed
+KeyGroupRoutes = namedtuple(
+    "KeyGroupRoutes", ["x", "y", "n_entries", "n_entries_compressed"])
+
+
+def _next_power_of_2(value):
+    """
+    :param int value:
+    :rtype: int
+    """
+    return 1 << max(0, value - 1).bit_length()
+
+
+def _fixed_keys_and_masks(machine_graph):
+    """ Find the keys and masks that the partitions of the graph will be\
+        constrained to, as the constraints are gathered before the keys are\
+        allocated
+
+    :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+    :rtype: list(~pacman.model.routing_info.BaseKeyAndMask)
+    """
+    keys_and_masks = list()
+    for partition in machine_graph.outgoing_edge_partitions:
+        vertex = partition.pre_vertex
+        constraints = list(partition.constraints) + list(vertex.constraints)
+        if isinstance(vertex, AbstractProvidesOutgoingPartitionConstraints):
+            constraints.extend(
+                vertex.get_outgoing_partition_constraints(partition))
+        elif isinstance(vertex.app_vertex,
+                        AbstractProvidesOutgoingPartitionConstraints):
+            constraints.extend(
+                vertex.app_vertex.get_outgoing_partition_constraints(
+                    partition))
+        for constraint in constraints:
+            if isinstance(constraint, FixedKeyAndMaskConstraint):
+                keys_and_masks.extend(constraint.keys_and_masks)
+    return keys_and_masks
+
+
+def _overlaps(key, mask, keys_and_masks):
+    """ Whether a key and mask matches any of the same keys as any of some\
+        others
+
+    :param int key:
+    :param int mask:
+    :param keys_and_masks: Anything with a key and a mask
+    :type keys_and_masks:
+        iterable(~pacman.model.routing_info.BaseKeyAndMask)
+    :rtype: bool
+    """
+    return any(
+        (key & mask & other.mask) == (other.key & mask & other.mask)
+        for other in keys_and_masks)
+
+
+class KeyGrouper(object):
+    """ Gives small populations that send spikes to the same cores a block\
+        of keys between them, so that a routing table compressor can more\
+        easily merge their entries on the chips that carry them.
+
+    Only the keys change; the routing table entries are made and compressed\
+    as usual, so any saving is made by the compressor, which may already\
+    merge the entries of keys that are not grouped.  The master population\
+    tables still have an entry for each population.
+
+    Each population in a group must have one core, so that its keys are in\
+    one range.  The members of a group have ranges of the same size, one\
+    after the other, in a block that is aligned to its size.  The blocks are\
+    fixed at the top of the key space so that the other keys are allocated\
+    around them, and are moved down past any keys that are already fixed,\
+    such as those of spike injectors and external devices.
+    """
+
+    __slots__ = [
+        # The most neurons a population can have to be put in a group
+        "__max_atoms"]
+
+    def __init__(self, max_atoms=None):
+        """
+        :param max_atoms:
+            The most neurons a population can have to be put in a group, or\
+            None to use the value in the configuration
+        :type max_atoms: int or None
+        :raises ConfigurationException: If the number is out of range
+        """
+        if max_atoms is None:
+            max_atoms = get_config_int("Mapping", "key_group_max_atoms")
+        if max_atoms < 1:
+            raise ConfigurationException(
+                "The most neurons in a population that shares keys must be"
+                " at least 1, not {}".format(max_atoms))
+        self.__max_atoms = max_atoms
+
+    def group(self, app_graph, machine_graph):
+        """ Put the small populations with the same targets into key groups
+
+        :param ~pacman.model.graphs.application.ApplicationGraph app_graph:
+            The graph of the populations
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+            The graph of their cores
+        :return: The groups made
+        :rtype: list(KeyGroup)
+        """
+        # Only the spikes of a population on one core are in one range
+        spike_partitions = defaultdict(list)
+        for partition in machine_graph.outgoing_edge_partitions:
+            if partition.identifier == SPIKE_PARTITION_ID:
+                spike_partitions[partition.pre_vertex.app_vertex].append(
+                    partition)
+
+        candidates = defaultdict(list)
+        for app_vertex in app_graph.vertices:
+            if not isinstance(app_vertex, AbstractPopulationVertex):
+                continue
+            app_vertex.set_key_group(None, None)
+            partitions = spike_partitions[app_vertex]
+            if app_vertex.n_atoms <= self.__max_atoms and \
+                    len(partitions) == 1 and partitions[0].edges:
+                targets = frozenset(
+                    edge.post_vertex for edge in partitions[0].edges)
+                stride = _next_power_of_2(app_vertex.n_atoms)
+                candidates[targets, stride].append(app_vertex)
+
+        # The blocks go down from the top of the key space, biggest first so
+        # that each block is aligned to its size, skipping over fixed keys
+        groups = sorted(
+            ((stride, members)
+             for (_, stride), members in candidates.items()
+             if len(members) > 1),
+            key=lambda group: -group[0] * _next_power_of_2(len(group[1])))
+        fixed_keys_and_masks = _fixed_keys_and_masks(machine_graph)
+        next_key = 1 << BITS_IN_KEY
+        key_groups = list()
+        for stride, members in groups:
+            n_keys = stride * _next_power_of_2(len(members))
+            mask = FULL_MASK & ~(n_keys - 1)
+            key = next_key - n_keys
+            while key >= 0 and _overlaps(key, mask, fixed_keys_and_masks):
+                key -= n_keys
+            if key < 0:
+                logger.warning(
+                    "Not sharing keys between {}, as there is no block of {}"
+                    " keys that is free of fixed keys",
+                    ", ".join(vertex.label for vertex in members), n_keys)
+                continue
+            next_key = key
+            key_group = KeyGroup(next_key, mask, stride, members)
+            for index, app_vertex in enumerate(members):
+                app_vertex.set_key_group(key_group, BaseKeyAndMask(
+                    next_key + index * stride, FULL_MASK & ~(stride - 1)))
+            key_groups.append(key_group)
+        return key_groups
+
+
+def compress_router_tables(router_tables):
+    """ Compress each routing table with the pair compressor, as the\
+        tables are compressed by default
+
+    :param ~pacman.model.routing_tables.MulticastRoutingTables router_tables:
+        The routing tables before compression
+    :return: The compressed entries of each chip by its coordinates
+    :rtype: dict(tuple(int, int), list)
+    """
+    compressor = PairCompressor()
+    return {
+        (table.x, table.y): compressor.compress_table(table)
+        for table in router_tables.routing_tables}
+
+
+def count_key_group_routes(key_group, router_tables, compressed_tables):
+    """ Count the entries that match the keys of a key group in each\
+        routing table, before and after compression
+
+    :param KeyGroup key_group: The group
+    :param ~pacman.model.routing_tables.MulticastRoutingTables router_tables:
+        The routing tables before compression
+    :param dict(tuple(int, int), list) compressed_tables:
+        The compressed entries of each chip, as from
+        :py:func:`compress_router_tables`
+    :rtype: list(KeyGroupRoutes)
+    """
+    block = [BaseKeyAndMask(key_group.key, key_group.mask)]
+    group_routes = list()
+    for table in router_tables.routing_tables:
+        n_entries = sum(
+            1 for entry in table.multicast_routing_entries
+            if _overlaps(entry.routing_entry_key, entry.mask, block))
+        if n_entries:
+            group_routes.append(KeyGroupRoutes(
+                table.x, table.y, n_entries, sum(
+                    1 for entry in compressed_tables[table.x, table.y]
+                    if _overlaps(entry.key, entry.mask, block))))
+    return group_routes
+
+
+def write_key_group_report(key_groups, router_tables):
+    """ Write the key groups and the routing table entries before and after\
+        compression
+
+    :param list(KeyGroup) key_groups: The groups, which may be empty
+    :param ~pacman.model.routing_tables.MulticastRoutingTables router_tables:
+        The routing tables before compression
+    """
+    file_name = os.path.join(report_default_directory(), _REPORT_NAME)
+    try:
+        with open(file_name, "w") as f:
+            _write_key_groups(f, key_groups, router_tables)
+    except IOError:
+        logger.exception("Could not write the key group report {}",
+                         file_name)
+
+
+def _write_key_groups(f, key_groups, router_tables):
+    """
+    :param ~io.TextIOBase f:
+    :param list(KeyGroup) key_groups:
+    :param ~pacman.model.routing_tables.MulticastRoutingTables router_tables:
+    """
+    f.write("Key groups only change the keys of their members; the routing"
+            " table entries are\nmade as usual and compressed here with the"
+            " pair compressor.  The master\npopulation table entries are"
+            " unchanged.  Compare the totals with a run without\n"
+            "group_small_population_keys to see the effect of the groups.\n\n")
+    compressed_tables = compress_router_tables(router_tables)
+    for key_group in key_groups:
+        f.write("Key 0x{:08x} mask 0x{:08x} ({} keys per population):\n"
+                .format(key_group.key, key_group.mask, key_group.stride))
+        for index, app_vertex in enumerate(key_group.members):
+            f.write("    0x{:08x}: {}\n".format(
+                key_group.key + index * key_group.stride, app_vertex.label))
+        group_routes = count_key_group_routes(
+            key_group, router_tables, compressed_tables)
+        for routes in group_routes:
+            f.write("    Chip ({}, {}): {} entries, {} after compression\n"
+                    .format(routes.x, routes.y, routes.n_entries,
+                            routes.n_entries_compressed))
+        f.write("    {} entries, {} after compression\n\n".format(
+            sum(routes.n_entries for routes in group_routes),
+            sum(routes.n_entries_compressed for routes in group_routes)))
+
+    f.write("{} populations in {} groups\n".format(
+        sum(len(key_group.members) for key_group in key_groups),
+        len(key_groups)))
+    total_entries = 0
+    total_compressed = 0
+    for table in router_tables.routing_tables:
+        n_compressed = len(compressed_tables[table.x, table.y])
+        f.write("Chip ({}, {}): {} entries, {} after compression\n".format(
+            table.x, table.y, table.number_of_entries, n_compressed))
+        total_entries += table.number_of_entries
+        total_compressed += n_compressed
+    f.write("All chips: {} entries, {} after compression, {} on the largest"
+            " table\n".format(
+                total_entries, total_compressed,
+                max((len(entries) for entries in compressed_tables.values()),
+                    default=0)))
@@ -13,9 +13,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from collections import defaultdict
 import os
 import struct
+import numpy
 from spinn_utilities.config_holder import get_config_bool
 from spinn_utilities.progress_bar import ProgressBar
 from spinnman.model import ExecutableTargets
@@ -25,34 +25,124 @@ from spinn_front_end_common.abstract_models import (
 from spinn_front_end_common.utilities import system_control_logic
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.utility_objs import ExecutableType
-from spinn_front_end_common.utilities.helpful_functions import n_word_struct
 from spinn_front_end_common.utilities.globals_variables import (
     report_default_directory)
 
 _THREE_WORDS = struct.Struct("<III")
 # bits in a word
 _BITS_IN_A_WORD = 32
-# bit to mask a bit
-_BIT_MASK = 1
+# Bottom 30 bits
+_N_WORDS_MASK = 0x3FFFFFFF
+# master pop key, n words and read pointer; filter_info_t
+_FILTER_INFO_DTYPE = numpy.dtype(
+    [("key", "<u4"), ("n_words", "<u4"), ("read_pointer", "<u4")])
+# The largest gap in bytes between bitfields that is read over rather than
+# starting another read
+_MAX_READ_GAP = 1024
 
 
-def _bit_for_neuron_id(bitfield, neuron_id):
-    """ Get the bit for a neuron in the bitfield.
+def _percent(amount, total):
+    """ The percentage that amount is of total, or 0 where total is 0.
 
-    :param list(int) bitfield:
-        the block of words which represent the bitfield
-    :param int neuron_id: the neuron id to find the bit in the bitfield
-    :return: the bit (``0`` or ``1``)
-    :rtype: int
+    :param amount: the amount or amounts
+    :type amount: int or ~numpy.ndarray
+    :param total: the total or totals
+    :type total: int or ~numpy.ndarray
+    :rtype: float or ~numpy.ndarray
     """
-    word_id, bit_in_word = divmod(neuron_id, _BITS_IN_A_WORD)
-    return (bitfield[word_id] >> bit_in_word) & _BIT_MASK
-
-
-def _percent(amount, total):
-    if total == 0:
-        return 0.0
-    return (100.0 * amount) / float(total)
+    amount = numpy.asarray(amount, dtype="float64")
+    total = numpy.asarray(total, dtype="float64")
+    percent = numpy.divide(
+        100.0 * amount, total, out=numpy.zeros(numpy.broadcast(
+            amount, total).shape), where=(total != 0))
+    if percent.ndim == 0:
+        return float(percent)
+    return percent
+
+
+def _read_runs(starts, n_bytes):
+    """ Group byte ranges into runs that can each be read in one go.
+
+    :param ~numpy.ndarray starts: The start address of each range
+    :param ~numpy.ndarray n_bytes: The size of each range; must not be 0
+    :return: the run of each range and the start and end of each run
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+    """
+    order = numpy.argsort(starts, kind="stable")
+    sorted_starts = starts[order]
+    sorted_ends = numpy.maximum.accumulate(sorted_starts + n_bytes[order])
+    new_run = numpy.ones(len(order), dtype="bool")
+    new_run[1:] = sorted_starts[1:] > sorted_ends[:-1] + _MAX_READ_GAP
+    run_index = numpy.cumsum(new_run) - 1
+    runs = numpy.empty_like(run_index)
+    runs[order] = run_index
+    run_starts = sorted_starts[new_run]
+    run_ends = sorted_ends[numpy.append(numpy.nonzero(new_run)[0][1:] - 1,
+                                        len(order) - 1)]
+    return runs, run_starts, run_ends
+
+
+def _read_bit_fields(transceiver, placement):
+    """ Reads back the bitfields that have been placed on a vertex.
+
+    The headers of the bitfields are read in one go, and the bitfields
+    themselves in as few reads as their placement in memory allows.
+
+    :param ~spinnman.transceiver.Transceiver transceiver:
+        How to read the memory of the machine
+    :param ~.Placement placement:
+        The vertex must support AbstractSupportsBitFieldGeneration
+    :returns: the master population key of each bitfield, the number of
+        bits in each bitfield, and the bits of all the bitfields one
+        after another, one byte per bit
+    :rtype: tuple(~numpy.ndarray,~numpy.ndarray,~numpy.ndarray)
+    """
+    x, y = placement.x, placement.y
+
+    # get bitfield address
+    address = placement.vertex.bit_field_base_address(
+        transceiver, placement)
+
+    # read how many bitfields there are; header of filter_region_t
+    _merged, _redundant, total = _THREE_WORDS.unpack(
+        transceiver.read_memory(x, y, address, _THREE_WORDS.size))
+    address += _THREE_WORDS.size
+
+    # read in the filter_info_t of every bitfield
+    if total:
+        infos = numpy.frombuffer(transceiver.read_memory(
+            x, y, address, total * _FILTER_INFO_DTYPE.itemsize),
+            dtype=_FILTER_INFO_DTYPE)
+    else:
+        infos = numpy.zeros(0, dtype=_FILTER_INFO_DTYPE)
+    # Mask off merged and all_ones flag bits
+    n_words = (infos["n_words"] & _N_WORDS_MASK).astype("int64")
+
+    # get bitfield words, reading each run of nearby bitfields at once
+    words = numpy.zeros(int(n_words.sum()), dtype="<u4")
+    offsets = numpy.cumsum(n_words) - n_words
+    present = numpy.nonzero(n_words)[0]
+    if len(present):
+        starts = infos["read_pointer"][present].astype("int64")
+        runs, run_starts, run_ends = _read_runs(
+            starts, n_words[present] * BYTES_PER_WORD)
+        for run, (start, end) in enumerate(zip(
+                run_starts.tolist(), run_ends.tolist())):
+            data = numpy.frombuffer(transceiver.read_memory(
+                x, y, start, end - start), dtype="<u4")
+            in_run = runs == run
+            counts = n_words[present[in_run]]
+            src = (starts[in_run] - start) // BYTES_PER_WORD
+            dst = offsets[present[in_run]]
+            # The position of each word within its own bitfield
+            position = numpy.arange(int(counts.sum())) - numpy.repeat(
+                numpy.cumsum(counts) - counts, counts)
+            words[numpy.repeat(dst, counts) + position] = data[
+                numpy.repeat(src, counts) + position]
+    # Bit i of a bitfield is bit i % 32 of word i // 32
+    bits = numpy.fliplr(numpy.unpackbits(
+        words.byteswap().view("uint8")).reshape((-1, 32))).reshape(-1)
+    return infos["key"], n_words * _BITS_IN_A_WORD, bits
 
 
 class OnChipBitFieldGenerator(object):
@@ -68,9 +158,6 @@ class OnChipBitFieldGenerator(object):
     _BIT_FIELD_REPORT_FILENAME = "generated_bit_fields.rpt"
     _BIT_FIELD_SUMMARY_REPORT_FILENAME = "bit_field_summary.rpt"
 
-    # Bottom 30 bits
-    _N_WORDS_MASK = 0x3FFFFFFF
-
     # binary name
     _BIT_FIELD_EXPANDER_APLX = "bit_field_expander.aplx"
 
@@ -149,45 +236,56 @@ class OnChipBitFieldGenerator(object):
         :param ~.ApplicationGraph app_graph: app graph
         :param str file_path: Where to write to
         """
-        chip_packet_count = defaultdict(int)
-        chip_redundant_count = defaultdict(int)
         progress = ProgressBar(
             app_graph.n_vertices,
             "reading back bitfields from chip for summary report")
+        cores = list()
+        totals = list()
+        redundants = list()
+        # read in for each app vertex that would have a bitfield
+        for app_vertex in progress.over(app_graph.vertices):
+            # get machine verts
+            for placement in self.__bitfield_placements(app_vertex):
+                _keys, _n_bits, bits = self.__bitfields(placement)
+                cores.append(placement)
+                totals.append(len(bits))
+                redundants.append(len(bits) - numpy.count_nonzero(bits))
+        totals = numpy.array(totals, dtype="int64")
+        redundants = numpy.array(redundants, dtype="int64")
+
+        # Sum up over the chips, in the order they were first seen
+        xys = numpy.array(
+            [(placement.x, placement.y) for placement in cores],
+            dtype="int64").reshape(-1, 2)
+        chips, first, chip_index = numpy.unique(
+            xys, axis=0, return_index=True, return_inverse=True)
+        chip_index = chip_index.reshape(-1)
+        chip_order = numpy.argsort(first)
+        chip_totals = numpy.bincount(
+            chip_index, totals, minlength=len(chips)).astype("int64")
+        chip_redundants = numpy.bincount(
+            chip_index, redundants, minlength=len(chips)).astype("int64")
+
         with open(file_path, "w") as output:
-            # read in for each app vertex that would have a bitfield
-            for app_vertex in progress.over(app_graph.vertices):
-                # get machine verts
-                for placement in self.__bitfield_placements(app_vertex):
-                    local_total = 0
-                    local_redundant = 0
-                    xy = (placement.x, placement.y)
-                    for _, n_neurons, bitfield in self.__bitfields(placement):
-                        for neuron_id in range(n_neurons):
-                            if not _bit_for_neuron_id(bitfield, neuron_id):
-                                chip_redundant_count[xy] += 1
-                                local_redundant += 1
-                        local_total += n_neurons
-                    chip_packet_count[xy] = local_total
-                    output.write(self._PER_CORE_SUMMARY.format(
-                        placement.x, placement.y, placement.p,
-                        placement.vertex.label,
-                        local_total, local_redundant,
-                        _percent(local_redundant, local_total)))
+            for placement, total, redundant, percent in zip(
+                    cores, totals.tolist(), redundants.tolist(),
+                    _percent(redundants, totals).tolist()):
+                output.write(self._PER_CORE_SUMMARY.format(
+                    placement.x, placement.y, placement.p,
+                    placement.vertex.label, total, redundant, percent))
 
             output.write("\n\n\n")
 
             # overall summary
-            total_packets = 0
-            total_redundant_packets = 0
-            for xy in chip_packet_count:
-                x, y = xy
+            chip_percents = _percent(chip_redundants, chip_totals)
+            for i in chip_order.tolist():
+                x, y = chips[i].tolist()
                 output.write(self._PER_CHIP_SUMMARY.format(
-                    x, y, chip_packet_count[xy], chip_redundant_count[xy],
-                    _percent(chip_redundant_count[xy], chip_packet_count[xy])))
-                total_packets += chip_packet_count[xy]
-                total_redundant_packets += chip_redundant_count[xy]
+                    x, y, int(chip_totals[i]), int(chip_redundants[i]),
+                    float(chip_percents[i])))
 
+            total_packets = int(totals.sum())
+            total_redundant_packets = int(redundants.sum())
             output.write(self._OVERALL_SUMMARY.format(
                 total_packets, total_redundant_packets,
                 _percent(total_redundant_packets, total_packets)))
@@ -215,12 +313,14 @@ class OnChipBitFieldGenerator(object):
         f.write(self._CORE_DETAIL.format(
             placement.x, placement.y, placement.p, placement.vertex.label))
 
-        for master_pop_key, n_bits, bitfield in self.__bitfields(placement):
+        keys, n_bits, bits = self.__bitfields(placement)
+        offsets = numpy.cumsum(n_bits)[:-1]
+        for master_pop_key, bitfield in zip(
+                keys.tolist(), numpy.split(bits, offsets)):
             # put into report
-            for neuron_id in range(n_bits):
-                f.write(self._FIELD_DETAIL.format(
-                    master_pop_key, neuron_id,
-                    _bit_for_neuron_id(bitfield, neuron_id)))
+            f.write("".join(
+                self._FIELD_DETAIL.format(master_pop_key, neuron_id, bit)
+                for neuron_id, bit in enumerate(bitfield.tolist())))
 
     def __bitfield_placements(self, app_vertex):
         """ The placements of the machine vertices of the given app vertex \
@@ -238,38 +338,9 @@ class OnChipBitFieldGenerator(object):
 
         :param ~.Placement placement:
             The vertex must support AbstractSupportsBitFieldGeneration
-        :returns: sequence of (master population key, num bits, bitfield data)
-        :rtype: iterable(tuple(int,int,list(int)))
+        :rtype: tuple(~numpy.ndarray,~numpy.ndarray,~numpy.ndarray)
         """
-        # get bitfield address
-        address = placement.vertex.bit_field_base_address(
-            self.__txrx, placement)
-
-        # read how many bitfields there are; header of filter_region_t
-        _merged, _redundant, total = _THREE_WORDS.unpack(
-            self.__txrx.read_memory(
-                placement.x, placement.y, address, _THREE_WORDS.size))
-        address += _THREE_WORDS.size
-
-        # read in each bitfield
-        for _bit_field_index in range(total):
-            # master pop key, n words and read pointer; filter_info_t
-            master_pop_key, n_words, read_pointer = _THREE_WORDS.unpack(
-                self.__txrx.read_memory(
-                    placement.x, placement.y, address, _THREE_WORDS.size))
-            address += _THREE_WORDS.size
-            # Mask off merged and all_ones flag bits
-            n_words &= self._N_WORDS_MASK
-
-            # get bitfield words
-            if n_words:
-                bitfield = n_word_struct(n_words).unpack(
-                    self.__txrx.read_memory(
-                        placement.x, placement.y, read_pointer,
-                        n_words * BYTES_PER_WORD))
-            else:
-                bitfield = []
-            yield master_pop_key, n_words * _BITS_IN_A_WORD, bitfield
+        return _read_bit_fields(self.__txrx, placement)
 
     def _calculate_core_data(self, app_graph, progress):
         """ gets the data needed for the bit field expander for the machine
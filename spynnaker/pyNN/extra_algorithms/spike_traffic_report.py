@@ -0,0 +1,360 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import csv
+import logging
+import os
+import re
+from collections import defaultdict, namedtuple
+import numpy
+from spinn_utilities.config_holder import get_config_bool
+from spinn_utilities.log import FormatAdapter
+from spinn_front_end_common.utilities.globals_variables import (
+    machine_time_step_per_ms, report_default_directory)
+from spynnaker.pyNN.models.neural_projections import (
+    DelayedApplicationEdge, ProjectionApplicationEdge)
+from spynnaker.pyNN.models.neuron import (
+    PopulationMachineVertex, PopulationSynapsesMachineVertexCommon)
+from spynnaker.pyNN.models.neuron.population_machine_synapses_provenance \
+    import PopulationMachineSynapsesProvenance
+from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
+try:
+    from matplotlib.figure import Figure
+    _matplotlib_missing = False
+except ImportError:
+    _matplotlib_missing = True
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# The names of the files written
+_CSV_NAME = "spike_traffic.csv"
+_NPZ_NAME = "spike_traffic.npz"
+_PNG_NAME = "spike_traffic.png"
+
+# The label of the row for packets that matched no incoming projection
+UNMATCHED = "(no matching projection)"
+
+# The core that provenance is from, as the start of the first name
+_CORE_NAME = re.compile(r"vertex_(\d+)_(\d+)_(\d+)_")
+
+# The provenance names counted, which differ a little between the cores
+# that do both neurons and synapses and the cores that do only synapses
+_GHOSTS = {PopulationMachineSynapsesProvenance.GHOST_SEARCHES}
+_INVALID = {PopulationMachineSynapsesProvenance.INVALID_MASTER_POP_HITS}
+_FILTERED = {PopulationMachineSynapsesProvenance.BIT_FIELD_FILTERED_PACKETS}
+_PROCESSED = {PopulationMachineVertex.SPIKES_PROCESSED,
+              PopulationSynapsesMachineVertexCommon.SPIKES_PROCESSED}
+_DMAS = {PopulationMachineVertex.DMA_COMPLETE,
+         PopulationSynapsesMachineVertexCommon.DMA_COMPLETE}
+
+#: The spike traffic of a run.  The matrices have a row for each
+#: population sending spikes, then one for packets that matched no
+#: projection, and a column for each core receiving them; the grids have
+#: the totals of each chip, indexed by x and then y.  The provenance only
+#: counts the packets of each core, so the traffic of each population is
+#: estimated, but the silent sources (the neurons of a population with no
+#: synapses on a core, or NaN where they can't be counted) and the totals
+#: of each core and chip are not.
+SpikeTraffic = namedtuple(
+    "SpikeTraffic",
+    ["pre_labels", "post_cores", "post_labels", "silent_sources",
+     "estimated_received", "estimated_redundant", "estimated_dmas",
+     "chip_received", "chip_redundant", "chip_dmas"])
+
+#: A pair of sending population and receiving core, with its traffic
+HotSpot = namedtuple(
+    "HotSpot",
+    ["pre_label", "x", "y", "p", "post_label", "silent_sources",
+     "estimated_redundant", "estimated_dmas", "estimated_received"])
+
+
+def _core_counts(provenance_items):
+    """ Total the counts of the synapse provenance of each core
+
+    :param list(ProvenanceDataItem) provenance_items:
+    :return: the received, redundant (filtered, invalid and ghost), \
+        processed and DMA counts, by core
+    :rtype: dict(tuple(int,int,int), dict(str,int))
+    """
+    counts = defaultdict(lambda: defaultdict(int))
+    for item in provenance_items:
+        match = _CORE_NAME.match(item.names[0])
+        if match is None:
+            continue
+        core = tuple(int(i) for i in match.groups())
+        name = item.names[-1]
+        for kind, names in (
+                ("ghosts", _GHOSTS), ("invalid", _INVALID),
+                ("filtered", _FILTERED), ("processed", _PROCESSED),
+                ("dmas", _DMAS)):
+            if name in names:
+                counts[core][kind] += item.value
+    return counts
+
+
+def _count_silent_sources(machine_edge):
+    """ Count the neurons sending along an edge that have no synapses on\
+        the core it goes to, so that their spikes are only ever filtered out\
+        or find an empty row.  This is only done where the blocks were made\
+        on the host and use no random numbers, so that making them again\
+        gives the same connections as were loaded.
+
+    :param ~pacman.model.graphs.machine.MachineEdge machine_edge:
+    :return: The number of neurons, or None if they can't be counted
+    :rtype: int or None
+    """
+    app_edge = machine_edge.app_edge
+    delayed = isinstance(app_edge, DelayedApplicationEdge)
+    if delayed:
+        app_edge = app_edge.undelayed_edge
+    if not isinstance(app_edge, ProjectionApplicationEdge):
+        return None
+    synapse_infos = app_edge.synapse_information
+    if any(synapse_info.may_generate_on_machine() or
+           synapse_info.connector.uses_random_numbers(synapse_info)
+           for synapse_info in synapse_infos):
+        return None
+
+    # The rows of a delay extension have the synapses with delays that the
+    # core can't do itself, and those of a population the rest
+    pre_slice = machine_edge.pre_vertex.vertex_slice
+    post_slice = machine_edge.post_vertex.vertex_slice
+    pre_slices = app_edge.pre_vertex.splitter.get_out_going_slices()[0]
+    post_slices = app_edge.post_vertex.splitter.get_in_coming_slices()[0]
+    max_delay = app_edge.post_vertex.splitter.max_support_delay()
+    has_synapses = numpy.zeros(pre_slice.n_atoms, dtype="bool")
+    for synapse_info in synapse_infos:
+        block = synapse_info.connector.create_synaptic_block(
+            pre_slices, post_slices, pre_slice, post_slice,
+            synapse_info.synapse_type, synapse_info)
+        is_delayed = numpy.rint(
+            block["delay"] * machine_time_step_per_ms()) > max_delay
+        has_synapses[block["source"][is_delayed == delayed].astype(
+            "int64") - pre_slice.lo_atom] = True
+    return pre_slice.n_atoms - int(numpy.count_nonzero(has_synapses))
+
+
+def _senders(machine_vertex, machine_graph):
+    """ Count the neurons that each population sends spikes to a core from,\
+        and how many of them are silent sources
+
+    :param ~pacman.model.graphs.machine.MachineVertex machine_vertex:
+    :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+    :return: The numbers of neurons and silent sources (or NaN if they\
+        can't be counted), by population
+    :rtype: dict(~pacman.model.graphs.application.ApplicationVertex,
+        tuple(int, float))
+    """
+    senders = dict()
+    for edge in machine_graph.get_edges_ending_at_vertex_with_partition_name(
+            machine_vertex, SPIKE_PARTITION_ID):
+        n_atoms, n_silent = senders.get(edge.pre_vertex.app_vertex, (0, 0))
+        silent = _count_silent_sources(edge)
+        senders[edge.pre_vertex.app_vertex] = (
+            n_atoms + edge.pre_vertex.vertex_slice.n_atoms,
+            numpy.nan if silent is None else n_silent + silent)
+    return senders
+
+
+def spike_traffic(provenance_items, placements, machine_graph):
+    """ Aggregate the synapse provenance of the cores into matrices of the\
+        traffic from each population to each core, and grids of the traffic\
+        at each chip.
+
+    The provenance counts the packets of each core, but not where they come\
+    from, so the traffic of each population is estimated.  The redundant\
+    packets of a core (those filtered out or finding an empty row) are\
+    shared between the populations sending to it by how many silent sources\
+    each has, if they can all be counted.  Otherwise, and for the other\
+    packets and the DMAs, the shares are by the number of neurons each\
+    sends from.  Packets that found no master population table entry are\
+    put in the unmatched row.
+
+    :param list(ProvenanceDataItem) provenance_items:
+        The provenance of the cores
+    :param ~pacman.model.placements.Placements placements:
+        Where the cores are
+    :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+        The graph of the cores
+    :rtype: SpikeTraffic
+    """
+    counts = _core_counts(provenance_items)
+    post_cores = list()
+    core_senders = list()
+    pre_vertices = list()
+    for (x, y, p), core_counts in sorted(counts.items()):
+        # Only the cores that receive spikes have synapse provenance
+        if "filtered" not in core_counts:
+            continue
+        vertex = placements.get_placement_on_processor(x, y, p).vertex
+        post_cores.append((x, y, p))
+        senders = _senders(vertex, machine_graph)
+        for sender in senders:
+            if sender not in pre_vertices:
+                pre_vertices.append(sender)
+        core_senders.append((vertex.label, senders))
+
+    n_pre = len(pre_vertices)
+    shape = (n_pre + 1, len(post_cores))
+    silent = numpy.full(shape, numpy.nan)
+    received = numpy.zeros(shape)
+    redundant = numpy.zeros(shape)
+    dmas = numpy.zeros(shape)
+    for col, (core, (_, senders)) in enumerate(zip(post_cores, core_senders)):
+        core_counts = counts[core]
+        core_redundant = core_counts["filtered"] + core_counts["invalid"]
+        matched = core_counts["processed"] + core_redundant
+        total_atoms = sum(n_atoms for n_atoms, _ in senders.values())
+        total_silent = sum(n_silent for _, n_silent in senders.values())
+        for sender, (n_atoms, n_silent) in senders.items():
+            row = pre_vertices.index(sender)
+            share = n_atoms / total_atoms
+            silent[row, col] = n_silent
+            received[row, col] = share * matched
+            dmas[row, col] = share * core_counts["dmas"]
+            if total_silent > 0:
+                share = n_silent / total_silent
+            redundant[row, col] = share * core_redundant
+        received[n_pre, col] = core_counts["ghosts"]
+        redundant[n_pre, col] = core_counts["ghosts"]
+        if not senders:
+            received[n_pre, col] += matched
+            redundant[n_pre, col] += core_redundant
+            dmas[n_pre, col] = core_counts["dmas"]
+
+    width = max((x for x, _, _ in post_cores), default=-1) + 1
+    height = max((y for _, y, _ in post_cores), default=-1) + 1
+    chip_grids = [numpy.zeros((width, height)) for _ in range(3)]
+    for col, (x, y, _) in enumerate(post_cores):
+        for grid, matrix in zip(chip_grids, (received, redundant, dmas)):
+            grid[x, y] += matrix[:, col].sum()
+
+    return SpikeTraffic(
+        [vertex.label for vertex in pre_vertices] + [UNMATCHED],
+        numpy.array(post_cores, dtype="uint32").reshape(-1, 3),
+        [label for label, _ in core_senders], silent, received, redundant,
+        dmas, *chip_grids)
+
+
+def hot_spots(traffic):
+    """ List the pairs of sending population and receiving core that have\
+        any traffic, with the most estimated redundant packets first, then\
+        the most estimated DMAs, then the most estimated packets
+
+    :param SpikeTraffic traffic:
+    :rtype: list(HotSpot)
+    """
+    spots = [
+        HotSpot(traffic.pre_labels[row], *traffic.post_cores[col],
+                traffic.post_labels[col], traffic.silent_sources[row, col],
+                traffic.estimated_redundant[row, col],
+                traffic.estimated_dmas[row, col],
+                traffic.estimated_received[row, col])
+        for row, col in zip(*numpy.nonzero(
+            traffic.estimated_received + traffic.estimated_dmas))]
+    return sorted(spots, key=lambda spot: (
+        -spot.estimated_redundant, -spot.estimated_dmas,
+        -spot.estimated_received))
+
+
+class SpikeTrafficReport(object):
+    """ Writes the spike traffic from each population to each core, as\
+        worked out from provenance, so that the pairs that send packets that\
+        are thrown away can be found.
+
+    The pairs are written to a CSV file, worst first, and the matrices and\
+    chip grids to a NumPy archive; a heat map of the estimated redundant\
+    packets is drawn too if write_spike_traffic_heat_map is set and\
+    matplotlib is installed.
+    """
+
+    __slots__ = []
+
+    def __call__(self, provenance_items, placements, machine_graph):
+        """
+        :param list(ProvenanceDataItem) provenance_items:
+            The provenance of the cores
+        :param ~pacman.model.placements.Placements placements:
+            Where the cores are
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+            The graph of the cores
+        """
+        traffic = spike_traffic(provenance_items, placements, machine_graph)
+        directory = report_default_directory()
+        try:
+            self._write_csv(os.path.join(directory, _CSV_NAME), traffic)
+            numpy.savez_compressed(
+                os.path.join(directory, _NPZ_NAME),
+                pre_labels=traffic.pre_labels, post_cores=traffic.post_cores,
+                post_labels=traffic.post_labels,
+                silent_sources=traffic.silent_sources,
+                estimated_received=traffic.estimated_received,
+                estimated_redundant=traffic.estimated_redundant,
+                estimated_dmas=traffic.estimated_dmas,
+                chip_received=traffic.chip_received,
+                chip_redundant=traffic.chip_redundant,
+                chip_dmas=traffic.chip_dmas)
+        except IOError:
+            logger.exception("Could not write the spike traffic report in {}",
+                             directory)
+            return
+
+        if get_config_bool("Reports", "write_spike_traffic_heat_map"):
+            if _matplotlib_missing:
+                logger.warning(
+                    "Not drawing the spike traffic heat map, as matplotlib is"
+                    " not installed")
+            else:
+                self._draw_heat_map(
+                    os.path.join(directory, _PNG_NAME), traffic)
+
+    @staticmethod
+    def _write_csv(file_name, traffic):
+        """
+        :param str file_name:
+        :param SpikeTraffic traffic:
+        """
+        with open(file_name, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(HotSpot._fields)
+            for spot in hot_spots(traffic):
+                writer.writerow(spot)
+
+    @staticmethod
+    def _draw_heat_map(file_name, traffic):
+        """
+        :param str file_name:
+        :param SpikeTraffic traffic:
+        """
+        figure = Figure(figsize=(16, 8))
+        edge_axes, chip_axes = figure.subplots(
+            1, 2, gridspec_kw={"width_ratios": [2, 1]})
+        image = edge_axes.imshow(
+            traffic.estimated_redundant, aspect="auto",
+            interpolation="nearest")
+        edge_axes.set_yticks(range(len(traffic.pre_labels)))
+        edge_axes.set_yticklabels(traffic.pre_labels)
+        edge_axes.set_xlabel("Receiving core")
+        edge_axes.set_title(
+            "Redundant packets by sending population (estimated)")
+        figure.colorbar(image, ax=edge_axes)
+        image = chip_axes.imshow(
+            traffic.chip_redundant.T, origin="lower", interpolation="nearest")
+        chip_axes.set_xlabel("x")
+        chip_axes.set_ylabel("y")
+        chip_axes.set_title("Redundant packets by chip")
+        figure.colorbar(image, ax=chip_axes)
+        figure.tight_layout()
+        figure.savefig(file_name)
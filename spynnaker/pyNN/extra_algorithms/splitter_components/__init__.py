@@ -23,6 +23,9 @@ from .spynnaker_splitter_slice_legacy import SpynnakerSplitterSliceLegacy
 from .splitter_abstract_pop_vertex_neurons_synapses import (
     SplitterAbstractPopulationVertexNeuronsSynapses)
 from .splitter_poisson_delegate import SplitterPoissonDelegate
+from .splitter_meanfield_vertex_slice import SplitterMeanfieldVertexSlice
+from .synaptic_load_planner import (
+    ProjectionLoad, SplitterLayout, SynapticLoadPlanner)
 from .abstract_supports_one_to_one_sdram_input import (
     AbstractSupportsOneToOneSDRAMInput)
 
@@ -31,4 +34,6 @@ __all__ = [
     'SplitterDelayVertexSlice', 'SpynnakerSplitterPartitioner',
     'SpynnakerSplitterSelector', 'SpynnakerSplitterSliceLegacy',
     'SplitterAbstractPopulationVertexNeuronsSynapses',
-    'SplitterPoissonDelegate', 'AbstractSupportsOneToOneSDRAMInput']
+    'SplitterPoissonDelegate', 'AbstractSupportsOneToOneSDRAMInput',
+    'SplitterMeanfieldVertexSlice', 'ProjectionLoad', 'SplitterLayout',
+    'SynapticLoadPlanner']
@@ -167,8 +167,7 @@ class SplitterAbstractPopulationVertexNeuronsSynapses(
                 " of synapse cores is set to 1")
 
         # Do some checks to make sure everything is likely to fit
-        atoms_per_core = min(
-            app_vertex.get_max_atoms_per_core(), app_vertex.n_atoms)
+        atoms_per_core = self.__get_atoms_per_core()
         n_synapse_types = app_vertex.neuron_impl.get_n_synapse_types()
         if (get_n_bits(atoms_per_core) + get_n_bits(n_synapse_types) +
                 get_n_bits(self.__get_max_delay)) > MAX_RING_BUFFER_BITS:
@@ -535,12 +534,22 @@ class SplitterAbstractPopulationVertexNeuronsSynapses(
         """
         if self.__slices is not None:
             return self.__slices
-        atoms_per_core = self._governed_app_vertex.get_max_atoms_per_core()
+        atoms_per_core = self.__get_atoms_per_core()
         n_atoms = self._governed_app_vertex.n_atoms
         self.__slices = [Slice(low, min(low + atoms_per_core - 1, n_atoms - 1))
                          for low in range(0, n_atoms, atoms_per_core)]
         return self.__slices
 
+    def __get_atoms_per_core(self):
+        """ Get the number of atoms on each neuron core, limited by the\
+            population and by any limit set on this splitter
+
+        :rtype: int
+        """
+        app_vertex = self._governed_app_vertex
+        return min(app_vertex.get_max_atoms_per_core(),
+                   self._max_atoms_per_core, app_vertex.n_atoms)
+
     @overrides(AbstractSplitterCommon.get_in_coming_slices)
     def get_in_coming_slices(self):
         return self.__get_fixed_slices(), True
@@ -761,8 +770,7 @@ class SplitterAbstractPopulationVertexNeuronsSynapses(
         max_delay_bits = get_n_bits(max_delay_steps)
 
         # Find the maximum possible delay
-        n_atom_bits = get_n_bits(min(
-            app_vertex.get_max_atoms_per_core(), app_vertex.n_atoms))
+        n_atom_bits = get_n_bits(self.__get_atoms_per_core())
         n_synapse_bits = get_n_bits(
             app_vertex.neuron_impl.get_n_synapse_types())
         n_delay_bits = MAX_RING_BUFFER_BITS - (n_atom_bits + n_synapse_bits)
@@ -59,7 +59,12 @@ class SplitterAbstractPopulationVertexSlice(
         # The size of all the bitfield data
         "__bitfield_sz",
         # The next index to use for a synapse core
-        "__next_index"
+        "__next_index",
+        # The maximum delay chosen for the cores, or None for the default
+        "__max_delay",
+        # The most atoms on each core that the maximum delay chosen allows,
+        # or None if it does not limit them
+        "__max_delay_atoms_per_core"
     ]
 
     """ The name of the splitter """
@@ -79,9 +84,11 @@ class SplitterAbstractPopulationVertexSlice(
         self.__weight_scales = None
         self.__all_syn_block_sz = dict()
         self.__structural_sz = dict()
-        self.__synapse_expander_sz = None
+        self.__synapse_expander_sz = dict()
         self.__bitfield_sz = None
         self.__next_index = 0
+        self.__max_delay = None
+        self.__max_delay_atoms_per_core = None
 
     @overrides(AbstractSplitterSlice.set_governed_app_vertex)
     def set_governed_app_vertex(self, app_vertex):
@@ -95,8 +102,18 @@ class SplitterAbstractPopulationVertexSlice(
         app_vertex = self._governed_app_vertex
         app_vertex.synapse_recorder.add_region_offset(
             len(app_vertex.neuron_recorder.get_recordable_variables()))
-        return super(SplitterAbstractPopulationVertexSlice, self)\
-            .create_machine_vertices(resource_tracker, machine_graph)
+
+        # The limit of the maximum delay only applies to this split, so that
+        # it goes when the splitter is reset
+        max_atoms_per_core = self._max_atoms_per_core
+        if self.__max_delay_atoms_per_core is not None:
+            self._max_atoms_per_core = min(
+                max_atoms_per_core, self.__max_delay_atoms_per_core)
+        try:
+            return super(SplitterAbstractPopulationVertexSlice, self)\
+                .create_machine_vertices(resource_tracker, machine_graph)
+        finally:
+            self._max_atoms_per_core = max_atoms_per_core
 
     @overrides(AbstractSplitterSlice.get_out_going_vertices)
     def get_out_going_vertices(self, edge, outgoing_edge_partition):
@@ -220,7 +237,7 @@ class SplitterAbstractPopulationVertexSlice(
                 app_vertex.incoming_projections))
         sdram.add_cost(
             PopulationMachineVertex.SYNAPSE_REGIONS.connection_builder,
-            self.__synapse_expander_size())
+            self.__synapse_expander_size(vertex_slice))
         sdram.merge(self.__bitfield_size())
         return sdram
 
@@ -252,16 +269,20 @@ class SplitterAbstractPopulationVertexSlice(
         self.__structural_sz[vertex_slice] = structural_sz
         return structural_sz
 
-    def __synapse_expander_size(self):
+    def __synapse_expander_size(self, vertex_slice):
         """ Work out how much SDRAM is needed for the synapse expander
 
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The slice of neurons to get the size of
         :rtype: int
         """
-        if self.__synapse_expander_sz is None:
-            self.__synapse_expander_sz = \
-                self._governed_app_vertex.get_synapse_expander_size(
-                    self._governed_app_vertex.incoming_projections)
-        return self.__synapse_expander_sz
+        if vertex_slice in self.__synapse_expander_sz:
+            return self.__synapse_expander_sz[vertex_slice]
+        synapse_expander_sz = \
+            self._governed_app_vertex.get_synapse_expander_size(
+                self._governed_app_vertex.incoming_projections, vertex_slice)
+        self.__synapse_expander_sz[vertex_slice] = synapse_expander_sz
+        return synapse_expander_sz
 
     def __bitfield_size(self):
         """ Work out how much SDRAM is needed by the bit fields
@@ -313,6 +334,36 @@ class SplitterAbstractPopulationVertexSlice(
                 MaxVertexAtomsConstraint, FixedVertexAtomsConstraint],
             abstract_constraint_type=AbstractPartitionerConstraint)
 
+    @overrides(AbstractSpynnakerSplitterDelay.max_support_delay)
+    def max_support_delay(self):
+        if self.__max_delay is not None:
+            return self.__max_delay
+        return super().max_support_delay()
+
+    @property
+    def max_delay_atoms_per_core(self):
+        """ The most atoms on each core that the maximum delay set allows,\
+            or None if it does not limit them
+
+        :rtype: int or None
+        """
+        return self.__max_delay_atoms_per_core
+
+    def set_max_support_delay(self, max_delay, max_atoms_per_core=None):
+        """ Set the maximum delay that the cores will support themselves,\
+            for example as chosen by a :py:class:`DelayPlanner`.  This lasts\
+            until the splitter is reset.
+
+        :param int max_delay:
+            The maximum delay in time steps; must be a power of 2
+        :param max_atoms_per_core:
+            The most atoms on each core whose ring buffers can hold the\
+            delay, or None if the delay does not limit them
+        :type max_atoms_per_core: int or None
+        """
+        self.__max_delay = max_delay
+        self.__max_delay_atoms_per_core = max_atoms_per_core
+
     @overrides(AbstractSplitterSlice.reset_called)
     def reset_called(self):
         super(SplitterAbstractPopulationVertexSlice, self).reset_called()
@@ -320,4 +371,7 @@ class SplitterAbstractPopulationVertexSlice(
         self.__weight_scales = None
         self.__all_syn_block_sz = dict()
         self.__structural_sz = dict()
+        self.__synapse_expander_sz = dict()
         self.__next_index = 0
+        self.__max_delay = None
+        self.__max_delay_atoms_per_core = None
@@ -195,7 +195,7 @@ class SplitterDelayVertexSlice(AbstractDependentSplitter):
             self._governed_app_vertex.tdma_sdram_size_in_bytes +
             DelayExtensionMachineVertex.get_provenance_data_size(
                 DelayExtensionMachineVertex.N_EXTRA_PROVENANCE_DATA_ENTRIES) +
-            self._get_size_of_generator_information(out_edges))
+            self._get_size_of_generator_information(out_edges, vertex_slice))
 
     def dtcm_cost(self, vertex_slice):
         """ returns the dtcm used by the delay extension slice.
@@ -215,10 +215,12 @@ class SplitterDelayVertexSlice(AbstractDependentSplitter):
         return CPUCyclesPerTickResource(
             self.ESTIMATED_CPU_CYCLES * vertex_slice.n_atoms)
 
-    def _get_size_of_generator_information(self, out_edges):
+    def _get_size_of_generator_information(self, out_edges, vertex_slice):
         """ Get the size of the generator data for all edges
 
         :param list(.ApplicationEdge) out_edges:
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The slice of the delay extension to get the size of
         :rtype: int
         """
         gen_on_machine = False
@@ -235,19 +237,24 @@ class SplitterDelayVertexSlice(AbstractDependentSplitter):
                         out_edge.post_vertex.n_atoms / float(max_atoms)))
 
                     # Get the size
-                    gen_size = self._get_edge_generator_size(synapse_info)
+                    gen_size = self._get_edge_generator_size(
+                        synapse_info, n_edge_vertices, vertex_slice)
                     if gen_size > 0:
                         gen_on_machine = True
-                        size += gen_size * n_edge_vertices
+                        size += gen_size
         if gen_on_machine:
             size += self._EXPANDER_BASE_PARAMS_SIZE
         return size
 
     @staticmethod
-    def _get_edge_generator_size(synapse_info):
+    def _get_edge_generator_size(synapse_info, n_edge_vertices, vertex_slice):
         """ Get the size of the generator data for a given synapse info object
 
         :param SynapseInformation synapse_info: the synapse info
+        :param int n_edge_vertices: the number of post-vertices generated for
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            the slice of the delay extension generated for
+        :rtype: int
         """
         connector = synapse_info.connector
         dynamics = synapse_info.synapse_dynamics
@@ -257,11 +264,13 @@ class SplitterDelayVertexSlice(AbstractDependentSplitter):
                 synapse_info.weights, synapse_info.delays))
         synapse_gen = isinstance(dynamics, AbstractGenerateOnMachine)
         if connector_gen and synapse_gen:
-            return sum((
-                DelayGeneratorData.BASE_SIZE,
-                connector.gen_delay_params_size_in_bytes(
-                    synapse_info.delays),
-                connector.gen_connector_params_size_in_bytes))
+            return (
+                (DelayGeneratorData.BASE_SIZE +
+                 connector.gen_delay_params_size_in_bytes(
+                     synapse_info.delays)) * n_edge_vertices +
+                connector.gen_connector_params_total_size_in_bytes(
+                    synapse_info, n_edge_vertices,
+                    pre_vertex_slice=vertex_slice))
         return 0
 
     @overrides(AbstractDependentSplitter.check_supported_constraints)
@@ -0,0 +1,148 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+from spinn_utilities.config_holder import get_config_float
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.overrides import overrides
+from pacman.exceptions import PacmanConfigurationException
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utilities.globals_variables import (
+    machine_time_step)
+from spynnaker.pyNN.models.neuron.implementations import (
+    MeanfieldImplStandard)
+from spynnaker.pyNN.utilities.constants import CPU_CYCLES_PER_US
+from .splitter_abstract_pop_vertex_slice import (
+    SplitterAbstractPopulationVertexSlice)
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+
+class SplitterMeanfieldVertexSlice(SplitterAbstractPopulationVertexSlice):
+    """ Splits a population of meanfields so that each core gets as many\
+        meanfields as it can update within a fraction of the time step, as\
+        predicted by the cycle model of the meanfield implementation.
+
+    A smaller number of meanfields per core set on the population is still\
+    respected.
+    """
+
+    __slots__ = [
+        # The fraction of the cycles of each time step that can be used
+        "__cpu_fraction"]
+
+    """ The name of the splitter """
+    SPLITTER_NAME = "SplitterMeanfieldVertexSlice"
+
+    """ The message to use when the Population is invalid """
+    INVALID_POP_ERROR_MESSAGE = (
+        "The vertex {} cannot be supported by the "
+        "SplitterMeanfieldVertexSlice as the only vertex supported by this "
+        "splitter is an AbstractPopulationVertex of meanfields. Please use "
+        "the correct splitter for your vertex and try again.")
+
+    def __init__(self, cpu_fraction=None):
+        """
+        :param cpu_fraction:
+            The fraction of the cycles of each time step that the update of
+            the meanfields on a core may take, or None to use the value in
+            the configuration
+        :type cpu_fraction: float or None
+        :raises ConfigurationException: If the fraction is not in (0, 1]
+        """
+        super().__init__()
+        if cpu_fraction is None:
+            cpu_fraction = get_config_float(
+                "Simulation", "meanfield_timestep_cpu_fraction")
+        if not 0 < cpu_fraction <= 1:
+            raise ConfigurationException(
+                "The fraction of each time step to use must be more than 0"
+                " and at most 1, not {}".format(cpu_fraction))
+        self.__cpu_fraction = cpu_fraction
+
+    @overrides(SplitterAbstractPopulationVertexSlice.set_governed_app_vertex)
+    def set_governed_app_vertex(self, app_vertex):
+        super().set_governed_app_vertex(app_vertex)
+        if not isinstance(app_vertex.neuron_impl, MeanfieldImplStandard):
+            raise PacmanConfigurationException(
+                self.INVALID_POP_ERROR_MESSAGE.format(app_vertex))
+
+    @overrides(SplitterAbstractPopulationVertexSlice.create_machine_vertices)
+    def create_machine_vertices(self, resource_tracker, machine_graph):
+        # The limit of the budget only applies to this split, so that it is
+        # worked out again from the graph of the next mapping
+        max_atoms_per_core = self._max_atoms_per_core
+        self._max_atoms_per_core = min(
+            max_atoms_per_core, self.get_max_atoms_within_budget())
+        try:
+            return super().create_machine_vertices(
+                resource_tracker, machine_graph)
+        finally:
+            self._max_atoms_per_core = max_atoms_per_core
+
+    @property
+    def cycle_budget(self):
+        """ The cycles of each time step that the meanfields on a core may\
+            take to update
+
+        :rtype: int
+        """
+        return int(
+            machine_time_step() * CPU_CYCLES_PER_US * self.__cpu_fraction)
+
+    def get_max_atoms_within_budget(self):
+        """ Get the most meanfields of the population that one core can\
+            update within the cycle budget
+
+        :return: The number of meanfields, which is at least 1 even if one
+            will not fit, in which case a warning is logged
+        :rtype: int
+        """
+        app_vertex = self._governed_app_vertex
+        budget = self.cycle_budget
+        if self.__get_cpu_cost(1) > budget:
+            logger.warning(
+                "One meanfield of {} needs {} cycles each time step, which is"
+                " more than the budget of {}; the time step will overrun",
+                app_vertex.label, self.__get_cpu_cost(1), budget)
+            return 1
+
+        # The cost grows with the number of atoms, so find the most that fit
+        low = 1
+        high = app_vertex.n_atoms
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.__get_cpu_cost(mid) <= budget:
+                low = mid
+            else:
+                high = mid - 1
+        logger.debug(
+            "Splitting {} into {} meanfields per core to fit {} cycles",
+            app_vertex.label, low, budget)
+        return low
+
+    def __get_cpu_cost(self, n_atoms):
+        """ Get the cycles needed by a core with a number of meanfields
+
+        :param int n_atoms: The number of meanfields on the core
+        :rtype: int
+        """
+        app_vertex = self._governed_app_vertex
+        vertex_slice = Slice(0, n_atoms - 1)
+        return (
+            app_vertex.get_common_cpu() +
+            app_vertex.get_neuron_cpu(vertex_slice) +
+            app_vertex.get_synapse_cpu(vertex_slice))
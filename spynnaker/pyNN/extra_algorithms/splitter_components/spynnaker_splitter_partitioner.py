@@ -12,10 +12,14 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from spinn_utilities.config_holder import get_config_bool
 from spinn_utilities.overrides import overrides
 from pacman.model.partitioner_interfaces import AbstractSlicesConnect
 from pacman.operations.partition_algorithms import SplitterPartitioner
 from data_specification import ReferenceContext
+from spynnaker.pyNN.extra_algorithms.key_grouper import KeyGrouper
+from spynnaker.pyNN.models.neuron.weight_planner import (
+    clear_weight_plan_report)
 
 
 class SpynnakerSplitterPartitioner(SplitterPartitioner):
@@ -26,7 +30,7 @@ class SpynnakerSplitterPartitioner(SplitterPartitioner):
 
     def __call__(
             self, app_graph, machine, plan_n_time_steps,
-            pre_allocated_resources=None):
+            pre_allocated_resources=None, mapping_change_tracker=None):
         """
         :param ApplicationGraph app_graph: app graph
         :param ~spinn_machine.Machine machine: machine
@@ -34,15 +38,34 @@ class SpynnakerSplitterPartitioner(SplitterPartitioner):
         :param pre_allocated_resources: any pre-allocated res to account for
             before doing any splitting.
         :type pre_allocated_resources: PreAllocatedResourceContainer or None
+        :param mapping_change_tracker:
+            The changes since the last run, used to keep the placements of
+            the machine vertices that have not changed
+        :type mapping_change_tracker: MappingChangeTracker or None
         :rtype: tuple(~pacman.model.graphs.machine.MachineGraph, int)
         :raise PacmanPartitionException: when it cant partition
         """
 
+        # the weights are planned as the populations are split, each adding
+        # to the report, so it starts empty each time the graph is mapped
+        if get_config_bool("Simulation", "plan_weight_scales") and \
+                get_config_bool("Reports", "write_weight_plan_report"):
+            clear_weight_plan_report()
+
         # do partitioning in same way, but in a context of references
         with ReferenceContext():
             machine_graph, chips_used = super().__call__(
                 app_graph, machine, plan_n_time_steps, pre_allocated_resources)
 
+        # share blocks of keys between small populations with the same
+        # targets, before the keys are allocated
+        if get_config_bool("Mapping", "group_small_population_keys"):
+            KeyGrouper().group(app_graph, machine_graph)
+
+        if mapping_change_tracker is not None:
+            mapping_change_tracker.keep_unchanged_placements(
+                machine_graph, machine)
+
         # return the accepted things
         return machine_graph, chips_used
 
@@ -12,6 +12,7 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from spinn_utilities.config_holder import get_config_bool
 from spinn_utilities.progress_bar import ProgressBar
 from pacman.model.graphs.application import (
     ApplicationSpiNNakerLinkVertex, ApplicationFPGAVertex)
@@ -25,7 +26,14 @@ from .splitter_abstract_pop_vertex_slice import (
     SplitterAbstractPopulationVertexSlice)
 from .spynnaker_splitter_slice_legacy import SpynnakerSplitterSliceLegacy
 from .splitter_poisson_delegate import SplitterPoissonDelegate
+from .splitter_meanfield_vertex_slice import SplitterMeanfieldVertexSlice
+from .splitter_abstract_pop_vertex_neurons_synapses import (
+    SplitterAbstractPopulationVertexNeuronsSynapses)
+from .synaptic_load_planner import (
+    SynapticLoadPlanner, write_splitter_layout_report)
 from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+from spynnaker.pyNN.models.neuron.implementations import (
+    MeanfieldImplStandard)
 from spynnaker.pyNN.models.spike_source.spike_source_array_vertex import (
     SpikeSourceArrayVertex)
 from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex import (
@@ -36,6 +44,9 @@ class SpynnakerSplitterSelector(SplitterSelector):
     """ splitter object selector that allocates splitters to app vertices\
         that have not yet been given a splitter object.\
         default for APV is the SplitterAbstractPopulationVertexSlice\
+        (or SplitterMeanfieldVertexSlice for meanfields if\
+        split_meanfields_by_cycles is set, or one chosen by the synaptic\
+        load if split_by_load is set)\
         default for external device splitters are SplitterOneToOneLegacy\
         default for the rest is the SpynnakerSplitterSliceLegacy.
 
@@ -56,9 +67,20 @@ class SpynnakerSplitterSelector(SplitterSelector):
             string_describing_what_being_progressed=self.PROGRESS_BAR_NAME,
             total_number_of_things_to_do=len(app_graph.vertices))
 
+        planner = None
+        if get_config_bool("Simulation", "split_by_load"):
+            planner = SynapticLoadPlanner()
+        layouts = list()
+
         for app_vertex in progress_bar.over(app_graph.vertices):
             if app_vertex.splitter is None:
-                if isinstance(app_vertex, AbstractPopulationVertex):
+                if (planner is not None and
+                        isinstance(app_vertex, AbstractPopulationVertex) and
+                        not isinstance(app_vertex.neuron_impl,
+                                       MeanfieldImplStandard)):
+                    layouts.append(
+                        self.load_based_heuristic(app_vertex, planner))
+                elif isinstance(app_vertex, AbstractPopulationVertex):
                     self.abstract_pop_heuristic(app_vertex)
                 elif isinstance(app_vertex, ApplicationSpiNNakerLinkVertex):
                     self.external_spinnaker_link_heuristic(app_vertex)
@@ -73,6 +95,10 @@ class SpynnakerSplitterSelector(SplitterSelector):
             if isinstance(app_vertex, AbstractAcceptsIncomingSynapses):
                 app_vertex.verify_splitter(app_vertex.splitter)
 
+        if layouts and get_config_bool(
+                "Reports", "write_splitter_layout_report"):
+            write_splitter_layout_report(layouts)
+
     @staticmethod
     def abstract_pop_heuristic(app_vertex):
         """ Assign the splitter for APV. Allows future overrides
@@ -80,7 +106,34 @@ class SpynnakerSplitterSelector(SplitterSelector):
         :param ~pacman.model.graphs.application.ApplicationGraph app_vertex:
             app vertex
         """
-        app_vertex.splitter = SplitterAbstractPopulationVertexSlice()
+        if (isinstance(app_vertex.neuron_impl, MeanfieldImplStandard) and
+                get_config_bool("Simulation", "split_meanfields_by_cycles")):
+            app_vertex.splitter = SplitterMeanfieldVertexSlice()
+        else:
+            app_vertex.splitter = SplitterAbstractPopulationVertexSlice()
+
+    @staticmethod
+    def load_based_heuristic(app_vertex, planner):
+        """ Assign the splitter for APV from an estimate of the load of its\
+            incoming synapses, limiting the atoms per core if needed
+
+        :param AbstractPopulationVertex app_vertex: app vertex
+        :param SynapticLoadPlanner planner: The planner to choose with
+        :return: The layout chosen
+        :rtype: SplitterLayout
+        """
+        layout = planner.plan(app_vertex)
+        if layout.n_synapse_cores:
+            app_vertex.splitter = \
+                SplitterAbstractPopulationVertexNeuronsSynapses(
+                    layout.n_synapse_cores)
+        else:
+            app_vertex.splitter = SplitterAbstractPopulationVertexSlice()
+
+        # The limit belongs to the splitter chosen with it, not the population
+        app_vertex.splitter.set_max_atoms_per_core(
+            layout.n_atoms_per_core, False)
+        return layout
 
     @staticmethod
     def external_spinnaker_link_heuristic(app_vertex):
@@ -0,0 +1,354 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import math
+import os
+from collections import namedtuple
+from spinn_utilities.config_holder import get_config_float, get_config_int
+from spinn_utilities.log import FormatAdapter
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.utilities.constants import (
+    MICRO_TO_SECOND_CONVERSION)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utilities.globals_variables import (
+    machine_time_step, report_default_directory)
+from spynnaker.pyNN.models.abstract_models import AbstractMaxSpikes
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    AbstractPlasticSynapseDynamics, AbstractSynapseDynamicsStructural)
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex import (
+    SpikeSourcePoissonVertex)
+from spynnaker.pyNN.utilities.constants import CPU_CYCLES_PER_US
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# The name of the report of the layouts chosen
+_REPORT_NAME = "splitter_layout.rpt"
+
+# The cycles taken to receive a spike and find and fetch its synaptic row
+_CYCLES_PER_SPIKE = 450
+
+# The cycles taken to process each static synapse of a row
+_CYCLES_PER_STATIC_SYNAPSE = 25
+
+# The cycles taken to process each plastic synapse of a row, including the
+# update of the weight from the pre- and post-synaptic traces
+_CYCLES_PER_PLASTIC_SYNAPSE = 130
+
+#: The load of one incoming projection on a core of a population
+ProjectionLoad = namedtuple(
+    "ProjectionLoad",
+    ["pre_label", "rate", "spikes_per_step", "synapses_per_step", "cycles"])
+
+#: The layout of the cores of a population chosen from its synaptic load;
+#: n_synapse_cores is 0 when neurons and synapses share each core, and
+#: synapse_core_cycles is then the same as synapse_cycles
+SplitterLayout = namedtuple(
+    "SplitterLayout",
+    ["label", "n_atoms", "n_atoms_per_core", "n_synapse_cores",
+     "neuron_cycles", "synapse_cycles", "synapse_core_cycles", "budget",
+     "projection_loads", "reason"])
+
+
+class SynapticLoadPlanner(object):
+    """ Chooses how to split a population between cores from an estimate\
+        of the spikes and synaptic events that each core will receive\
+        in each time step.
+
+    Neurons and synapses share each core when a core can process both\
+    within the budget.  Otherwise the synapses are processed on separate\
+    cores, as many as are needed to share the load, and the neurons per\
+    core are halved until that number is allowed.  The spikes from each\
+    source core of an incoming edge all go to one synapse core, with the\
+    source cores taking the synapse cores in turn, so the load is shared\
+    out in the same way to check that every synapse core keeps within the\
+    budget.
+    """
+
+    __slots__ = [
+        # The fraction of the cycles of each time step that can be used
+        "__cpu_fraction",
+        # The most synapse cores that may serve each neuron core
+        "__max_synapse_cores"]
+
+    def __init__(self, cpu_fraction=None, max_synapse_cores=None):
+        """
+        :param cpu_fraction:
+            The fraction of the cycles of each time step that the processing
+            on a core may take, or None to use the value in the configuration
+        :type cpu_fraction: float or None
+        :param max_synapse_cores:
+            The most synapse cores to use for each neuron core, or None to
+            use the value in the configuration
+        :type max_synapse_cores: int or None
+        :raises ConfigurationException: If either value is out of range
+        """
+        if cpu_fraction is None:
+            cpu_fraction = get_config_float(
+                "Simulation", "split_by_load_cpu_fraction")
+        if max_synapse_cores is None:
+            max_synapse_cores = get_config_int(
+                "Simulation", "split_by_load_max_synapse_cores")
+        if not 0 < cpu_fraction <= 1:
+            raise ConfigurationException(
+                "The fraction of each time step to use must be more than 0"
+                " and at most 1, not {}".format(cpu_fraction))
+        if max_synapse_cores < 1:
+            raise ConfigurationException(
+                "At least one synapse core must be allowed, not {}".format(
+                    max_synapse_cores))
+        self.__cpu_fraction = cpu_fraction
+        self.__max_synapse_cores = max_synapse_cores
+
+    @property
+    def cycle_budget(self):
+        """ The cycles of each time step that the processing on a core may\
+            take
+
+        :rtype: int
+        """
+        return int(
+            machine_time_step() * CPU_CYCLES_PER_US * self.__cpu_fraction)
+
+    def plan(self, app_vertex):
+        """ Choose the layout of the cores of a population
+
+        :param AbstractPopulationVertex app_vertex: The population
+        :rtype: SplitterLayout
+        """
+        budget = self.cycle_budget
+        max_synapse_cores = self.__max_synapse_cores
+        if isinstance(app_vertex.synapse_dynamics,
+                      AbstractSynapseDynamicsStructural):
+            # Structural plasticity only runs on a single synapse core
+            max_synapse_cores = 1
+
+        max_atoms_per_core = min(
+            app_vertex.get_max_atoms_per_core(), app_vertex.n_atoms)
+        n_atoms_per_core = max_atoms_per_core
+        while True:
+            vertex_slice = Slice(0, n_atoms_per_core - 1)
+            neuron_cycles = (
+                app_vertex.get_common_cpu() +
+                app_vertex.get_neuron_cpu(vertex_slice))
+            loads = self.get_projection_loads(app_vertex, vertex_slice)
+            base_cycles = app_vertex.get_synapse_cpu(vertex_slice)
+            synapse_cycles = base_cycles + sum(load.cycles for load in loads)
+            reduced = ""
+            if n_atoms_per_core < max_atoms_per_core:
+                reduced = (
+                    "; the neurons per core were reduced from {} so that no"
+                    " more than {} synapse cores are needed".format(
+                        max_atoms_per_core, max_synapse_cores))
+
+            if neuron_cycles + synapse_cycles <= budget:
+                return self.__layout(
+                    app_vertex, n_atoms_per_core, 0, neuron_cycles,
+                    synapse_cycles, synapse_cycles, budget, loads,
+                    "the neurons and synapses fit within the budget of one"
+                    " core")
+            n_synapse_cores, synapse_core_cycles = self.__share_synapses(
+                self.get_source_core_loads(app_vertex, loads), base_cycles,
+                budget, max_synapse_cores)
+            if n_synapse_cores and neuron_cycles <= budget:
+                return self.__layout(
+                    app_vertex, n_atoms_per_core, n_synapse_cores,
+                    neuron_cycles, synapse_cycles, synapse_core_cycles,
+                    budget, loads,
+                    "the neurons and synapses together exceed the budget of"
+                    " one core, so the synapses are shared between {} cores"
+                    "{}".format(n_synapse_cores, reduced))
+            if n_atoms_per_core == 1:
+                logger.warning(
+                    "The synaptic load on {} is more than {} synapse cores"
+                    " can process each time step, even with one neuron per"
+                    " core; spikes are likely to be dropped",
+                    app_vertex.label, max_synapse_cores)
+                return self.__layout(
+                    app_vertex, 1, max_synapse_cores, neuron_cycles,
+                    synapse_cycles, synapse_core_cycles, budget, loads,
+                    "the synapses exceed the budget of {} cores even with"
+                    " one neuron per core".format(max_synapse_cores))
+            n_atoms_per_core = max(n_atoms_per_core // 2, 1)
+
+    @staticmethod
+    def __share_synapses(
+            source_core_loads, base_cycles, budget, max_synapse_cores):
+        """ Find the fewest synapse cores that keep within the budget when\
+            the source cores take them in turn
+
+        :param list(int) source_core_loads:
+            The cycles of the spikes from each source core, in the order that
+            the source cores are given synapse cores
+        :param int base_cycles: The cycles of each synapse core without spikes
+        :param int budget: The cycles allowed on each core
+        :param int max_synapse_cores: The most synapse cores allowed
+        :return: The number of synapse cores, or None if even the most allowed
+            do not keep within the budget, and the most cycles on any of
+            them (with the most synapse cores allowed if none fit)
+        :rtype: tuple(int or None, int)
+        """
+        for n_synapse_cores in range(1, max_synapse_cores + 1):
+            core_cycles = [base_cycles] * n_synapse_cores
+            for index, cycles in enumerate(source_core_loads):
+                core_cycles[index % n_synapse_cores] += cycles
+            if max(core_cycles) <= budget:
+                return n_synapse_cores, max(core_cycles)
+        return None, max(core_cycles)
+
+    @staticmethod
+    def __layout(
+            app_vertex, n_atoms_per_core, n_synapse_cores, neuron_cycles,
+            synapse_cycles, synapse_core_cycles, budget, loads, reason):
+        return SplitterLayout(
+            app_vertex.label, app_vertex.n_atoms, n_atoms_per_core,
+            n_synapse_cores, neuron_cycles, synapse_cycles,
+            synapse_core_cycles, budget, loads, reason)
+
+    @staticmethod
+    def get_source_core_loads(app_vertex, loads):
+        """ Share the load of the incoming projections between the cores\
+            that send the spikes
+
+        The projections from the same source share an edge, and each core of\
+        the source sends the spikes of its neurons to the same synapse core,\
+        so that is the smallest load that can be given to a synapse core.
+
+        :param AbstractPopulationVertex app_vertex: The population
+        :param list(ProjectionLoad) loads:
+            The load of each incoming projection, as from
+            :py:meth:`get_projection_loads`
+        :return: The cycles of the spikes from each source core, in the order
+            of the edges
+        :rtype: list(int)
+        """
+        edge_cycles = dict()
+        for proj, load in zip(app_vertex.incoming_projections, loads):
+            edge = proj._projection_edge
+            edge_cycles[edge] = edge_cycles.get(edge, 0) + load.cycles
+        source_core_loads = list()
+        for edge, cycles in edge_cycles.items():
+            pre_vertex = edge.pre_vertex
+            n_source_cores = int(math.ceil(pre_vertex.n_atoms / min(
+                pre_vertex.get_max_atoms_per_core(), pre_vertex.n_atoms)))
+            source_core_loads.extend(
+                [int(math.ceil(cycles / n_source_cores))] * n_source_cores)
+        return source_core_loads
+
+    def get_projection_loads(self, app_vertex, vertex_slice):
+        """ Estimate the load of each incoming projection on a core
+
+        Every spike of the source needs its row to be found and fetched,
+        and the synapses processed are limited both by the longest row to
+        the slice and by the most connections to any neuron.
+
+        :param AbstractPopulationVertex app_vertex: The population
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The slice of neurons on the core
+        :rtype: list(ProjectionLoad)
+        """
+        steps_per_second = MICRO_TO_SECOND_CONVERSION / machine_time_step()
+        loads = list()
+        for proj in app_vertex.incoming_projections:
+            synapse_info = proj._synapse_information
+            connector = synapse_info.connector
+            pre_vertex = proj._projection_edge.pre_vertex
+            rate = self.__get_max_rate(pre_vertex, app_vertex)
+            spikes_per_step = pre_vertex.n_atoms * rate / steps_per_second
+            row_length = connector.get_n_connections_from_pre_vertex_maximum(
+                vertex_slice, synapse_info)
+            in_degree = connector.get_n_connections_to_post_vertex_maximum(
+                synapse_info)
+            synapses_per_step = min(
+                spikes_per_step * row_length,
+                vertex_slice.n_atoms * in_degree * rate / steps_per_second)
+            cycles_per_synapse = _CYCLES_PER_STATIC_SYNAPSE
+            if isinstance(synapse_info.synapse_dynamics,
+                          AbstractPlasticSynapseDynamics):
+                cycles_per_synapse = _CYCLES_PER_PLASTIC_SYNAPSE
+            loads.append(ProjectionLoad(
+                pre_vertex.label, rate, spikes_per_step, synapses_per_step,
+                int(math.ceil(spikes_per_step * _CYCLES_PER_SPIKE +
+                              synapses_per_step * cycles_per_synapse))))
+        return loads
+
+    @staticmethod
+    def __get_max_rate(pre_vertex, app_vertex):
+        """ Get the most spikes per second expected from each source neuron
+
+        :param ~pacman.model.graphs.application.ApplicationVertex pre_vertex:
+            The source of the spikes
+        :param AbstractPopulationVertex app_vertex:
+            The population receiving the spikes, whose expected rate is used
+            if nothing better is known
+        :rtype: float
+        """
+        if isinstance(pre_vertex, SpikeSourcePoissonVertex):
+            return pre_vertex.max_rate
+        if isinstance(pre_vertex, AbstractPopulationVertex):
+            return pre_vertex.spikes_per_second
+        if isinstance(pre_vertex, AbstractMaxSpikes):
+            rate = pre_vertex.max_spikes_per_second()
+            if rate:
+                return rate
+        return app_vertex.spikes_per_second
+
+
+def write_splitter_layout_report(layouts):
+    """ Write a report of the layouts chosen for populations and the loads\
+        they were chosen from
+
+    :param list(SplitterLayout) layouts: The layouts chosen
+    """
+    file_name = os.path.join(report_default_directory(), _REPORT_NAME)
+    try:
+        with open(file_name, "w") as f:
+            for layout in layouts:
+                _write_layout(f, layout)
+    except IOError:
+        logger.exception("Could not write the splitter layout report {}",
+                         file_name)
+
+
+def _write_layout(f, layout):
+    """
+    :param ~io.TextIOBase f:
+    :param SplitterLayout layout:
+    """
+    if layout.n_synapse_cores:
+        split = "{} synapse cores for each neuron core".format(
+            layout.n_synapse_cores)
+    else:
+        split = "neurons and synapses on the same core"
+    f.write("Population {} ({} neurons): {} per core, {}\n".format(
+        layout.label, layout.n_atoms, layout.n_atoms_per_core, split))
+    f.write("    Reason: {}\n".format(layout.reason))
+    f.write("    Budget: {} cycles per time step on each core\n".format(
+        layout.budget))
+    f.write("    Neuron cycles per time step: {}\n".format(
+        layout.neuron_cycles))
+    f.write("    Synapse cycles per time step: {}\n".format(
+        layout.synapse_cycles))
+    if layout.n_synapse_cores:
+        f.write("    Most synapse cycles per time step on one core: {}\n"
+                .format(layout.synapse_core_cycles))
+    for load in layout.projection_loads:
+        f.write(
+            "        From {}: {:.1f} Hz, {:.1f} spikes and {:.1f} synaptic"
+            " events per time step, {} cycles\n".format(
+                load.pre_label, load.rate, load.spikes_per_step,
+                load.synapses_per_step, load.cycles))
+    f.write("\n")
@@ -13,12 +13,145 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+from spinn_utilities.config_holder import get_config_int
+from spinn_utilities.ordered_set import OrderedSet
 from spinn_front_end_common.interface.interface_functions import (
     GraphDataSpecificationWriter)
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+from spynnaker.pyNN.models.neuron.synaptic_matrix_cache import (
+    get_block_key, has_block)
 from spynnaker.pyNN.models.utility_models.delays import (
     DelayExtensionMachineVertex)
 
 
+def _make_block(job):
+    """ Make a synaptic block using the random numbers of its slice pair
+
+    :param tuple job:
+        The synapse information, the pre- and post-slices of the
+        application vertices, the pre- and post-slices of the block and the
+        seed of the block
+    :rtype: ~numpy.ndarray
+    """
+    synapse_info, pre_slices, post_slices, pre_slice, post_slice, seed = job
+    return synapse_info.connector.create_synaptic_block_from_seed(
+        seed, pre_slices, post_slices, pre_slice, post_slice,
+        synapse_info.synapse_type, synapse_info)
+
+
+class _SynapticBlockMaker(object):
+    """ Makes the synaptic blocks of connectors that are generated on the\
+        host in a pool of threads, a few blocks ahead of the synaptic\
+        matrices being written, so that only a few blocks are held at once.
+
+    The blocks are made in the order that the matrices are expected to take
+    them.  A block taken out of that order is made by the matrix instead,
+    and the blocks that were expected before it are dropped.
+    """
+
+    __slots__ = [
+        # The blocks to make, in the order they are expected to be taken
+        "__jobs",
+        # The index of each job by synapse information and slices
+        "__job_indices",
+        # The index of the next job to start
+        "__next_job",
+        # The blocks started but not yet taken, by job index, in order
+        "__pending",
+        # The most blocks to hold at once
+        "__max_pending",
+        # The synapse information that have had a block made
+        "__started",
+        # The threads making the blocks
+        "__executor"]
+
+    def __init__(self, jobs, n_threads):
+        """
+        :param list(tuple) jobs:
+            The blocks to make, in the order they are expected to be taken
+        :param int n_threads: The number of threads to make them in
+        """
+        self.__jobs = jobs
+        self.__job_indices = {
+            (job[0], job[3].lo_atom, job[4].lo_atom): index
+            for index, job in enumerate(jobs)}
+        self.__next_job = 0
+        self.__pending = OrderedDict()
+        self.__max_pending = 2 * n_threads
+        self.__started = set()
+        self.__executor = ThreadPoolExecutor(n_threads)
+        for synapse_info in {job[0] for job in jobs}:
+            synapse_info.set_block_maker(self)
+        self.__start_jobs()
+
+    def __start_jobs(self):
+        """ Start making blocks until enough are being held
+        """
+        while (len(self.__pending) < self.__max_pending and
+                self.__next_job < len(self.__jobs)):
+            index = self.__next_job
+            self.__next_job += 1
+            job = self.__jobs[index]
+            if job[0] in self.__started:
+                self.__pending[index] = self.__executor.submit(
+                    _make_block, job)
+            else:
+                # The first block of each projection is made here, so that
+                # anything the connector works out once for all of its
+                # blocks is done before other threads use it
+                self.__started.add(job[0])
+                future = Future()
+                future.set_result(_make_block(job))
+                self.__pending[index] = future
+
+    def __drop_pending(self, before):
+        """ Drop the blocks that are expected before a given job, as they\
+            will not be taken now
+
+        :param int before: The index of the job
+        """
+        while self.__pending:
+            index = next(iter(self.__pending))
+            if index >= before:
+                return
+            self.__pending.pop(index).cancel()
+
+    def take_block(self, synapse_info, pre_vertex_slice, post_vertex_slice):
+        """ Take a block, waiting for it to be made if it has been started
+
+        :param SynapseInformation synapse_info:
+        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :return: The block, or None if the caller should make it
+        :rtype: ~numpy.ndarray or None
+        """
+        index = self.__job_indices.get(
+            (synapse_info, pre_vertex_slice.lo_atom,
+             post_vertex_slice.lo_atom), None)
+        if index is None:
+            return None
+        self.__drop_pending(index)
+        future = self.__pending.pop(index, None)
+        if future is None and index >= self.__next_job:
+            # The writing has got ahead of the blocks being made
+            self.__next_job = index + 1
+        self.__start_jobs()
+        if future is None:
+            return None
+        return future.result()
+
+    def close(self):
+        """ Stop making blocks, and drop those not taken
+        """
+        self.__drop_pending(len(self.__jobs))
+        self.__executor.shutdown(wait=True)
+        for synapse_info in {job[0] for job in self.__jobs}:
+            synapse_info.set_block_maker(None)
+
+
 class SpynnakerDataSpecificationWriter(GraphDataSpecificationWriter):
     """ Executes data specification generation for sPyNNaker
     """
@@ -53,5 +186,104 @@ class SpynnakerDataSpecificationWriter(GraphDataSpecificationWriter):
                 placement_order.append(placement)
         placement_order.extend(delay_extensions)
 
-        return super().__call__(
-            placements, hostname, machine, data_n_timesteps, placement_order)
+        # The jobs are found whether or not the blocks are made ahead, as
+        # that gives each connector the seeds of its slices in the same order
+        jobs = self.__get_block_jobs(placement_order)
+        n_threads = get_config_int(
+            "Simulation", "n_synapse_generation_threads")
+        if n_threads is None:
+            n_threads = os.cpu_count() or 1
+        block_maker = None
+        if n_threads > 0 and jobs:
+            block_maker = _SynapticBlockMaker(jobs, n_threads)
+        try:
+            return super().__call__(
+                placements, hostname, machine, data_n_timesteps,
+                placement_order)
+        finally:
+            if block_maker is not None:
+                block_maker.close()
+
+    @staticmethod
+    def __get_block_jobs(placement_order):
+        """ Find the synaptic blocks that will be made on the host from\
+            connectors that can make their blocks in any order, and that\
+            don't have rows in the synaptic matrix cache, in the order that\
+            the synaptic matrices will be written
+
+        :param list(~pacman.model.placements.Placement) placement_order:
+            The placements in the order that they will be written
+        :return: The synapse information, the pre- and post-slices of the
+            application vertices, the pre- and post-slices of the block and
+            the seed of the block, for each block
+        :rtype: list(tuple)
+        """
+        edges_by_post_slice = dict()
+        seen = set()
+        jobs = list()
+        for placement in placement_order:
+            app_vertex = placement.vertex.app_vertex
+            if not isinstance(app_vertex, AbstractPopulationVertex):
+                continue
+            post_slice = placement.vertex.vertex_slice
+            # pylint: disable=protected-access
+            app_edges = OrderedSet(
+                proj._projection_edge
+                for proj in app_vertex.incoming_projections)
+            for app_edge in app_edges:
+                if app_edge not in edges_by_post_slice:
+                    edges_by_post_slice[app_edge] = \
+                        SpynnakerDataSpecificationWriter.__edges_by_post_slice(
+                            app_edge)
+                machine_edges = edges_by_post_slice[app_edge][
+                    post_slice.lo_atom]
+                pre_slices = \
+                    app_edge.pre_vertex.splitter.get_out_going_slices()[0]
+                post_slices = \
+                    app_edge.post_vertex.splitter.get_in_coming_slices()[0]
+                for synapse_info in app_edge.synapse_information:
+                    connector = synapse_info.connector
+                    if (synapse_info.may_generate_on_machine() or
+                            not connector.generates_slices_independently()):
+                        continue
+                    for machine_edge in machine_edges:
+                        pre_slice = machine_edge.pre_vertex.vertex_slice
+                        key = (synapse_info, pre_slice.lo_atom,
+                               post_slice.lo_atom)
+                        if key in seen:
+                            continue
+                        seen.add(key)
+
+                        # Blocks with rows in the cache will probably not be
+                        # needed
+                        block_key = get_block_key(
+                            synapse_info, pre_slice, post_slice)
+                        if block_key is not None and has_block(block_key):
+                            continue
+                        jobs.append((
+                            synapse_info, pre_slices, post_slices, pre_slice,
+                            post_slice, connector.get_slice_seed(
+                                synapse_info, pre_slice, post_slice)))
+        return jobs
+
+    @staticmethod
+    def __edges_by_post_slice(app_edge):
+        """ Get the machine edges of an application edge, and of its delay\
+            edge, by the first atom of the post-slice; the delayed and\
+            undelayed edges of a pair of slices share a block, so only one\
+            edge of each pair is included
+
+        :param ProjectionApplicationEdge app_edge:
+        :rtype: dict(int, list(~pacman.model.graphs.machine.MachineEdge))
+        """
+        machine_edges = list(app_edge.machine_edges)
+        if app_edge.delay_edge is not None:
+            machine_edges.extend(app_edge.delay_edge.machine_edges)
+        edges = defaultdict(OrderedDict)
+        for machine_edge in machine_edges:
+            post_lo = machine_edge.post_vertex.vertex_slice.lo_atom
+            pre_lo = machine_edge.pre_vertex.vertex_slice.lo_atom
+            edges[post_lo].setdefault(pre_lo, machine_edge)
+        return defaultdict(list, {
+            post_lo: list(by_pre.values())
+            for post_lo, by_pre in edges.items()})
@@ -16,6 +16,7 @@
 import logging
 import math
 import re
+import threading
 import numpy
 from spinn_utilities.log import FormatAdapter
 from pyNN.random import NumpyRNG, RandomDistribution
@@ -52,13 +53,15 @@ class AbstractConnector(object, metaclass=AbstractBase):
         "_delays",
         "__min_delay",
         "__n_clipped_delays",
-        "_rng",
+        "__rng",
         "__safe",
         "__space",
         "__verbose",
         "_weights",
         "__param_seeds",
-        "__synapse_info"]
+        "__synapse_info",
+        "__slice_rng",
+        "__slice_seed_bases"]
 
     def __init__(self, safe=True, callback=None, verbose=False, rng=None):
         """
@@ -83,6 +86,25 @@ class AbstractConnector(object, metaclass=AbstractBase):
         self.__min_delay = 0
         self.__param_seeds = dict()
         self.__synapse_info = None
+        self.__slice_rng = threading.local()
+        self.__slice_seed_bases = dict()
+
+    @property
+    def _rng(self):
+        """ The random number generator of the blocks being made by this\
+            thread; this is the generator of the connector unless the thread\
+            is making a block from a slice seed
+
+        :rtype: ~pyNN.random.NumpyRNG
+        """
+        slice_rng = getattr(self.__slice_rng, "rng", None)
+        if slice_rng is not None:
+            return slice_rng
+        return self.__rng
+
+    @_rng.setter
+    def _rng(self, rng):
+        self.__rng = rng
 
     def set_space(self, space):
         """ Set the space object (allowed after instantiation).
@@ -421,11 +443,16 @@ class AbstractConnector(object, metaclass=AbstractBase):
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :rtype: ~numpy.ndarray
         """
-        key = (id(pre_vertex_slice), id(post_vertex_slice), id(values))
-        seed = self.__param_seeds.get(key, None)
-        if seed is None:
-            seed = int(values.rng.next() * 0x7FFFFFFF)
-            self.__param_seeds[key] = seed
+        if getattr(self.__slice_rng, "rng", None) is not None:
+            # The block is being made from a slice seed, so take the seed of
+            # the values from that too
+            seed = int(self._rng.next() * 0x7FFFFFFF)
+        else:
+            key = (id(pre_vertex_slice), id(post_vertex_slice), id(values))
+            seed = self.__param_seeds.get(key, None)
+            if seed is None:
+                seed = int(values.rng.next() * 0x7FFFFFFF)
+                self.__param_seeds[key] = seed
         new_rng = NumpyRNG(seed)
         copy_rd = RandomDistribution(
             values.name, parameters_pos=None, rng=new_rng,
@@ -651,6 +678,106 @@ class AbstractConnector(object, metaclass=AbstractBase):
         """
         return False
 
+    def generates_slices_independently(self):
+        """ Determine if a synaptic block for one pair of slices can be made\
+            without the blocks of any other pair having been made first, so\
+            that blocks may be made in any order or in parallel.
+
+        :rtype: bool
+        """
+        return False
+
+    def get_cache_parameters(self):
+        """ Get the parameters of the connector that, with the synapse\
+            information, the slices and the seed of the slices, decide the\
+            connections of a block, so that blocks may be kept between runs.
+
+        :return: The parameters, or None if the blocks can't be kept
+        :rtype: tuple or None
+        """
+        return None
+
+    def uses_random_numbers(self, synapse_info):
+        """ Determine if the blocks of the connector draw any random\
+            numbers, either to choose the connections or to make their\
+            weights and delays, so that a block depends on the seed of its\
+            slices.
+
+        :param SynapseInformation synapse_info:
+        :rtype: bool
+        """
+        return True
+
+    @staticmethod
+    def _has_random_weights_or_delays(synapse_info):
+        """ Determine if the weights or delays are made from random numbers
+
+        :param SynapseInformation synapse_info:
+        :rtype: bool
+        """
+        return (isinstance(synapse_info.weights, RandomDistribution) or
+                isinstance(synapse_info.delays, RandomDistribution))
+
+    def get_slice_seed(
+            self, synapse_info, pre_vertex_slice, post_vertex_slice):
+        """ Get a seed for the random numbers of the block of a pair of\
+            slices; this only depends on the random number generator of the\
+            connector and the slices, so is the same whatever order the\
+            blocks are made in.
+
+        The blocks of a connector with a seeded generator are therefore\
+        reproducible, but not the same as those made by drawing every block\
+        from the generator of the connector in turn, as was done before the\
+        blocks were seeded by slice.
+
+        :param SynapseInformation synapse_info:
+        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :rtype: int
+        """
+        base_seed = self.__slice_seed_bases.get(synapse_info, None)
+        if base_seed is None:
+            base_seed = int(self.__rng.next() * 0x7FFFFFFF)
+            self.__slice_seed_bases[synapse_info] = base_seed
+        return int(numpy.random.RandomState(
+            [base_seed, pre_vertex_slice.lo_atom,
+             post_vertex_slice.lo_atom]).randint(0x7FFFFFFF))
+
+    def use_slice_seed(self, seed):
+        """ Draw the random numbers of the blocks made from now on by this\
+            thread from a generator with the given seed, or go back to the\
+            generator of the connector.
+
+        :param seed: The seed from :py:meth:`get_slice_seed`, or None
+        :type seed: int or None
+        """
+        self.__slice_rng.rng = None if seed is None else NumpyRNG(seed)
+
+    def create_synaptic_block_from_seed(
+            self, seed, pre_slices, post_slices, pre_vertex_slice,
+            post_vertex_slice, synapse_type, synapse_info):
+        """ Create a synaptic block with random numbers from a generator\
+            with the given seed; only the calling thread uses the seed, so\
+            blocks of connectors that generate slices independently may be\
+            made by several threads at once.
+
+        :param int seed: The seed from :py:meth:`get_slice_seed`
+        :param list(~pacman.model.graphs.common.Slice) pre_slices:
+        :param list(~pacman.model.graphs.common.Slice) post_slices:
+        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :param AbstractSynapseType synapse_type:
+        :param SynapseInformation synapse_info:
+        :rtype: ~numpy.ndarray
+        """
+        self.use_slice_seed(seed)
+        try:
+            return self.create_synaptic_block(
+                pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
+                synapse_type, synapse_info)
+        finally:
+            self.use_slice_seed(None)
+
     def could_connect(
             self, synapse_info, src_machine_vertex, dest_machine_vertex):
         """
@@ -38,6 +38,8 @@ PARAM_TYPE_BY_NAME = {
 
 PARAM_TYPE_KERNEL = 6
 
+PARAM_TYPE_FROM_LIST = 7
+
 
 # Hashes of the connection generators supported by the synapse expander
 class ConnectorIDs(Enum):
@@ -48,6 +50,7 @@ class ConnectorIDs(Enum):
     FIXED_NUMBER_PRE_CONNECTOR = 4
     FIXED_NUMBER_POST_CONNECTOR = 5
     KERNEL_CONNECTOR = 6
+    FROM_LIST_CONNECTOR = 7
 
 
 class AbstractGenerateConnectorOnMachine(
@@ -308,6 +311,25 @@ class AbstractGenerateConnectorOnMachine(
         """
         return 0
 
+    def gen_connector_params_total_size_in_bytes(
+            self, synapse_info, n_blocks, pre_vertex_slice=None,
+            post_vertex_slice=None):
+        """ The most that the connector parameters of a number of blocks of\
+            connections can take in bytes, where each block is between a\
+            pre-slice and a post-slice.  Where given, the blocks are all\
+            from the given pre-slice or all to the given post-slice.
+
+        :param SynapseInformation synapse_info:
+        :param int n_blocks: The number of blocks
+        :param pre_vertex_slice: The pre-slice of all the blocks, if known
+        :type pre_vertex_slice: ~pacman.model.graphs.common.Slice or None
+        :param post_vertex_slice: The post-slice of all the blocks, if known
+        :type post_vertex_slice: ~pacman.model.graphs.common.Slice or None
+        :rtype: int
+        """
+        # pylint: disable=unused-argument
+        return self.gen_connector_params_size_in_bytes * n_blocks
+
     @staticmethod
     def _get_view_lo_hi(view):
         """ Get the range of neuron IDs covered by a view.
@@ -117,6 +117,18 @@ class AllToAllConnector(AbstractGenerateConnectorOnMachine,
         return self._get_weight_maximum(
             synapse_info.weights, n_conns, synapse_info)
 
+    @overrides(AbstractConnector.generates_slices_independently)
+    def generates_slices_independently(self):
+        return True
+
+    @overrides(AbstractConnector.uses_random_numbers)
+    def uses_random_numbers(self, synapse_info):
+        return self._has_random_weights_or_delays(synapse_info)
+
+    @overrides(AbstractConnector.get_cache_parameters)
+    def get_cache_parameters(self):
+        return (self.__allow_self_connections, )
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
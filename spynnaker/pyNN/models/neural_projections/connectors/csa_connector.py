@@ -34,7 +34,7 @@ class CSAConnector(AbstractConnector):
     """
 
     __slots = [
-        "__cset", "__full_connection_set", "__full_cset"]
+        "__cset", "__full_cset"]
 
     def __init__(self, cset, safe=True, callback=None, verbose=False):
         """
@@ -64,7 +64,6 @@ class CSAConnector(AbstractConnector):
         self.__cset = cset
 
         # Storage for full connection sets
-        self.__full_connection_set = None
         self.__full_cset = None
 
     @overrides(AbstractConnector.get_delay_maximum)
@@ -134,6 +133,10 @@ class CSAConnector(AbstractConnector):
         return self._get_weight_maximum(
             synapse_info.weights, n_conns_max, synapse_info)
 
+    @overrides(AbstractConnector.generates_slices_independently)
+    def generates_slices_independently(self):
+        return True
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
@@ -141,15 +144,6 @@ class CSAConnector(AbstractConnector):
         n_connections, pair_list = self._get_n_connections(
             pre_vertex_slice, post_vertex_slice, synapse_info)
 
-        # Use whatever has been set up in _get_n_connections here
-        # to send into the block structure
-        # TO DO: not sure this works with repeated connector, but
-        #        what does a repeated connector mean in this context?
-        if self.__full_connection_set is None:
-            self.__full_connection_set = [x for x in pair_list]
-        else:
-            self.__full_connection_set += [x for x in pair_list]
-
         block = numpy.zeros(
             n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
         # source and target are the pre_neurons and post_neurons in pair_list
@@ -170,7 +164,9 @@ class CSAConnector(AbstractConnector):
         :param int n_post_neurons:
         """
         # Yuck; this was supposed to be available to the user from scripts...
-        csa.show(self.__full_connection_set, n_pre_neurons, n_post_neurons)
+        # The blocks are the parts of the full set within each pair of slices,
+        # so together they are the full set whatever order they were made in
+        csa.show(self.__full_cset, n_pre_neurons, n_post_neurons)
 
     def __repr__(self):
         return "CSAConnector({})".format(
@@ -172,6 +172,15 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
                 numpy.amax(self.__probs)),
             synapse_info)
 
+    @overrides(AbstractConnector.generates_slices_independently)
+    def generates_slices_independently(self):
+        return True
+
+    @overrides(AbstractConnector.get_cache_parameters)
+    def get_cache_parameters(self):
+        return (
+            self.__d_expression, self.__allow_self_connections, self.__probs)
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
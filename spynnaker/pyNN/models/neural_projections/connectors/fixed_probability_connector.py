@@ -127,6 +127,14 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine,
         return self._get_weight_maximum(
             synapse_info.weights, n_connections, synapse_info)
 
+    @overrides(AbstractConnector.generates_slices_independently)
+    def generates_slices_independently(self):
+        return True
+
+    @overrides(AbstractConnector.get_cache_parameters)
+    def get_cache_parameters(self):
+        return (self._p_connect, self.__allow_self_connections)
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
@@ -13,17 +13,27 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import hashlib
+import logging
 import os
 import numpy
 from pyNN.recording.files import StandardTextFile
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.overrides import overrides
 from .from_list_connector import FromListConnector
 
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# File extensions which are read as numpy binary files rather than text
+_NPY = ".npy"
+_NPZ = ".npz"
+
 
 class FromFileConnector(FromListConnector):
     """ Make connections according to a list read from a file.
     """
     # pylint: disable=redefined-builtin
-    __slots__ = ["_file"]
+    __slots__ = ["_file", "__binary"]
 
     def __init__(
             self, file,  # @ReservedAssignment
@@ -39,6 +49,17 @@ class FromFileConnector(FromListConnector):
                 # columns = ["i", "j", "weight", "delay", "U", "tau_rec"]
 
             Note that the header requires `#` at the beginning of the line.
+
+            A filename ending in ``.npy`` is instead memory-mapped as a numpy
+            array, either 2D as above or structured as described in
+            :py:class:`FromListConnector`, so that the connections are not
+            read into memory.
+            A filename ending in ``.npz`` is read as a numpy archive holding
+            either a single such array or one array per column, named as
+            the fields of a structured array; these are read into memory.
+            For either, the order of the connections when split between
+            cores is saved in files next to this file, for reuse when the
+            network is next mapped in the same way.
         :type file: str or ~io.FileIO
         :param bool distributed:
             Basic pyNN says:
@@ -63,7 +84,11 @@ class FromFileConnector(FromListConnector):
             CSV file
         """
         self._file = file
-        if isinstance(file, str):
+        self.__binary = isinstance(file, str) and file.endswith((_NPY, _NPZ))
+        column_names = None
+        if self.__binary:
+            conn_list = self._read_binary_conn_list(file)
+        elif isinstance(file, str):
             real_file = self.get_reader(file)
             try:
                 conn_list = self._read_conn_list(real_file, distributed)
@@ -72,17 +97,74 @@ class FromFileConnector(FromListConnector):
         else:
             conn_list = self._read_conn_list(file, distributed)
 
-        column_names = self.get_reader(self._file).get_metadata().get(
-            'columns')
-        if column_names is not None:
-            column_names = [column for column in column_names
-                            if column not in ("i", "j")]
+        if not self.__binary:
+            column_names = self.get_reader(self._file).get_metadata().get(
+                'columns')
+            if column_names is not None:
+                column_names = [column for column in column_names
+                                if column not in ("i", "j")]
 
         # pylint: disable=too-many-arguments
         super().__init__(
             conn_list, safe=safe, verbose=verbose,
             column_names=column_names, callback=callback)
 
+    @staticmethod
+    def _read_binary_conn_list(filename):
+        """ Read a connection list from a numpy binary file.
+
+        :param str filename: The name of the ``.npy`` or ``.npz`` file
+        :rtype: ~numpy.ndarray
+        """
+        if filename.endswith(_NPY):
+            return numpy.load(filename, mmap_mode="r")
+        with numpy.load(filename) as archive:
+            names = archive.files
+            if len(names) == 1:
+                return archive[names[0]]
+            columns = [archive[name] for name in names]
+        conn_list = numpy.empty(len(columns[0]), dtype=[
+            (name, column.dtype) for name, column in zip(names, columns)])
+        for name, column in zip(names, columns):
+            conn_list[name] = column
+        return conn_list
+
+    @overrides(FromListConnector._sort_into_blocks)
+    def _sort_into_blocks(self, pre_bins, post_bins, order=None):
+        if not self.__binary:
+            return super()._sort_into_blocks(pre_bins, post_bins, order)
+
+        # The saved order depends on the way the connections are split
+        digest = hashlib.md5()
+        digest.update(numpy.asarray(pre_bins, dtype="int64").tobytes())
+        digest.update(numpy.asarray(post_bins, dtype="int64").tobytes())
+        prefix = "{}.{}".format(self._file, digest.hexdigest()[:16])
+        order_file = prefix + ".order" + _NPY
+        offsets_file = prefix + ".offsets" + _NPY
+
+        # Reuse a saved order if it was written after the connections
+        # (the offsets are written last, so their presence marks completion)
+        if (os.path.exists(offsets_file) and os.path.exists(order_file) and
+                os.path.getmtime(offsets_file) >=
+                os.path.getmtime(self._file)):
+            return (numpy.load(order_file, mmap_mode="r"),
+                    numpy.load(offsets_file))
+
+        try:
+            order = numpy.lib.format.open_memmap(
+                order_file, mode="w+", dtype="int64",
+                shape=(len(self.conn_list),))
+            order, offsets = super()._sort_into_blocks(
+                pre_bins, post_bins, order)
+            order.flush()
+            numpy.save(offsets_file, offsets)
+        except OSError:
+            logger.warning(
+                "Unable to save the connection order of {} next to it;"
+                " it will be kept in memory instead", self._file)
+            return super()._sort_into_blocks(pre_bins, post_bins)
+        return order, offsets
+
     def _read_conn_list(self, the_file, distributed):
         if not distributed:
             return the_file.read()
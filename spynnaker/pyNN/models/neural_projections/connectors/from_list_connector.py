@@ -13,22 +13,43 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import hashlib
 import numpy
 from spinn_utilities.overrides import overrides
+from data_specification.enums.data_type import DataType
 from spinn_front_end_common.utilities.constants import (
-    MICRO_TO_MILLISECOND_CONVERSION)
+    BYTES_PER_WORD, MICRO_TO_MILLISECOND_CONVERSION)
 from spinn_front_end_common.utilities.globals_variables import (
-    machine_time_step)
+    machine_time_step, machine_time_step_ms)
 from spynnaker.pyNN.exceptions import InvalidParameterType
 from .abstract_connector import AbstractConnector
+from .abstract_generate_connector_on_machine import (
+    AbstractGenerateConnectorOnMachine, ConnectorIDs, PARAM_TYPE_FROM_LIST)
 
 # Indices of the source and target in the connection list array
 _SOURCE = 0
 _TARGET = 1
 _FIRST_PARAM = 2
 
+# Names of the source and target fields in a structured connection list
+_SOURCE_FIELDS = ("source", "i")
+_TARGET_FIELDS = ("target", "j")
 
-class FromListConnector(AbstractConnector):
+# The number of connections to group into blocks at once; this limits the
+# memory used when splitting lists that are memory-mapped from files
+_SPLIT_CHUNK_SIZE = 1 << 22
+
+# The pairs of weight and delay that connections are generated with
+_VALUES_DTYPE = [("weight", "float64"), ("delay", "float64")]
+
+# The number of words before the rows of a block generated on the machine
+_N_BLOCK_HEADER_WORDS = 4
+
+# The bits of a variable-length number held in each byte
+_VARINT_BITS = 7
+
+
+class FromListConnector(AbstractGenerateConnectorOnMachine):
     """ Make connections according to a list.
     """
     __slots__ = [
@@ -41,8 +62,13 @@ class FromListConnector(AbstractConnector):
         "__extra_parameters",
         "__extra_parameter_names",
         "__split_conn_list",
+        "__split_order",
         "__split_pre_slices",
-        "__split_post_slices"]
+        "__split_post_slices",
+        "__list_digest",
+        "__n_per_source",
+        "__n_per_target",
+        "__gen_blocks"]
 
     def __init__(self, conn_list, safe=True, verbose=False, column_names=None,
                  callback=None):
@@ -59,6 +85,11 @@ class FromListConnector(AbstractConnector):
             ``p1``, ``p2``, etc. are the synaptic parameters (e.g.,
             weight, delay, plasticity parameters).
             All tuples/rows must have the same number of items.
+            Alternatively, a one-dimensional structured numpy array (which
+            may be memory-mapped) with fields ``source`` (or ``i``),
+            ``target`` (or ``j``) and the synaptic parameters; the parameters
+            are then the other fields in order, unless ``column_names`` is
+            given.
         :type conn_list: ~numpy.ndarray or list(tuple(int,int,...))
         :param bool safe:
             if ``True``, check that weights and delays have valid values.
@@ -80,8 +111,13 @@ class FromListConnector(AbstractConnector):
 
         self.__column_names = column_names
         self.__split_conn_list = {}
+        self.__split_order = None
         self.__split_pre_slices = None
         self.__split_post_slices = None
+        self.__list_digest = None
+        self.__n_per_source = None
+        self.__n_per_target = None
+        self.__gen_blocks = dict()
 
         # Call the conn_list setter, as this sets the internal values
         self.conn_list = conn_list
@@ -92,7 +128,7 @@ class FromListConnector(AbstractConnector):
             return self._get_delay_maximum(
                 synapse_info.delays, len(self.__targets), synapse_info)
         else:
-            return numpy.max(self.__delays)
+            return self.__round_delays(numpy.max(self.__delays))
 
     @overrides(AbstractConnector.get_delay_minimum)
     def get_delay_minimum(self, synapse_info):
@@ -100,7 +136,7 @@ class FromListConnector(AbstractConnector):
             return self._get_delay_minimum(
                 synapse_info.delays, len(self.__targets), synapse_info)
         else:
-            return numpy.min(self.__delays)
+            return self.__round_delays(numpy.min(self.__delays))
 
     @overrides(AbstractConnector.get_delay_variance)
     def get_delay_variance(self, delays, synapse_info):
@@ -108,7 +144,9 @@ class FromListConnector(AbstractConnector):
             return AbstractConnector.get_delay_variance(
                 self, delays, synapse_info)
         else:
-            return numpy.var(self.__delays)
+            return _chunked_variance(
+                self.__round_delays(self.__delays[chunk])
+                for chunk in _chunks(len(self.__delays)))
 
     def _split_connections(self, pre_slices, post_slices):
         """
@@ -121,6 +159,9 @@ class FromListConnector(AbstractConnector):
                 self.__split_post_slices == post_slices):
             return False
 
+        # Any blocks encoded for generation on the machine are now different
+        self.__gen_blocks = dict()
+
         # If there are no connections, return
         if not len(self.__sources):
             self.__split_conn_list = {}
@@ -135,65 +176,81 @@ class FromListConnector(AbstractConnector):
         post_bins = numpy.concatenate((
             [0], numpy.sort([s.hi_atom + 1 for s in post_slices])))
 
-        # Find the group of each item in the separate bins
-        pre_indices = numpy.searchsorted(
-            pre_bins, self.__sources, side="right")
-        post_indices = numpy.searchsorted(
-            post_bins, self.__targets, side="right")
+        # Sort the connections by the block they fall in to
+        self.__split_order, offsets = self._sort_into_blocks(
+            pre_bins, post_bins)
 
-        # Join the groups from both axes
+        # Count the connections in each block, ignoring the outliers
         n_bins = (len(pre_bins) + 1, len(post_bins) + 1)
-        joined_indices = numpy.ravel_multi_index(
-            (pre_indices, post_indices), n_bins)
+        counts = numpy.diff(offsets).reshape(n_bins)[1:-1, 1:-1]
 
-        # Get a count of the indices in each bin
-        index_count = numpy.bincount(
-            joined_indices, minlength=numpy.prod(n_bins))
+        # Get the ranges of the sort order indexed by hi_atom in the slices
+        self.__split_conn_list = dict()
+        for pre_index, post_index in zip(*numpy.nonzero(counts)):
+            block = numpy.ravel_multi_index(
+                (pre_index + 1, post_index + 1), n_bins)
+            self.__split_conn_list[
+                pre_bins[pre_index + 1] - 1, post_bins[post_index + 1] - 1] = (
+                    offsets[block], offsets[block + 1])
 
-        # Get a sort order on the connections
-        sort_indices = numpy.argsort(joined_indices)
+        return True
 
-        # Split the sort order in to groups of connection indices
-        split_indices = numpy.array(numpy.split(
-            sort_indices, numpy.cumsum(index_count)))
+    def _sort_into_blocks(self, pre_bins, post_bins, order=None):
+        """ Get an order of the connections which groups them by the\
+            (pre-slice, post-slice) block they fall in to.
+
+        :param ~numpy.ndarray pre_bins:
+            Zero followed by one more than the last atom of each pre-slice
+        :param ~numpy.ndarray post_bins:
+            Zero followed by one more than the last atom of each post-slice
+        :param order:
+            Where to write the order; a new array is made if not given
+        :type order: ~numpy.ndarray or None
+        :return: The order, and the offset of each block within it
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        return _block_sort(
+            self.__sources, self.__targets, pre_bins, post_bins, order)
 
-        # Ignore the outliers
-        split_indices = split_indices[:-1].reshape(n_bins)[1:-1, 1:-1]
-        split_indices = split_indices.reshape(-1)
+    def __block_indices(self, pre_hi, post_hi):
+        """ Get the indices of the connections in a block.
 
-        # Get the results indexed by hi_atom in the slices
-        pre_post_bins = [(pre - 1, post - 1) for pre in pre_bins[1:]
-                         for post in post_bins[1:]]
-        self.__split_conn_list = {
-            pre_post: indices
-            for pre_post, indices in zip(pre_post_bins, split_indices)
-            if len(indices) > 0
-        }
+        :param int pre_hi: The last atom of the pre-slice
+        :param int post_hi: The last atom of the post-slice
+        :rtype: ~numpy.ndarray
+        """
+        start, end = self.__split_conn_list[pre_hi, post_hi]
+        return numpy.array(self.__split_order[start:end])
 
-        return True
+    def __round_delays(self, delays):
+        """ Round delays from the list to whole time steps.
+
+        :param delays: The delays to round
+        :type delays: float or ~numpy.ndarray
+        :rtype: float or ~numpy.ndarray
+        """
+        time_step_ms = machine_time_step() / MICRO_TO_MILLISECOND_CONVERSION
+        return numpy.rint(numpy.asarray(delays) / time_step_ms) * time_step_ms
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, post_vertex_slice, synapse_info, min_delay=None,
             max_delay=None):
 
-        mask = None
-        if min_delay is None or max_delay is None or self.__delays is None:
-            mask = ((self.__targets >= post_vertex_slice.lo_atom) &
-                    (self.__targets <= post_vertex_slice.hi_atom))
-        elif self.__delays is not None:
-            mask = ((self.__targets >= post_vertex_slice.lo_atom) &
-                    (self.__targets <= post_vertex_slice.hi_atom) &
-                    (self.__delays >= min_delay) &
-                    (self.__delays <= max_delay))
-        if mask is None:
-            sources = self.__sources
-        else:
-            sources = self.__sources[mask]
-        if sources.size == 0:
+        # Count the connections of each source a chunk at a time
+        counts = numpy.zeros(0, dtype="int64")
+        for chunk in _chunks(len(self.__sources)):
+            targets = self.__targets[chunk]
+            mask = ((targets >= post_vertex_slice.lo_atom) &
+                    (targets <= post_vertex_slice.hi_atom))
+            if (min_delay is not None and max_delay is not None and
+                    self.__delays is not None):
+                delays = self.__round_delays(self.__delays[chunk])
+                mask &= (delays >= min_delay) & (delays <= max_delay)
+            counts = _add_counts(counts, self.__sources[chunk][mask])
+        if not counts.size:
             return 0
-        max_targets = numpy.max(numpy.bincount(
-            sources.astype('int64', copy=False)))
+        max_targets = numpy.max(counts)
 
         # If no delays just return max targets as this is for all delays
         # If there are delays in the list, this was also handled above
@@ -212,8 +269,7 @@ class FromListConnector(AbstractConnector):
         if not len(self.__targets):
             return 0
         # pylint: disable=too-many-arguments
-        return numpy.max(numpy.bincount(
-            self.__targets.astype('int64', copy=False)))
+        return numpy.max(self.__get_n_per_neuron()[1])
 
     @overrides(AbstractConnector.get_weight_mean)
     def get_weight_mean(self, weights, synapse_info):
@@ -221,7 +277,10 @@ class FromListConnector(AbstractConnector):
             return AbstractConnector.get_weight_mean(
                 self, weights, synapse_info)
         else:
-            return numpy.mean(numpy.abs(self.__weights))
+            return numpy.sum([
+                numpy.sum(numpy.abs(self.__weights[chunk]))
+                for chunk in _chunks(len(self.__weights))]) / len(
+                    self.__weights)
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self, synapse_info):
@@ -230,7 +289,9 @@ class FromListConnector(AbstractConnector):
             return self._get_weight_maximum(
                 synapse_info.weights, len(self.__targets), synapse_info)
         else:
-            return numpy.amax(numpy.abs(self.__weights))
+            return numpy.amax([
+                numpy.amax(numpy.abs(self.__weights[chunk]))
+                for chunk in _chunks(len(self.__weights))])
 
     @overrides(AbstractConnector.get_weight_variance)
     def get_weight_variance(self, weights, synapse_info):
@@ -239,7 +300,32 @@ class FromListConnector(AbstractConnector):
             return AbstractConnector.get_weight_variance(
                 self, weights, synapse_info)
         else:
-            return numpy.var(numpy.abs(self.__weights))
+            return _chunked_variance(
+                numpy.abs(self.__weights[chunk])
+                for chunk in _chunks(len(self.__weights)))
+
+    @overrides(AbstractConnector.generates_slices_independently)
+    def generates_slices_independently(self):
+        return True
+
+    @overrides(AbstractConnector.uses_random_numbers)
+    def uses_random_numbers(self, synapse_info):
+        return self._has_random_weights_or_delays(synapse_info)
+
+    @overrides(AbstractConnector.get_cache_parameters)
+    def get_cache_parameters(self):
+        # The list can be big, so it is only read once to make a digest
+        if self.__list_digest is None:
+            digest = hashlib.sha256()
+            digest.update(repr((
+                self.__conn_list.dtype.descr, self.__conn_list.shape,
+                self.__column_names)).encode())
+            n_rows = len(self.__conn_list)
+            for start in range(0, n_rows, _SPLIT_CHUNK_SIZE):
+                digest.update(numpy.ascontiguousarray(
+                    self.__conn_list[start:start + _SPLIT_CHUNK_SIZE]).data)
+            self.__list_digest = digest.hexdigest()
+        return (self.__list_digest, )
 
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
@@ -252,8 +338,7 @@ class FromListConnector(AbstractConnector):
         if (pre_hi, post_hi) not in self.__split_conn_list:
             return numpy.zeros(0, dtype=self.NUMPY_SYNAPSES_DTYPE)
         else:
-            indices = self.__split_conn_list[
-                pre_vertex_slice.hi_atom, post_vertex_slice.hi_atom]
+            indices = self.__block_indices(pre_hi, post_hi)
         block = numpy.zeros(len(indices), dtype=self.NUMPY_SYNAPSES_DTYPE)
         block["source"] = self.__sources[indices]
         block["target"] = self.__targets[indices]
@@ -276,7 +361,8 @@ class FromListConnector(AbstractConnector):
                     block["source"], block["target"], len(indices), None,
                     pre_vertex_slice, post_vertex_slice, synapse_info)
         else:
-            block["delay"] = self._clip_delays(self.__delays[indices])
+            block["delay"] = self._clip_delays(
+                self.__round_delays(self.__delays[indices]))
         block["synapse_type"] = synapse_type
         return block
 
@@ -307,9 +393,76 @@ class FromListConnector(AbstractConnector):
     def conn_list(self, conn_list):
         if conn_list is None or not len(conn_list):
             self.__conn_list = numpy.zeros((0, 2), dtype="uint32")
+        elif isinstance(conn_list, numpy.memmap):
+            # Leave memory-mapped lists on disk rather than copying them
+            self.__conn_list = conn_list
         else:
             self.__conn_list = numpy.array(conn_list)
+        self.__list_digest = None
+        self.__n_per_source = None
+        self.__n_per_target = None
+        self.__gen_blocks = dict()
+
+        # Get the columns, either by name or by position
+        if self.__conn_list.dtype.names is not None:
+            sources, targets, column_names, columns = \
+                self.__get_named_columns()
+        else:
+            sources, targets, column_names, columns = \
+                self.__get_positional_columns()
+
+        # Set the source and targets
+        self.__sources = sources
+        self.__targets = targets
 
+        # Find any weights
+        self.__weights = None
+        if 'weight' in column_names:
+            self.__weights = columns[column_names.index('weight')]
+
+        # Find any delays; these are rounded to time steps when used
+        self.__delays = None
+        if 'delay' in column_names:
+            self.__delays = columns[column_names.index('delay')]
+
+        # Find extra columns
+        extra_columns = list()
+        for i, name in enumerate(column_names):
+            if name not in ('weight', 'delay'):
+                extra_columns.append(i)
+
+        # Check any additional parameters have single values over the whole
+        # set of connections (as other things aren't currently supported
+        for i in extra_columns:
+            first = columns[i][0]
+            if any(numpy.any(columns[i][chunk] != first)
+                   for chunk in _chunks(len(columns[i]))):
+                raise ValueError(
+                    "All values in column {} ({}) of a FromListConnector must"
+                    " have the same value".format(
+                        i + _FIRST_PARAM, column_names[i]))
+
+        # Store the extra data; as each column has a single value, this is a
+        # view of those values as one row per connection
+        self.__extra_parameters = None
+        self.__extra_parameter_names = None
+        if extra_columns:
+            first_row = numpy.array(
+                [columns[i][0] for i in extra_columns],
+                dtype=numpy.result_type(*[columns[i] for i in extra_columns]))
+            self.__extra_parameters = numpy.broadcast_to(
+                first_row, (len(self.__sources), len(extra_columns)))
+            self.__extra_parameter_names = [
+                column_names[i] for i in extra_columns]
+
+    def __get_positional_columns(self):
+        """ Get the columns of a 2D connection list.
+
+        :return: The sources, the targets, the names of the other columns\
+            and the other columns
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, list(str),
+            list(~numpy.ndarray))
+        """
         # If the shape of the conn_list is 2D, numpy has been able to create
         # a 2D array which means every entry has the same number of values.
         # If this was not possible, raise an exception!
@@ -343,53 +496,47 @@ class FromListConnector(AbstractConnector):
                     "Need to set 'column_names' for n_columns={}".format(
                         n_columns))
 
-        # Set the source and targets
-        self.__sources = self.__conn_list[:, _SOURCE]
-        self.__targets = self.__conn_list[:, _TARGET]
-
-        # Find any weights
-        self.__weights = None
-        try:
-            weight_column = column_names.index('weight') + _FIRST_PARAM
-            self.__weights = self.__conn_list[:, weight_column]
-        except ValueError:
-            pass
-
-        # Find any delays
-        self.__delays = None
-        try:
-            delay_column = column_names.index('delay') + _FIRST_PARAM
-            self.__delays = (numpy.rint(
-                numpy.array(self.__conn_list[:, delay_column]) * (
-                    MICRO_TO_MILLISECOND_CONVERSION / machine_time_step())) *
-                    (machine_time_step() / MICRO_TO_MILLISECOND_CONVERSION))
-        except ValueError:
-            pass
+        return (
+            self.__conn_list[:, _SOURCE], self.__conn_list[:, _TARGET],
+            list(column_names),
+            [self.__conn_list[:, i] for i in range(_FIRST_PARAM, n_columns)])
 
-        # Find extra columns
-        extra_columns = list()
-        for i, name in enumerate(column_names):
-            if name not in ('weight', 'delay'):
-                extra_columns.append(i + _FIRST_PARAM)
+    def __get_named_columns(self):
+        """ Get the columns of a structured connection list, e.g. one\
+            memory-mapped from a file.  The fields other than the source and\
+            target are the parameters, unless column names are given.
 
-        # Check any additional parameters have single values over the whole
-        # set of connections (as other things aren't currently supported
-        for i in extra_columns:
-            # numpy.ptp gives the difference between the maximum and
-            # minimum values of an array, so if 0, all values are equal
-            if numpy.ptp(self.__conn_list[:, i]):
-                raise ValueError(
-                    "All values in column {} ({}) of a FromListConnector must"
-                    " have the same value".format(
-                        i, column_names[i - _FIRST_PARAM]))
+        :return: The sources, the targets, the names of the other columns\
+            and the other columns
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, list(str),
+            list(~numpy.ndarray))
+        """
+        if len(self.__conn_list.shape) != 1:
+            raise InvalidParameterType(
+                "A structured connection list for the FromListConnector"
+                " must be one-dimensional")
+        names = self.__conn_list.dtype.names
+        source = _find_field(names, _SOURCE_FIELDS)
+        target = _find_field(names, _TARGET_FIELDS)
+        if source is None or target is None:
+            raise InvalidParameterType(
+                "A structured connection list for the FromListConnector"
+                " must have fields {} and {}".format(
+                    " or ".join(_SOURCE_FIELDS), " or ".join(_TARGET_FIELDS)))
 
-        # Store the extra data
-        self.__extra_parameters = None
-        self.__extra_parameter_names = None
-        if extra_columns:
-            self.__extra_parameters = self.__conn_list[:, extra_columns]
-            self.__extra_parameter_names = [
-                column_names[i - _FIRST_PARAM] for i in extra_columns]
+        column_names = self.__column_names
+        if column_names is None:
+            column_names = [
+                name for name in names if name not in (source, target)]
+        for name in column_names:
+            if name not in names:
+                raise InvalidParameterType(
+                    "The connection list has no field called {}".format(name))
+
+        return (
+            self.__conn_list[source], self.__conn_list[target],
+            list(column_names),
+            [self.__conn_list[name] for name in column_names])
 
     @property
     def column_names(self):
@@ -433,6 +580,240 @@ class FromListConnector(AbstractConnector):
         post_hi = dest_machine_vertex.vertex_slice.hi_atom
         return (pre_hi, post_hi) in self.__split_conn_list
 
+    @property
+    def __has_values(self):
+        """ Whether the list gives the weights or delays of the connections
+
+        :rtype: bool
+        """
+        return self.__weights is not None or self.__delays is not None
+
+    def __values_of(self, indices):
+        """ Get the (weight, delay) pairs of some connections as they are\
+            generated on the machine, with the weights quantised to s1615 and\
+            the delays rounded; values not in the list are zero.
+
+        :param ~numpy.ndarray indices: The connections to get the values of
+        :rtype: ~numpy.ndarray
+        """
+        values = numpy.zeros(len(indices), dtype=_VALUES_DTYPE)
+        if self.__weights is not None:
+            scale = float(DataType.S1615.scale)
+            values["weight"] = numpy.round(
+                self.__weights[indices] * scale) / scale
+        if self.__delays is not None:
+            values["delay"] = self.__round_delays(self.__delays[indices])
+        return values
+
+    def __get_n_per_neuron(self):
+        """ Get the number of connections from each source and to each\
+            target, counted once over the list a chunk at a time.
+
+        :return: The counts indexed by source and by target
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        if self.__n_per_source is None:
+            n_per_source = numpy.zeros(0, dtype="int64")
+            n_per_target = numpy.zeros(0, dtype="int64")
+            for chunk in _chunks(len(self.__sources)):
+                n_per_source = _add_counts(n_per_source, self.__sources[chunk])
+                n_per_target = _add_counts(n_per_target, self.__targets[chunk])
+            self.__n_per_source = n_per_source
+            self.__n_per_target = n_per_target
+        return self.__n_per_source, self.__n_per_target
+
+    def __get_gen_block(self, pre_vertex_slice, post_vertex_slice):
+        """ Get the encoded connections of a block, and the table of values\
+            that they index, encoding them if not already done.  The\
+            connections must already be split between the slices.
+
+        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :rtype: tuple(~numpy.ndarray(~numpy.uint32), ~numpy.ndarray)
+        """
+        key = (pre_vertex_slice.hi_atom, post_vertex_slice.hi_atom)
+        if key not in self.__gen_blocks:
+            self.__gen_blocks[key] = self.__encode_block(
+                pre_vertex_slice, post_vertex_slice)
+        return self.__gen_blocks[key]
+
+    def __encode_block(self, pre_vertex_slice, post_vertex_slice):
+        """ Encode the connections of a block for generation on the machine.
+
+        The block is a header, followed by the rows of the pre-neurons of the\
+        pre-slice as variable-length numbers; each row is the number of\
+        connections, then for each connection in order of target, the\
+        difference of the target from the last target (or from the start of\
+        the post-slice), and the index of its values if the list has any.\
+        The values are the distinct (weight, delay) pairs of the block.
+
+        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :return: The encoded block and the table of its values
+        :rtype: tuple(~numpy.ndarray(~numpy.uint32), ~numpy.ndarray)
+        """
+        key = (pre_vertex_slice.hi_atom, post_vertex_slice.hi_atom)
+        if key not in self.__split_conn_list:
+            return numpy.array(
+                [0, pre_vertex_slice.lo_atom, self.__has_values, 0],
+                dtype="uint32"), numpy.zeros(0, dtype=_VALUES_DTYPE)
+
+        indices = self.__block_indices(*key)
+        sources = self.__sources[indices].astype("int64", copy=False) - \
+            pre_vertex_slice.lo_atom
+        targets = self.__targets[indices].astype("int64", copy=False) - \
+            post_vertex_slice.lo_atom
+        order = numpy.lexsort((targets, sources))
+        indices = indices[order]
+        sources = sources[order]
+        targets = targets[order]
+
+        # Each target is given relative to the last in the row
+        deltas = targets.copy()
+        deltas[1:] -= targets[:-1]
+        first = numpy.ones(len(sources), dtype="bool")
+        first[1:] = sources[1:] != sources[:-1]
+        deltas[first] = targets[first]
+
+        # Find where each row and each connection goes in the numbers
+        n_per_connection = 2 if self.__has_values else 1
+        n_per_row = numpy.bincount(sources, minlength=pre_vertex_slice.n_atoms)
+        row_sizes = 1 + n_per_row * n_per_connection
+        row_starts = numpy.cumsum(row_sizes) - row_sizes
+        row_offsets = numpy.cumsum(n_per_row) - n_per_row
+        positions = row_starts[sources] + 1 + n_per_connection * (
+            numpy.arange(len(sources)) - row_offsets[sources])
+
+        numbers = numpy.zeros(numpy.sum(row_sizes), dtype="uint32")
+        numbers[row_starts] = n_per_row
+        numbers[positions] = deltas
+        values = numpy.zeros(0, dtype=_VALUES_DTYPE)
+        if self.__has_values:
+            values, numbers[positions + 1] = numpy.unique(
+                self.__values_of(indices), return_inverse=True)
+        data = _encode_varints(numbers)
+        n_bytes = len(data)
+        data = numpy.concatenate((
+            data, numpy.zeros(-n_bytes % BYTES_PER_WORD, dtype="uint8")))
+        return numpy.concatenate((numpy.array(
+            [pre_vertex_slice.n_atoms, pre_vertex_slice.lo_atom,
+             self.__has_values, n_bytes], dtype="uint32"),
+            data.view("uint32"))), values
+
+    @overrides(AbstractGenerateConnectorOnMachine.generate_on_machine)
+    def generate_on_machine(self, weights, delays):
+        if self.__weights is None and not self._generate_lists_on_machine(
+                weights):
+            return False
+        if self.__delays is None and not self._generate_lists_on_machine(
+                delays):
+            return False
+        return True
+
+    @overrides(AbstractGenerateConnectorOnMachine.gen_weights_id)
+    def gen_weights_id(self, weights):
+        if self.__weights is not None:
+            return PARAM_TYPE_FROM_LIST
+        return super().gen_weights_id(weights)
+
+    @overrides(
+        AbstractGenerateConnectorOnMachine.gen_weight_params_size_in_bytes)
+    def gen_weight_params_size_in_bytes(self, weights):
+        if self.__weights is not None:
+            # The table of each block is counted with the connections
+            return BYTES_PER_WORD
+        return super().gen_weight_params_size_in_bytes(weights)
+
+    @overrides(AbstractGenerateConnectorOnMachine.gen_weights_params)
+    def gen_weights_params(self, weights, pre_vertex_slice, post_vertex_slice):
+        if self.__weights is not None:
+            _, values = self.__get_gen_block(
+                pre_vertex_slice, post_vertex_slice)
+            values = values["weight"]
+            return numpy.concatenate((
+                numpy.array([len(values)], dtype="uint32"),
+                DataType.S1615.encode_as_numpy_int_array(values).astype(
+                    "uint32")))
+        return super().gen_weights_params(
+            weights, pre_vertex_slice, post_vertex_slice)
+
+    @overrides(AbstractGenerateConnectorOnMachine.gen_delays_id)
+    def gen_delays_id(self, delays):
+        if self.__delays is not None:
+            return PARAM_TYPE_FROM_LIST
+        return super().gen_delays_id(delays)
+
+    @overrides(
+        AbstractGenerateConnectorOnMachine.gen_delay_params_size_in_bytes)
+    def gen_delay_params_size_in_bytes(self, delays):
+        if self.__delays is not None:
+            # The table of each block is counted with the connections
+            return BYTES_PER_WORD
+        return super().gen_delay_params_size_in_bytes(delays)
+
+    @overrides(AbstractGenerateConnectorOnMachine.gen_delay_params)
+    def gen_delay_params(self, delays, pre_vertex_slice, post_vertex_slice):
+        if self.__delays is not None:
+            # The delays are clipped as on the host, and the machine rounds
+            # down, so half a time step is added to get the rounded delay
+            time_step_ms = machine_time_step_ms()
+            _, values = self.__get_gen_block(
+                pre_vertex_slice, post_vertex_slice)
+            values = numpy.maximum(values["delay"], time_step_ms)
+            return numpy.concatenate((
+                numpy.array([len(values)], dtype="uint32"),
+                DataType.S1615.encode_as_numpy_int_array(
+                    values + time_step_ms / 2).astype("uint32")))
+        return super().gen_delay_params(
+            delays, pre_vertex_slice, post_vertex_slice)
+
+    @property
+    @overrides(AbstractGenerateConnectorOnMachine.gen_connector_id)
+    def gen_connector_id(self):
+        return ConnectorIDs.FROM_LIST_CONNECTOR.value
+
+    @overrides(AbstractGenerateConnectorOnMachine.gen_connector_params)
+    def gen_connector_params(
+            self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
+            synapse_type, synapse_info):
+        self._split_connections(pre_slices, post_slices)
+        params, _ = self.__get_gen_block(pre_vertex_slice, post_vertex_slice)
+        return params
+
+    @overrides(AbstractGenerateConnectorOnMachine.
+               gen_connector_params_total_size_in_bytes)
+    def gen_connector_params_total_size_in_bytes(
+            self, synapse_info, n_blocks, pre_vertex_slice=None,
+            post_vertex_slice=None):
+        # Count the connections that the blocks could hold
+        n_rows = synapse_info.n_pre_neurons
+        post_span = synapse_info.n_post_neurons
+        n_connections = len(self.__sources)
+        n_per_source, n_per_target = self.__get_n_per_neuron()
+        if pre_vertex_slice is not None:
+            n_rows = pre_vertex_slice.n_atoms * n_blocks
+            n_connections = min(n_connections, int(numpy.sum(n_per_source[
+                pre_vertex_slice.lo_atom:pre_vertex_slice.hi_atom + 1])))
+        if post_vertex_slice is not None:
+            post_span = post_vertex_slice.n_atoms
+            n_connections = min(n_connections, int(numpy.sum(n_per_target[
+                post_vertex_slice.lo_atom:post_vertex_slice.hi_atom + 1])))
+
+        # Each block has a header and up to a word of padding, each row
+        # a count and each connection a target and maybe a value index; the
+        # tables of values of the blocks have at most an entry per connection
+        bytes_per_connection = _n_varint_bytes(max(post_span - 1, 0))
+        if self.__has_values:
+            bytes_per_connection += _n_varint_bytes(max(n_connections - 1, 0))
+        if self.__weights is not None:
+            bytes_per_connection += BYTES_PER_WORD
+        if self.__delays is not None:
+            bytes_per_connection += BYTES_PER_WORD
+        return (
+            n_blocks * (_N_BLOCK_HEADER_WORDS + 1) * BYTES_PER_WORD +
+            n_rows * _n_varint_bytes(n_connections) +
+            n_connections * bytes_per_connection)
+
     def _apply_parameters_to_synapse_type(self, synapse_type):
         """
         :param AbstractStaticSynapseDynamics synapse_type:
@@ -440,3 +821,154 @@ class FromListConnector(AbstractConnector):
         if self.__extra_parameter_names:
             for i, name in enumerate(self.__extra_parameter_names):
                 synapse_type.set_value(name, self.__extra_parameters[:, i])
+
+
+def _find_field(names, candidates):
+    """ Find the first of the candidate field names which is present.
+
+    :param tuple(str) names: The field names present
+    :param tuple(str) candidates: The acceptable names, in preference order
+    :rtype: str or None
+    """
+    for candidate in candidates:
+        if candidate in names:
+            return candidate
+    return None
+
+
+def _chunks(n_connections):
+    """ Split the connections into chunks to be handled one at a time, so\
+        that lists memory-mapped from files are not read into memory at once.
+
+    :param int n_connections: The number of connections
+    :rtype: iterable(slice)
+    """
+    for start in range(0, n_connections, _SPLIT_CHUNK_SIZE):
+        yield slice(start, start + _SPLIT_CHUNK_SIZE)
+
+
+def _add_counts(counts, values):
+    """ Add the number of times each value appears to counts of the values.
+
+    :param ~numpy.ndarray counts: The counts so far, indexed by value
+    :param ~numpy.ndarray values: The values to count
+    :return: The new counts, which might be longer than the old
+    :rtype: ~numpy.ndarray
+    """
+    new_counts = numpy.bincount(
+        values.astype("int64", copy=False), minlength=len(counts))
+    new_counts[:len(counts)] += counts
+    return new_counts
+
+
+def _chunked_variance(chunks):
+    """ The variance of values given in chunks, combining the mean and sum\
+        of squared differences of each chunk with those of the chunks before.
+
+    :param iterable(~numpy.ndarray) chunks: The values
+    :rtype: float
+    """
+    n_total = 0
+    mean = 0.0
+    squares = 0.0
+    for chunk in chunks:
+        n_chunk = len(chunk)
+        if not n_chunk:
+            continue
+        chunk_mean = numpy.mean(chunk)
+        chunk_squares = numpy.sum((chunk - chunk_mean) ** 2)
+        delta = chunk_mean - mean
+        n_new = n_total + n_chunk
+        mean += delta * n_chunk / n_new
+        squares += chunk_squares + delta ** 2 * n_total * n_chunk / n_new
+        n_total = n_new
+    if not n_total:
+        return numpy.nan
+    return squares / n_total
+
+
+def _n_varint_bytes(value):
+    """ The number of bytes a variable-length number takes.
+
+    :param int value: The number
+    :rtype: int
+    """
+    return max(1, -(-int(value).bit_length() // _VARINT_BITS))
+
+
+def _encode_varints(numbers):
+    """ Encode numbers as variable-length numbers, with 7 bits in each byte\
+        from the least significant, and the top bit of each byte set when\
+        another byte of the number follows.
+
+    :param ~numpy.ndarray(~numpy.uint32) numbers: The numbers to encode
+    :rtype: ~numpy.ndarray(~numpy.uint8)
+    """
+    numbers = numbers.astype("uint32", copy=False)
+    n_bytes = numpy.ones(len(numbers), dtype="int64")
+    for shift in range(_VARINT_BITS, 32, _VARINT_BITS):
+        n_bytes += numbers >= (1 << shift)
+    offsets = numpy.cumsum(n_bytes) - n_bytes
+    data = numpy.zeros(numpy.sum(n_bytes), dtype="uint8")
+    for i in range(int(numpy.max(n_bytes)) if len(n_bytes) else 0):
+        has_byte = n_bytes > i
+        data[offsets[has_byte] + i] = (
+            (numbers[has_byte] >> (i * _VARINT_BITS)) & 0x7F) | numpy.where(
+                n_bytes[has_byte] > i + 1, 0x80, 0)
+    return data
+
+
+def _block_sort(sources, targets, pre_bins, post_bins, order=None,
+                chunk_size=_SPLIT_CHUNK_SIZE):
+    """ Counting sort of connections into (pre-slice, post-slice) blocks.\
+        The columns are read in chunks, so that at most one chunk needs to be\
+        in memory at a time; connections keep their relative order within a\
+        block.
+
+    :param ~numpy.ndarray sources: The source of each connection
+    :param ~numpy.ndarray targets: The target of each connection
+    :param ~numpy.ndarray pre_bins: The bin edges of the pre-slices
+    :param ~numpy.ndarray post_bins: The bin edges of the post-slices
+    :param order:
+        Where to write the order; a new array is made if not given
+    :type order: ~numpy.ndarray or None
+    :param int chunk_size: The number of connections to handle at once
+    :return: The order, and the offset of each block within it
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+    """
+    n_connections = len(sources)
+    n_post_bins = len(post_bins) + 1
+    n_blocks = (len(pre_bins) + 1) * n_post_bins
+    chunk_starts = range(0, n_connections, chunk_size)
+
+    def blocks_of_chunk(start):
+        end = start + chunk_size
+        pre_indices = numpy.searchsorted(
+            pre_bins, sources[start:end], side="right")
+        post_indices = numpy.searchsorted(
+            post_bins, targets[start:end], side="right")
+        return pre_indices * n_post_bins + post_indices
+
+    # Count the connections in each block to find where each block starts
+    counts = numpy.zeros(n_blocks, dtype="int64")
+    blocks = None
+    for start in chunk_starts:
+        blocks = blocks_of_chunk(start)
+        counts += numpy.bincount(blocks, minlength=n_blocks)
+    offsets = numpy.concatenate(([0], numpy.cumsum(counts)))
+
+    # Place the connections of each chunk after those of earlier chunks
+    if order is None:
+        order = numpy.empty(n_connections, dtype="int64")
+    next_free = offsets[:-1].copy()
+    for start in chunk_starts:
+        if len(chunk_starts) > 1:
+            blocks = blocks_of_chunk(start)
+        chunk_order = numpy.argsort(blocks, kind="stable")
+        sorted_blocks = blocks[chunk_order]
+        chunk_counts = numpy.bincount(blocks, minlength=n_blocks)
+        rank = numpy.arange(len(blocks)) - (
+            numpy.cumsum(chunk_counts) - chunk_counts)[sorted_blocks]
+        order[next_free[sorted_blocks] + rank] = chunk_order + start
+        next_free += chunk_counts
+    return order, offsets
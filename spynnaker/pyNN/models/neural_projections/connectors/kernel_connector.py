@@ -147,6 +147,12 @@ class KernelConnector(AbstractGenerateConnectorOnMachine):
         self._krn_weights = self.__get_kernel_vals(weight_kernel)
         self._krn_delays = self.__get_kernel_vals(delay_kernel)
 
+        # The kernels as given, as those made from the weights and delays of
+        # the synapse information when none are given only exist once a
+        # block has been made
+        self._given_krn_weights = self._krn_weights
+        self._given_krn_delays = self._krn_delays
+
         self._shape_common = \
             shape_pre if shape_common is None else shape_common
         self._common_w = self._shape_common[WIDTH]
@@ -366,6 +372,23 @@ class KernelConnector(AbstractGenerateConnectorOnMachine):
         return "KernelConnector(shape_kernel[{},{}])".format(
             self._kernel_w, self._kernel_h)
 
+    @overrides(AbstractConnector.generates_slices_independently)
+    def generates_slices_independently(self):
+        return True
+
+    @overrides(AbstractConnector.uses_random_numbers)
+    def uses_random_numbers(self, synapse_info):
+        return self._has_random_weights_or_delays(synapse_info)
+
+    @overrides(AbstractConnector.get_cache_parameters)
+    def get_cache_parameters(self):
+        return (
+            self._kernel_w, self._kernel_h, self._pre_w, self._pre_h,
+            self._post_w, self._post_h, self._pre_start_w, self._pre_start_h,
+            self._post_start_w, self._post_start_h, self._pre_step_w,
+            self._pre_step_h, self._post_step_w, self._post_step_h,
+            self._given_krn_weights, self._given_krn_delays)
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
@@ -112,6 +112,18 @@ class OneToOneConnector(AbstractGenerateConnectorOnMachine,
             max(synapse_info.n_pre_neurons, synapse_info.n_post_neurons),
             synapse_info)
 
+    @overrides(AbstractConnector.generates_slices_independently)
+    def generates_slices_independently(self):
+        return True
+
+    @overrides(AbstractConnector.uses_random_numbers)
+    def uses_random_numbers(self, synapse_info):
+        return self._has_random_weights_or_delays(synapse_info)
+
+    @overrides(AbstractConnector.get_cache_parameters)
+    def get_cache_parameters(self):
+        return ()
+
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
             self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
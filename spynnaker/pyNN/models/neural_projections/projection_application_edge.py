@@ -47,6 +47,8 @@ class ProjectionApplicationEdge(
         # True if slices have been convered to sorted lists
         "__slices_list_mode",
         "__machine_edges_by_slices",
+        # The machine_edges in order, indexed by the slice of their post_vertex
+        "__machine_edges_by_post_slice",
         "__filter"
     ]
 
@@ -76,6 +78,7 @@ class ProjectionApplicationEdge(
 
         # Keep the machine edges by pre- and post-vertex
         self.__machine_edges_by_slices = dict()
+        self.__machine_edges_by_post_slice = dict()
 
         self.__pre_slices = set()
         self.__post_slices = set()
@@ -137,6 +140,19 @@ class ProjectionApplicationEdge(
         return self.__machine_edges_by_slices.get(
             (pre_vertex.vertex_slice, post_vertex.vertex_slice), None)
 
+    def get_machine_edges_for_post_slice(self, post_slice):
+        """ Get the machine edges of this edge that end at a given slice of\
+            the post_vertex, in the order in which they were remembered
+
+        This uses an index kept up to date as machine edges are remembered,
+        so it does not need to look at the machine edges of other slices.
+
+        :param ~pacman.model.graphs.common.Slice post_slice:
+            The slice of the post_vertex
+        :rtype: list(~pacman.model.graphs.machine.MachineEdge)
+        """
+        return self.__machine_edges_by_post_slice.get(post_slice, [])
+
     @overrides(AbstractSlicesConnect.could_connect)
     def could_connect(self, src_machine_vertex, dest_machine_vertex):
         if not self.__filter:
@@ -158,11 +174,15 @@ class ProjectionApplicationEdge(
             self.__pre_slices = set(self.__pre_slices)
             self.__post_slices = set(self.__post_slices)
             self.__slices_list_mode = False
-        self.__pre_slices.add(machine_edge.pre_vertex.vertex_slice)
-        self.__post_slices.add(machine_edge.post_vertex.vertex_slice)
-        self.__machine_edges_by_slices[
-            machine_edge.pre_vertex.vertex_slice,
-            machine_edge.post_vertex.vertex_slice] = machine_edge
+        pre_slice = machine_edge.pre_vertex.vertex_slice
+        post_slice = machine_edge.post_vertex.vertex_slice
+        self.__pre_slices.add(pre_slice)
+        self.__post_slices.add(post_slice)
+        if self.__machine_edges_by_slices.get(
+                (pre_slice, post_slice)) is not machine_edge:
+            self.__machine_edges_by_post_slice.setdefault(
+                post_slice, list()).append(machine_edge)
+        self.__machine_edges_by_slices[pre_slice, post_slice] = machine_edge
 
     @overrides(ApplicationEdge.forget_machine_edges)
     def forget_machine_edges(self):
@@ -170,6 +190,8 @@ class ProjectionApplicationEdge(
         self.__pre_slices = set()
         self.__post_slices = set()
         self.__slices_list_mode = False
+        self.__machine_edges_by_slices = dict()
+        self.__machine_edges_by_post_slice = dict()
 
     def __check_list_mode(self):
         """
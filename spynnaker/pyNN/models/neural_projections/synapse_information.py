@@ -36,7 +36,8 @@ class SynapseInformation(object):
         "__is_virtual_machine",
         "__weights",
         "__delays",
-        "__pre_run_connection_holders"]
+        "__pre_run_connection_holders",
+        "__block_maker"]
 
     def __init__(self, connector, pre_population, post_population,
                  prepop_is_view, postpop_is_view, rng,
@@ -79,6 +80,9 @@ class SynapseInformation(object):
         # Make a list of holders to be updated
         self.__pre_run_connection_holders = list()
 
+        # What makes blocks ahead of the synaptic matrices being written
+        self.__block_maker = None
+
     @property
     def connector(self):
         """ The connector connected to the synapse
@@ -234,3 +238,28 @@ class SynapseInformation(object):
         for holder in self.__pre_run_connection_holders:
             holder.finish()
         del self.__pre_run_connection_holders[:]
+
+    def set_block_maker(self, block_maker):
+        """ Set what makes synaptic blocks ahead of the synaptic matrices\
+            being written, or None to make each block as it is needed
+
+        :param block_maker:
+            An object with a ``take_block(synapse_info, pre_vertex_slice,
+            post_vertex_slice)`` method, or None
+        """
+        self.__block_maker = block_maker
+
+    def pop_precomputed_block(self, pre_vertex_slice, post_vertex_slice):
+        """ Take a synaptic block made ahead of time, if there is one; it is\
+            only given out once
+
+        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+            The slice of the pre-vertex the block is for
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The slice of the post-vertex the block is for
+        :rtype: ~numpy.ndarray or None
+        """
+        if self.__block_maker is None:
+            return None
+        return self.__block_maker.take_block(
+            self, pre_vertex_slice, post_vertex_slice)
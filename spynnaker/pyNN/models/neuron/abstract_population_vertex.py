@@ -23,7 +23,7 @@ from spinn_utilities.overrides import overrides
 from spinn_utilities.progress_bar import ProgressBar
 from data_specification.enums.data_type import DataType
 from pacman.model.constraints.key_allocator_constraints import (
-    ContiguousKeyRangeContraint)
+    ContiguousKeyRangeContraint, FixedKeyAndMaskConstraint)
 from spinn_utilities.config_holder import (
     get_config_int, get_config_float, get_config_bool)
 from pacman.model.resources import MultiRegionSDRAM
@@ -55,7 +55,8 @@ from spynnaker.pyNN.models.abstract_models import (
 from spynnaker.pyNN.exceptions import InvalidParameterType
 from spynnaker.pyNN.utilities.ranged import (
     SpynnakerRangeDictionary)
-from spynnaker.pyNN.utilities.constants import POSSION_SIGMA_SUMMATION_LIMIT
+from spynnaker.pyNN.utilities.constants import (
+    POSSION_SIGMA_SUMMATION_LIMIT, SPIKE_PARTITION_ID)
 from spynnaker.pyNN.utilities.running_stats import RunningStats
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSynapseDynamics, AbstractSynapseDynamicsStructural)
@@ -63,6 +64,7 @@ from .synapse_io import get_max_row_info
 from .master_pop_table import MasterPopTableAsBinarySearch
 from .generator_data import GeneratorData
 from .synaptic_matrices import SYNAPSES_BASE_GENERATOR_SDRAM_USAGE_IN_BYTES
+from .weight_planner import WeightPlanner, write_weight_plan_report
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -114,7 +116,9 @@ class AbstractPopulationVertex(
         "__incoming_projections",
         "__synapse_dynamics",
         "__max_row_info",
-        "__self_projection"]
+        "__self_projection",
+        "__key_group",
+        "__grouped_key_and_mask"]
 
     #: recording region IDs
     _SPIKE_RECORDING_REGION = 0
@@ -233,6 +237,10 @@ class AbstractPopulationVertex(
         self.__max_row_info = dict()
         self.__self_projection = None
 
+        # The group of small populations whose keys this shares a block with
+        self.__key_group = None
+        self.__grouped_key_and_mask = None
+
         # Prepare for dealing with STDP - there can only be one (non-static)
         # synapse dynamics per vertex at present
         self.__synapse_dynamics = None
@@ -649,8 +657,33 @@ class AbstractPopulationVertex(
         :param partition: the partition that leaves this vertex
         :return: list of constraints
         """
+        if (self.__grouped_key_and_mask is not None and
+                partition.identifier == SPIKE_PARTITION_ID):
+            return [FixedKeyAndMaskConstraint([self.__grouped_key_and_mask])]
         return [ContiguousKeyRangeContraint()]
 
+    @property
+    def key_group(self):
+        """ The group of small populations that this population shares a\
+            block of keys with, or None if it has keys of its own
+
+        :rtype: KeyGroup or None
+        """
+        return self.__key_group
+
+    def set_key_group(self, key_group, key_and_mask):
+        """ Put the spikes of this population in a block of keys shared\
+            with other small populations, or take it out of one
+
+        :param key_group: The group, or None to allocate keys as usual
+        :type key_group: KeyGroup or None
+        :param key_and_mask: The keys of this population within the group
+        :type key_and_mask:
+            ~pacman.model.routing_info.BaseKeyAndMask or None
+        """
+        self.__key_group = key_group
+        self.__grouped_key_and_mask = key_and_mask
+
     @overrides(AbstractNeuronRecordable.clear_recording)
     def clear_recording(self, variable, buffer_manager, placements):
         if variable == NeuronRecorder.SPIKES:
@@ -835,6 +868,13 @@ class AbstractPopulationVertex(
             The projections to consider in the calculations
         :rtype: list(int)
         """
+        if get_config_bool("Simulation", "plan_weight_scales"):
+            plan = WeightPlanner().plan(self, incoming_projections)
+            if get_config_bool("Reports", "write_weight_plan_report"):
+                write_weight_plan_report(plan)
+            return [type_plan.chosen.shift
+                    for type_plan in plan.synapse_type_plans]
+
         weight_scale = self.__neuron_impl.get_global_weight_scale()
         weight_scale_squared = weight_scale * weight_scale
         n_synapse_types = self.__neuron_impl.get_n_synapse_types()
@@ -1071,11 +1111,15 @@ class AbstractPopulationVertex(
         self.__max_row_info[key] = max_row_info
         return max_row_info
 
-    def get_synapse_expander_size(self, incoming_projections):
+    def get_synapse_expander_size(
+            self, incoming_projections, vertex_slice=None):
         """ Get the size of the synapse expander region in bytes
 
         :param list(~spynnaker.pyNN.models.Projection) incoming_projections:
             The projections to consider in the calculations
+        :param vertex_slice:
+            The slice of neurons to get the size of, or None for any slice
+        :type vertex_slice: ~pacman.model.graphs.common.Slice or None
         :rtype: int
         """
         size = 0
@@ -1089,7 +1133,8 @@ class AbstractPopulationVertex(
                 max_atoms = float(min(vertex.get_max_atoms_per_core(),
                                       vertex.n_atoms))
                 n_sub_edges = int(math.ceil(vertex.n_atoms / max_atoms))
-            size += self.__generator_info_size(synapse_info) * n_sub_edges
+            size += self.__generator_info_size(
+                synapse_info, n_sub_edges, vertex_slice)
 
         # If anything generates data, also add some base information
         if size:
@@ -1099,10 +1144,13 @@ class AbstractPopulationVertex(
         return size
 
     @staticmethod
-    def __generator_info_size(synapse_info):
+    def __generator_info_size(synapse_info, n_sub_edges, vertex_slice):
         """ The number of bytes required by the generator information
 
         :param SynapseInformation synapse_info: The synapse information to use
+        :param int n_sub_edges: The number of edges to generate for
+        :param vertex_slice: The slice generated for, if known
+        :type vertex_slice: ~pacman.model.graphs.common.Slice or None
 
         :rtype: int
         """
@@ -1115,10 +1163,12 @@ class AbstractPopulationVertex(
             GeneratorData.BASE_SIZE,
             connector.gen_delay_params_size_in_bytes(synapse_info.delays),
             connector.gen_weight_params_size_in_bytes(synapse_info.weights),
-            connector.gen_connector_params_size_in_bytes,
             dynamics.gen_matrix_params_size_in_bytes
         ))
-        return gen_size
+        return (gen_size * n_sub_edges +
+                connector.gen_connector_params_total_size_in_bytes(
+                    synapse_info, n_sub_edges,
+                    post_vertex_slice=vertex_slice))
 
     @property
     def synapse_executable_suffix(self):
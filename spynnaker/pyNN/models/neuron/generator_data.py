@@ -76,16 +76,8 @@ class GeneratorData(object):
 
         :rtype: int
         """
-        connector = self.__synapse_information.connector
-        dynamics = self.__synapse_information.synapse_dynamics
-
-        return sum((self.BASE_SIZE,
-                    dynamics.gen_matrix_params_size_in_bytes,
-                    connector.gen_connector_params_size_in_bytes,
-                    connector.gen_weight_params_size_in_bytes(
-                        self.__synapse_information.weights),
-                    connector.gen_delay_params_size_in_bytes(
-                        self.__synapse_information.delays)))
+        # The connector parameters can depend on the slices, so are measured
+        return sum(item.nbytes for item in self.gen_data)
 
     @property
     def gen_data(self):
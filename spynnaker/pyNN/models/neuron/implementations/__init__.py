@@ -16,9 +16,11 @@
 from .abstract_standard_neuron_component import AbstractStandardNeuronComponent
 from .abstract_neuron_impl import AbstractNeuronImpl
 from .neuron_impl_standard import NeuronImplStandard
+from .meanfield_cycle_model import MeanfieldCycleModel
 from .meanfield_impl_standard import MeanfieldImplStandard
 from .ranged_dict_vertex_slice import RangedDictVertexSlice
 
 __all__ = [
     "AbstractNeuronImpl", "AbstractStandardNeuronComponent",
-    "NeuronImplStandard", "MeanfieldImplStandard", "RangedDictVertexSlice"]
+    "NeuronImplStandard", "MeanfieldCycleModel", "MeanfieldImplStandard",
+    "RangedDictVertexSlice"]
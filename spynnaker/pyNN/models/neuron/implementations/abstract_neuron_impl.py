@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 from spinn_utilities.abstract_base import (
     AbstractBase, abstractmethod, abstractproperty)
 
@@ -175,6 +176,37 @@ class AbstractNeuronImpl(object, metaclass=AbstractBase):
             The holder of the state variables to update
         """
 
+    def get_rate_output_data(self, rate_key, vertex_slice):
+        """ Get the data *to be written to the machine* that says where the\
+            model sends rates that drive Poisson sources.  Models that\
+            cannot send rates write nothing.
+
+        :param rate_key:
+            The key to send the rates with, or None if they are not sent
+        :type rate_key: int or None
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The slice of the vertex to generate the data for
+        :rtype: ~numpy.ndarray(~numpy.uint32)
+        """
+        # pylint: disable=unused-argument
+        return numpy.zeros(0, dtype="uint32")
+
+    def get_state_output_data(self, state_key, vertex_slice, n_atoms):
+        """ Get the data *to be written to the machine* that says where the\
+            model sends its state live to the host.  Models that cannot send\
+            their state write nothing.
+
+        :param state_key:
+            The key to send the state with, or None if it is not sent
+        :type state_key: int or None
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The slice of the vertex to generate the data for
+        :param int n_atoms: The number of atoms in the whole population
+        :rtype: ~numpy.ndarray(~numpy.uint32)
+        """
+        # pylint: disable=unused-argument
+        return numpy.zeros(0, dtype="uint32")
+
     @abstractmethod
     def get_units(self, variable):
         """ Get the units of the given variable
@@ -0,0 +1,179 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.utilities.constants import CPU_CYCLES_PER_US
+
+#: The number of evaluations of the transfer function by each meanfield in
+#: each sub-step; the RK2 midpoint update evaluates it for the excitatory and
+#: inhibitory populations at both the start and the midpoint of the step
+TF_EVALUATIONS_PER_STEP = 4
+
+# The default costs below are estimates from the operation counts of the
+# update code, not measurements; refit them with MeanfieldCycleModel.fit
+
+# The cycles of one evaluation of the transfer function, including the
+# fluctuation regime variables, the square roots and the error function
+_CYCLES_PER_TF = 2600
+
+# The cycles of the rest of a sub-step of one meanfield (synaptic input,
+# input type and the RK2 arithmetic around the transfer functions)
+_CYCLES_PER_STEP_OVERHEAD = 700
+
+# The cycles of each meanfield that do not depend on the number of sub-steps
+# (finding the parameters, recording and sending rates and state)
+_CYCLES_PER_UNIT = 450
+
+# The cycles of each time step that do not depend on the number of meanfields
+_CYCLES_PER_TIMESTEP = 1800
+
+# The name of the profile tag that times the update of the meanfields
+_NEURON_UPDATE_TAG = "NEURON_UPDATE"
+
+
+class MeanfieldCycleModel(object):
+    """ A model of the CPU cycles taken by the meanfield binary to update\
+        the meanfields on a core in one time step.
+
+    The cycles are modelled as a fixed cost for each time step, plus a cost\
+    for each meanfield, plus a cost for each sub-step of each meanfield\
+    (the sum of :py:data:`TF_EVALUATIONS_PER_STEP` transfer function\
+    evaluations and the rest of the RK2 step).  The defaults can be\
+    replaced by a model fitted to the ``NEURON_UPDATE`` profile tag of the\
+    binary with :py:meth:`fit` and :py:meth:`profiled_cycles`.
+    """
+
+    __slots__ = [
+        "__cycles_per_step",
+        "__cycles_per_timestep",
+        "__cycles_per_unit"]
+
+    def __init__(
+            self, cycles_per_timestep=_CYCLES_PER_TIMESTEP,
+            cycles_per_unit=_CYCLES_PER_UNIT,
+            cycles_per_step=(
+                TF_EVALUATIONS_PER_STEP * _CYCLES_PER_TF +
+                _CYCLES_PER_STEP_OVERHEAD)):
+        """
+        :param float cycles_per_timestep:
+            The cycles of each time step on a core, whatever the number of
+            meanfields
+        :param float cycles_per_unit:
+            The cycles of each meanfield, whatever the number of sub-steps
+        :param float cycles_per_step:
+            The cycles of each sub-step of each meanfield
+        """
+        self.__cycles_per_timestep = cycles_per_timestep
+        self.__cycles_per_unit = cycles_per_unit
+        self.__cycles_per_step = cycles_per_step
+
+    @property
+    def cycles_per_timestep(self):
+        """ The cycles of each time step, whatever the number of meanfields
+
+        :rtype: float
+        """
+        return self.__cycles_per_timestep
+
+    @property
+    def cycles_per_unit(self):
+        """ The cycles of each meanfield, whatever the number of sub-steps
+
+        :rtype: float
+        """
+        return self.__cycles_per_unit
+
+    @property
+    def cycles_per_step(self):
+        """ The cycles of each sub-step of each meanfield
+
+        :rtype: float
+        """
+        return self.__cycles_per_step
+
+    def get_n_cpu_cycles(self, n_units, n_steps_per_timestep):
+        """ Get the cycles taken to update some meanfields in one time step
+
+        :param int n_units: The number of meanfields on the core
+        :param int n_steps_per_timestep: The number of sub-steps of each
+        :rtype: int
+        """
+        return int(numpy.ceil(
+            self.__cycles_per_timestep + n_units * (
+                self.__cycles_per_unit +
+                n_steps_per_timestep * self.__cycles_per_step)))
+
+    def get_max_units(self, n_steps_per_timestep, n_cycles):
+        """ Get the most meanfields that can be updated within a number of\
+            cycles
+
+        :param int n_steps_per_timestep: The number of sub-steps of each
+        :param int n_cycles: The cycles available in each time step
+        :return: The number of meanfields, which is 0 if even one won't fit
+        :rtype: int
+        """
+        per_unit = (
+            self.__cycles_per_unit +
+            n_steps_per_timestep * self.__cycles_per_step)
+        return max(int(
+            (n_cycles - self.__cycles_per_timestep) // per_unit), 0)
+
+    @classmethod
+    def fit(cls, n_units, n_steps_per_timestep, n_cycles):
+        """ Fit a model to measurements of the cycles taken by cores
+
+        The measurements must cover at least two numbers of meanfields and,
+        for one of those, two numbers of sub-steps, so that the costs can be
+        told apart.
+
+        :param ~numpy.ndarray n_units:
+            The number of meanfields on the core of each measurement
+        :param ~numpy.ndarray n_steps_per_timestep:
+            The number of sub-steps of each measurement
+        :param ~numpy.ndarray n_cycles:
+            The mean cycles per time step of each measurement
+        :rtype: MeanfieldCycleModel
+        :raises ConfigurationException:
+            If the measurements do not determine the costs
+        """
+        n_units = numpy.asarray(n_units, dtype="float64")
+        n_steps = numpy.asarray(n_steps_per_timestep, dtype="float64")
+        design = numpy.column_stack(
+            [numpy.ones(len(n_units)), n_units, n_units * n_steps])
+        if numpy.linalg.matrix_rank(design) < design.shape[1]:
+            raise ConfigurationException(
+                "The measurements must vary both the number of meanfields and"
+                " the number of steps per time step to fit a cycle model")
+        (per_timestep, per_unit, per_step), _, _, _ = numpy.linalg.lstsq(
+            design, numpy.asarray(n_cycles, dtype="float64"), rcond=None)
+        return cls(per_timestep, per_unit, per_step)
+
+    @staticmethod
+    def profiled_cycles(profile_data):
+        """ Get the mean cycles per time step of the update of the\
+            meanfields from the profile of a core
+
+        The binary must have been built with profiling and run with
+        ``n_profile_samples`` set in the ``Reports`` section of the
+        configuration.
+
+        :param ~spinn_front_end_common.interface.profiling.ProfileData \
+                profile_data:
+            The profile read from the core
+        :rtype: float
+        """
+        return (profile_data.get_mean_ms(_NEURON_UPDATE_TAG) * 1000.0 *
+                CPU_CYCLES_PER_US)
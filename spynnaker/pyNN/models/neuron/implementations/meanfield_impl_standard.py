@@ -18,7 +18,9 @@ import numpy
 from data_specification.enums import DataType
 from spinn_utilities.overrides import overrides
 from spynnaker.pyNN.models.neuron.input_types import InputTypeConductance
+from spynnaker.pyNN.utilities.utility_calls import convert_to
 from .abstract_neuron_impl import AbstractNeuronImpl
+from .meanfield_cycle_model import MeanfieldCycleModel
 from spinn_front_end_common.utilities import globals_variables
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 
@@ -28,6 +30,16 @@ _N_STEPS_PER_TIMESTEP_SIZE = 1 * BYTES_PER_WORD
 # The default number of steps per timestep
 _DEFAULT_N_STEPS_PER_TIMESTEP = 1
 
+# has_key, key, first_source_id, scale
+_RATE_OUTPUT_SIZE = 4 * BYTES_PER_WORD
+
+# The binaries that read the output blocks at the end of the parameters; the
+# others lay out their parameters differently and never send anything
+_LIVE_OUTPUT_BINARIES = frozenset(["meanfield_model_cond_only.aplx"])
+
+# has_key, key, first_neuron_id, n_neurons, interval, variables
+_STATE_OUTPUT_SIZE = 6 * BYTES_PER_WORD
+
 
 class MeanfieldImplStandard(AbstractNeuronImpl):
     """ The standard componentised meanfield implementation.
@@ -46,7 +58,11 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
         "__threshold_type",
         "__additional_input_type",
         "__components",
-        "__n_steps_per_timestep"
+        "__cycle_model",
+        "__n_steps_per_timestep",
+        "__rate_output_scale",
+        "__state_output_interval",
+        "__state_output_variables"
     ]
 
     _RECORDABLES = ["Ve", "Vi", "w"]
@@ -93,6 +109,10 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
         self.__threshold_type = threshold_type
         self.__additional_input_type = additional_input_type
         self.__n_steps_per_timestep = _DEFAULT_N_STEPS_PER_TIMESTEP
+        self.__cycle_model = MeanfieldCycleModel()
+        self.__rate_output_scale = None
+        self.__state_output_interval = None
+        self.__state_output_variables = None
 
         self.__components = [
             self.__neuron_model,
@@ -114,11 +134,72 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
     def n_steps_per_timestep(self, n_steps_per_timestep):
         self.__n_steps_per_timestep = n_steps_per_timestep
 
+    @property
+    def cycle_model(self):
+        """ The model of the CPU cycles taken to update the meanfields
+
+        :rtype: MeanfieldCycleModel
+        """
+        return self.__cycle_model
+
+    @cycle_model.setter
+    def cycle_model(self, cycle_model):
+        self.__cycle_model = cycle_model
+
+    @property
+    def rate_output_scale(self):
+        """ The scale applied to Ve to get the rate of the Poisson sources\
+            driven by this model, or None if it doesn't drive any
+
+        :rtype: float or None
+        """
+        return self.__rate_output_scale
+
+    @rate_output_scale.setter
+    def rate_output_scale(self, rate_output_scale):
+        self.__rate_output_scale = rate_output_scale
+
+    @property
+    def state_output_variables(self):
+        """ The variables sent live to the host, or None if none are
+
+        :rtype: list(str) or None
+        """
+        return self.__state_output_variables
+
+    @property
+    def state_output_interval(self):
+        """ The number of time steps between each value sent live to the\
+            host, or None if none are sent
+
+        :rtype: int or None
+        """
+        return self.__state_output_interval
+
+    def set_state_output(self, variables, interval):
+        """ Send the values of some of the recordable variables live to the\
+            host
+
+        :param list(str) variables: The variables to send
+        :param int interval: The number of time steps between each value
+        """
+        self.__state_output_variables = list(variables)
+        self.__state_output_interval = interval
+
     @property
     @overrides(AbstractNeuronImpl.model_name)
     def model_name(self):
         return self.__model_name
 
+    @property
+    def supports_live_output(self):
+        """ Whether the binary of the model reads the output blocks, and so\
+            can send its rates and state while it runs
+
+        :rtype: bool
+        """
+        return self.__binary in _LIVE_OUTPUT_BINARIES
+
     @property
     @overrides(AbstractNeuronImpl.binary_name)
     def binary_name(self):
@@ -126,17 +207,10 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
 
     @overrides(AbstractNeuronImpl.get_n_cpu_cycles)
     def get_n_cpu_cycles(self, n_neurons):
-        total = self.__neuron_model.get_n_cpu_cycles(n_neurons)
-        total += self.__synapse_type.get_n_cpu_cycles(n_neurons)
-        total += self.__params_from_network.get_n_cpu_cycles(n_neurons)
-        total += self.__p_fit_polynomial_exc.get_n_cpu_cycles(n_neurons)
-        total += self.__p_fit_polynomial_inh.get_n_cpu_cycles(n_neurons)
-        total += self.__input_type.get_n_cpu_cycles(n_neurons)
-        total += self.__mathsbox.get_n_cpu_cycles(n_neurons)
-        total += self.__threshold_type.get_n_cpu_cycles(n_neurons)
-        if self.__additional_input_type is not None:
-            total += self.__additional_input_type.get_n_cpu_cycles(n_neurons)
-        return total
+        # The cycles are dominated by the transfer functions evaluated in
+        # each sub-step, which the cycle model accounts for as a whole
+        return self.__cycle_model.get_n_cpu_cycles(
+            n_neurons, self.__n_steps_per_timestep)
 
     @overrides(AbstractNeuronImpl.get_dtcm_usage_in_bytes)
     def get_dtcm_usage_in_bytes(self, n_neurons):
@@ -156,7 +230,8 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
 
     @overrides(AbstractNeuronImpl.get_sdram_usage_in_bytes)
     def get_sdram_usage_in_bytes(self, n_neurons):
-        total = _N_STEPS_PER_TIMESTEP_SIZE
+        total = (_N_STEPS_PER_TIMESTEP_SIZE + _RATE_OUTPUT_SIZE +
+                 _STATE_OUTPUT_SIZE)
         total += self.__neuron_model.get_sdram_usage_in_bytes(n_neurons)
         total += self.__synapse_type.get_sdram_usage_in_bytes(n_neurons)
         total += self.__params_from_network.get_sdram_usage_in_bytes(n_neurons)
@@ -227,6 +302,26 @@ class MeanfieldImplStandard(AbstractNeuronImpl):
             for component in self.__components)
         return numpy.concatenate(items)
 
+    @overrides(AbstractNeuronImpl.get_rate_output_data)
+    def get_rate_output_data(self, rate_key, vertex_slice):
+        if rate_key is None or self.__rate_output_scale is None:
+            return numpy.zeros(_RATE_OUTPUT_SIZE // BYTES_PER_WORD, "uint32")
+        return numpy.array([
+            1, rate_key, vertex_slice.lo_atom,
+            convert_to(self.__rate_output_scale, DataType.S1615)],
+            dtype="uint32")
+
+    @overrides(AbstractNeuronImpl.get_state_output_data)
+    def get_state_output_data(self, state_key, vertex_slice, n_atoms):
+        if state_key is None or self.__state_output_variables is None:
+            return numpy.zeros(_STATE_OUTPUT_SIZE // BYTES_PER_WORD, "uint32")
+        variable_mask = sum(
+            1 << self._RECORDABLES.index(variable)
+            for variable in self.__state_output_variables)
+        return numpy.array([
+            1, state_key, vertex_slice.lo_atom, n_atoms,
+            self.__state_output_interval, variable_mask], dtype="uint32")
+
     @overrides(AbstractNeuronImpl.read_data)
     def read_data(
             self, data, offset, vertex_slice, parameters, state_variables):
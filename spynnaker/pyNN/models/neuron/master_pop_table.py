@@ -12,10 +12,7 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
-import math
 import numpy
-import ctypes
-from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spynnaker.pyNN.exceptions import (
     SynapseRowTooBigException, SynapticConfigurationException)
 from spynnaker.pyNN.utilities.constants import POP_TABLE_MAX_ROW_LENGTH
@@ -28,120 +25,68 @@ _ADDRESS_SCALE = 16
 # A padding byte
 _PADDING_BYTE = 0xDD
 
-# Bits in a byte
-_BITS_PER_BYTES = 8
-
-# ctypes stores the number of bits in a bitfield in the top 16 bits
-_CTYPES_N_BITS_SHIFT = 16
-
-
-def _n_bits(field):
-    """ Get the number of bits in a field (ctypes doesn't do this)
-
-    :param _ctypes.CField field: a ctype field from a structure
-    :return: the number of bits
-    :rtype: int
-    """
-    # ctypes stores the number of bits in a bitfield in the top 16 bits;
-    # if it isn't a bitfield, this is 0
-    n_bits = field.size >> _CTYPES_N_BITS_SHIFT
-    if n_bits:
-        return n_bits
-
-    # If it isn't a bitfield, the number of bits is the field size (which is
-    # then in bytes) multiplied by 8 (bits in a byte)
-    return _BITS_PER_BYTES * field.size
-
-
-def _make_array(ctype, n_items):
-    """ Make an array of ctype items; done separately as the syntax is a
-        little odd!
-
-    :param _ctypes.PyCSimpleType ctype: A ctype
-    :param int n_items: The number of items in the array
-    :return: a ctype array
-    :rtype: _ctypes.PyCArrayType
-    """
-    array_type = ctype * n_items
-    return array_type()
-
-
-class _MasterPopEntryCType(ctypes.LittleEndianStructure):
-    """ A Master Population Table Entry; matches the C struct
-    """
-    _fields_ = [
-        # The key to match against the incoming message
-        ("key", ctypes.c_uint32),
-        # The mask to select the relevant bits of key for matching
-        ("mask", ctypes.c_uint32),
-        # The index into address_list for this entry
-        ("start", ctypes.c_uint32, 15),
-        # Flag to indicate if an extra_info struct is present
-        ("extra_info_flag", ctypes.c_uint32, 1),
-        # The number of entries in ::address_list for this entry
-        ("count", ctypes.c_uint32, 16)
-    ]
-
+# A Master Population Table Entry; matches the C struct, with the bit fields
+# after the key and mask packed into one word:
+#   start: 15 bits - The index into address_list for this entry
+#   extra_info_flag: 1 bit - Flag to indicate if an extra_info is present
+#   count: 16 bits - The number of entries in address_list for this entry
+_MASTER_POP_ENTRY_DTYPE = numpy.dtype([
+    # The key to match against the incoming message
+    ("key", "<u4"),
+    # The mask to select the relevant bits of key for matching
+    ("mask", "<u4"),
+    # The packed start, extra_info_flag and count
+    ("start_and_count", "<u4")])
+_START_BITS = 15
+_EXTRA_INFO_FLAG_SHIFT = 15
+_COUNT_SHIFT = 16
+_COUNT_BITS = 16
 
 # Maximum start position in the address list
-_MAX_ADDRESS_START = (1 << _n_bits(_MasterPopEntryCType.start)) - 1
+_MAX_ADDRESS_START = (1 << _START_BITS) - 1
 # Maximum count of address list entries for a single pop table entry
-_MAX_ADDRESS_COUNT = (1 << _n_bits(_MasterPopEntryCType.count)) - 1
-
-
-class _ExtraInfoCType(ctypes.LittleEndianStructure):
-    """ An Extra Info structure; matches the C struct
-    """
-    _fields_ = [
-        # The mask to apply to the key once shifted get the core index
-        ("core_mask", ctypes.c_uint32, 10),
-        # The number of words required for n_neurons
-        ("n_words", ctypes.c_uint32, 6),
-        # The shift to apply to the key to get the core part (0-31)
-        ("mask_shift", ctypes.c_uint32, 5),
-        # The number of neurons per core (up to 2048)
-        ("n_neurons", ctypes.c_uint32, 11)
-    ]
-
+_MAX_ADDRESS_COUNT = (1 << _COUNT_BITS) - 1
+
+# An Extra Info word; matches the C struct:
+#   core_mask: 10 bits - The mask to apply to the key once shifted to get the
+#       core index
+#   n_words: 6 bits - The number of words required for n_neurons
+#   mask_shift: 5 bits - The shift to apply to the key to get the core part
+#   n_neurons: 11 bits - The number of neurons per core
+_CORE_MASK_BITS = 10
+_N_WORDS_SHIFT = 10
+_N_WORDS_BITS = 6
+_MASK_SHIFT_SHIFT = 16
+_MASK_SHIFT_BITS = 5
+_N_NEURONS_SHIFT = 21
+_N_NEURONS_BITS = 11
 
 # The maximum n_neurons value
-_MAX_N_NEURONS = (1 << _n_bits(_ExtraInfoCType.n_neurons)) - 1
+_MAX_N_NEURONS = (1 << _N_NEURONS_BITS) - 1
 # Maximum core mask (i.e. number of cores)
-_MAX_CORE_MASK = (1 << _n_bits(_ExtraInfoCType.core_mask)) - 1
-
-
-class _AddressAndRowLengthCType(ctypes.LittleEndianStructure):
-    """ An Address and Row Length structure; matches the C struct
-    """
-    _fields_ = [
-        # the length of the row
-        ("row_length", ctypes.c_uint32, 8),
-        # the address
-        ("address", ctypes.c_uint32, 23),
-        # whether this is a direct/single address
-        ("is_single", ctypes.c_uint32, 1)
-    ]
+_MAX_CORE_MASK = (1 << _CORE_MASK_BITS) - 1
 
+# An Address and Row Length word; matches the C struct:
+#   row_length: 8 bits - the length of the row
+#   address: 23 bits - the address
+#   is_single: 1 bit - whether this is a direct/single address
+_ROW_LENGTH_BITS = 8
+_ADDRESS_SHIFT = 8
+_ADDRESS_BITS = 23
+_IS_SINGLE_SHIFT = 31
 
 # An invalid address in the address and row length list
-_INVALID_ADDDRESS = (1 << _n_bits(_AddressAndRowLengthCType.address)) - 1
+_INVALID_ADDDRESS = (1 << _ADDRESS_BITS) - 1
 # Address is 23 bits, but maximum value means invalid
-_MAX_ADDRESS = (1 << _n_bits(_AddressAndRowLengthCType.address)) - 2
-
-
-class _AddressListEntryCType(ctypes.Union):
-    """ An Address List entry; one of two things
-    """
-    _fields_ = [
-        ("addr", _AddressAndRowLengthCType),
-        ("extra", _ExtraInfoCType)
-    ]
+_MAX_ADDRESS = (1 << _ADDRESS_BITS) - 2
 
+# The address list word of an invalid entry
+_INVALID_ADDRESS_WORD = _INVALID_ADDDRESS << _ADDRESS_SHIFT
 
 # Sizes of structs
-_MASTER_POP_ENTRY_SIZE_BYTES = ctypes.sizeof(_MasterPopEntryCType)
-_ADDRESS_LIST_ENTRY_SIZE_BYTES = ctypes.sizeof(_AddressListEntryCType)
-_EXTRA_INFO_ENTRY_SIZE_BYTES = ctypes.sizeof(_ExtraInfoCType)
+_MASTER_POP_ENTRY_SIZE_BYTES = _MASTER_POP_ENTRY_DTYPE.itemsize
+_ADDRESS_LIST_ENTRY_SIZE_BYTES = 4
+_EXTRA_INFO_ENTRY_SIZE_BYTES = 4
 
 # Base size - 2 words for size of table and address list
 _BASE_SIZE_BYTES = 8
@@ -149,194 +94,54 @@ _BASE_SIZE_BYTES = 8
 # Number of times to multiply for delays
 _DELAY_SCALE = 2
 
-# A ctypes pointer to a uint32
-_UINT32_PTR = ctypes.POINTER(ctypes.c_uint32)
-
-
-def _to_numpy(array):
-    """ Convert a ctypes array to a numpy array of uint32
-
-    Note: no data copying is done; it is pure type conversion.  Editing
-    the returned array will result in changes to the original.
-
-    :param _ctypes.PyCArrayType array: The array to convert
-    :rtype: numpy.ndarray
-    """
-    # Nothing to do if the array is 0 sized
-    if not len(array):
-        return numpy.zeros(0, dtype="uint32")
+# The details of an entry of the table as it is added
+_ENTRY_DTYPE = numpy.dtype([
+    ("key", "<u4"), ("mask", "<u4"), ("core_mask", "<u4"),
+    ("core_shift", "<u4"), ("n_neurons", "<u4")])
 
-    uint32_array = ctypes.cast(array, _UINT32_PTR)
-    n_words = (len(array) * ctypes.sizeof(array[0])) // BYTES_PER_WORD
-    return numpy.ctypeslib.as_array(uint32_array, (n_words,))
 
+def _bits(values, n_bits, shift=0):
+    """ Truncate values to a bit field and shift them into place, as the\
+        C compiler does when assigning to the field
 
-class _MasterPopEntry(object):
-    """ Internal class that contains a master population table entry
+    :param ~numpy.ndarray values: The values of the field
+    :param int n_bits: The number of bits in the field
+    :param int shift: The position of the lowest bit of the field
+    :rtype: ~numpy.ndarray
     """
-    __slots__ = [
-        "__addresses_and_row_lengths",
-        # The mask to match this entry on
-        "__mask",
-        # The routing key to match this entry on
-        "__routing_key",
-        # The part of the key where the core id is held after shifting (below)
-        "__core_mask",
-        # Where in the key that the core id is held
-        "__core_shift",
-        # The number of neurons on every core except the last
-        "__n_neurons"]
-
-    def __init__(self, routing_key, mask, core_mask, core_shift, n_neurons):
-        """
-        :param int routing_key: The key to match for this entry
-        :param int mask: The mask to match for this entry
-        :param int core_mask:
-            The part of the routing_key where the core id is held
-        :param int core_shift: Where in the routing_key the core_id is held
-        :param int n_neurons:
-            The number of neurons on each core, except the last
-        """
-        self.__routing_key = routing_key
-        self.__mask = mask
-        self.__core_mask = core_mask
-        self.__core_shift = core_shift
-        self.__n_neurons = n_neurons
-        self.__addresses_and_row_lengths = list()
-
-    def append(self, address, row_length, is_single):
-        """ Add a synaptic matrix pointer to the entry
-
-        :param int address: The address of the synaptic matrix
-        :param int row_length: The length of each row in the matrix
-        :param bool is_single: True if the address is to the direct matrix
-        :return: The index of the pointer within the entry
-        :rtype: int
-        """
-        index = len(self.__addresses_and_row_lengths)
-        if index > _MAX_ADDRESS_COUNT:
-            raise SynapticConfigurationException(
-                "{} connections for the same source key (maximum {})".format(
-                    index, _MAX_ADDRESS_COUNT))
-        self.__addresses_and_row_lengths.append(
-            (address, row_length, is_single, True))
-        return index
-
-    def append_invalid(self):
-        """ Add an invalid marker to the entry; used to ensure index alignment
-            between multiple entries when necessary
-
-        :return: The index of the marker within the entry
-        :rtype: int
-        """
-        index = len(self.__addresses_and_row_lengths)
-        self.__addresses_and_row_lengths.append((0, 0, False, False))
-        return index
-
-    @property
-    def routing_key(self):
-        """
-        :return: the key combo of this entry
-        :rtype: int
-        """
-        return self.__routing_key
-
-    @property
-    def mask(self):
-        """
-        :return: the mask of the key for this entry
-        :rtype: int
-        """
-        return self.__mask
-
-    @property
-    def core_mask(self):
-        """
-        :return: the mask of the key once shifted to get the source core ID
-        :rtype: int
-        """
-        return self.__core_mask
-
-    @property
-    def core_shift(self):
-        """
-        :return: the shift of the key to get the source core ID
-        :rtype: int
-        """
-        return self.__core_shift
-
-    @property
-    def n_neurons(self):
-        """
-        :return: the number of neurons per source core
-        :rtype: int
-        """
-        return self.__n_neurons
-
-    @property
-    def addresses_and_row_lengths(self):
-        """
-        :return: the memory address that this master pop entry points at
-            (synaptic matrix)
-        :rtype: list(tuple(int,int,bool,bool))
-        """
-        return self.__addresses_and_row_lengths
-
-    def write_to_table(self, entry, address_list, start):
-        """ Write entries to the master population table
-
-        :param _MasterPopEntryCType entry: The entry to write to
-        :param _AddressListEntryCType_Array address_list:
-            The address_list to write to
-        :param int start:
-            The index of the entry of the address list to start at
-        :return: The number of entries written to the address list
-        :rtype: int
-        """
-        entry.key = self.__routing_key
-        entry.mask = self.__mask
-        entry.start = start
-        count = len(self.__addresses_and_row_lengths)
-        entry.count = count
-
-        # Mark where the next entry starts and the number added; this might
-        # change if there is extra info
-        next_addr = start
-        n_entries = count
-
-        # If there is a core mask, add a special entry for it
-        if self.__core_mask != 0:
-            entry.extra_info_flag = True
-            extra_info = address_list[next_addr].extra
-            extra_info.core_mask = self.__core_mask
-            extra_info.n_words = int(math.ceil(
-                self.__n_neurons / BIT_IN_A_WORD))
-            extra_info.n_neurons = self.__n_neurons
-            extra_info.mask_shift = self.__core_shift
-            next_addr += 1
-            n_entries += 1
-
-        for j, (address, row_length, is_single, is_valid) in enumerate(
-                self.__addresses_and_row_lengths):
-            address_entry = address_list[next_addr + j].addr
-            if not is_valid:
-                address_entry.address = _INVALID_ADDDRESS
-            else:
-                address_entry.is_single = is_single
-                address_entry.row_length = row_length
-                address_entry.address = address
-        return n_entries
+    return (values.astype("uint32") & numpy.uint32((1 << n_bits) - 1)) << \
+        numpy.uint32(shift)
 
 
 class MasterPopTableAsBinarySearch(object):
     """ Master population table, implemented as binary search master.
+
+    The entries and addresses are gathered as they are added and only\
+    sorted and packed into the table, as arrays, when it is finished.
     """
     __slots__ = [
+        # The address list words, in the order they were added
+        "__address_words",
+        # The entry of each address
+        "__address_entries",
+        # The index of each address within its entry
+        "__address_indices",
+        # The key, mask, core mask, core shift and n_neurons of each entry
+        "__entry_details",
+        # The number of addresses of each entry
+        "__entry_counts",
+        # The index of the entry of each key
         "__entries",
+        # The number of address list entries, including extra info
         "__n_addresses"]
 
     def __init__(self):
         self.__entries = None
+        self.__entry_details = None
+        self.__entry_counts = None
+        self.__address_words = None
+        self.__address_entries = None
+        self.__address_indices = None
         self.__n_addresses = 0
 
     @staticmethod
@@ -414,6 +219,11 @@ class MasterPopTableAsBinarySearch(object):
         """ Initialise the master pop data structure.
         """
         self.__entries = dict()
+        self.__entry_details = list()
+        self.__entry_counts = list()
+        self.__address_words = list()
+        self.__address_entries = list()
+        self.__address_indices = list()
         self.__n_addresses = 0
 
     def add_machine_entry(
@@ -508,8 +318,15 @@ class MasterPopTableAsBinarySearch(object):
 
         entry = self.__add_entry(
             key_and_mask, core_mask, core_shift, n_neurons)
-        index = entry.append(start_addr, row_length - 1, is_single)
-        self.__n_addresses += 1
+        index = self.__entry_counts[entry]
+        if index > _MAX_ADDRESS_COUNT:
+            raise SynapticConfigurationException(
+                "{} connections for the same source key (maximum {})".format(
+                    index, _MAX_ADDRESS_COUNT))
+        self.__add_address(entry, index, (
+            ((row_length - 1) & ((1 << _ROW_LENGTH_BITS) - 1)) |
+            ((start_addr & _INVALID_ADDDRESS) << _ADDRESS_SHIFT) |
+            (int(bool(is_single)) << _IS_SINGLE_SHIFT)))
         return index
 
     def add_invalid_machine_entry(self, key_and_mask):
@@ -582,37 +399,49 @@ class MasterPopTableAsBinarySearch(object):
         """
         entry = self.__add_entry(
             key_and_mask, core_mask, core_shift, n_neurons)
-        index = entry.append_invalid()
-        self.__n_addresses += 1
+        index = self.__entry_counts[entry]
+        self.__add_address(entry, index, _INVALID_ADDRESS_WORD)
         return index
 
+    def __add_address(self, entry, index, word):
+        """ Add an address list word to an entry
+
+        :param int entry: The index of the entry
+        :param int index: The index of the word within the entry
+        :param int word: The packed address and row length
+        """
+        self.__address_words.append(word)
+        self.__address_entries.append(entry)
+        self.__address_indices.append(index)
+        self.__entry_counts[entry] += 1
+        self.__n_addresses += 1
+
     def __add_entry(self, key_and_mask, core_mask, core_shift, n_neurons):
         if self.__n_addresses >= _MAX_ADDRESS_START:
             raise SynapticConfigurationException(
                 "The table already contains {} entries;"
                 " adding another is too many".format(self.__n_addresses))
-        if key_and_mask.key not in self.__entries:
-            entry = _MasterPopEntry(
-                key_and_mask.key, key_and_mask.mask, core_mask, core_shift,
-                n_neurons)
+        details = (key_and_mask.key, key_and_mask.mask, core_mask,
+                   core_shift, n_neurons)
+        entry = self.__entries.get(key_and_mask.key)
+        if entry is None:
+            entry = len(self.__entry_details)
             self.__entries[key_and_mask.key] = entry
+            self.__entry_details.append(details)
+            self.__entry_counts.append(0)
             # Need to add an extra "address" for the extra_info if needed
             if core_mask != 0:
                 self.__n_addresses += 1
             return entry
-        entry = self.__entries[key_and_mask.key]
-        if (key_and_mask.mask != entry.mask or
-                core_mask != entry.core_mask or
-                core_shift != entry.core_shift or
-                n_neurons != entry.n_neurons):
+        existing = self.__entry_details[entry]
+        if existing != details:
             raise SynapticConfigurationException(
                 "Existing entry for key {} doesn't match one being added:"
                 " Existing mask: {} core_mask: {} core_shift: {}"
                 " n_neurons: {}"
                 " Adding mask: {} core_mask: {} core_shift: {}"
                 " n_neurons: {}".format(
-                    key_and_mask.key, entry.mask, entry.core_mask,
-                    entry.core_shift, entry.n_neurons, key_and_mask.mask,
+                    key_and_mask.key, *existing[1:], key_and_mask.mask,
                     core_mask, core_shift, n_neurons))
         return entry
 
@@ -626,11 +455,7 @@ class MasterPopTableAsBinarySearch(object):
         :param ref:
             the reference to use for the region, or None if not referenceable
         """
-        # sort entries by key
-        entries = sorted(
-            self.__entries.values(),
-            key=lambda a_entry: a_entry.routing_key)
-        n_entries = len(entries)
+        n_entries = len(self.__entry_details)
 
         # reserve space and switch
         master_pop_table_sz = (
@@ -646,22 +471,69 @@ class MasterPopTableAsBinarySearch(object):
         spec.write_value(n_entries)
         spec.write_value(self.__n_addresses)
 
-        # Generate the table and list as arrays
-        pop_table = _make_array(_MasterPopEntryCType, n_entries)
-        address_list = _make_array(_AddressListEntryCType, self.__n_addresses)
-        start = 0
-        for i, entry in enumerate(entries):
-            start += entry.write_to_table(pop_table[i], address_list, start)
+        # Generate the table and list as arrays and write them
+        pop_table, address_list = self.__make_arrays()
+        spec.write_array(pop_table.view("<u4"))
+        spec.write_array(address_list)
 
-        # Write the arrays
-        spec.write_array(_to_numpy(pop_table))
-        spec.write_array(_to_numpy(address_list))
-
-        self.__entries.clear()
-        del self.__entries
         self.__entries = None
+        self.__entry_details = None
+        self.__entry_counts = None
+        self.__address_words = None
+        self.__address_entries = None
+        self.__address_indices = None
         self.__n_addresses = 0
 
+    def __make_arrays(self):
+        """ Sort the entries by key and pack them and their addresses into\
+            the table and the address list
+
+        :return: The table and the address list
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        n_entries = len(self.__entry_details)
+        entries = numpy.array(self.__entry_details, dtype=_ENTRY_DTYPE)
+        counts = numpy.array(self.__entry_counts, dtype="uint32")
+
+        # Sort by key, and find where each entry moved to
+        order = numpy.argsort(entries["key"], kind="stable")
+        entries = entries[order]
+        counts = counts[order]
+        position = numpy.empty(n_entries, dtype="uint32")
+        position[order] = numpy.arange(n_entries, dtype="uint32")
+
+        # The extra info of an entry, if any, comes before its addresses
+        has_extra = (entries["core_mask"] != 0).astype("uint32")
+        starts = numpy.zeros(n_entries, dtype="uint32")
+        numpy.cumsum((counts + has_extra)[:-1], out=starts[1:])
+
+        pop_table = numpy.zeros(n_entries, dtype=_MASTER_POP_ENTRY_DTYPE)
+        pop_table["key"] = entries["key"]
+        pop_table["mask"] = entries["mask"]
+        pop_table["start_and_count"] = (
+            _bits(starts, _START_BITS) |
+            _bits(has_extra, 1, _EXTRA_INFO_FLAG_SHIFT) |
+            _bits(counts, _COUNT_BITS, _COUNT_SHIFT))
+
+        address_list = numpy.zeros(self.__n_addresses, dtype="uint32")
+        extra = has_extra.astype(bool)
+        n_neurons = entries["n_neurons"][extra]
+        address_list[starts[extra]] = (
+            _bits(entries["core_mask"][extra], _CORE_MASK_BITS) |
+            _bits((n_neurons + (BIT_IN_A_WORD - 1)) // BIT_IN_A_WORD,
+                  _N_WORDS_BITS, _N_WORDS_SHIFT) |
+            _bits(entries["core_shift"][extra], _MASK_SHIFT_BITS,
+                  _MASK_SHIFT_SHIFT) |
+            _bits(n_neurons, _N_NEURONS_BITS, _N_NEURONS_SHIFT))
+
+        address_entries = position[numpy.array(
+            self.__address_entries, dtype="uint32")]
+        address_list[
+            starts[address_entries] + has_extra[address_entries] +
+            numpy.array(self.__address_indices, dtype="uint32")] = \
+            numpy.array(self.__address_words, dtype="uint32")
+        return pop_table, address_list
+
     @property
     def max_n_neurons_per_core(self):
         """ The maximum number of neurons per core supported when a core-mask\
@@ -16,8 +16,11 @@
 import math
 import numpy
 
+# Default position of the fixed point for STDP
+STDP_FIXED_POINT = 11
+
 # Default value of fixed-point one for STDP
-STDP_FIXED_POINT_ONE = (1 << 11)
+STDP_FIXED_POINT_ONE = (1 << STDP_FIXED_POINT)
 
 
 def float_to_fixed(value):
@@ -51,3 +54,15 @@ def get_exp_lut_array(time_step, time_constant, shift=0):
     # Concatenate with the header
     header = numpy.array([len(a), shift], dtype="uint16")
     return numpy.concatenate((header, a.astype("uint16"))).view("uint32")
+
+
+def get_exp_dist_lut_array(mean):
+    """ Get the inverse cumulative distribution of an exponential\
+        distribution, indexed by a uniform fixed-point random number
+
+    :param float mean: The mean of the distribution in time steps
+    :rtype: ~numpy.ndarray
+    """
+    indices = numpy.arange(STDP_FIXED_POINT_ONE)
+    inv_cdf = numpy.log(1.0 - indices/float(STDP_FIXED_POINT_ONE)) * -mean
+    return inv_cdf.astype(numpy.uint16)
@@ -0,0 +1,866 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import math
+import numpy
+from spinn_front_end_common.utilities.globals_variables import (
+    machine_time_step_ms, machine_time_step_per_ms)
+from spynnaker.pyNN.exceptions import SynapticConfigurationException
+from spynnaker.pyNN.models.neuron.plasticity.stdp.common import (
+    STDP_FIXED_POINT, STDP_FIXED_POINT_ONE, float_to_fixed,
+    get_exp_dist_lut_array, get_exp_lut_array)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
+    TimingDependencePfisterSpikeTriplet, TimingDependenceRecurrent,
+    TimingDependenceSpikeNearestPair, TimingDependenceSpikePair,
+    TimingDependenceVogels2011)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
+    WeightDependenceAdditive, WeightDependenceAdditiveTriplet,
+    WeightDependenceMultiplicative)
+
+# The number of post-synaptic events kept per neuron, including the first
+# entry which only marks the start of the history
+_MAX_POST_SYNAPTIC_EVENTS = 16
+
+# Times on the machine are unsigned 32-bit values
+_UINT32_MASK = 0xFFFFFFFF
+
+# Plastic weights are unsigned 16-bit values
+_WEIGHT_MASK = 0xFFFF
+
+# States of the recurrent rule state machine
+_STATE_IDLE = 0
+_STATE_PRE_OPEN = 1
+_STATE_POST_OPEN = 2
+
+# The window length and accumulator of the pre-stochastic recurrent rule are
+# bit fields of the synaptic word
+_WINDOW_LENGTH_MASK = 0x3FF
+_ACCUMULATOR_BITS = 4
+
+
+def _fixed_mul(a, b, shift=STDP_FIXED_POINT):
+    """ Multiply the bottom 16 bits of two signed values and shift the\
+        result right, as ``maths_fixed_mul16`` does on the machine
+
+    :param ~numpy.ndarray a:
+    :param ~numpy.ndarray b:
+    :param shift: The position of the fixed point
+    :type shift: int or ~numpy.ndarray
+    :rtype: ~numpy.ndarray
+    """
+    return (numpy.asarray(a).astype("int16").astype("int64") *
+            numpy.asarray(b).astype("int16").astype("int64")) >> shift
+
+
+def _int16(values):
+    """ Truncate values to signed 16 bits, as storing them in a trace does
+
+    :param ~numpy.ndarray values:
+    :rtype: ~numpy.ndarray
+    """
+    return values.astype("int16").astype("int64")
+
+
+def _elapsed(time, last_time):
+    """ The time between two events, which wraps as unsigned 32-bit\
+        subtraction does on the machine
+
+    :param ~numpy.ndarray time:
+    :param ~numpy.ndarray last_time:
+    :rtype: ~numpy.ndarray
+    """
+    return (time - last_time) & _UINT32_MASK
+
+
+class _ExpDecayLut(object):
+    """ An exponential decay lookup table, exactly as written to the machine
+    """
+
+    __slots__ = [
+        "__shift",
+        "__values"]
+
+    def __init__(self, time_constant, shift=0):
+        """
+        :param float time_constant: The time constant in milliseconds
+        :param int shift: The right shift applied to times to index the table
+        """
+        halves = get_exp_lut_array(
+            machine_time_step_ms(), time_constant, shift).view("uint16")
+        size = int(halves[0])
+        self.__shift = int(halves[1])
+        # Anything past the end of the table has decayed to nothing
+        self.__values = numpy.concatenate((
+            halves[2:2 + size].astype("int16"), [0])).astype("int64")
+
+    def decay(self, elapsed):
+        """ Look up the decay after a number of time steps
+
+        :param ~numpy.ndarray elapsed:
+        :rtype: ~numpy.ndarray
+        """
+        return self.__values[numpy.minimum(
+            elapsed >> self.__shift, len(self.__values) - 1)]
+
+
+class _SpikePairRule(object):
+    """ The spike pair timing rule, with one trace for each of pre and post
+    """
+
+    __slots__ = [
+        "__tau_minus",
+        "__tau_plus"]
+
+    n_trace_fields = 1
+
+    def __init__(self, timing_dependence):
+        """
+        :param TimingDependenceSpikePair timing_dependence:
+        """
+        self.__tau_plus = _ExpDecayLut(timing_dependence.tau_plus)
+        self.__tau_minus = _ExpDecayLut(timing_dependence.tau_minus)
+
+    def reset(self, n_synapses, rng):
+        pass
+
+    def add_pre_spike(self, time, last_time, last_trace):
+        return _int16(_fixed_mul(last_trace[0], self.__tau_plus.decay(
+            _elapsed(time, last_time))) + STDP_FIXED_POINT_ONE)[None]
+
+    def add_post_spike(self, time, last_time, last_trace):
+        return _int16(_fixed_mul(last_trace[0], self.__tau_minus.decay(
+            _elapsed(time, last_time))) + STDP_FIXED_POINT_ONE)[None]
+
+    def apply_pre_spike(
+            self, synapses, time, trace, last_pre_time, last_pre_trace,
+            last_post_time, last_post_trace, weights):
+        weights.depress(synapses, _fixed_mul(
+            last_post_trace[0],
+            self.__tau_minus.decay(_elapsed(time, last_post_time))))
+
+    def apply_post_spike(
+            self, synapses, time, trace, last_pre_time, last_pre_trace,
+            last_post_time, last_post_trace, weights):
+        elapsed = _elapsed(time, last_pre_time)
+        weights.potentiate(synapses, numpy.where(elapsed > 0, _fixed_mul(
+            last_pre_trace[0], self.__tau_plus.decay(elapsed)), 0))
+
+    def write_back(self, synapses):
+        pass
+
+
+class _SpikeNearestPairRule(object):
+    """ The nearest spike pair timing rule, which has no traces
+    """
+
+    __slots__ = [
+        "__tau_minus",
+        "__tau_plus"]
+
+    n_trace_fields = 0
+
+    def __init__(self, timing_dependence):
+        """
+        :param TimingDependenceSpikeNearestPair timing_dependence:
+        """
+        self.__tau_plus = _ExpDecayLut(timing_dependence.tau_plus)
+        self.__tau_minus = _ExpDecayLut(timing_dependence.tau_minus)
+
+    def reset(self, n_synapses, rng):
+        pass
+
+    def add_pre_spike(self, time, last_time, last_trace):
+        return last_trace
+
+    def add_post_spike(self, time, last_time, last_trace):
+        return last_trace
+
+    def apply_pre_spike(
+            self, synapses, time, trace, last_pre_time, last_pre_trace,
+            last_post_time, last_post_trace, weights):
+        weights.depress(synapses, self.__tau_minus.decay(
+            _elapsed(time, last_post_time)))
+
+    def apply_post_spike(
+            self, synapses, time, trace, last_pre_time, last_pre_trace,
+            last_post_time, last_post_trace, weights):
+        since_pre = _elapsed(time, last_pre_time)
+        since_post = _elapsed(time, last_post_time)
+        weights.potentiate(synapses, numpy.where(
+            (since_pre > 0) & (since_post >= since_pre),
+            self.__tau_plus.decay(since_pre), 0))
+
+    def write_back(self, synapses):
+        pass
+
+
+class _PfisterSpikeTripletRule(object):
+    """ The Pfister spike triplet timing rule, with two traces for each of\
+        pre and post and two weight terms
+    """
+
+    __slots__ = [
+        "__tau_minus",
+        "__tau_plus",
+        "__tau_x",
+        "__tau_y"]
+
+    n_trace_fields = 2
+
+    def __init__(self, timing_dependence):
+        """
+        :param TimingDependencePfisterSpikeTriplet timing_dependence:
+        """
+        self.__tau_plus = _ExpDecayLut(timing_dependence.tau_plus)
+        self.__tau_minus = _ExpDecayLut(timing_dependence.tau_minus)
+        self.__tau_x = _ExpDecayLut(timing_dependence.tau_x, shift=2)
+        self.__tau_y = _ExpDecayLut(timing_dependence.tau_y, shift=2)
+
+    def reset(self, n_synapses, rng):
+        pass
+
+    @staticmethod
+    def __add_spike(time, last_time, last_trace, tau_1, tau_2):
+        elapsed = _elapsed(time, last_time)
+        trace_1 = _int16(_fixed_mul(
+            last_trace[0], tau_1.decay(elapsed)) + STDP_FIXED_POINT_ONE)
+        # The second trace is sampled before the spike, so the first spike
+        # leaves it at zero
+        trace_2 = numpy.where(last_time == 0, 0, _int16(_fixed_mul(
+            last_trace[1] + STDP_FIXED_POINT_ONE, tau_2.decay(elapsed))))
+        return numpy.stack((trace_1, trace_2))
+
+    def add_pre_spike(self, time, last_time, last_trace):
+        return self.__add_spike(
+            time, last_time, last_trace, self.__tau_plus, self.__tau_x)
+
+    def add_post_spike(self, time, last_time, last_trace):
+        return self.__add_spike(
+            time, last_time, last_trace, self.__tau_minus, self.__tau_y)
+
+    def apply_pre_spike(
+            self, synapses, time, trace, last_pre_time, last_pre_trace,
+            last_post_time, last_post_trace, weights):
+        decayed_o1 = _fixed_mul(
+            last_post_trace[0],
+            self.__tau_minus.decay(_elapsed(time, last_post_time)))
+        weights.depress(
+            synapses, decayed_o1, _fixed_mul(decayed_o1, trace[1]))
+
+    def apply_post_spike(
+            self, synapses, time, trace, last_pre_time, last_pre_trace,
+            last_post_time, last_post_trace, weights):
+        elapsed = _elapsed(time, last_pre_time)
+        decayed_r1 = numpy.where(elapsed > 0, _fixed_mul(
+            last_pre_trace[0], self.__tau_plus.decay(elapsed)), 0)
+        weights.potentiate(
+            synapses, decayed_r1, _fixed_mul(decayed_r1, trace[1]))
+
+    def write_back(self, synapses):
+        pass
+
+
+class _Vogels2011Rule(object):
+    """ The Vogels 2011 inhibitory timing rule, with one trace for each of\
+        pre and post
+    """
+
+    __slots__ = [
+        "__alpha",
+        "__tau"]
+
+    n_trace_fields = 1
+
+    def __init__(self, timing_dependence):
+        """
+        :param TimingDependenceVogels2011 timing_dependence:
+        """
+        self.__alpha = float_to_fixed(timing_dependence.alpha)
+        self.__tau = _ExpDecayLut(timing_dependence.tau)
+
+    def reset(self, n_synapses, rng):
+        pass
+
+    def __add_spike(self, time, last_time, last_trace):
+        return _int16(_fixed_mul(last_trace[0], self.__tau.decay(
+            _elapsed(time, last_time))) + STDP_FIXED_POINT_ONE)[None]
+
+    def add_pre_spike(self, time, last_time, last_trace):
+        return self.__add_spike(time, last_time, last_trace)
+
+    def add_post_spike(self, time, last_time, last_trace):
+        return self.__add_spike(time, last_time, last_trace)
+
+    def apply_pre_spike(
+            self, synapses, time, trace, last_pre_time, last_pre_trace,
+            last_post_time, last_post_trace, weights):
+        weights.potentiate(synapses, _fixed_mul(
+            last_post_trace[0],
+            self.__tau.decay(_elapsed(time, last_post_time))) - self.__alpha)
+
+    def apply_post_spike(
+            self, synapses, time, trace, last_pre_time, last_pre_trace,
+            last_post_time, last_post_trace, weights):
+        weights.potentiate(synapses, _fixed_mul(
+            last_pre_trace[0],
+            self.__tau.decay(_elapsed(time, last_pre_time))))
+
+    def write_back(self, synapses):
+        pass
+
+
+class _RecurrentRule(object):
+    """ The recurrent timing rule, in either its dual state machine form,\
+        where the window lengths are the traces, or its pre-stochastic form,\
+        where each synapse has a state machine and a window length.
+
+    The window lengths are drawn from the same distributions as on the\
+    machine, but from a host random number generator, so only the\
+    statistics of the weights match those of the machine.
+    """
+
+    __slots__ = [
+        "__accumulators",
+        "__depression_plus_one",
+        "__dual_fsm",
+        "__post_windows",
+        "__potentiation_minus_one",
+        "__pre_windows",
+        "__rng",
+        "__states",
+        "__window_lengths"]
+
+    def __init__(self, timing_dependence):
+        """
+        :param TimingDependenceRecurrent timing_dependence:
+        """
+        self.__depression_plus_one = \
+            timing_dependence.accumulator_depression_plus_one
+        self.__potentiation_minus_one = \
+            timing_dependence.accumulator_potentiation_minus_one
+        self.__dual_fsm = timing_dependence.dual_fsm
+        time_step_per_ms = machine_time_step_per_ms()
+        self.__pre_windows = get_exp_dist_lut_array(
+            timing_dependence.mean_pre_window * time_step_per_ms).astype(
+                "int64")
+        self.__post_windows = get_exp_dist_lut_array(
+            timing_dependence.mean_post_window * time_step_per_ms).astype(
+                "int64")
+        self.__accumulators = None
+        self.__states = None
+        self.__window_lengths = None
+        self.__rng = None
+
+    @property
+    def n_trace_fields(self):
+        return 1 if self.__dual_fsm else 0
+
+    def reset(self, n_synapses, rng):
+        self.__accumulators = numpy.zeros(n_synapses, dtype="int64")
+        self.__states = numpy.zeros(n_synapses, dtype="int64")
+        self.__window_lengths = numpy.zeros(n_synapses, dtype="int64")
+        self.__rng = rng
+
+    def __draw(self, windows, n):
+        return windows[self.__rng.randint(0, STDP_FIXED_POINT_ONE, n)]
+
+    def add_pre_spike(self, time, last_time, last_trace):
+        if not self.__dual_fsm:
+            return last_trace
+        return self.__draw(self.__pre_windows, len(time))[None]
+
+    def add_post_spike(self, time, last_time, last_trace):
+        if not self.__dual_fsm:
+            return last_trace
+        return self.__draw(self.__post_windows, len(time))[None]
+
+    def __depress(self, synapses, in_window, weights):
+        accumulators = self.__accumulators[synapses]
+        count = in_window & (accumulators > self.__depression_plus_one)
+        reached = in_window & ~count
+        accumulators[count] -= 1
+        accumulators[reached] = 0
+        self.__accumulators[synapses] = accumulators
+        weights.depress(
+            synapses, numpy.where(reached, STDP_FIXED_POINT_ONE, 0))
+
+    def __potentiate(self, synapses, in_window, weights):
+        accumulators = self.__accumulators[synapses]
+        count = in_window & (accumulators < self.__potentiation_minus_one)
+        reached = in_window & ~count
+        accumulators[count] += 1
+        accumulators[reached] = 0
+        self.__accumulators[synapses] = accumulators
+        weights.potentiate(
+            synapses, numpy.where(reached, STDP_FIXED_POINT_ONE, 0))
+
+    def apply_pre_spike(
+            self, synapses, time, trace, last_pre_time, last_pre_trace,
+            last_post_time, last_post_trace, weights):
+        since_post = _elapsed(time, last_post_time)
+        if self.__dual_fsm:
+            self.__depress(synapses, since_post < last_post_trace[0], weights)
+            return
+
+        states = self.__states[synapses]
+        windows = self.__window_lengths[synapses]
+        since_pre = _elapsed(time, last_pre_time)
+        idle = states == _STATE_IDLE
+        pre_open = states == _STATE_PRE_OPEN
+        post_open = states == _STATE_POST_OPEN
+        in_pre = pre_open & (since_pre < windows)
+        in_post = post_open & (since_post < windows)
+        self.__depress(synapses, in_post, weights)
+        new_window = idle | (pre_open & ~in_pre) | (post_open & ~in_post)
+        states[in_pre | in_post] = _STATE_IDLE
+        states[new_window] = _STATE_PRE_OPEN
+        windows[new_window] = self.__draw(
+            self.__pre_windows, numpy.count_nonzero(new_window))
+        self.__states[synapses] = states
+        self.__window_lengths[synapses] = windows
+
+    def apply_post_spike(
+            self, synapses, time, trace, last_pre_time, last_pre_trace,
+            last_post_time, last_post_trace, weights):
+        since_pre = _elapsed(time, last_pre_time)
+        if self.__dual_fsm:
+            self.__potentiate(
+                synapses, (since_pre > 0) & (since_pre < last_pre_trace[0]),
+                weights)
+            return
+
+        states = self.__states[synapses]
+        windows = self.__window_lengths[synapses]
+        since_post = _elapsed(time, last_post_time)
+        idle = states == _STATE_IDLE
+        pre_open = states == _STATE_PRE_OPEN
+        post_open = states == _STATE_POST_OPEN
+        in_post = post_open & (since_post < windows)
+        together = pre_open & (since_pre == 0)
+        in_pre = pre_open & ~together & (since_pre < windows)
+        self.__potentiate(synapses, in_pre, weights)
+        new_window = idle | (post_open & ~in_post) | (
+            pre_open & ~together & ~in_pre)
+        states[in_post | together | in_pre] = _STATE_IDLE
+        states[new_window] = _STATE_POST_OPEN
+        windows[new_window] = self.__draw(
+            self.__post_windows, numpy.count_nonzero(new_window))
+        self.__states[synapses] = states
+        self.__window_lengths[synapses] = windows
+
+    def write_back(self, synapses):
+        if self.__dual_fsm:
+            self.__accumulators[synapses] = _int16(
+                self.__accumulators[synapses])
+            return
+        # Keep only what fits in the bit fields of the synaptic word
+        self.__window_lengths[synapses] &= _WINDOW_LENGTH_MASK
+        sign = 1 << (_ACCUMULATOR_BITS - 1)
+        self.__accumulators[synapses] = (
+            (self.__accumulators[synapses] + sign) %
+            (1 << _ACCUMULATOR_BITS)) - sign
+
+
+class _AdditiveWeights(object):
+    """ The additive weight dependence with one or two terms, which sums the\
+        changes and applies them when the synapse is written back
+    """
+
+    __slots__ = [
+        "__a_minus",
+        "__a_plus",
+        "__max_weight",
+        "__min_weight",
+        "__minus",
+        "__plus",
+        "weights"]
+
+    def __init__(self, weight_dependence, weight_scale, n_terms, weights):
+        """
+        :param weight_dependence: The weight dependence
+        :type weight_dependence:
+            WeightDependenceAdditive or WeightDependenceAdditiveTriplet
+        :param float weight_scale: The weight scale of the synapse type
+        :param int n_terms: The number of weight terms
+        :param ~numpy.ndarray weights: The initial fixed-point weights
+        """
+        w = weight_scale
+        w_max = weight_dependence.w_max
+        self.__min_weight = int(round(weight_dependence.w_min * w))
+        self.__max_weight = int(round(w_max * w))
+        self.__a_plus = [int(round(weight_dependence.A_plus * w_max * w))]
+        self.__a_minus = [int(round(weight_dependence.A_minus * w_max * w))]
+        if n_terms == 2:
+            self.__a_plus.append(
+                int(round(weight_dependence.A3_plus * w_max * w)))
+            self.__a_minus.append(
+                int(round(weight_dependence.A3_minus * w_max * w)))
+        self.__plus = numpy.zeros((n_terms, len(weights)), dtype="int64")
+        self.__minus = numpy.zeros((n_terms, len(weights)), dtype="int64")
+        self.weights = weights
+
+    def start(self, synapses):
+        self.__plus[:, synapses] = 0
+        self.__minus[:, synapses] = 0
+
+    def depress(self, synapses, *terms):
+        for i, term in enumerate(terms):
+            self.__minus[i, synapses] += term
+
+    def potentiate(self, synapses, *terms):
+        for i, term in enumerate(terms):
+            self.__plus[i, synapses] += term
+
+    def finish(self, synapses):
+        weights = self.weights[synapses]
+        for plus, minus, a_plus, a_minus in zip(
+                self.__plus, self.__minus, self.__a_plus, self.__a_minus):
+            weights += (_fixed_mul(plus[synapses], a_plus) -
+                        _fixed_mul(minus[synapses], a_minus))
+        self.weights[synapses] = numpy.clip(
+            weights, self.__min_weight, self.__max_weight) & _WEIGHT_MASK
+
+
+class _MultiplicativeWeights(object):
+    """ The multiplicative weight dependence, which changes the weight as\
+        each change is made
+    """
+
+    __slots__ = [
+        "__a_minus",
+        "__a_plus",
+        "__max_weight",
+        "__min_weight",
+        "__shift",
+        "weights"]
+
+    def __init__(
+            self, weight_dependence, weight_scale, ring_buffer_shift,
+            weights):
+        """
+        :param WeightDependenceMultiplicative weight_dependence:
+            The weight dependence
+        :param float weight_scale: The weight scale of the synapse type
+        :param int ring_buffer_shift:
+            The ring buffer to input left shift of the synapse type
+        :param ~numpy.ndarray weights: The initial fixed-point weights
+        """
+        w = weight_scale
+        self.__min_weight = int(round(weight_dependence.w_min * w))
+        self.__max_weight = int(round(weight_dependence.w_max * w))
+        self.__a_plus = int(round(weight_dependence.A_plus * w))
+        self.__a_minus = int(round(weight_dependence.A_minus * w))
+        self.__shift = 16 - (ring_buffer_shift + 1)
+        self.weights = weights
+
+    def start(self, synapses):
+        pass
+
+    def depress(self, synapses, depression):
+        weights = self.weights[synapses]
+        scale = _fixed_mul(
+            weights - self.__min_weight, self.__a_minus, self.__shift)
+        self.weights[synapses] = weights - _fixed_mul(scale, depression)
+
+    def potentiate(self, synapses, potentiation):
+        weights = self.weights[synapses]
+        scale = _fixed_mul(
+            self.__max_weight - weights, self.__a_plus, self.__shift)
+        self.weights[synapses] = weights + _fixed_mul(scale, potentiation)
+
+    def finish(self, synapses):
+        self.weights[synapses] &= _WEIGHT_MASK
+
+
+def _spike_time_steps(spike_times, n_neurons):
+    """ Convert spike times in milliseconds to sorted time steps
+
+    :param list(list(float)) spike_times: The spike times of each neuron
+    :param int n_neurons: The number of neurons needed
+    :return: The time steps of all the spikes in neuron order, and the index
+        of the first spike and number of spikes of each neuron
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+    """
+    time_step_per_ms = machine_time_step_per_ms()
+    steps = [numpy.unique(numpy.rint(
+        numpy.asarray(times, dtype="float64") * time_step_per_ms).astype(
+            "int64")) for times in spike_times]
+    steps += [numpy.zeros(0, dtype="int64")] * (n_neurons - len(steps))
+    counts = numpy.array([len(s) for s in steps], dtype="int64")
+    starts = numpy.concatenate(([0], numpy.cumsum(counts)[:-1]))
+    return (numpy.concatenate(steps + [numpy.zeros(0, dtype="int64")]),
+            starts.astype("int64"), counts)
+
+
+class STDPReferenceSimulator(object):
+    """ Applies an STDP rule to recorded spike trains on the host, with the\
+        same fixed-point arithmetic and lookup tables as the machine, to\
+        predict the weights that the machine will learn.
+
+    Each presynaptic spike is processed for all the synapses of its neuron at\
+    once, as a row is on the machine.  The postsynaptic spikes up to and\
+    including the time step of the presynaptic spike are seen, and only the\
+    last 15 of those are kept, as on the machine.  The spikes of the rows of\
+    a delay extension arrive a whole number of delay stages late.
+    """
+
+    __slots__ = [
+        "__backprop_delay",
+        "__max_delay",
+        "__n_weight_terms",
+        "__ring_buffer_shifts",
+        "__seed",
+        "__timing",
+        "__weight_dependence",
+        "__weight_scales"]
+
+    def __init__(
+            self, synapse_dynamics, ring_buffer_shifts, weight_scale=1.0,
+            max_delay=None, seed=None):
+        """
+        :param SynapseDynamicsSTDP synapse_dynamics:
+            The plastic synapse dynamics of the projections to simulate
+        :param list(int) ring_buffer_shifts:
+            The ring buffer to input left shift of each synapse type of the
+            postsynaptic population
+        :param float weight_scale:
+            The global weight scale of the postsynaptic neuron model
+        :param max_delay:
+            The maximum delay in time steps supported by the postsynaptic
+            cores, or None if there is no delay extension
+        :type max_delay: int or None
+        :param seed: The seed of the random windows of the recurrent rule
+        :type seed: int or None
+        :raises SynapticConfigurationException:
+            If the rules of the dynamics cannot be simulated
+        """
+        timing = synapse_dynamics.timing_dependence
+        weight_dependence = synapse_dynamics.weight_dependence
+        if isinstance(timing, TimingDependenceSpikePair):
+            self.__timing = _SpikePairRule(timing)
+        elif isinstance(timing, TimingDependenceSpikeNearestPair):
+            self.__timing = _SpikeNearestPairRule(timing)
+        elif isinstance(timing, TimingDependencePfisterSpikeTriplet):
+            self.__timing = _PfisterSpikeTripletRule(timing)
+        elif isinstance(timing, TimingDependenceVogels2011):
+            self.__timing = _Vogels2011Rule(timing)
+        elif isinstance(timing, TimingDependenceRecurrent):
+            self.__timing = _RecurrentRule(timing)
+        else:
+            raise SynapticConfigurationException(
+                "No reference simulation of timing dependence {}".format(
+                    type(timing).__name__))
+        if isinstance(weight_dependence, WeightDependenceAdditiveTriplet):
+            n_terms = 2
+        elif isinstance(weight_dependence, (
+                WeightDependenceAdditive, WeightDependenceMultiplicative)):
+            n_terms = 1
+        else:
+            raise SynapticConfigurationException(
+                "No reference simulation of weight dependence {}".format(
+                    type(weight_dependence).__name__))
+        if n_terms != timing.n_weight_terms:
+            raise SynapticConfigurationException(
+                "{} has {} weight terms but {} needs {}".format(
+                    type(weight_dependence).__name__, n_terms,
+                    type(timing).__name__, timing.n_weight_terms))
+
+        self.__weight_dependence = weight_dependence
+        self.__n_weight_terms = n_terms
+        self.__backprop_delay = synapse_dynamics.backprop_delay
+        self.__ring_buffer_shifts = list(ring_buffer_shifts)
+        self.__weight_scales = [
+            math.pow(2, 16 - (shift + 1)) * weight_scale
+            for shift in self.__ring_buffer_shifts]
+        self.__max_delay = max_delay
+        self.__seed = seed
+
+    @property
+    def weight_scales(self):
+        """ The scale from weights to fixed-point weights of each synapse type
+
+        :rtype: list(float)
+        """
+        return self.__weight_scales
+
+    def __weights(self, synapse_type, weights):
+        """ Make the weight dependence state of the synapses
+
+        :param int synapse_type:
+        :param ~numpy.ndarray weights: The initial weights
+        """
+        # The machine holds the magnitude of each weight, as the synapse
+        # dynamics write it, and the rule only changes that
+        weight_scale = self.__weight_scales[synapse_type]
+        fixed = numpy.minimum(numpy.rint(numpy.abs(
+            weights * weight_scale)), _WEIGHT_MASK).astype("int64")
+        if isinstance(
+                self.__weight_dependence, WeightDependenceMultiplicative):
+            return _MultiplicativeWeights(
+                self.__weight_dependence, weight_scale,
+                self.__ring_buffer_shifts[synapse_type], fixed)
+        return _AdditiveWeights(
+            self.__weight_dependence, weight_scale, self.__n_weight_terms,
+            fixed)
+
+    def run(self, connections, pre_spike_times, post_spike_times,
+            synapse_type=0):
+        """ Apply the rule to the connections given the spikes of the\
+            neurons at each end.
+
+        :param ~numpy.ndarray connections:
+            The connections, with the source, target, weight and delay of
+            each, as made by a connector
+        :param list(list(float)) pre_spike_times:
+            The spike times in milliseconds of each presynaptic neuron
+        :param list(list(float)) post_spike_times:
+            The spike times in milliseconds of each postsynaptic neuron
+        :param int synapse_type: The synapse type of the connections
+        :return: A copy of the connections with the learned weights, as they
+            would be read back from the machine
+        :rtype: ~numpy.ndarray
+        """
+        learned = numpy.array(connections, copy=True)
+        n_synapses = len(connections)
+        if not n_synapses:
+            return learned
+        sources = connections["source"].astype("int64")
+        targets = connections["target"].astype("int64")
+        n_pre = int(sources.max()) + 1
+        n_post = int(targets.max()) + 1
+        pre_times, pre_starts, pre_counts = _spike_time_steps(
+            pre_spike_times, n_pre)
+        post_times, post_starts, post_counts = _spike_time_steps(
+            post_spike_times, n_post)
+
+        # Process the nth spike of every presynaptic neuron together; the
+        # synapses are ordered with those with the most spikes first, so that
+        # the active synapses are always at the front, and then by target so
+        # that the searches of the postsynaptic spikes are close together
+        counts = pre_counts[sources]
+        order = numpy.lexsort((targets, -counts))
+        counts = counts[order]
+        sources = sources[order]
+        targets = targets[order]
+
+        # Spikes to the rows of a delay extension arrive a number of delay
+        # stages late, and the rest of the delay is the dendritic delay
+        delays = numpy.rint(connections["delay"][order] *
+                            machine_time_step_per_ms()).astype("int64")
+        offsets = numpy.zeros(n_synapses, dtype="int64")
+        if self.__max_delay is not None:
+            offsets = ((delays - 1) // self.__max_delay) * self.__max_delay
+        delays -= offsets
+        if not self.__backprop_delay:
+            delays[:] = 0
+
+        timing = self.__timing
+        timing.reset(n_synapses, numpy.random.RandomState(self.__seed))
+        initial_weights = connections["weight"][order]
+        signs = numpy.where(initial_weights < 0, -1.0, 1.0)
+        weights = self.__weights(synapse_type, initial_weights)
+        n_fields = timing.n_trace_fields
+
+        # The traces of the postsynaptic spikes depend only on the spikes
+        post_traces = numpy.zeros((n_fields, len(post_times)), dtype="int64")
+        last_time = numpy.zeros(len(post_counts), dtype="int64")
+        last_trace = numpy.zeros((n_fields, len(post_counts)), dtype="int64")
+        for k in range(int(post_counts.max())):
+            neurons = numpy.nonzero(post_counts > k)[0]
+            index = post_starts[neurons] + k
+            time = post_times[index]
+            trace = timing.add_post_spike(
+                time, last_time[neurons], last_trace[:, neurons])
+            post_traces[:, index] = trace
+            last_time[neurons] = time
+            last_trace[:, neurons] = trace
+
+        # Find the spikes of a postsynaptic neuron by searching a key made
+        # from the neuron and time; a sentinel makes every index valid
+        key_scale = int(max(
+            post_times.max() if len(post_times) else 0,
+            pre_times.max() if len(pre_times) else 0) + offsets.max()) + 1
+        post_keys = numpy.repeat(
+            numpy.arange(n_post, dtype="int64"), post_counts) * key_scale + \
+            post_times
+        post_times = numpy.concatenate((post_times, [0]))
+        post_traces = numpy.concatenate(
+            (post_traces, numpy.zeros((n_fields, 1), dtype="int64")), axis=1)
+        keys = targets * key_scale
+        starts = post_starts[targets]
+
+        last_pre_time = numpy.zeros(n_synapses, dtype="int64")
+        last_pre_trace = numpy.zeros((n_fields, n_synapses), dtype="int64")
+        for m in range(int(counts[0])):
+            n_active = numpy.count_nonzero(counts > m)
+            active = slice(0, n_active)
+            delay = delays[active]
+            time = pre_times[pre_starts[sources[active]] + m] + \
+                offsets[active]
+            last_time = last_pre_time[active]
+            last_trace = last_pre_trace[:, active]
+            trace = timing.add_pre_spike(time, last_time, last_trace)
+            weights.start(active)
+
+            # Find the window of postsynaptic spikes in the history
+            key = keys[active]
+            start = starts[active]
+            n_history = numpy.searchsorted(
+                post_keys, key + time, side="right") - start
+            first_history = numpy.maximum(
+                n_history - (_MAX_POST_SYNAPTIC_EVENTS - 1), 0)
+            begin = numpy.maximum(last_time - delay, 0)
+            end = numpy.maximum(time - delay, 0)
+            prev = numpy.searchsorted(
+                post_keys, key + begin, side="right") - start - 1
+            prev_valid = prev >= first_history
+            prev_index = numpy.where(prev_valid, start + prev, -1)
+            prev_time = post_times[prev_index]
+            prev_trace = post_traces[:, prev_index]
+            first = numpy.maximum(prev + 1, first_history)
+            n_events = numpy.minimum(numpy.searchsorted(
+                post_keys, key + end, side="right") - start, n_history) - first
+
+            # Apply the postsynaptic spikes in the window in turn
+            for k in range(int(n_events.max())):
+                events = numpy.nonzero(n_events > k)[0]
+                index = start[events] + first[events] + k
+                post_time = post_times[index]
+                post_trace = post_traces[:, index]
+                timing.apply_post_spike(
+                    events, post_time + delay[events], post_trace,
+                    last_time[events], last_trace[:, events],
+                    prev_time[events], prev_trace[:, events], weights)
+                prev_time[events] = post_time
+                prev_trace[:, events] = post_trace
+                prev_valid[events] = True
+
+            # Apply the presynaptic spike if there has been a postsynaptic one
+            events = numpy.nonzero(prev_valid)[0]
+            timing.apply_pre_spike(
+                events, time[events], trace[:, events],
+                last_time[events], last_trace[:, events],
+                prev_time[events] + delay[events], prev_trace[:, events],
+                weights)
+
+            weights.finish(active)
+            timing.write_back(active)
+            last_pre_time[active] = time
+            last_pre_trace[:, active] = trace
+
+        # The learned magnitudes keep the sign of the weights they started as
+        learned["weight"][order] = signs * weights.weights / \
+            self.__weight_scales[synapse_type]
+        return learned
@@ -13,7 +13,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import numpy
 from spinn_utilities.overrides import overrides
 from data_specification.enums import DataType
 from spinn_front_end_common.utilities.constants import (
@@ -24,7 +23,7 @@ from .abstract_timing_dependence import AbstractTimingDependence
 from spynnaker.pyNN.models.neuron.plasticity.stdp.synapse_structure import (
     SynapseStructureWeightAccumulator)
 from spynnaker.pyNN.models.neuron.plasticity.stdp.common import (
-    STDP_FIXED_POINT_ONE)
+    STDP_FIXED_POINT_ONE, get_exp_dist_lut_array)
 
 
 class TimingDependenceRecurrent(AbstractTimingDependence):
@@ -101,6 +100,47 @@ class TimingDependenceRecurrent(AbstractTimingDependence):
     def A_minus(self, new_value):
         self.__a_minus = new_value
 
+    @property
+    def accumulator_depression_plus_one(self):
+        """ One more than the accumulator value at which depression happens
+
+        :rtype: int
+        """
+        return self.__accumulator_depression_plus_one
+
+    @property
+    def accumulator_potentiation_minus_one(self):
+        """ One less than the accumulator value at which potentiation happens
+
+        :rtype: int
+        """
+        return self.__accumulator_potentiation_minus_one
+
+    @property
+    def mean_pre_window(self):
+        """ The mean length of the pre-window in milliseconds
+
+        :rtype: float
+        """
+        return self.__mean_pre_window
+
+    @property
+    def mean_post_window(self):
+        """ The mean length of the post-window in milliseconds
+
+        :rtype: float
+        """
+        return self.__mean_post_window
+
+    @property
+    def dual_fsm(self):
+        """ Whether the windows are kept in the traces rather than in the\
+            synapses
+
+        :rtype: bool
+        """
+        return self.__dual_fsm
+
     @overrides(AbstractTimingDependence.is_same_as)
     def is_same_as(self, timing_dependence):
         if timing_dependence is None or not isinstance(
@@ -175,10 +215,8 @@ class TimingDependenceRecurrent(AbstractTimingDependence):
         :param .DataSpecificationGenerator spec:
         :param float mean:
         """
-        indices = numpy.arange(STDP_FIXED_POINT_ONE)
-        inv_cdf = numpy.log(1.0 - indices/float(STDP_FIXED_POINT_ONE)) * -mean
         spec.write_array(
-            inv_cdf.astype(numpy.uint16), data_type=DataType.UINT16)
+            get_exp_dist_lut_array(mean), data_type=DataType.UINT16)
 
     @property
     def synaptic_structure(self):
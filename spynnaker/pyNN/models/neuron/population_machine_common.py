@@ -34,6 +34,8 @@ from spinn_front_end_common.interface.simulation.simulation_utilities import (
 from spinn_front_end_common.utilities.utility_objs import ExecutableType
 from spinn_front_end_common.interface.profiling import AbstractHasProfileData
 from spinn_front_end_common.utilities.constants import SIMULATION_N_BYTES
+from spynnaker.pyNN.utilities.constants import (
+    MEANFIELD_RATE_PARTITION_ID, MEANFIELD_STATE_PARTITION_ID)
 
 
 # Identifiers for common regions
@@ -107,6 +109,19 @@ class PopulationMachineCommon(
     def _n_additional_data_items(self):
         return self.__n_provenance_items
 
+    @overrides(MachineVertex.get_n_keys_for_partition)
+    def get_n_keys_for_partition(self, partition):
+        # Rates sent to Poisson sources carry the index of the atom in the
+        # whole population, so each core needs keys for all of the atoms
+        if partition.identifier == MEANFIELD_RATE_PARTITION_ID:
+            return self.app_vertex.n_atoms
+        # Live state does the same, with a block of keys for each variable
+        if partition.identifier == MEANFIELD_STATE_PARTITION_ID:
+            n_variables = len(
+                self.app_vertex.neuron_impl.get_recordable_variables())
+            return n_variables * self.app_vertex.n_atoms
+        return super().get_n_keys_for_partition(partition)
+
     @overrides(AbstractReceiveBuffersToHost.get_recording_region_base_address)
     def get_recording_region_base_address(self, txrx, placement):
         return locate_memory_region_for_placement(
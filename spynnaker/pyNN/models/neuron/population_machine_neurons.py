@@ -23,7 +23,9 @@ from spinn_front_end_common.utilities import helpful_functions
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spynnaker.pyNN.models.abstract_models import (
     AbstractReadParametersBeforeSet)
-from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
+from spynnaker.pyNN.utilities.constants import (
+    MEANFIELD_RATE_PARTITION_ID, MEANFIELD_STATE_PARTITION_ID,
+    SPIKE_PARTITION_ID)
 from spynnaker.pyNN.utilities.utility_calls import get_n_bits
 
 
@@ -99,6 +101,42 @@ class PopulationMachineNeurons(
         :param int key: The key to be set
         """
 
+    @abstractproperty
+    def _rate_key(self):
+        """ The key for rates sent to Poisson sources, or None if there are\
+            none.
+
+        :rtype: int or None
+        """
+
+    @abstractmethod
+    def _set_rate_key(self, rate_key):
+        """ Set the key for rates sent to Poisson sources.
+
+        :note: This is required because this class cannot have any storage.
+
+        :param rate_key: The key to be set
+        :type rate_key: int or None
+        """
+
+    @abstractproperty
+    def _state_key(self):
+        """ The key for state sent live to the host, or None if there is\
+            none.
+
+        :rtype: int or None
+        """
+
+    @abstractmethod
+    def _set_state_key(self, state_key):
+        """ Set the key for state sent live to the host.
+
+        :note: This is required because this class cannot have any storage.
+
+        :param state_key: The key to be set
+        :type state_key: int or None
+        """
+
     @abstractproperty
     def _neuron_regions(self):
         """ The region identifiers for the neuron regions
@@ -139,9 +177,13 @@ class PopulationMachineNeurons(
         :param list(int) ring_buffer_shifts:
             The shifts to apply to convert ring buffer values to S1615 values
         """
-        # Get and store the key
+        # Get and store the keys
         self._set_key(routing_info.get_first_key_from_pre_vertex(
             self, SPIKE_PARTITION_ID))
+        self._set_rate_key(routing_info.get_first_key_from_pre_vertex(
+            self, MEANFIELD_RATE_PARTITION_ID))
+        self._set_state_key(routing_info.get_first_key_from_pre_vertex(
+            self, MEANFIELD_STATE_PARTITION_ID))
 
         # Write the neuron parameters
         self._write_neuron_parameters(spec, ring_buffer_shifts)
@@ -208,6 +250,20 @@ class PopulationMachineNeurons(
             self._vertex_slice)
         spec.write_array(neuron_data)
 
+        # Write where to send rates to, for models that can send them
+        rate_output_data = self._app_vertex.neuron_impl.get_rate_output_data(
+            self._rate_key, self._vertex_slice)
+        if len(rate_output_data):
+            spec.write_array(rate_output_data)
+
+        # Write where to send live state to, for models that can send it
+        state_output_data = (
+            self._app_vertex.neuron_impl.get_state_output_data(
+                self._state_key, self._vertex_slice,
+                self._app_vertex.n_atoms))
+        if len(state_output_data):
+            spec.write_array(state_output_data)
+
     @overrides(AbstractReadParametersBeforeSet.read_parameters_from_machine)
     def read_parameters_from_machine(
             self, transceiver, placement, vertex_slice):
@@ -75,6 +75,8 @@ class PopulationMachineVertex(
         "__change_requires_neuron_parameters_reload",
         "__synaptic_matrices",
         "__key",
+        "__rate_key",
+        "__state_key",
         "__ring_buffer_shifts",
         "__weight_scales",
         "__all_syn_block_sz",
@@ -141,7 +143,8 @@ class PopulationMachineVertex(
         1: "DMA_READ",
         2: "INCOMING_SPIKE",
         3: "PROCESS_FIXED_SYNAPSES",
-        4: "PROCESS_PLASTIC_SYNAPSES"}
+        4: "PROCESS_PLASTIC_SYNAPSES",
+        5: "NEURON_UPDATE"}
 
     def __init__(
             self, resources_required, label, constraints, app_vertex,
@@ -173,6 +176,8 @@ class PopulationMachineVertex(
             SpikeProcessingProvenance.N_ITEMS + MainProvenance.N_ITEMS,
             self._PROFILE_TAG_LABELS, self.__get_binary_file_name(app_vertex))
         self.__key = None
+        self.__rate_key = None
+        self.__state_key = None
         self.__synaptic_matrices = self._create_synaptic_matrices()
         self.__change_requires_neuron_parameters_reload = False
         self.__slice_index = slice_index
@@ -195,6 +200,24 @@ class PopulationMachineVertex(
     def _set_key(self, key):
         self.__key = key
 
+    @property
+    @overrides(PopulationMachineNeurons._rate_key)
+    def _rate_key(self):
+        return self.__rate_key
+
+    @overrides(PopulationMachineNeurons._set_rate_key)
+    def _set_rate_key(self, rate_key):
+        self.__rate_key = rate_key
+
+    @property
+    @overrides(PopulationMachineNeurons._state_key)
+    def _state_key(self):
+        return self.__state_key
+
+    @overrides(PopulationMachineNeurons._set_state_key)
+    def _set_state_key(self, state_key):
+        self.__state_key = state_key
+
     @property
     @overrides(PopulationMachineNeurons._neuron_regions)
     def _neuron_regions(self):
@@ -60,6 +60,8 @@ class PopulationNeuronsMachineVertex(
     __slots__ = [
         "__change_requires_neuron_parameters_reload",
         "__key",
+        "__rate_key",
+        "__state_key",
         "__sdram_partition",
         "__ring_buffer_shifts",
         "__weight_scales",
@@ -89,7 +91,8 @@ class PopulationNeuronsMachineVertex(
     )
 
     _PROFILE_TAG_LABELS = {
-        0: "TIMER_NEURONS"}
+        0: "TIMER_NEURONS",
+        5: "NEURON_UPDATE"}
 
     def __init__(
             self, resources_required, label, constraints, app_vertex,
@@ -117,6 +120,8 @@ class PopulationNeuronsMachineVertex(
             NeuronProvenance.N_ITEMS + NeuronMainProvenance.N_ITEMS,
             self._PROFILE_TAG_LABELS, self.__get_binary_file_name(app_vertex))
         self.__key = None
+        self.__rate_key = None
+        self.__state_key = None
         self.__change_requires_neuron_parameters_reload = False
         self.__sdram_partition = None
         self.__slice_index = slice_index
@@ -137,6 +142,24 @@ class PopulationNeuronsMachineVertex(
     def _set_key(self, key):
         self.__key = key
 
+    @property
+    @overrides(PopulationMachineNeurons._rate_key)
+    def _rate_key(self):
+        return self.__rate_key
+
+    @overrides(PopulationMachineNeurons._set_rate_key)
+    def _set_rate_key(self, rate_key):
+        self.__rate_key = rate_key
+
+    @property
+    @overrides(PopulationMachineNeurons._state_key)
+    def _state_key(self):
+        return self.__state_key
+
+    @overrides(PopulationMachineNeurons._set_state_key)
+    def _set_state_key(self, state_key):
+        self.__state_key = state_key
+
     @property
     @overrides(PopulationMachineNeurons._neuron_regions)
     def _neuron_regions(self):
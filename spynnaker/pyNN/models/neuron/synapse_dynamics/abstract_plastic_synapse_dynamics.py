@@ -36,19 +36,17 @@ class AbstractPlasticSynapseDynamics(
     @abstractmethod
     def get_plastic_synaptic_data(
             self, connections, connection_row_indices, n_rows,
-            post_vertex_slice, n_synapse_types, max_n_synapses):
-        """ Get the fixed-plastic data, and plastic-plastic data for each row,\
-            and lengths for the fixed_plastic and plastic-plastic parts of\
-            each row.
-
-        Data is returned as an array made up of an array of 32-bit words for\
-        each row, for each of the fixed-plastic and plastic-plastic data\
-        regions.  The row into which connection should go is given by\
-        `connection_row_indices`, and the total number of rows is given by\
-        `n_rows`.
+            post_vertex_slice, n_synapse_types, max_n_synapses, row_data):
+        """ Write the fixed-plastic data and plastic-plastic data, and the\
+            lengths of the fixed-plastic and plastic-plastic parts, into the\
+            rows of a synaptic matrix.
 
-        Lengths are returned as an array made up of an integer for each row,\
-        for each of the fixed-plastic and plastic-plastic regions.
+        The row into which connection should go is given by\
+        `connection_row_indices`, and the total number of rows is given by\
+        `n_rows`.  Each row of `row_data` starts with the length of the\
+        plastic-plastic region, followed by that region, then the length of\
+        the (empty) fixed-fixed region, the length of the fixed-plastic\
+        region and finally the fixed-plastic region.
 
         :param ~numpy.ndarray connections: The connections to get data for
         :param ~numpy.ndarray connection_row_indices:
@@ -58,10 +56,8 @@ class AbstractPlasticSynapseDynamics(
             The slice of the post vertex to get the connections for
         :param int n_synapse_types: The number of synapse types
         :param int max_n_synapses: The maximum number of synapses to generate
-        :return: (fp_data, pp_data, fp_size, pp_size)
-        :rtype:
-            tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray,
-            ~numpy.ndarray)
+        :param ~numpy.ndarray row_data:
+            The zeroed 2D array of 32-bit words to write the rows into
         """
 
     @abstractmethod
@@ -97,9 +93,13 @@ class AbstractPlasticSynapseDynamics(
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :param int n_synapse_types:
         :param ~numpy.ndarray pp_size: 1D
-        :param ~numpy.ndarray pp_data: 2D
+        :param ~numpy.ndarray pp_data:
+            2D, with a row of words for each row of the matrix; only as many
+            words as indicated by `pp_size` are valid
         :param ~numpy.ndarray fp_size: 1D
-        :param ~numpy.ndarray fp_data: 2D
+        :param ~numpy.ndarray fp_data:
+            2D, with a row of words for each row of the matrix; only as many
+            words as indicated by `fp_size` are valid
         :return:
             array with columns ``source``, ``target``, ``weight``, ``delay``
         :rtype: ~numpy.ndarray
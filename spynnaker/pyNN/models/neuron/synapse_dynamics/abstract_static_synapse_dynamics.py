@@ -36,17 +36,15 @@ class AbstractStaticSynapseDynamics(
     @abstractmethod
     def get_static_synaptic_data(
             self, connections, connection_row_indices, n_rows,
-            post_vertex_slice, n_synapse_types, max_n_synapses):
-        """ Get the fixed-fixed data for each row, and lengths for the\
-            fixed-fixed parts of each row.
+            post_vertex_slice, n_synapse_types, max_n_synapses, row_data):
+        """ Write the fixed-fixed data and the length of the fixed-fixed\
+            part of each row into the rows of a synaptic matrix.
 
-        Data is returned as an array made up of an array of 32-bit words for\
-        each row for the fixed-fixed region. The row into which connection\
-        should go is given by `connection_row_indices`, and the total number\
-        of rows is given by `n_rows`.
-
-        Lengths are returned as an array made up of an integer for each row,\
-        for the fixed-fixed region.
+        The row into which connection should go is given by\
+        `connection_row_indices`, and the total number of rows is given by\
+        `n_rows`.  Each row of `row_data` starts with three header words;\
+        the second is the length of the fixed-fixed region, which follows\
+        the header.
 
         :param ~numpy.ndarray connections: The connections to get data for
         :param ~numpy.ndarray connection_row_indices:
@@ -56,8 +54,8 @@ class AbstractStaticSynapseDynamics(
             The slice of the post vertex to generate for
         :param int n_synapse_types: The number of synapse types
         :param int max_n_synapses: The maximum number of synapses to generate
-        :return: (ff_data, ff_size)
-        :rtype: tuple(list(~numpy.ndarray), ~numpy.ndarray)
+        :param ~numpy.ndarray row_data:
+            The zeroed 2D array of 32-bit words to write the rows into
         """
 
     @abstractmethod
@@ -84,6 +82,8 @@ class AbstractStaticSynapseDynamics(
 
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
         :param int n_synapse_types:
-        :param ~numpy.ndarray ff_size:
-        :param list(~numpy.ndarray) ff_data:
+        :param ~numpy.ndarray ff_size: 1D
+        :param ~numpy.ndarray ff_data:
+            2D, with a row of words for each row of the matrix; only as many
+            words as indicated by `ff_size` are valid
         """
@@ -13,7 +13,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import math
 import numpy
 from spinn_utilities.abstract_base import (
     AbstractBase, abstractmethod, abstractproperty)
@@ -188,44 +187,38 @@ class AbstractSynapseDynamics(object, metaclass=AbstractBase):
         # pylint: disable=too-many-arguments
         return connector.get_weight_variance(weights, synapse_info)
 
-    def convert_per_connection_data_to_rows(
-            self, connection_row_indices, n_rows, data, max_n_synapses):
-        """ Converts per-connection data generated from connections into\
-            row-based data to be returned from get_synaptic_data
+    def get_row_positions(
+            self, connection_row_indices, n_rows, max_n_synapses):
+        """ Work out where each connection goes in the rows, keeping the\
+            connections of each row in the order given and dropping any\
+            beyond the maximum number in a row.
 
         :param ~numpy.ndarray connection_row_indices:
-            The index of the row that each item should go into
+            The index of the row that each connection should go into
         :param int n_rows:
             The number of rows
-        :param ~numpy.ndarray data:
-            The non-row-based data
         :param int max_n_synapses:
             The maximum number of synapses to generate in each row
-        :rtype: list(~numpy.ndarray)
-        """
-        return [
-            data[connection_row_indices == i][:max_n_synapses].reshape(-1)
-            for i in range(n_rows)]
-
-    def get_n_items(self, rows, item_size):
-        """ Get the number of items in each row as 4-byte values, given the\
-            item size
-
-        :param ~numpy.ndarray rows:
-        :param int item_size:
-        :rtype: ~numpy.ndarray
-        """
-        return numpy.array([
-            int(math.ceil(float(row.size) / float(item_size)))
-            for row in rows], dtype="uint32").reshape((-1, 1))
-
-    def get_words(self, rows):
-        """ Convert the row data to words
-
-        :param ~numpy.ndarray rows:
-        :rtype: ~numpy.ndarray
-        """
-        words = [numpy.pad(
-            row, (0, (4 - (row.size % 4)) & 0x3), mode="constant",
-            constant_values=0).view("uint32") for row in rows]
-        return words
+        :return: (``indices``, ``rows``, ``positions``, ``n_synapses``)
+            where ``indices`` are the indices of the connections to include,
+            ``rows`` and ``positions`` are the row and position in the row
+            of each of these, and ``n_synapses`` is the number of synapses
+            in each row
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray,
+            ~numpy.ndarray)
+        """
+        rows = connection_row_indices
+        if numpy.any(rows[1:] < rows[:-1]):
+            indices = numpy.argsort(rows, kind="stable")
+            rows = rows[indices]
+        else:
+            # Connections are mostly made in order of source, in which case
+            # they are already in row order and need not be sorted
+            indices = numpy.arange(len(rows))
+        n_per_row = numpy.bincount(rows, minlength=n_rows)
+        row_starts = numpy.cumsum(n_per_row) - n_per_row
+        positions = numpy.arange(len(rows)) - row_starts[rows]
+        included = positions < max_n_synapses
+        return (
+            indices[included], rows[included], positions[included],
+            numpy.minimum(n_per_row, max_n_synapses).astype("uint32"))
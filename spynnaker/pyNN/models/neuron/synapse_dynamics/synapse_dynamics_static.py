@@ -24,7 +24,9 @@ from .abstract_generate_on_machine import (
     AbstractGenerateOnMachine, MatrixGeneratorID)
 from spynnaker.pyNN.exceptions import InvalidParameterType
 from spynnaker.pyNN.utilities.utility_calls import get_n_bits
-from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+
+# The number of header words in each row
+_N_HEADER_WORDS = 3
 
 
 class SynapseDynamicsStatic(
@@ -97,49 +99,28 @@ class SynapseDynamicsStatic(
     @overrides(AbstractStaticSynapseDynamics.get_static_synaptic_data)
     def get_static_synaptic_data(
             self, connections, connection_row_indices, n_rows,
-            post_vertex_slice, n_synapse_types, max_n_synapses):
+            post_vertex_slice, n_synapse_types, max_n_synapses, row_data):
         # pylint: disable=too-many-arguments
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
         n_synapse_type_bits = get_n_bits(n_synapse_types)
 
         fixed_fixed = (
-            ((numpy.rint(numpy.abs(connections["weight"])).astype("uint32") &
-              0xFFFF) << 16) |
+            (numpy.minimum(numpy.rint(numpy.abs(connections["weight"])),
+                           0xFFFF).astype("uint32") << 16) |
             (connections["delay"].astype("uint32") <<
              (n_neuron_id_bits + n_synapse_type_bits)) |
             (connections["synapse_type"].astype(
                 "uint32") << n_neuron_id_bits) |
             ((connections["target"] - post_vertex_slice.lo_atom) &
              neuron_id_mask))
-        fixed_fixed_rows = self.convert_per_connection_data_to_rows(
-            connection_row_indices, n_rows,
-            fixed_fixed.view(dtype="uint8").reshape((-1, BYTES_PER_WORD)),
-            max_n_synapses)
-        ff_size = self.get_n_items(fixed_fixed_rows, BYTES_PER_WORD)
-        if self.__pad_to_length is not None:
-            # Pad the data
-            fixed_fixed_rows = self._pad_row(fixed_fixed_rows, BYTES_PER_WORD)
-        ff_data = [fixed_row.view("uint32") for fixed_row in fixed_fixed_rows]
-
-        return ff_data, ff_size
-
-    def _pad_row(self, rows, no_bytes_per_connection):
-        """
-        :param list(~numpy.ndarray) rows:
-        :param int no_bytes_per_connection:
-        :rtype: list(~numpy.ndarray)
-        """
-        padded_rows = []
-        for row in rows:  # Row elements are (individual) bytes
-            padded_rows.append(
-                numpy.concatenate((
-                    row, numpy.zeros(numpy.clip(
-                        no_bytes_per_connection * self.__pad_to_length -
-                        row.size, 0, None)).astype(
-                            dtype="uint8"))).view(dtype="uint8"))
+        indices, rows, positions, ff_size = self.get_row_positions(
+            connection_row_indices, n_rows, max_n_synapses)
 
-        return padded_rows
+        # The size is the second header word and the data follows the header;
+        # any padding is already there as the rows start as zeros
+        row_data[:, 1] = ff_size
+        row_data[rows, _N_HEADER_WORDS + positions] = fixed_fixed[indices]
 
     @overrides(AbstractStaticSynapseDynamics.get_n_static_words_per_row)
     def get_n_static_words_per_row(self, ff_size):
@@ -161,10 +142,12 @@ class SynapseDynamicsStatic(
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
 
-        data = numpy.concatenate(ff_data)
+        # Only the words up to the size of each row are synapses
+        valid = numpy.arange(ff_data.shape[1]) < ff_size.reshape(-1, 1)
+        data = ff_data[valid]
         connections = numpy.zeros(data.size, dtype=self.NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, ff_size[i]) for i in range(len(ff_size))])
+        connections["source"] = numpy.repeat(
+            numpy.arange(len(ff_size)), ff_size)
         connections["target"] = (
             (data & neuron_id_mask) + post_vertex_slice.lo_atom)
         connections["weight"] = (data >> 16) & 0xFFFF
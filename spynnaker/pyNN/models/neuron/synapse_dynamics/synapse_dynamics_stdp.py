@@ -35,6 +35,9 @@ from .abstract_generate_on_machine import (
 # How large are the time-stamps stored with each event
 TIME_STAMP_BYTES = BYTES_PER_WORD
 
+# The number of half-words in a word
+_SHORTS_PER_WORD = BYTES_PER_WORD // BYTES_PER_SHORT
+
 
 class SynapseDynamicsSTDP(
         AbstractPlasticSynapseDynamics, AbstractSettable,
@@ -318,7 +321,7 @@ class SynapseDynamicsSTDP(
     @overrides(AbstractPlasticSynapseDynamics.get_plastic_synaptic_data)
     def get_plastic_synaptic_data(
             self, connections, connection_row_indices, n_rows,
-            post_vertex_slice, n_synapse_types, max_n_synapses):
+            post_vertex_slice, n_synapse_types, max_n_synapses, row_data):
         # pylint: disable=too-many-arguments
         n_synapse_type_bits = get_n_bits(n_synapse_types)
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
@@ -332,66 +335,34 @@ class SynapseDynamicsSTDP(
              << n_neuron_id_bits) |
             ((connections["target"].astype("uint16") -
               post_vertex_slice.lo_atom) & neuron_id_mask))
-        fixed_plastic_rows = self.convert_per_connection_data_to_rows(
-            connection_row_indices, n_rows,
-            fixed_plastic.view(dtype="uint8").reshape((-1, 2)),
-            max_n_synapses)
-        fp_size = self.get_n_items(fixed_plastic_rows, BYTES_PER_SHORT)
-        if self.__pad_to_length is not None:
-            # Pad the data
-            fixed_plastic_rows = self._pad_row(
-                fixed_plastic_rows, BYTES_PER_SHORT)
-        fp_data = self.get_words(fixed_plastic_rows)
+        indices, rows, positions, fp_size = self.get_row_positions(
+            connection_row_indices, n_rows, max_n_synapses)
 
-        # Get the plastic data by inserting the weight into the half-word
-        # specified by the synapse structure
+        # The plastic region is the header followed by the plastic
+        # half-words of each connection, padded if requested
         synapse_structure = self.__timing_dependence.synaptic_structure
         n_half_words = synapse_structure.get_n_half_words_per_connection()
         half_word = synapse_structure.get_weight_half_word()
-        plastic_plastic = numpy.zeros(
-            len(connections) * n_half_words, dtype="uint16")
-        plastic_plastic[half_word::n_half_words] = \
-            numpy.rint(numpy.abs(connections["weight"])).astype("uint16")
-
-        # Convert the plastic data into groups of bytes per connection and
-        # then into rows
-        plastic_plastic = plastic_plastic.view(dtype="uint8").reshape(
-            (-1, n_half_words * BYTES_PER_SHORT))
-        plastic_plastic_row_data = self.convert_per_connection_data_to_rows(
-            connection_row_indices, n_rows, plastic_plastic, max_n_synapses)
-
-        # pp_size = fp_size in words => fp_size * no_bytes / 4 (bytes)
+        n_padded = fp_size
         if self.__pad_to_length is not None:
-            # Pad the data
-            plastic_plastic_row_data = self._pad_row(
-                plastic_plastic_row_data, n_half_words * BYTES_PER_SHORT)
-        plastic_headers = numpy.zeros(
-            (n_rows, self._n_header_bytes), dtype="uint8")
-        plastic_plastic_rows = [
-            numpy.concatenate((
-                plastic_headers[i], plastic_plastic_row_data[i]))
-            for i in range(n_rows)]
-        pp_size = self.get_n_items(plastic_plastic_rows, BYTES_PER_WORD)
-        pp_data = self.get_words(plastic_plastic_rows)
-
-        return fp_data, pp_data, fp_size, pp_size
-
-    def _pad_row(self, rows, no_bytes_per_connection):
-        """
-        :param list(~numpy.ndarray) rows:
-        :param int no_bytes_per_connection:
-        :rtype: list(~numpy.ndarray)
-        """
-        # Row elements are (individual) bytes
-        return [
-            numpy.concatenate((
-                row, numpy.zeros(
-                    numpy.clip(
-                        (no_bytes_per_connection * self.__pad_to_length -
-                         row.size),
-                        0, None)).astype(dtype="uint8"))
-                ).view(dtype="uint8")
-            for row in rows]
+            n_padded = numpy.maximum(fp_size, self.__pad_to_length)
+        pp_size = (
+            self._n_header_bytes + n_padded * n_half_words * BYTES_PER_SHORT +
+            (BYTES_PER_WORD - 1)) // BYTES_PER_WORD
+
+        # Write the data as half-words; the plastic data starts after the
+        # plastic size and header, the fixed-plastic size is two words after
+        # the plastic data and the fixed-plastic data follows it
+        half_words = row_data.view("uint16")
+        pp_start = (
+            (1 + self._n_header_bytes // BYTES_PER_WORD) * _SHORTS_PER_WORD)
+        row_data[:, 0] = pp_size
+        half_words[rows, pp_start + positions * n_half_words + half_word] = \
+            numpy.minimum(numpy.rint(numpy.abs(
+                connections["weight"][indices])), 0xFFFF).astype("uint16")
+        row_data[numpy.arange(n_rows), pp_size + 2] = fp_size
+        fp_start = (pp_size[rows] + 3) * _SHORTS_PER_WORD
+        half_words[rows, fp_start + positions] = fixed_plastic[indices]
 
     @overrides(
         AbstractPlasticSynapseDynamics.get_n_plastic_plastic_words_per_row)
@@ -416,29 +387,31 @@ class SynapseDynamicsSTDP(
             self, post_vertex_slice, n_synapse_types, pp_size, pp_data,
             fp_size, fp_data):
         # pylint: disable=too-many-arguments
-        n_rows = len(fp_size)
-
         n_synapse_type_bits = get_n_bits(n_synapse_types)
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
+        fp_size = fp_size.reshape(-1, 1)
+
+        # Each fixed-plastic synapse is a half-word
+        fp_half_words = fp_data.view("uint16")
+        data_fixed = fp_half_words[
+            numpy.arange(fp_half_words.shape[1]) < fp_size]
 
-        data_fixed = numpy.concatenate([
-            fp_data[i].view(dtype="uint16")[0:fp_size[i]]
-            for i in range(n_rows)])
-        pp_without_headers = [
-            row.view(dtype="uint8")[self._n_header_bytes:] for row in pp_data]
+        # The weight is one of the half-words of each plastic synapse, which
+        # follow the header
         synapse_structure = self.__timing_dependence.synaptic_structure
         n_half_words = synapse_structure.get_n_half_words_per_connection()
         half_word = synapse_structure.get_weight_half_word()
-        pp_half_words = numpy.concatenate([
-            pp[:size * n_half_words * BYTES_PER_SHORT].view("uint16")[
-                half_word::n_half_words]
-            for pp, size in zip(pp_without_headers, fp_size)])
+        pp_weights = pp_data.view("uint16")[
+            :, self._n_header_bytes // BYTES_PER_SHORT + half_word::
+            n_half_words]
+        pp_half_words = pp_weights[
+            numpy.arange(pp_weights.shape[1]) < fp_size]
 
         connections = numpy.zeros(
             data_fixed.size, dtype=self.NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, fp_size[i]) for i in range(len(fp_size))])
+        connections["source"] = numpy.repeat(
+            numpy.arange(len(fp_size)), fp_size.reshape(-1))
         connections["target"] = (
             (data_fixed & neuron_id_mask) + post_vertex_slice.lo_atom)
         connections["weight"] = pp_half_words
@@ -18,7 +18,6 @@ import numpy
 from spinn_utilities.abstract_base import (
     AbstractBase, abstractmethod, abstractproperty)
 from spinn_utilities.overrides import overrides
-from data_specification.enums.data_type import DataType
 from spinn_front_end_common.utilities.constants import (
     MICRO_TO_MILLISECOND_CONVERSION, MICRO_TO_SECOND_CONVERSION,
     BYTES_PER_WORD, BYTES_PER_SHORT)
@@ -204,14 +203,11 @@ class SynapseDynamicsStructuralCommon(
         :param list(tuple(ProjectionApplicationEdge,SynapseInformation)) \
                 structural_projections:
             Projections that are structural
-        :param machine_edges_by_app:
-            map of app edge to associated machine edges
-        :type machine_edges_by_app:
-            dict(~pacman.model.graphs.application.ApplicationEdge,
-            list(~pacman.model.graphs.machine.MachineEdge))
         :param RoutingInfo routing_info:
         :param dict(AbstractSynapseType,float) weight_scales:
         :param SynapticMatrices synaptic_matrices:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The slice of the target vertex to generate for
         :rtype: dict(tuple(AbstractPopulationVertex,SynapseInformation),int)
         """
         spec.comment("Writing pre-population info")
@@ -226,47 +222,49 @@ class SynapseDynamicsStructuralCommon(
             index += 1
             dynamics = synapse_info.synapse_dynamics
 
-            machine_edges = list()
-            for machine_edge in app_edge.machine_edges:
-                if machine_edge.post_vertex.vertex_slice == post_vertex_slice:
-                    machine_edges.append(machine_edge)
+            machine_edges = app_edge.get_machine_edges_for_post_slice(
+                post_vertex_slice)
 
-            # Number of machine edges
-            spec.write_value(len(machine_edges), data_type=DataType.UINT16)
-            # Controls - currently just if this is a self connection or not
-            self_connected = app_vertex == app_edge.pre_vertex
-            spec.write_value(int(self_connected), data_type=DataType.UINT16)
             # Delay
             delay_scale = (
                     MICRO_TO_MILLISECOND_CONVERSION /
                     machine_time_step())
             if isinstance(dynamics.initial_delay, collections.Iterable):
-                spec.write_value(int(dynamics.initial_delay[0] * delay_scale),
-                                 data_type=DataType.UINT16)
-                spec.write_value(int(dynamics.initial_delay[1] * delay_scale),
-                                 data_type=DataType.UINT16)
+                delay_lo = int(dynamics.initial_delay[0] * delay_scale)
+                delay_hi = int(dynamics.initial_delay[1] * delay_scale)
             else:
-                scaled_delay = dynamics.initial_delay * delay_scale
-                spec.write_value(scaled_delay, data_type=DataType.UINT16)
-                spec.write_value(scaled_delay, data_type=DataType.UINT16)
-
+                delay_lo = delay_hi = int(
+                    dynamics.initial_delay * delay_scale)
+
+            # The whole block is written at once; the header has four 16-bit
+            # fields packed into two words, followed by three words, followed
+            # by a fixed number of words for each machine edge
+            block = numpy.empty(
+                self._PRE_POP_INFO_BASE_SIZE // BYTES_PER_WORD +
+                (self._KEY_ATOM_INFO_SIZE // BYTES_PER_WORD) *
+                len(machine_edges), dtype="uint32")
+            # Number of machine edges, and controls - currently just if this
+            # is a self connection or not
+            self_connected = app_vertex == app_edge.pre_vertex
+            block[0] = len(machine_edges) | (int(self_connected) << 16)
+            block[1] = delay_lo | (delay_hi << 16)
             # Weight
-            spec.write_value(round(dynamics.initial_weight *
-                                   weight_scales[synapse_info.synapse_type]))
+            block[2] = round(dynamics.initial_weight *
+                             weight_scales[synapse_info.synapse_type])
             # Connection type
-            spec.write_value(synapse_info.synapse_type)
+            block[3] = synapse_info.synapse_type
             # Total number of atoms in pre-vertex
-            spec.write_value(app_edge.pre_vertex.n_atoms)
+            block[4] = app_edge.pre_vertex.n_atoms
             # Machine edge information
-            for machine_edge in machine_edges:
+            key_atom_info = block[5:].reshape(-1, 5)
+            for i, machine_edge in enumerate(machine_edges):
                 r_info = routing_info.get_routing_info_for_edge(machine_edge)
                 vertex_slice = machine_edge.pre_vertex.vertex_slice
-                spec.write_value(r_info.first_key)
-                spec.write_value(r_info.first_mask)
-                spec.write_value(vertex_slice.n_atoms)
-                spec.write_value(vertex_slice.lo_atom)
-                spec.write_value(synaptic_matrices.get_index(
-                    app_edge, synapse_info, machine_edge))
+                key_atom_info[i] = (
+                    r_info.first_key, r_info.first_mask, vertex_slice.n_atoms,
+                    vertex_slice.lo_atom, synaptic_matrices.get_index(
+                        app_edge, synapse_info, machine_edge))
+            spec.write_array(block)
         return pop_index
 
     def __write_post_to_pre_table(
@@ -382,52 +382,21 @@ def _get_row_data(
         The synapse dynamics of the synapses
     :param int max_row_n_synapses: The maximum number of synapses in a row
     :param int max_row_n_words: The maximum number of words in a row
-    :rtype: tuple(int, ~numpy.ndarray)
+    :return: The rows, each of the same length, one after the other
+    :rtype: ~numpy.ndarray
     """
-    # pylint: disable=too-many-arguments, too-many-locals
-    row_ids = range(n_rows)
-    ff_data, ff_size = None, None
-    fp_data, pp_data, fp_size, pp_size = None, None, None, None
+    # pylint: disable=too-many-arguments
+    row_data = numpy.zeros(
+        (n_rows, _N_HEADER_WORDS + max_row_n_words), dtype="uint32")
     if isinstance(synapse_dynamics, AbstractStaticSynapseDynamics):
-
-        # Get the static data
-        ff_data, ff_size = synapse_dynamics.get_static_synaptic_data(
+        synapse_dynamics.get_static_synaptic_data(
             connections, row_indices, n_rows, post_vertex_slice,
-            n_synapse_types, max_row_n_synapses)
-
-        # Blank the plastic data
-        fp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-        pp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-        fp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
-        pp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
+            n_synapse_types, max_row_n_synapses, row_data)
     else:
-
-        # Blank the static data
-        ff_data = [numpy.zeros(0, dtype="uint32") for _ in row_ids]
-        ff_size = [numpy.zeros(1, dtype="uint32") for _ in row_ids]
-
-        # Get the plastic data
-        fp_data, pp_data, fp_size, pp_size = \
-            synapse_dynamics.get_plastic_synaptic_data(
-                connections, row_indices, n_rows, post_vertex_slice,
-                n_synapse_types, max_row_n_synapses)
-
-    # Add some padding
-    row_lengths = [
-        pp_data[i].size + fp_data[i].size + ff_data[i].size
-        for i in row_ids]
-    padding = [
-        numpy.zeros(max_row_n_words - row_length, dtype="uint32")
-        for row_length in row_lengths]
-
-    # Join the bits into rows
-    items_to_join = [
-        pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding]
-    rows = [numpy.concatenate(items) for items in zip(*items_to_join)]
-    row_data = numpy.concatenate(rows)
-
-    # Return the data
-    return row_data
+        synapse_dynamics.get_plastic_synaptic_data(
+            connections, row_indices, n_rows, post_vertex_slice,
+            n_synapse_types, max_row_n_synapses, row_data)
+    return row_data.reshape(-1)
 
 
 def convert_to_connections(
@@ -544,17 +513,15 @@ def _parse_static_data(row_data, dynamics):
     :param AbstractStaticSynapseDynamics dynamics:
         The synapse dynamics that can decode the rows
     :return: A tuple of the recorded length of each row and the row data
-        organised into rows
-    :rtype: tuple(~numpy.ndarray, list(~numpy.ndarray))
+        organised into a 2D array of rows; the rows may be longer than the
+        recorded lengths
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
     """
-    n_rows = row_data.shape[0]
     ff_size = row_data[:, 1]
     ff_words = dynamics.get_n_static_words_per_row(ff_size)
-    ff_start = _N_HEADER_WORDS
-    ff_end = ff_start + ff_words
+    max_ff_words = int(numpy.max(ff_words)) if len(ff_words) else 0
     return (
-        ff_size,
-        [row_data[row, ff_start:ff_end[row]] for row in range(n_rows)])
+        ff_size, row_data[:, _N_HEADER_WORDS:_N_HEADER_WORDS + max_ff_words])
 
 
 def _read_static_data(
@@ -601,11 +568,12 @@ def _parse_plastic_data(row_data, dynamics):
     :param AbstractPlasticSynapseDynamics dynamics:
         The dynamics that generated the data
     :return: A tuple of the recorded length of the plastic-plastic data in
-        each row; the plastic-plastic data organised into rows; the
-        recorded length of the static-plastic data in each row; and the
-        static-plastic data organised into rows
-    :rtype: tuple(~numpy.ndarray, list(~numpy.ndarray), ~numpy.ndarray,
-        list(~numpy.ndarray))
+        each row; the plastic-plastic data organised into a 2D array of rows;
+        the recorded length of the static-plastic data in each row; and the
+        static-plastic data organised into a 2D array of rows.  The rows of
+        data may be longer than the recorded lengths.
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray,
+        ~numpy.ndarray)
     """
     n_rows = row_data.shape[0]
     pp_size = row_data[:, 0]
@@ -613,13 +581,17 @@ def _parse_plastic_data(row_data, dynamics):
     fp_size = row_data[numpy.arange(n_rows), pp_words + 2]
     fp_words = dynamics.get_n_fixed_plastic_words_per_row(fp_size)
     fp_start = pp_size + _N_HEADER_WORDS
-    fp_end = fp_start + fp_words
-    row_ids = range(n_rows)
-    return (
-        pp_size,
-        [row_data[row, 1:pp_words[row] + 1] for row in row_ids],
-        fp_size,
-        [row_data[row, fp_start[row]:fp_end[row]] for row in row_ids])
+
+    # The plastic-plastic data starts in the same place in every row, but
+    # the static-plastic data has to be gathered to line it up
+    max_pp_words = int(numpy.max(pp_words)) if n_rows else 0
+    pp_data = numpy.ascontiguousarray(row_data[:, 1:max_pp_words + 1])
+    max_fp_words = int(numpy.max(fp_words)) if n_rows else 0
+    fp_columns = numpy.minimum(
+        fp_start.reshape(-1, 1) + numpy.arange(max_fp_words),
+        row_data.shape[1] - 1)
+    fp_data = row_data[numpy.arange(n_rows).reshape(-1, 1), fp_columns]
+    return pp_size, pp_data, fp_size, fp_data
 
 
 def _read_plastic_data(
@@ -696,23 +668,17 @@ def __convert_delayed_data(
     """
     # Work out the delay stage of each row; rows are the all the rows
     # from the first delay stage, then all from the second stage and so on
-    synapse_ids = range(len(n_synapses))
-    row_stage = numpy.array([
-        i // pre_vertex_slice.n_atoms
-        for i in synapse_ids], dtype="uint32")
+    row_stage = (
+        numpy.arange(len(n_synapses)) //
+        pre_vertex_slice.n_atoms).astype("uint32")
     # Work out the delay for each stage
     row_min_delay = (row_stage + 1) * post_vertex_max_delay_ticks
     # Repeat the delay for all connections in the same row
-    connection_min_delay = numpy.concatenate([
-        numpy.repeat(row_min_delay[i], n_synapses[i])
-        for i in synapse_ids])
+    connection_min_delay = numpy.repeat(row_min_delay, n_synapses)
     # Repeat the "extra" source id for all connections in the same row;
     # this converts the row id back to a source neuron id
-    connection_source_extra = numpy.concatenate([
-        numpy.repeat(
-            row_stage[i] * numpy.uint32(pre_vertex_slice.n_atoms),
-            n_synapses[i])
-        for i in synapse_ids])
+    connection_source_extra = numpy.repeat(
+        row_stage * numpy.uint32(pre_vertex_slice.n_atoms), n_synapses)
     # Do the conversions
     delayed_connections["source"] -= connection_source_extra
     delayed_connections["source"] += pre_vertex_slice.lo_atom
@@ -21,6 +21,8 @@ from spynnaker.pyNN.models.neuron.synapse_dynamics import (
 
 from .generator_data import GeneratorData, SYN_REGION_UNUSED
 from .synapse_io import get_synapses, convert_to_connections
+from .synaptic_matrix_cache import (
+    get_block_key, get_rows_key, read_rows, write_rows)
 
 
 class SynapticMatrix(object):
@@ -153,38 +155,35 @@ class SynapticMatrix(object):
         :return: The data and the delayed data
         :rtype: tuple(~numpy.ndarray or None, ~numpy.ndarray or None)
         """
-
-        # Get the actual connections
-        pre_slices =\
-            self.__app_edge.pre_vertex.splitter.get_out_going_slices()[0]
-        post_slices =\
-            self.__app_edge.post_vertex.splitter.get_in_coming_slices()[0]
         pre_vertex_slice = self.__machine_edge.pre_vertex.vertex_slice
         post_vertex_slice = self.__machine_edge.post_vertex.vertex_slice
-        connections = self.__synapse_info.connector.create_synaptic_block(
-            pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
-            self.__synapse_info.synapse_type, self.__synapse_info)
-
-        # Get the row data; note that we use the availability of the routing
-        # keys to decide if we should actually generate any data; this is
-        # because a single edge might have been filtered
-        (row_data, delayed_row_data, delayed_source_ids,
-         delay_stages) = get_synapses(
-            connections, self.__synapse_info, self.__app_edge.n_delay_stages,
-            self.__n_synapse_types, self.__weight_scales, self.__app_edge,
-            pre_vertex_slice, post_vertex_slice, self.__max_row_info,
-            self.__routing_info is not None,
-            self.__delay_routing_info is not None)
 
-        # Set connections for structural plasticity
-        if isinstance(self.__synapse_info.synapse_dynamics,
-                      AbstractSynapseDynamicsStructural):
-            self.__synapse_info.synapse_dynamics.set_connections(
-                connections, post_vertex_slice, self.__app_edge,
-                self.__synapse_info, self.__machine_edge)
+        # Use rows from an earlier run if they are the same; note that we use
+        # the availability of the routing keys to decide if we should
+        # actually generate any data; this is because a single edge might
+        # have been filtered
+        gen_undelayed = self.__routing_info is not None
+        gen_delayed = self.__delay_routing_info is not None
+        block_key = get_block_key(
+            self.__synapse_info, pre_vertex_slice, post_vertex_slice)
+        rows_key = None
+        rows = None
+        if block_key is not None:
+            rows_key = get_rows_key(
+                block_key, self.__synapse_info, self.__app_edge,
+                self.__n_synapse_types, self.__weight_scales,
+                self.__max_row_info, gen_undelayed, gen_delayed)
+            if rows_key is not None:
+                rows = read_rows(block_key, rows_key)
+        if rows is None:
+            rows = self.__generate_rows(
+                pre_vertex_slice, post_vertex_slice, gen_undelayed,
+                gen_delayed)
+            if rows_key is not None:
+                write_rows(block_key, rows_key, rows)
+        row_data, delayed_row_data, delayed_source_ids, delay_stages = rows
 
         if self.__app_edge.delay_edge is not None:
-            pre_vertex_slice = self.__machine_edge.pre_vertex.vertex_slice
             self.__app_edge.delay_edge.pre_vertex.add_delays(
                 pre_vertex_slice, delayed_source_ids, delay_stages)
         elif delayed_source_ids.size != 0:
@@ -194,6 +193,63 @@ class SynapticMatrix(object):
 
         return row_data, delayed_row_data
 
+    def __generate_rows(
+            self, pre_vertex_slice, post_vertex_slice, gen_undelayed,
+            gen_delayed):
+        """ Generate the rows of the matrix from the connector
+
+        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+            The slice of the pre-vertex
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The slice of the post-vertex
+        :param bool gen_undelayed: Whether to generate undelayed rows
+        :param bool gen_delayed: Whether to generate delayed rows
+        :return: The rows as returned by
+            :py:func:`~spynnaker.pyNN.models.neuron.synapse_io.get_synapses`
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray,
+            ~numpy.ndarray)
+        """
+        # Get the actual connections; connectors that can make their blocks
+        # in any order always do so with the random numbers of the slices, so
+        # the connections don't depend on whether, or by how many threads,
+        # they were made ahead of time
+        connections = self.__synapse_info.pop_precomputed_block(
+            pre_vertex_slice, post_vertex_slice)
+        if connections is None:
+            pre_slices =\
+                self.__app_edge.pre_vertex.splitter.get_out_going_slices()[0]
+            post_slices =\
+                self.__app_edge.post_vertex.splitter.get_in_coming_slices()[0]
+            connector = self.__synapse_info.connector
+            if connector.generates_slices_independently():
+                connections = connector.create_synaptic_block_from_seed(
+                    connector.get_slice_seed(
+                        self.__synapse_info, pre_vertex_slice,
+                        post_vertex_slice),
+                    pre_slices, post_slices, pre_vertex_slice,
+                    post_vertex_slice, self.__synapse_info.synapse_type,
+                    self.__synapse_info)
+            else:
+                connections = connector.create_synaptic_block(
+                    pre_slices, post_slices, pre_vertex_slice,
+                    post_vertex_slice, self.__synapse_info.synapse_type,
+                    self.__synapse_info)
+
+        rows = get_synapses(
+            connections, self.__synapse_info, self.__app_edge.n_delay_stages,
+            self.__n_synapse_types, self.__weight_scales, self.__app_edge,
+            pre_vertex_slice, post_vertex_slice, self.__max_row_info,
+            gen_undelayed, gen_delayed)
+
+        # Set connections for structural plasticity
+        if isinstance(self.__synapse_info.synapse_dynamics,
+                      AbstractSynapseDynamicsStructural):
+            self.__synapse_info.synapse_dynamics.set_connections(
+                connections, post_vertex_slice, self.__app_edge,
+                self.__synapse_info, self.__machine_edge)
+
+        return rows
+
     def write_machine_matrix(
             self, spec, block_addr, single_synapses, single_addr, row_data):
         """ Write a matrix for the incoming machine vertex
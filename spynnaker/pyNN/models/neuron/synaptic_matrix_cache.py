@@ -0,0 +1,281 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" A cache of the synaptic rows generated on the host, kept on disk so that\
+    later runs of the same network (in this or another process) don't have\
+    to generate them again.
+
+Rows are stored by two keys: a block key, which is a digest of everything
+that decides the connections between a pair of slices, and a rows key,
+which adds everything that decides how those connections are written as
+rows.  The connections of a cached block are made with the random numbers
+of their slice pair (see
+:py:meth:`~spynnaker.pyNN.models.neural_projections.connectors.AbstractConnector.get_slice_seed`),
+so a block is only cached if it would be made the same way again; the seed
+is left out of the key of a block that uses no random numbers, so that such
+blocks are found again by other processes.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import zipfile
+import numpy
+from pyNN.random import RandomDistribution
+from spinn_utilities.config_holder import get_config_str
+from spinn_utilities.log import FormatAdapter
+from spinn_front_end_common.utilities.globals_variables import (
+    machine_time_step)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    AbstractSynapseDynamicsStructural)
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# Change this when the format of the rows changes, to stop old rows being
+# used
+_FORMAT_VERSION = 1
+
+# The names of the arrays in a cache file
+_ROW_NAMES = ("row_data", "delayed_row_data", "delayed_source_ids", "stages")
+
+
+class _NotCacheable(Exception):
+    """ Raised when a value can't be made into a digest
+    """
+
+
+def get_cache_directory():
+    """ Get the directory in which rows are cached
+
+    :return: The directory, or None if rows are not cached
+    :rtype: str or None
+    """
+    return get_config_str("Simulation", "synaptic_matrix_cache_directory")
+
+
+def get_block_key(synapse_info, pre_vertex_slice, post_vertex_slice):
+    """ Get the key of the connections between a pair of slices
+
+    :param SynapseInformation synapse_info: The synapse information
+    :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        The slice of the pre-vertex
+    :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        The slice of the post-vertex
+    :return: The key, or None if the connections can't be cached
+    :rtype: str or None
+    """
+    if get_cache_directory() is None:
+        return None
+    connector = synapse_info.connector
+    if not connector.generates_slices_independently():
+        return None
+    parameters = connector.get_cache_parameters()
+    if parameters is None:
+        return None
+
+    # Views and expressions depend on things outside of the projection
+    if synapse_info.prepop_is_view or synapse_info.postpop_is_view:
+        return None
+    if (isinstance(synapse_info.weights, str) or
+            isinstance(synapse_info.delays, str)):
+        return None
+
+    # The seed is only part of the key if random numbers are drawn, as an
+    # unseeded connector gets a different seed in each process
+    seed = None
+    if connector.uses_random_numbers(synapse_info):
+        seed = connector.get_slice_seed(
+            synapse_info, pre_vertex_slice, post_vertex_slice)
+
+    return _get_digest((
+        _FORMAT_VERSION, type(connector).__qualname__, parameters,
+        synapse_info.weights, synapse_info.delays, synapse_info.synapse_type,
+        synapse_info.n_pre_neurons, synapse_info.n_post_neurons,
+        tuple(pre_vertex_slice), tuple(post_vertex_slice),
+        machine_time_step(), seed))
+
+
+def get_rows_key(
+        block_key, synapse_info, app_edge, n_synapse_types, weight_scales,
+        max_row_info, gen_undelayed, gen_delayed):
+    """ Get the key of the rows of a block of connections
+
+    :param str block_key: The key of the block of connections
+    :param SynapseInformation synapse_info: The synapse information
+    :param ProjectionApplicationEdge app_edge: The edge of the connections
+    :param int n_synapse_types: The number of synapse types of the target
+    :param list(float) weight_scales: The scale of the weights by type
+    :param MaxRowInfo max_row_info: The maximum sizes of the rows
+    :param bool gen_undelayed: Whether undelayed rows are generated
+    :param bool gen_delayed: Whether delayed rows are generated
+    :return: The key, or None if the rows can't be cached
+    :rtype: str or None
+    """
+    # Structural plasticity needs the connections as well as the rows
+    dynamics = synapse_info.synapse_dynamics
+    if isinstance(dynamics, AbstractSynapseDynamicsStructural):
+        return None
+    return _get_digest((
+        block_key, dynamics, app_edge.n_delay_stages,
+        app_edge.post_vertex.splitter.max_support_delay(), n_synapse_types,
+        list(weight_scales), max_row_info, gen_undelayed, gen_delayed))
+
+
+def has_block(block_key):
+    """ Determine if there are any cached rows of a block of connections
+
+    :param str block_key: The key of the block of connections
+    :rtype: bool
+    """
+    block_dir = os.path.join(get_cache_directory(), block_key)
+    return os.path.isdir(block_dir) and any(
+        name.endswith(".npz") for name in os.listdir(block_dir))
+
+
+def read_rows(block_key, rows_key):
+    """ Read cached rows
+
+    :param str block_key: The key of the block of connections
+    :param str rows_key: The key of the rows
+    :return: The rows as returned by
+        :py:func:`~spynnaker.pyNN.models.neuron.synapse_io.get_synapses`,
+        or None if they are not in the cache
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray,
+        ~numpy.ndarray) or None
+    """
+    filename = os.path.join(
+        get_cache_directory(), block_key, rows_key + ".npz")
+    if not os.path.isfile(filename):
+        return None
+    try:
+        with numpy.load(filename, allow_pickle=False) as data:
+            return tuple(data[name] for name in _ROW_NAMES)
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        logger.warning("Ignoring unreadable cached rows in {}", filename)
+        return None
+
+
+def write_rows(block_key, rows_key, rows):
+    """ Write rows to the cache
+
+    :param str block_key: The key of the block of connections
+    :param str rows_key: The key of the rows
+    :param tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray, \
+            ~numpy.ndarray) rows:
+        The rows as returned by
+        :py:func:`~spynnaker.pyNN.models.neuron.synapse_io.get_synapses`
+    """
+    block_dir = os.path.join(get_cache_directory(), block_key)
+    try:
+        os.makedirs(block_dir, exist_ok=True)
+
+        # Write to a temporary file first so that other processes never see
+        # a partly written file
+        handle, temp_name = tempfile.mkstemp(suffix=".tmp", dir=block_dir)
+        try:
+            with os.fdopen(handle, "wb") as f:
+                numpy.savez(f, **dict(zip(_ROW_NAMES, rows)))
+            os.replace(temp_name, os.path.join(block_dir, rows_key + ".npz"))
+        except BaseException:
+            os.remove(temp_name)
+            raise
+    except OSError as e:
+        logger.warning("Unable to cache synaptic rows in {}: {}", block_dir, e)
+
+
+def _get_digest(value):
+    """ Get a digest of a value made of simple values, arrays, random\
+        distributions and objects made of these
+
+    :param value: The value to make a digest of
+    :return: The digest, or None if the value can't be made into a digest
+    :rtype: str or None
+    """
+    digest = hashlib.sha256()
+    try:
+        _add_to_digest(digest, value, set())
+    except _NotCacheable:
+        return None
+    return digest.hexdigest()
+
+
+def _add_to_digest(digest, value, in_progress):
+    """ Add a value to a digest
+
+    :param ~hashlib.sha256 digest: The digest to add to
+    :param value: The value to add
+    :param set(int) in_progress: The ids of the objects being added
+    :raises _NotCacheable: If the value can't be added
+    """
+    if isinstance(value, numpy.generic):
+        value = value.item()
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        digest.update(repr((type(value).__name__, value)).encode())
+    elif isinstance(value, numpy.ndarray):
+        if value.dtype.hasobject:
+            raise _NotCacheable()
+        digest.update(repr((value.dtype.descr, value.shape)).encode())
+        digest.update(numpy.ascontiguousarray(value).data)
+    elif isinstance(value, (list, tuple)):
+        digest.update(repr((type(value).__name__, len(value))).encode())
+        for item in value:
+            _add_to_digest(digest, item, in_progress)
+    elif isinstance(value, dict):
+        digest.update(repr(("dict", len(value))).encode())
+        for key in sorted(value, key=repr):
+            _add_to_digest(digest, key, in_progress)
+            _add_to_digest(digest, value[key], in_progress)
+    elif isinstance(value, RandomDistribution):
+        # The generator is not needed; values are made from the slice seed
+        digest.update(repr(("RandomDistribution", value.name)).encode())
+        _add_to_digest(digest, value.parameters, in_progress)
+    else:
+        _add_object_to_digest(digest, value, in_progress)
+
+
+def _add_object_to_digest(digest, value, in_progress):
+    """ Add the state of an object to a digest
+
+    :param ~hashlib.sha256 digest: The digest to add to
+    :param object value: The object to add
+    :param set(int) in_progress: The ids of the objects being added
+    :raises _NotCacheable: If the object can't be added
+    """
+    if callable(value) or id(value) in in_progress:
+        raise _NotCacheable()
+    state = dict()
+    has_state = hasattr(value, "__dict__")
+    for cls in type(value).__mro__:
+        if "__slots__" not in cls.__dict__:
+            continue
+        has_state = True
+        slots = cls.__dict__["__slots__"]
+        if isinstance(slots, str):
+            slots = (slots, )
+        for name in slots:
+            if name.startswith("__") and not name.endswith("__"):
+                name = "_{}{}".format(cls.__name__.lstrip("_"), name)
+            if hasattr(value, name):
+                state[name] = getattr(value, name)
+    if not has_state:
+        # Objects made in C don't show their state, so can't be compared
+        raise _NotCacheable()
+    state.update(getattr(value, "__dict__", {}))
+    digest.update(repr((
+        type(value).__module__, type(value).__qualname__)).encode())
+    in_progress.add(id(value))
+    _add_to_digest(digest, state, in_progress)
+    in_progress.remove(id(value))
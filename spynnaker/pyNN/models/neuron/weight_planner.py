@@ -0,0 +1,337 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import math
+import os
+from collections import namedtuple
+from spinn_utilities.config_holder import get_config_float
+from spinn_utilities.log import FormatAdapter
+from spinn_front_end_common.utilities.constants import (
+    MICRO_TO_SECOND_CONVERSION)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utilities.globals_variables import (
+    machine_time_step, report_default_directory)
+from spynnaker.pyNN.models.abstract_models import AbstractMaxSpikes
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# The name of the report of the weight plans
+_REPORT_NAME = "weight_plan.rpt"
+
+# The bits of a weight in the synaptic rows; a weight scale leaves the
+# top bit clear so that the ring buffers can be shifted into an s1615
+_WEIGHT_BITS = 16
+
+# The largest ring buffer shift considered
+_MAX_SHIFT = 31
+
+#: The input from one incoming projection to the post-neuron that receives
+#: the most connections from it; weights are as given by the user, and
+#: rates are per time step
+ProjectionInput = namedtuple(
+    "ProjectionInput",
+    ["pre_label", "synapse_type", "n_connections", "spikes_per_step",
+     "max_spikes_per_step", "weight_mean", "weight_square_mean",
+     "weight_maximum"])
+
+#: One choice of ring buffer shift for a synapse type; the saturation
+#: probability is an upper bound on the chance that the input to a neuron
+#: in a time step does not fit, and the weight step is the difference
+#: between weights that can be represented
+WeightOption = namedtuple(
+    "WeightOption",
+    ["shift", "capacity", "saturation_probability", "weight_step",
+     "mean_weight_error"])
+
+#: The ring buffer shift chosen for a synapse type
+SynapseTypePlan = namedtuple(
+    "SynapseTypePlan",
+    ["synapse_type", "expected_input", "worst_case_input", "options",
+     "chosen", "reason"])
+
+#: The ring buffer shifts chosen for a population
+WeightPlan = namedtuple(
+    "WeightPlan", ["label", "inputs", "synapse_type_plans"])
+
+
+class WeightPlanner(object):
+    """ Chooses the ring buffer shift, and so the weight scale, of each\
+        synapse type of a population from the weights, fan-in and rates of\
+        its incoming projections.
+
+    The input to a neuron in a time step is taken as the sum of the weights\
+    of the spikes that arrive, with each source firing as a Poisson process\
+    at its rate.  The worst case has every source firing as often as it\
+    can in a single time step.  For each shift from 0 up to the one that\
+    holds the worst case, the chance that the input does not fit is bounded\
+    by Bennett's inequality from the mean, mean square and maximum of the\
+    weights.  The smallest shift (and so the finest weights) whose bound is\
+    within the saturation probability allowed is chosen.
+    """
+
+    __slots__ = [
+        # The largest chance of saturation allowed in each time step
+        "__saturation_probability"]
+
+    def __init__(self, saturation_probability=None):
+        """
+        :param saturation_probability:
+            The largest chance allowed that the input to a neuron in a time\
+            step saturates the ring buffer, or None to use the value in the\
+            configuration
+        :type saturation_probability: float or None
+        :raises ConfigurationException: If the probability is out of range
+        """
+        if saturation_probability is None:
+            saturation_probability = get_config_float(
+                "Simulation", "weight_plan_saturation_probability")
+        if not 0 <= saturation_probability < 1:
+            raise ConfigurationException(
+                "The saturation probability allowed must be at least 0 and"
+                " less than 1, not {}".format(saturation_probability))
+        self.__saturation_probability = saturation_probability
+
+    def plan(self, app_vertex, incoming_projections):
+        """ Plan the ring buffer shifts of a population
+
+        :param AbstractPopulationVertex app_vertex: The population
+        :param list(~spynnaker.pyNN.models.Projection) incoming_projections:
+            The projections into the population
+        :rtype: WeightPlan
+        :raises ConfigurationException: If a weight is too big for any shift
+        """
+        steps_per_second = MICRO_TO_SECOND_CONVERSION / machine_time_step()
+        inputs = list()
+        weights_signed = False
+        for proj in incoming_projections:
+            synapse_info = proj._synapse_information
+            synapse_dynamics = synapse_info.synapse_dynamics
+            connector = synapse_info.connector
+            if synapse_dynamics.are_weights_signed():
+                weights_signed = True
+
+            # Sources fire at most once a time step unless they say otherwise
+            spikes_per_second = app_vertex.spikes_per_second
+            max_spikes_per_step = max(
+                1.0, spikes_per_second / steps_per_second)
+            pre_vertex = proj._projection_edge.pre_vertex
+            if isinstance(pre_vertex, AbstractMaxSpikes):
+                rate = pre_vertex.max_spikes_per_second()
+                if rate != 0:
+                    spikes_per_second = rate
+                max_spikes_per_step = pre_vertex.max_spikes_per_ts()
+
+            weight_mean = abs(synapse_dynamics.get_weight_mean(
+                connector, synapse_info))
+            weight_variance = synapse_dynamics.get_weight_variance(
+                connector, synapse_info.weights, synapse_info)
+            inputs.append(ProjectionInput(
+                proj._projection_edge.pre_vertex.label,
+                synapse_info.synapse_type,
+                connector.get_n_connections_to_post_vertex_maximum(
+                    synapse_info),
+                spikes_per_second / steps_per_second, max_spikes_per_step,
+                weight_mean, weight_variance + weight_mean ** 2,
+                synapse_dynamics.get_weight_maximum(connector, synapse_info)))
+
+        return self.plan_inputs(
+            app_vertex.label, inputs,
+            app_vertex.neuron_impl.get_n_synapse_types(),
+            app_vertex.neuron_impl.get_global_weight_scale(), weights_signed)
+
+    def plan_inputs(
+            self, label, inputs, n_synapse_types, global_weight_scale,
+            weights_signed):
+        """ Plan the ring buffer shifts of a population from its inputs
+
+        :param str label: The label of the population
+        :param list(ProjectionInput) inputs: The input of each projection
+        :param int n_synapse_types: The number of synapse types
+        :param float global_weight_scale:
+            The scale applied to all weights by the neuron model
+        :param bool weights_signed:
+            Whether the synapses can have negative weights, which takes
+            another bit of the ring buffers
+        :rtype: WeightPlan
+        :raises ConfigurationException: If a weight is too big for any shift
+        """
+        return WeightPlan(label, inputs, [
+            self.__plan_synapse_type(
+                label, synapse_type,
+                [i for i in inputs if i.synapse_type == synapse_type],
+                global_weight_scale, weights_signed)
+            for synapse_type in range(n_synapse_types)])
+
+    def __plan_synapse_type(
+            self, label, synapse_type, inputs, global_weight_scale,
+            weights_signed):
+        """
+        :rtype: SynapseTypePlan
+        :raises ConfigurationException: If a weight is too big for any shift
+        """
+        # Work in the units of the ring buffers, before the weight scale
+        expected_input = global_weight_scale * sum(
+            i.n_connections * i.spikes_per_step * i.weight_mean
+            for i in inputs)
+        square_input = global_weight_scale ** 2 * sum(
+            i.n_connections * i.spikes_per_step * i.weight_square_mean
+            for i in inputs)
+        worst_case_input = global_weight_scale * sum(
+            i.n_connections * i.max_spikes_per_step * i.weight_maximum
+            for i in inputs)
+        biggest_weight = global_weight_scale * max(
+            (i.weight_maximum for i in inputs), default=0.0)
+        n_connections = sum(i.n_connections for i in inputs)
+        mean_weight = 0.0
+        if n_connections:
+            mean_weight = sum(
+                i.n_connections * i.weight_mean
+                for i in inputs) / n_connections
+
+        # The input to a ring buffer with a shift must be less than 2 to the
+        # power of the shift, or one less if it can be negative; try shifts
+        # until the worst case fits
+        options = list()
+        for shift in range(_MAX_SHIFT + 1):
+            capacity = 2.0 ** (shift - 1 if weights_signed else shift)
+            if capacity <= biggest_weight:
+                continue
+            weight_step = 2.0 ** (shift - (_WEIGHT_BITS - 1)) / \
+                global_weight_scale
+            mean_weight_error = 0.0
+            if mean_weight > 0:
+                mean_weight_error = weight_step / 2 / mean_weight
+            saturation_probability = 0.0
+            if worst_case_input >= capacity:
+                saturation_probability = _bennett_bound(
+                    capacity - expected_input, square_input, biggest_weight)
+            options.append(WeightOption(
+                shift, capacity / global_weight_scale,
+                saturation_probability, weight_step, mean_weight_error))
+            if worst_case_input < capacity:
+                break
+        if not options:
+            raise ConfigurationException(
+                "The weight {} of synapse type {} of {} is too big for any"
+                " ring buffer shift; weights must be less than {}".format(
+                    biggest_weight / global_weight_scale, synapse_type, label,
+                    capacity / global_weight_scale))
+
+        if not inputs or worst_case_input == 0:
+            return SynapseTypePlan(
+                synapse_type, expected_input / global_weight_scale,
+                worst_case_input / global_weight_scale, options, options[0],
+                "there is no input")
+        chosen = next((
+            o for o in options
+            if o.saturation_probability <= self.__saturation_probability),
+            options[-1])
+        if chosen.saturation_probability > self.__saturation_probability:
+            reason = (
+                "FAILED: the chance of saturation is still more than {} at"
+                " the largest shift".format(self.__saturation_probability))
+            logger.warning(
+                "The ring buffers of synapse type {} of {} may saturate with"
+                " chance up to {:.3g} per step, more than the {} allowed",
+                synapse_type, label, chosen.saturation_probability,
+                self.__saturation_probability)
+        elif chosen is options[-1] and chosen.saturation_probability == 0:
+            reason = "the worst case input cannot saturate"
+        else:
+            reason = "the chance of saturation is within {}".format(
+                self.__saturation_probability)
+        return SynapseTypePlan(
+            synapse_type, expected_input / global_weight_scale,
+            worst_case_input / global_weight_scale, options, chosen, reason)
+
+
+def _bennett_bound(excess, square_input, biggest_weight):
+    """ Bound the chance that a sum of independent Poisson numbers of\
+        weights is more than its mean by some excess, by Bennett's\
+        inequality
+
+    :param float excess: How much more than the mean the sum is
+    :param float square_input:
+        The expected sum of the squares of the weights of the spikes
+    :param float biggest_weight: The largest weight
+    :rtype: float
+    """
+    if excess <= 0:
+        return 1.0
+    if square_input <= 0:
+        return 0.0
+    u = biggest_weight * excess / square_input
+    return math.exp(-(square_input / biggest_weight ** 2) * (
+        (1 + u) * math.log1p(u) - u))
+
+
+def clear_weight_plan_report():
+    """ Empty the report of weight plans, so that it has only the plans of\
+        the next mapping
+    """
+    file_name = os.path.join(report_default_directory(), _REPORT_NAME)
+    try:
+        with open(file_name, "w"):
+            pass
+    except IOError:
+        logger.exception("Could not write the weight plan report {}",
+                         file_name)
+
+
+def write_weight_plan_report(plan):
+    """ Add the shifts planned for a population, and the others that were\
+        considered, to the report of weight plans
+
+    :param WeightPlan plan: The plan made
+    """
+    file_name = os.path.join(report_default_directory(), _REPORT_NAME)
+    try:
+        with open(file_name, "a") as f:
+            _write_plan(f, plan)
+    except IOError:
+        logger.exception("Could not write the weight plan report {}",
+                         file_name)
+
+
+def _write_plan(f, plan):
+    """
+    :param ~io.TextIOBase f:
+    :param WeightPlan plan:
+    """
+    f.write("Population {}:\n".format(plan.label))
+    for i in plan.inputs:
+        f.write(
+            "    From {} to synapse type {}: {} connections, {} spikes per"
+            " step (at most {}), mean weight {}, largest weight {}\n".format(
+                i.pre_label, i.synapse_type, i.n_connections,
+                i.spikes_per_step, i.max_spikes_per_step, i.weight_mean,
+                i.weight_maximum))
+    for type_plan in plan.synapse_type_plans:
+        f.write(
+            "    Synapse type {} (expected input {}, worst case {}): chose a"
+            " shift of {}: {}\n".format(
+                type_plan.synapse_type, type_plan.expected_input,
+                type_plan.worst_case_input, type_plan.chosen.shift,
+                type_plan.reason))
+        for option in type_plan.options:
+            f.write(
+                "        Shift {}: holds up to {}, saturates with chance at"
+                " most {:.3g} per step, weights in steps of {:.3g} (error of"
+                " up to {:.3%} at the mean weight)\n".format(
+                    option.shift, option.capacity,
+                    option.saturation_probability, option.weight_step,
+                    option.mean_weight_error))
+    f.write("\n")
@@ -0,0 +1,126 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from pacman.model.graphs.application import ApplicationEdge
+from spinn_front_end_common.utilities.globals_variables import get_simulator
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.utilities.constants import MEANFIELD_RATE_PARTITION_ID
+from spynnaker.pyNN.models.populations import Population
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+from spynnaker.pyNN.models.neuron.implementations import (
+    MeanfieldImplStandard)
+from spynnaker.pyNN.models.spike_source import SpikeSourcePoissonVertex
+
+
+class RateProjection(object):
+    """ Drives the rates of a population of Poisson sources from the Ve of\
+        a population of meanfields while the simulation runs.
+
+    Each time step, meanfield *i* sends its Ve, multiplied by the rate\
+    scale, to Poisson source *i* as a multicast packet with payload, in the\
+    same way as a live rate controller does, so that the rates never go\
+    through the host.  Note that the recording space of the Poisson sources\
+    is based on their ``max_rate``, which should be set if they are\
+    recorded.
+    """
+
+    __slots__ = [
+        "__label",
+        "__projection_edge",
+        "__rate_scale"]
+
+    def __init__(
+            self, pre_synaptic_population, post_synaptic_population,
+            rate_scale=1.0, label=None):
+        """
+        :param ~spynnaker.pyNN.models.populations.Population \
+                pre_synaptic_population:
+            The meanfields to take the rates from
+        :param ~spynnaker.pyNN.models.populations.Population \
+                post_synaptic_population:
+            The Poisson sources to drive, one per meanfield
+        :param float rate_scale:
+            The scale to apply to Ve to get the rate of the source in Hz
+        :param str label:
+        :raises ConfigurationException:
+            If the populations cannot be connected in this way
+        """
+        for population in (pre_synaptic_population, post_synaptic_population):
+            if not isinstance(population, Population):
+                raise ConfigurationException(
+                    "Rates can only be sent between whole populations")
+        pre_vertex = pre_synaptic_population._vertex
+        post_vertex = post_synaptic_population._vertex
+        if (not isinstance(pre_vertex, AbstractPopulationVertex) or
+                not isinstance(
+                    pre_vertex.neuron_impl, MeanfieldImplStandard)):
+            raise ConfigurationException(
+                "The rates of {} cannot be sent as it is not made of "
+                "meanfields".format(pre_synaptic_population.label))
+        if not pre_vertex.neuron_impl.supports_live_output:
+            raise ConfigurationException(
+                "The rates of {} cannot be sent as its model {} does not "
+                "send them".format(
+                    pre_synaptic_population.label,
+                    pre_vertex.neuron_impl.model_name))
+        if not isinstance(post_vertex, SpikeSourcePoissonVertex):
+            raise ConfigurationException(
+                "The rates of {} cannot be set as it is not a Poisson "
+                "source".format(post_synaptic_population.label))
+        if pre_vertex.n_atoms != post_vertex.n_atoms:
+            raise ConfigurationException(
+                "There must be one Poisson source for each meanfield")
+        if rate_scale <= 0:
+            raise ConfigurationException("The rate scale must be positive")
+
+        # The scale is applied by the meanfields, so all the Poisson sources
+        # that they drive must use the same scale
+        neuron_impl = pre_vertex.neuron_impl
+        if neuron_impl.rate_output_scale not in (None, rate_scale):
+            raise ConfigurationException(
+                "The rates of {} are already sent with a scale of {}".format(
+                    pre_synaptic_population.label,
+                    neuron_impl.rate_output_scale))
+        neuron_impl.rate_output_scale = rate_scale
+
+        self.__rate_scale = rate_scale
+        self.__label = label
+        if label is None:
+            self.__label = "rates from {} to {}".format(
+                pre_synaptic_population.label, post_synaptic_population.label)
+        self.__projection_edge = ApplicationEdge(
+            pre_vertex, post_vertex, label=self.__label)
+        get_simulator().add_application_edge(
+            self.__projection_edge, MEANFIELD_RATE_PARTITION_ID)
+
+    @property
+    def label(self):
+        """ The label of the projection
+
+        :rtype: str
+        """
+        return self.__label
+
+    @property
+    def rate_scale(self):
+        """ The scale applied to Ve to get the rate of the sources in Hz
+
+        :rtype: float
+        """
+        return self.__rate_scale
+
+    def __repr__(self):
+        return "RateProjection(\"{}\", rate_scale={})".format(
+            self.__label, self.__rate_scale)
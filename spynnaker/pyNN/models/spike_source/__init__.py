@@ -21,8 +21,10 @@ from .spike_source_poisson_variable import SpikeSourcePoissonVariable
 from .spike_source_poisson_machine_vertex import (
     SpikeSourcePoissonMachineVertex)
 from .spike_source_poisson_vertex import SpikeSourcePoissonVertex
+from .spike_time_provider import AbstractSpikeTimeProvider, SpikeTimeColumns
 
-__all__ = ["SpikeSourceArray", "SpikeSourceArrayVertex",
-           "SpikeSourceFromFile", "SpikeSourcePoisson",
-           "SpikeSourcePoissonMachineVertex", "SpikeSourcePoissonVariable",
-           "SpikeSourcePoissonVertex"]
+__all__ = ["AbstractSpikeTimeProvider", "SpikeSourceArray",
+           "SpikeSourceArrayVertex", "SpikeSourceFromFile",
+           "SpikeSourcePoisson", "SpikeSourcePoissonMachineVertex",
+           "SpikeSourcePoissonVariable", "SpikeSourcePoissonVertex",
+           "SpikeTimeColumns"]
@@ -0,0 +1,291 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+
+
+def _is_nested(values):
+    """ Determine if the values are given as one list per source rather than\
+        as a single list shared by all sources
+
+    :param values: The values to check
+    :rtype: bool
+    """
+    if isinstance(values, numpy.ndarray):
+        return values.ndim > 1 or values.dtype == object
+    return len(values) > 0 and hasattr(values[0], "__len__")
+
+
+def _to_columns(values, n_sources, name):
+    """ Convert a shared list or one list per source into a count of values\
+        per source and a flat array of values
+
+    :param values: The values, either shared or one list per source
+    :param int n_sources: The number of sources
+    :param str name: The name of the parameter, used in error messages
+    :return: The count of values per source and the flat values
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+    """
+    if not _is_nested(values):
+        shared = numpy.asarray(values, dtype="float64")
+        counts = numpy.full(n_sources, len(shared), dtype="int64")
+        return counts, numpy.tile(shared, n_sources)
+    if len(values) != n_sources:
+        raise Exception(
+            "Must specify one {} for all neurons or one per neuron".format(
+                name))
+    if isinstance(values, numpy.ndarray) and values.dtype != object:
+        counts = numpy.full(n_sources, values.shape[1], dtype="int64")
+        return counts, values.astype("float64").reshape(-1)
+    counts = numpy.fromiter(
+        (len(v) for v in values), dtype="int64", count=n_sources)
+    if not n_sources:
+        return counts, numpy.zeros(0, dtype="float64")
+    return counts, numpy.concatenate(
+        [numpy.asarray(v, dtype="float64") for v in values])
+
+
+def _single_per_source(value, n_sources):
+    """ Convert a single value, or one value per source, into a flat array\
+        holding exactly one value per source
+
+    :param value: The value or values
+    :param int n_sources: The number of sources
+    :rtype: ~numpy.ndarray
+    """
+    return numpy.broadcast_to(
+        numpy.asarray(value, dtype="float64"), (n_sources, )).copy()
+
+
+class RateSchedule(object):
+    """ The rates of a set of Poisson sources over time, stored in columns.
+
+    The schedule of source *i* is held in elements\
+    ``offsets[i]:offsets[i + 1]`` of flat arrays of rates, start times,\
+    durations and time until the next spike, so that the whole schedule\
+    can be validated, sliced and encoded with array operations rather than\
+    by looking at each source in turn.  A duration of NaN means that the\
+    rate lasts until the end of the simulation.
+    """
+
+    __slots__ = [
+        "__durations",
+        "__offsets",
+        "__rates",
+        "__starts",
+        "__time_to_spike"]
+
+    def __init__(self, offsets, rates, starts, durations):
+        """
+        :param ~numpy.ndarray offsets:
+            The index of the first rate of each source, followed by the total
+            number of rates
+        :param ~numpy.ndarray rates: The rates in Hz
+        :param ~numpy.ndarray starts: The start times in ms
+        :param ~numpy.ndarray durations:
+            The durations in ms, with NaN meaning "until the end"
+        """
+        self.__offsets = numpy.asarray(offsets, dtype="int64")
+        self.__rates = numpy.asarray(rates, dtype="float64")
+        self.__starts = numpy.asarray(starts, dtype="float64")
+        self.__durations = numpy.asarray(durations, dtype="float64")
+        self.__time_to_spike = numpy.zeros(len(self.__rates), dtype="uint32")
+
+    @staticmethod
+    def from_parameters(
+            n_sources, rate=None, start=None, duration=None, rates=None,
+            starts=None, durations=None):
+        """ Build a schedule from the parameters of a Poisson source.
+
+        Each of the single-valued parameters (``rate``, ``start``,\
+        ``duration``) may be given as one value for all sources or as one\
+        value per source.  Each of the multi-valued parameters (``rates``,\
+        ``starts``, ``durations``) may be given as one list for all sources\
+        or as one list per source, including as a 2D array.
+
+        :param int n_sources: The number of sources
+        :param rate: The single rate of each source
+        :param start: The single start time of each source
+        :param duration: The single duration of each source
+        :param rates: The rates of each source
+        :param starts: The start times of each source
+        :param durations: The durations of each source
+        :rtype: RateSchedule
+        """
+        # pylint: disable=too-many-arguments
+        if (rates is not None) and (rate is not None):
+            raise Exception("Exactly one of rate and rates can be specified")
+        if (starts is not None) and (start is not None):
+            raise Exception("Exactly one of start and starts can be specified")
+        if (durations is not None) and (duration is not None):
+            raise Exception(
+                "Exactly one of duration and durations can be specified")
+        if rate is None and rates is None:
+            raise Exception("One of rate or rates must be specified")
+
+        # Work out the rates and so how many there are for each source
+        if rates is None:
+            n_rates = numpy.ones(n_sources, dtype="int64")
+            flat_rates = _single_per_source(rate, n_sources)
+        else:
+            if not hasattr(rates, "__len__"):
+                raise Exception("Multiple rates must be a list")
+            n_rates, flat_rates = _to_columns(rates, n_sources, "rate")
+        offsets = numpy.zeros(n_sources + 1, dtype="int64")
+        numpy.cumsum(n_rates, out=offsets[1:])
+
+        # Each rate must have a start, unless there is only one rate
+        if starts is None and start is None:
+            if numpy.any(n_rates > 1):
+                raise Exception(
+                    "When multiple rates are specified,"
+                    " each must have a start")
+            flat_starts = numpy.zeros(len(flat_rates))
+        elif starts is None:
+            n_starts = numpy.ones(n_sources, dtype="int64")
+            flat_starts = _single_per_source(start, n_sources)
+        else:
+            n_starts, flat_starts = _to_columns(starts, n_sources, "start")
+        if start is not None or starts is not None:
+            if not numpy.array_equal(n_starts, n_rates):
+                raise Exception("Each rate must have a start")
+            if numpy.any(numpy.isnan(flat_starts)):
+                raise Exception("Start must not be None")
+
+        # Durations are optional, but if given there must be one per rate
+        if durations is None and duration is None:
+            flat_durations = numpy.full(len(flat_rates), numpy.nan)
+        else:
+            if durations is None:
+                n_durations = numpy.ones(n_sources, dtype="int64")
+                flat_durations = _single_per_source(duration, n_sources)
+            else:
+                n_durations, flat_durations = _to_columns(
+                    durations, n_sources, "duration")
+            if not numpy.array_equal(n_durations, n_rates):
+                raise Exception("Each rate must have its own duration")
+
+        return RateSchedule(offsets, flat_rates, flat_starts, flat_durations)
+
+    @property
+    def n_sources(self):
+        """ The number of sources in the schedule
+
+        :rtype: int
+        """
+        return len(self.__offsets) - 1
+
+    @property
+    def offsets(self):
+        """ The index of the first rate of each source, followed by the\
+            total number of rates
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__offsets
+
+    @property
+    def n_rates_per_source(self):
+        """ The number of rates of each source
+
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.diff(self.__offsets)
+
+    @property
+    def rates(self):
+        """ The flat rates of all sources in Hz
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__rates
+
+    @property
+    def starts(self):
+        """ The flat start times of all rates in ms
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__starts
+
+    @property
+    def durations(self):
+        """ The flat durations of all rates in ms, with NaN meaning "until\
+            the end"
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__durations
+
+    @property
+    def time_to_spike(self):
+        """ The flat time steps until the next spike of all rates, as read\
+            back from the machine
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__time_to_spike
+
+    def get_rate_range(self, vertex_slice):
+        """ Get the range of the flat arrays that hold the rates of the\
+            sources in a slice
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+        :rtype: slice
+        """
+        return slice(self.__offsets[vertex_slice.lo_atom],
+                     self.__offsets[vertex_slice.hi_atom + 1])
+
+    def get_slice_offsets(self, vertex_slice):
+        """ Get the offsets of the sources in a slice, relative to the first\
+            rate of the slice
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+        :return: An array of n_atoms + 1 offsets
+        :rtype: ~numpy.ndarray
+        """
+        offsets = self.__offsets[
+            vertex_slice.lo_atom:vertex_slice.hi_atom + 2]
+        return offsets - offsets[0]
+
+    def n_rates(self, vertex_slice):
+        """ Get the total number of rates of the sources in a slice
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+        :rtype: int
+        """
+        return int(self.__offsets[vertex_slice.hi_atom + 1] -
+                   self.__offsets[vertex_slice.lo_atom])
+
+    def max_rate_per_source(self):
+        """ Get the maximum rate of each source, or 0 for a source with no\
+            rates
+
+        :rtype: ~numpy.ndarray
+        """
+        max_rates = numpy.zeros(self.n_sources)
+        has_rates = numpy.diff(self.__offsets) > 0
+        if numpy.any(has_rates):
+            max_rates[has_rates] = numpy.maximum.reduceat(
+                self.__rates, self.__offsets[:-1][has_rates])
+        return max_rates
+
+    def split(self, values):
+        """ Split flat values into one array per source
+
+        :param ~numpy.ndarray values: The flat values to split
+        :rtype: list(~numpy.ndarray)
+        """
+        return numpy.split(values, self.__offsets[1:-1])
@@ -22,22 +22,22 @@ from spinn_front_end_common.utility_models import ReverseIpTagMultiCastSource
 from spinn_front_end_common.abstract_models import AbstractChangableAfterRun
 from spinn_front_end_common.abstract_models.impl import (
     ProvidesKeyToAtomMappingImpl)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.globals_variables import (
     get_simulator, machine_time_step)
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, EIEIOSpikeRecorder, SimplePopulationSettable)
 from spynnaker.pyNN.utilities import constants
+from .spike_time_provider import (
+    AbstractSpikeTimeProvider, SpikeTimeProviderTicks, _as_numpy_ticks)
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
 
-def _as_numpy_ticks(times, time_step):
-    return numpy.ceil(
-        numpy.floor(numpy.array(times) * 1000.0) / time_step).astype("int64")
-
-
 def _send_buffer_times(spike_times, time_step):
     # Convert to ticks
+    if isinstance(spike_times, AbstractSpikeTimeProvider):
+        return SpikeTimeProviderTicks(spike_times, time_step)
     if len(spike_times) and hasattr(spike_times[0], "__len__"):
         data = []
         for times in spike_times:
@@ -56,6 +56,9 @@ class SpikeSourceArrayVertex(
 
     SPIKE_RECORDING_REGION_ID = 0
 
+    # The number of neurons to check the spike times of at once
+    _CHECK_CHUNK_NEURONS = 1024
+
     def __init__(
             self, n_neurons, spike_times, constraints, label,
             max_atoms_per_core, model, splitter):
@@ -64,6 +67,8 @@ class SpikeSourceArrayVertex(
         self.__model = model
         if spike_times is None:
             spike_times = []
+        if isinstance(spike_times, AbstractSpikeTimeProvider):
+            self.__check_provider(spike_times, n_neurons)
         self._spike_times = spike_times
         time_step = self.get_spikes_sampling_interval()
 
@@ -93,45 +98,72 @@ class SpikeSourceArrayVertex(
     def spike_times(self):
         """ The spike times of the spike source array
         """
+        if isinstance(self._spike_times, AbstractSpikeTimeProvider):
+            return self._spike_times
         return list(self._spike_times)
 
     def _to_early_spikes_single_list(self, spike_times):
         """
         Checks if there is one or more spike_times before the current time
 
-        Logs a warning for the first oen found
+        Logs a warning for the first one found
 
-        :param iterable(int spike_times:
+        :param iterable(int) spike_times:
         """
         current_time = get_simulator().get_current_time()
-        for i in range(len(spike_times)):
-            if spike_times[i] > current_time:
-                logger.warning(
-                    "SpikeSourceArray {} has spike_times that are lower than "
-                    "the current time {} For example {} - "
-                    "these will be ignored.".format(
-                        self, current_time, float(spike_times[i])))
-                return
+        times = numpy.asarray(spike_times, dtype="float64")
+        self.__warn_early(times[times < current_time], current_time)
 
     def _check_spikes_double_list(self, spike_times):
         """
         Checks if there is one or more spike_times before the current time
 
-        Logs a warning for the first oen found
+        Logs a warning for the first one found
 
-        :param iterable(iterable(int) spike_times:
+        :param iterable(iterable(int)) spike_times:
         """
         current_time = get_simulator().get_current_time()
-        for neuron_id in range(0, self.n_atoms):
-            id_times = spike_times[neuron_id]
-            for i in range(len(id_times)):
-                if id_times[i] > current_time:
-                    logger.warning(
-                       "SpikeSourceArray {} has spike_times that are lower "
-                       "than the current time {} For example {} - "
-                       "these will be ignored.".format(
-                            self, current_time, float(id_times[i])))
-                    return
+
+        # Check the neurons a chunk at a time so that each check is done
+        # on an array rather than spike by spike
+        for first in range(0, self.n_atoms, self._CHECK_CHUNK_NEURONS):
+            last = min(first + self._CHECK_CHUNK_NEURONS, self.n_atoms)
+            times = numpy.concatenate(
+                [numpy.asarray(spike_times[neuron_id], dtype="float64")
+                 for neuron_id in range(first, last)])
+            if self.__warn_early(times[times < current_time], current_time):
+                return
+
+    def __warn_early(self, early_times, current_time):
+        """ Warn about the first of a set of spike times that are too early
+
+        :param ~numpy.ndarray early_times: The times that are too early
+        :param float current_time: The current time of the simulation
+        :return: Whether a warning was given
+        :rtype: bool
+        """
+        if not len(early_times):
+            return False
+        logger.warning(
+            "SpikeSourceArray {} has spike_times that are lower than "
+            "the current time {} For example {} - "
+            "these will be ignored.".format(
+                self, current_time, float(early_times[0])))
+        return True
+
+    @staticmethod
+    def __check_provider(provider, n_neurons):
+        """ Check that a spike time provider can be used for this source
+
+        :param AbstractSpikeTimeProvider provider:
+        :param int n_neurons:
+        :raises ConfigurationException: If the provider is not valid
+        """
+        if provider.n_neurons != n_neurons:
+            raise ConfigurationException(
+                "The spike time provider has times for {} neurons but the "
+                "source has {}".format(provider.n_neurons, n_neurons))
+        provider.validate()
 
     @spike_times.setter
     def spike_times(self, spike_times):
@@ -140,8 +172,12 @@ class SpikeSourceArrayVertex(
 
         """
         time_step = self.get_spikes_sampling_interval()
-        # warn the user if they are asking for a spike time out of range
-        if spike_times:  # in case of empty list do not check
+        if isinstance(spike_times, AbstractSpikeTimeProvider):
+            # Times before the current time are expected in a provider, and
+            # are simply not sent
+            self.__check_provider(spike_times, self.n_atoms)
+        elif len(spike_times):  # in case of empty list do not check
+            # warn the user if they are asking for a spike time out of range
             if hasattr(spike_times[0], '__iter__'):
                 self._check_spikes_double_list(spike_times)
             else:
@@ -213,6 +249,11 @@ class SpikeSourceArrayVertex(
     @overrides(SimplePopulationSettable.set_value_by_selector)
     def set_value_by_selector(self, selector, key, value):
         if key == "spike_times":
+            if isinstance(self._spike_times, AbstractSpikeTimeProvider):
+                raise ConfigurationException(
+                    "The spike times of some of the neurons of {} cannot be "
+                    "changed as they come from a spike time provider".format(
+                        self.label))
             old_values = self.get_value(key)
             if isinstance(old_values, RangedListOfList):
                 ranged_list = old_values
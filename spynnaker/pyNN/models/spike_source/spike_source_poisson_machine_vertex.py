@@ -55,22 +55,14 @@ from spynnaker.pyNN.models.abstract_models import (
 from spynnaker.pyNN.exceptions import SynapticConfigurationException
 
 
-def _flatten(alist):
-    for item in alist:
-        if hasattr(item, "__iter__"):
-            yield from _flatten(item)
-        else:
-            yield item
-
-
-def get_rates_bytes(vertex_slice, rate_data):
+def get_rates_bytes(vertex_slice, rate_schedule):
     """ Gets the size of the Poisson rates in bytes
 
     :param ~pacman.model.graphs.common.Slice vertex_slice:
+    :param RateSchedule rate_schedule:
     :rtype: int
     """
-    n_rates = sum(len(rate_data[i]) for i in range(
-        vertex_slice.lo_atom, vertex_slice.hi_atom + 1))
+    n_rates = rate_schedule.n_rates(vertex_slice)
     return ((vertex_slice.n_atoms * PARAMS_WORDS_PER_NEURON) +
             (n_rates * PARAMS_WORDS_PER_RATE)) * BYTES_PER_WORD
 
@@ -99,7 +91,6 @@ SDRAM_EDGE_PARAMS_BYTES_PER_WEIGHT = BYTES_PER_SHORT
 # 3. offset to start writing, 4. VLA of weights (not counted here)
 SDRAM_EDGE_PARAMS_BASE_BYTES = 3 * BYTES_PER_WORD
 
-_ONE_WORD = struct.Struct("<I")
 _FOUR_WORDS = struct.Struct("<4I")
 
 
@@ -422,47 +413,64 @@ class SpikeSourcePoissonMachineVertex(
         spec.switch_write_focus(
             self.POISSON_SPIKE_SOURCE_REGIONS.RATES_REGION.value)
 
-        # Extract the data on which to work and convert to appropriate form
-        starts = numpy.array(list(_flatten(
-            self._app_vertex.start[self.vertex_slice.as_slice]))).astype(
-                "float")
-        durations = numpy.array(list(_flatten(
-            self._app_vertex.duration[self.vertex_slice.as_slice]))).astype(
-                "float")
-        local_rates = self._app_vertex.rates[self.vertex_slice.as_slice]
-        n_rates = numpy.array([len(r) for r in local_rates])
-        splits = numpy.cumsum(n_rates)
-        rates = numpy.array(list(_flatten(local_rates)))
-        time_to_spike = numpy.array(list(_flatten(
-            self._app_vertex.time_to_spike[
-                self.vertex_slice.as_slice]))).astype("u4")
-        rate_change = self._app_vertex.rate_change[self.vertex_slice.as_slice]
+        spec.write_array(self._get_poisson_rates_data(
+            self._app_vertex.rate_schedule, self._app_vertex.rate_change,
+            self.vertex_slice, first_machine_time_step))
+
+    @classmethod
+    def _get_poisson_rates_data(
+            cls, rate_schedule, rate_change, vertex_slice,
+            first_machine_time_step):
+        """ Encode the rates of the sources in a slice as they appear in the\
+            rates region
+
+        :param RateSchedule rate_schedule: The schedule of rates to encode
+        :param ~numpy.ndarray rate_change:
+            The change in rate of each source since the last read-back
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The sources to encode
+        :param int first_machine_time_step:
+            First machine time step to start from the correct index
+        :rtype: ~numpy.ndarray(dtype="uint32")
+        """
+        # Extract the data on which to work
+        rate_range = rate_schedule.get_rate_range(vertex_slice)
+        offsets = rate_schedule.get_slice_offsets(vertex_slice)
+        n_rates = numpy.diff(offsets)
+        starts = rate_schedule.starts[rate_range]
+        durations = rate_schedule.durations[rate_range]
+        rates = rate_schedule.rates[rate_range]
+        time_to_spike = rate_schedule.time_to_spike[rate_range]
+        rate_change = rate_change[vertex_slice.as_slice]
+        has_rates = n_rates > 0
+        first_rates = offsets[:-1][has_rates]
+        last_rates = offsets[1:][has_rates] - 1
 
         # Convert start times to start time steps
-        starts_scaled = self._convert_ms_to_n_timesteps(starts)
+        starts_scaled = cls._convert_ms_to_n_timesteps(starts)
 
         # Convert durations to end time steps, using the maximum for "None"
         # duration (which means "until the end")
         no_duration = numpy.isnan(durations)
         durations_filtered = numpy.where(no_duration, 0, durations)
-        ends_scaled = self._convert_ms_to_n_timesteps(
+        ends_scaled = cls._convert_ms_to_n_timesteps(
             durations_filtered) + starts_scaled
         ends_scaled = (
-            numpy.where(no_duration, self._MAX_TIMESTEP, ends_scaled))
+            numpy.where(no_duration, cls._MAX_TIMESTEP, ends_scaled))
 
         # Work out the timestep at which the next rate activates, using
-        # the maximum value at the end (meaning there is no "next")
-        starts_split = numpy.array_split(starts_scaled, splits)
-        next_scaled = numpy.concatenate(
-            [numpy.append(s[1:], self._MAX_TIMESTEP)
-             for s in starts_split[:-1]])
+        # the maximum value at the end of each source (meaning there is no
+        # "next")
+        next_scaled = numpy.empty_like(starts_scaled)
+        next_scaled[:-1] = starts_scaled[1:]
+        next_scaled[last_rates] = cls._MAX_TIMESTEP
 
         # Compute the spikes per tick for each rate for each atom
         spikes_per_tick = rates * (
                 machine_time_step() / MICRO_TO_SECOND_CONVERSION)
         # Determine the properties of the sources
-        is_fast_source = spikes_per_tick >= self.SLOW_RATE_PER_TICK_CUTOFF
-        is_faster_source = spikes_per_tick >= self.FAST_RATE_PER_TICK_CUTOFF
+        is_fast_source = spikes_per_tick >= cls.SLOW_RATE_PER_TICK_CUTOFF
+        is_faster_source = spikes_per_tick >= cls.FAST_RATE_PER_TICK_CUTOFF
         not_zero = spikes_per_tick > 0
         # pylint: disable=assignment-from-no-return
         is_slow_source = numpy.logical_not(is_fast_source)
@@ -487,33 +495,43 @@ class SpikeSourcePoissonMachineVertex(
 
         # Reuse the time-to-spike read from the machine (if has been run)
         # or don't if the rate has since been changed
-        time_to_spike_split = numpy.array_split(time_to_spike, splits)
-        time_to_spike = numpy.concatenate(
-            [t if rate_change[i] else numpy.repeat(0, len(t))
-             for i, t in enumerate(time_to_spike_split[:-1])])
-
-        # Turn the fast source booleans into uint32
-        is_fast_source = is_fast_source.astype("uint32")
-
-        # Group together the rate data for the core by rate
-        core_data = numpy.dstack((
-            starts_scaled, ends_scaled, next_scaled, is_fast_source,
-            exp_minus_lambda, sqrt_lambda, isi_val, time_to_spike))[0]
-
-        # Group data by neuron id
-        core_data_split = numpy.array_split(core_data, splits)
+        time_to_spike = numpy.where(
+            numpy.repeat(rate_change != 0, n_rates), time_to_spike, 0)
 
         # Work out the index where the core should start based on the given
-        # first timestep
-        ends_scaled_split = numpy.array_split(ends_scaled, splits)
-        indices = [numpy.argmax(e > first_machine_time_step)
-                   for e in ends_scaled_split[:-1]]
-
-        # Build the final data for this core, and write it
-        final_data = numpy.concatenate([
-            numpy.concatenate(([len(d), indices[i]], numpy.concatenate(d)))
-            for i, d in enumerate(core_data_split[:-1])])
-        spec.write_array(final_data)
+        # first timestep; this is the first rate of each source that ends
+        # after the timestep, or 0 if there is no such rate
+        local_index = numpy.arange(len(rates)) - numpy.repeat(
+            offsets[:-1], n_rates)
+        candidates = numpy.where(
+            ends_scaled > first_machine_time_step, local_index,
+            numpy.iinfo("int64").max)
+        indices = numpy.zeros(vertex_slice.n_atoms, dtype="int64")
+        if len(first_rates):
+            first_index = numpy.minimum.reduceat(candidates, first_rates)
+            indices[has_rates] = numpy.where(
+                first_index == numpy.iinfo("int64").max, 0, first_index)
+
+        # Build the final data for this core; each source has a header of
+        # the number of rates and the index, followed by the data of each
+        # rate
+        data = numpy.zeros(
+            (vertex_slice.n_atoms * PARAMS_WORDS_PER_NEURON) +
+            (len(rates) * PARAMS_WORDS_PER_RATE), dtype="uint32")
+        headers = (
+            numpy.arange(vertex_slice.n_atoms) * PARAMS_WORDS_PER_NEURON +
+            offsets[:-1] * PARAMS_WORDS_PER_RATE)
+        data[headers] = n_rates
+        data[headers + 1] = indices
+        rate_words = (
+            numpy.repeat(headers + PARAMS_WORDS_PER_NEURON, n_rates) +
+            local_index * PARAMS_WORDS_PER_RATE)
+        data[rate_words[:, None] + numpy.arange(PARAMS_WORDS_PER_RATE)] = (
+            numpy.column_stack((
+                starts_scaled, ends_scaled, next_scaled,
+                is_fast_source.astype("uint32"), exp_minus_lambda,
+                sqrt_lambda, isi_val, time_to_spike)).astype("uint32"))
+        return data
 
     def _write_poisson_parameters(self, spec, graph, placement, routing_info):
         """ Generate Parameter data for Poisson spike sources
@@ -538,20 +556,25 @@ class SpikeSourcePoissonMachineVertex(
         spec.write_value(data=1 if key is not None else 0)
         spec.write_value(data=key if key is not None else 0)
 
-        # Write the incoming mask if there is one
+        # Write the incoming mask if there is one; rates can be sent by a
+        # live controller and by meanfields, which must all use the same mask
         in_edges = graph.get_edges_ending_at_vertex_with_partition_name(
             placement.vertex, constants.LIVE_POISSON_CONTROL_PARTITION_ID)
         if len(in_edges) > 1:
             raise ConfigurationException(
                 "Only one control edge can end at a Poisson vertex")
+        in_edges = list(in_edges)
+        in_edges.extend(graph.get_edges_ending_at_vertex_with_partition_name(
+            placement.vertex, constants.MEANFIELD_RATE_PARTITION_ID))
+        masks = {routing_info.get_routing_info_for_edge(in_edge).first_mask
+                 for in_edge in in_edges}
+        if len(masks) > 1:
+            raise ConfigurationException(
+                "All rates sent to a Poisson vertex must use the same mask")
         incoming_mask = 0
-        if len(in_edges) == 1:
-            in_edge = in_edges[0]
-
+        if masks:
             # Get the mask of the incoming keys
-            incoming_mask = \
-                routing_info.get_routing_info_for_edge(in_edge).first_mask
-            incoming_mask = ~incoming_mask & 0xFFFFFFFF
+            incoming_mask = ~masks.pop() & 0xFFFFFFFF
         spec.write_value(incoming_mask)
 
         # Write the number of seconds per timestep (unsigned long fract)
@@ -644,7 +667,8 @@ class SpikeSourcePoissonMachineVertex(
         spec.reserve_memory_region(
             region=self.POISSON_SPIKE_SOURCE_REGIONS.RATES_REGION.value,
             size=get_rates_bytes(
-                placement.vertex.vertex_slice, self._app_vertex.rates),
+                placement.vertex.vertex_slice,
+                self._app_vertex.rate_schedule),
             label='PoissonRates')
 
     @staticmethod
@@ -683,53 +707,52 @@ class SpikeSourcePoissonMachineVertex(
             self.poisson_rate_region_address(placement, transceiver))
 
         # get size of poisson params
-        size_of_region = get_rates_bytes(vertex_slice, self._app_vertex.rates)
+        rate_schedule = self._app_vertex.rate_schedule
+        size_of_region = get_rates_bytes(vertex_slice, rate_schedule)
 
         # get data from the machine
         byte_array = transceiver.read_memory(
             placement.x, placement.y,
             poisson_rate_region_sdram_address, size_of_region)
 
-        # For each atom, read the number of rates and the rate parameters
-        offset = 0
-        for i in range(vertex_slice.lo_atom, vertex_slice.hi_atom + 1):
-            n_values, = _ONE_WORD.unpack_from(byte_array, offset)
-            offset += 4
-
-            # Skip reading the index, as it will be recalculated on data write
-            offset += 4
-
-            (_start, _end, _next, is_fast_source, exp_minus_lambda,
-             sqrt_lambda, isi, time_to_next_spike) = (
-                 self._PoissonStruct.read_data(byte_array, offset, n_values))
-            offset += (
-                self._PoissonStruct.get_size_in_whole_words(
-                    n_values) * BYTES_PER_WORD)
-
-            # Work out the spikes per tick depending on if the source is
-            # slow (isi), fast (exp) or faster (sqrt)
-            is_fast_source = is_fast_source == 1.0
-            spikes_per_tick = numpy.zeros(len(is_fast_source), dtype="float")
-            spikes_per_tick[is_fast_source] = numpy.log(
-                exp_minus_lambda[is_fast_source]) * -1.0
-            is_faster_source = sqrt_lambda > 0
-            # pylint: disable=assignment-from-no-return
-            spikes_per_tick[is_faster_source] = numpy.square(
-                sqrt_lambda[is_faster_source])
-            slow_elements = isi > 0
-            spikes_per_tick[slow_elements] = 1.0 / isi[slow_elements]
-
-            # Convert spikes per tick to rates
-            self._app_vertex.rates.set_value_by_id(
-                i,
-                spikes_per_tick *
-                (MICRO_TO_SECOND_CONVERSION /
-                 machine_time_step()))
-
-            # Store the updated time until next spike so that it can be
-            # rewritten when the parameters are loaded
-            self._app_vertex.time_to_spike.set_value_by_id(
-                i, time_to_next_spike)
+        # Gather the rate parameters of all the atoms, skipping the header of
+        # the number of rates and the index (which will be recalculated on
+        # data write) of each atom
+        offsets = rate_schedule.get_slice_offsets(vertex_slice)
+        n_rates = numpy.diff(offsets)
+        rate_words = (
+            numpy.repeat(
+                numpy.arange(1, vertex_slice.n_atoms + 1) *
+                PARAMS_WORDS_PER_NEURON, n_rates) +
+            numpy.arange(offsets[-1]) * PARAMS_WORDS_PER_RATE)
+        words = numpy.frombuffer(byte_array, dtype="uint32")
+        rate_data = numpy.ascontiguousarray(words[
+            rate_words[:, None] + numpy.arange(PARAMS_WORDS_PER_RATE)])
+        (_start, _end, _next, is_fast_source, exp_minus_lambda,
+         sqrt_lambda, isi, time_to_next_spike) = (
+            self._PoissonStruct.read_data(rate_data, 0, int(offsets[-1])))
+
+        # Work out the spikes per tick depending on if the source is
+        # slow (isi), fast (exp) or faster (sqrt)
+        is_fast_source = is_fast_source == 1.0
+        spikes_per_tick = numpy.zeros(len(is_fast_source), dtype="float")
+        spikes_per_tick[is_fast_source] = numpy.log(
+            exp_minus_lambda[is_fast_source]) * -1.0
+        is_faster_source = sqrt_lambda > 0
+        # pylint: disable=assignment-from-no-return
+        spikes_per_tick[is_faster_source] = numpy.square(
+            sqrt_lambda[is_faster_source])
+        slow_elements = isi > 0
+        spikes_per_tick[slow_elements] = 1.0 / isi[slow_elements]
+
+        # Convert spikes per tick to rates
+        rate_range = rate_schedule.get_rate_range(vertex_slice)
+        rate_schedule.rates[rate_range] = spikes_per_tick * (
+            MICRO_TO_SECOND_CONVERSION / machine_time_step())
+
+        # Store the updated time until next spike so that it can be
+        # rewritten when the parameters are loaded
+        rate_schedule.time_to_spike[rate_range] = time_to_next_spike
 
     @overrides(SendsSynapticInputsOverSDRAM.sdram_requirement)
     def sdram_requirement(self, sdram_machine_edge):
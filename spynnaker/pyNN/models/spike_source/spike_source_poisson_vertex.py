@@ -40,13 +40,10 @@ from spinn_front_end_common.utilities.globals_variables import (
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, MultiSpikeRecorder, SimplePopulationSettable)
 from .spike_source_poisson_machine_vertex import (
-    SpikeSourcePoissonMachineVertex, _flatten, get_rates_bytes,
+    SpikeSourcePoissonMachineVertex, get_rates_bytes,
     get_sdram_edge_params_bytes)
+from .rate_schedule import RateSchedule
 from spynnaker.pyNN.utilities.utility_calls import create_mars_kiss_seeds
-from spynnaker.pyNN.utilities.ranged.spynnaker_ranged_dict \
-    import SpynnakerRangeDictionary
-from spynnaker.pyNN.utilities.ranged.spynnaker_ranged_list \
-    import SpynnakerRangedList
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -92,10 +89,10 @@ class SpikeSourcePoissonVertex(
         "__max_rate",
         "__rate_change",
         "__n_profile_samples",
-        "__data",
         "__is_variable_rate",
         "__max_spikes",
-        "__outgoing_projections"]
+        "__outgoing_projections",
+        "__schedule"]
 
     SPIKE_RECORDING_REGION_ID = 0
 
@@ -138,120 +135,10 @@ class SpikeSourcePoissonVertex(
 
         self.__spike_recorder = MultiSpikeRecorder()
 
-        # Check for disallowed pairs of parameters
-        if (rates is not None) and (rate is not None):
-            raise Exception("Exactly one of rate and rates can be specified")
-        if (starts is not None) and (start is not None):
-            raise Exception("Exactly one of start and starts can be specified")
-        if (durations is not None) and (duration is not None):
-            raise Exception(
-                "Exactly one of duration and durations can be specified")
-        if rate is None and rates is None:
-            raise Exception("One of rate or rates must be specified")
-
-        # Normalise the parameters
+        # Store the rates in columns, validating them as they are stored
         self.__is_variable_rate = rates is not None
-        if rates is None:
-            if hasattr(rate, "__len__"):
-                # Single rate per neuron for whole simulation
-                rates = [numpy.array([r]) for r in rate]
-            else:
-                # Single rate for all neurons for whole simulation
-                rates = numpy.array([rate])
-        elif hasattr(rates[0], "__len__"):
-            # Convert each list to numpy array
-            rates = [numpy.array(r) for r in rates]
-        else:
-            rates = numpy.array(rates)
-        if starts is None and start is not None:
-            if hasattr(start, "__len__"):
-                starts = [numpy.array([s]) for s in start]
-            elif start is None:
-                starts = numpy.array([0])
-            else:
-                starts = numpy.array([start])
-        elif starts is not None and hasattr(starts[0], "__len__"):
-            starts = [numpy.array(s) for s in starts]
-        elif starts is not None:
-            starts = numpy.array(starts)
-        if durations is None and duration is not None:
-            if hasattr(duration, "__len__"):
-                durations = [numpy.array([d]) for d in duration]
-            else:
-                durations = numpy.array([duration])
-        elif durations is not None and hasattr(durations[0], "__len__"):
-            durations = [numpy.array(d) for d in durations]
-        elif durations is not None:
-            durations = numpy.array(durations)
-        else:
-            if hasattr(rates[0], "__len__"):
-                durations = [numpy.array([None for r in _rate])
-                             for _rate in rates]
-            else:
-                durations = numpy.array([None for _rate in rates])
-
-        # Check that there is either one list for all neurons,
-        # or one per neuron
-        if hasattr(rates[0], "__len__") and len(rates) != n_neurons:
-            raise Exception(
-                "Must specify one rate for all neurons or one per neuron")
-        if (starts is not None and hasattr(starts[0], "__len__") and
-                len(starts) != n_neurons):
-            raise Exception(
-                "Must specify one start for all neurons or one per neuron")
-        if (durations is not None and hasattr(durations[0], "__len__") and
-                len(durations) != n_neurons):
-            raise Exception(
-                "Must specify one duration for all neurons or one per neuron")
-
-        # Check that for each rate there is a start and duration if needed
-        # TODO: Could be more efficient for case where parameters are not one
-        #       per neuron
-        for i in range(n_neurons):
-            rate_set = rates
-            if hasattr(rates[0], "__len__"):
-                rate_set = rates[i]
-            if not hasattr(rate_set, "__len__"):
-                raise Exception("Multiple rates must be a list")
-            if starts is None and len(rate_set) > 1:
-                raise Exception(
-                    "When multiple rates are specified,"
-                    " each must have a start")
-            elif starts is not None:
-                start_set = starts
-                if hasattr(starts[0], "__len__"):
-                    start_set = starts[i]
-                if len(start_set) != len(rate_set):
-                    raise Exception("Each rate must have a start")
-                if any(s is None for s in start_set):
-                    raise Exception("Start must not be None")
-            if durations is not None:
-                duration_set = durations
-                if hasattr(durations[0], "__len__"):
-                    duration_set = durations[i]
-                if len(duration_set) != len(rate_set):
-                    raise Exception("Each rate must have its own duration")
-
-        if hasattr(rates[0], "__len__"):
-            time_to_spike = [
-                numpy.array([0 for _ in range(len(rates[i]))])
-                for i in range(len(rates))]
-        else:
-            time_to_spike = numpy.array([0 for _ in range(len(rates))])
-
-        self.__data = SpynnakerRangeDictionary(n_neurons)
-        self.__data["rates"] = SpynnakerRangedList(
-            n_neurons, rates,
-            use_list_as_value=not hasattr(rates[0], "__len__"))
-        self.__data["starts"] = SpynnakerRangedList(
-            n_neurons, starts,
-            use_list_as_value=not hasattr(starts[0], "__len__"))
-        self.__data["durations"] = SpynnakerRangedList(
-            n_neurons, durations,
-            use_list_as_value=not hasattr(durations[0], "__len__"))
-        self.__data["time_to_spike"] = SpynnakerRangedList(
-            n_neurons, time_to_spike,
-            use_list_as_value=not hasattr(time_to_spike[0], "__len__"))
+        self.__schedule = RateSchedule.from_parameters(
+            n_neurons, rate, start, duration, rates, starts, durations)
         self.__rng = numpy.random.RandomState(seed)
         self.__rate_change = numpy.zeros(n_neurons)
 
@@ -261,7 +148,7 @@ class SpikeSourcePoissonVertex(
         # Prepare for recording, and to get spikes
         self.__spike_recorder = MultiSpikeRecorder()
 
-        all_rates = list(_flatten(self.__data["rates"]))
+        all_rates = self.__schedule.rates
         self.__max_rate = max_rate
         if max_rate is None and len(all_rates):
             self.__max_rate = numpy.amax(all_rates)
@@ -271,9 +158,7 @@ class SpikeSourcePoissonVertex(
         total_rate = numpy.sum(all_rates)
         self.__max_spikes = 0
         if total_rate > 0:
-            # Note we have to do this per rate, as the whole array is not numpy
-            max_rates = numpy.array(
-                [numpy.max(r) for r in self.__data["rates"]])
+            max_rates = self.__schedule.max_rate_per_source()
             self.__max_spikes = numpy.sum(scipy.stats.poisson.ppf(
                 1.0 - (1.0 / max_rates), max_rates))
 
@@ -303,26 +188,21 @@ class SpikeSourcePoissonVertex(
     def rate(self):
         if self.__is_variable_rate:
             raise Exception("Get variable rate poisson rates with .rates")
-        return list(_flatten(self.__data["rates"]))
+        return list(self.__schedule.rates)
 
     @rate.setter
     def rate(self, rate):
         if self.__is_variable_rate:
             raise Exception("Cannot set rate of a variable rate poisson")
-        self.__rate_change = rate - numpy.array(
-            list(_flatten(self.__data["rates"])))
-        # Normalise parameter
-        if hasattr(rate, "__len__"):
-            # Single rate per neuron for whole simulation
-            self.__data["rates"].set_value([numpy.array([r]) for r in rate])
-        else:
-            # Single rate for all neurons for whole simulation
-            self.__data["rates"].set_value(
-                numpy.array([rate]), use_list_as_value=True)
-        all_rates = list(_flatten(self.__data["rates"]))
+        # There is exactly one rate per neuron, so the flat rates can be
+        # replaced directly
+        rate = numpy.broadcast_to(
+            numpy.asarray(rate, dtype="float64"), (self.__n_atoms, ))
+        self.__rate_change = rate - self.__schedule.rates
+        self.__schedule.rates[:] = rate
         new_max = 0
-        if len(all_rates):
-            new_max = numpy.amax(all_rates)
+        if len(rate):
+            new_max = numpy.amax(rate)
         if self.__max_rate is None:
             self.__max_rate = new_max
         # Setting record forces reset so OK to go over if not recording
@@ -335,42 +215,51 @@ class SpikeSourcePoissonVertex(
 
     @property
     def start(self):
-        return self.__data["starts"]
+        return self.__schedule.split(self.__schedule.starts)
 
     @start.setter
     def start(self, start):
         if self.__is_variable_rate:
             raise Exception("Cannot set start of a variable rate poisson")
-        # Normalise parameter
-        if hasattr(start, "__len__"):
-            # Single start per neuron for whole simulation
-            self.__data["starts"].set_value([numpy.array([s]) for s in start])
-        else:
-            # Single start for all neurons for whole simulation
-            self.__data["starts"].set_value(
-                numpy.array([start]), use_list_as_value=True)
+        self.__schedule.starts[:] = self.__value_per_neuron(start, "start")
 
     @property
     def duration(self):
-        return self.__data["durations"]
+        return self.__schedule.split(self.__schedule.durations)
 
     @duration.setter
     def duration(self, duration):
         if self.__is_variable_rate:
             raise Exception("Cannot set duration of a variable rate poisson")
-        # Normalise parameter
-        if hasattr(duration, "__len__"):
-            # Single duration per neuron for whole simulation
-            self.__data["durations"].set_value(
-                [numpy.array([d]) for d in duration])
-        else:
-            # Single duration for all neurons for whole simulation
-            self.__data["durations"].set_value(
-                numpy.array([duration]), use_list_as_value=True)
+        # None means "until the end", which is stored as NaN
+        self.__schedule.durations[:] = self.__value_per_neuron(
+            duration, "duration")
+
+    def __value_per_neuron(self, value, name):
+        """ Get one value per neuron of a source with a single rate, from\
+            one value for all neurons or a value for each neuron; the value\
+            of a neuron may be in an array of one item, as given by\
+            :py:attr:`start` and :py:attr:`duration`, and None becomes NaN
+
+        :param value: The value or values
+        :type value: float or None or iterable(float or None or ~numpy.ndarray)
+        :param str name: The name of the parameter being set
+        :rtype: ~numpy.ndarray
+        """
+        if not hasattr(value, "__len__"):
+            return numpy.full(
+                self.__n_atoms, numpy.asarray(value, dtype="float64"))
+        values = [numpy.asarray(v, dtype="float64").reshape(-1)
+                  for v in value]
+        if len(values) != self.__n_atoms or any(v.size != 1 for v in values):
+            raise Exception(
+                "The {} of a Poisson source with one rate per neuron must be"
+                " one value, or one value for each neuron".format(name))
+        return numpy.concatenate(values)
 
     @property
     def rates(self):
-        return self.__data["rates"]
+        return self.__schedule.split(self.__schedule.rates)
 
     @rates.setter
     def rates(self, _rates):
@@ -380,7 +269,7 @@ class SpikeSourcePoissonVertex(
 
     @property
     def starts(self):
-        return self.__data["starts"]
+        return self.__schedule.split(self.__schedule.starts)
 
     @starts.setter
     def starts(self, _starts):
@@ -390,7 +279,7 @@ class SpikeSourcePoissonVertex(
 
     @property
     def durations(self):
-        return self.__data["durations"]
+        return self.__schedule.split(self.__schedule.durations)
 
     @durations.setter
     def durations(self, _durations):
@@ -400,7 +289,15 @@ class SpikeSourcePoissonVertex(
 
     @property
     def time_to_spike(self):
-        return self.__data["time_to_spike"]
+        return self.__schedule.split(self.__schedule.time_to_spike)
+
+    @property
+    def rate_schedule(self):
+        """ The columnar schedule of rates of the sources
+
+        :rtype: RateSchedule
+        """
+        return self.__schedule
 
     @property
     def rate_change(self):
@@ -452,7 +349,7 @@ class SpikeSourcePoissonVertex(
         :param ~pacman.model.graphs.common.Slice vertex_slice:
         """
         # pylint: disable=arguments-differ
-        poisson_params_sz = get_rates_bytes(vertex_slice, self.__data["rates"])
+        poisson_params_sz = get_rates_bytes(vertex_slice, self.__schedule)
         sdram_sz = get_sdram_edge_params_bytes(vertex_slice)
         other = ConstantSDRAM(
             SYSTEM_BYTES_REQUIREMENT +
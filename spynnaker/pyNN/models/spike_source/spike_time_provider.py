@@ -0,0 +1,251 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_utilities.abstract_base import (
+    AbstractBase, abstractmethod, abstractproperty)
+from spinn_utilities.overrides import overrides
+from spinn_front_end_common.utilities.constants import (
+    MICRO_TO_MILLISECOND_CONVERSION)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utilities.globals_variables import get_simulator
+
+#: The default number of spike times to look at in one go when validating
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class AbstractSpikeTimeProvider(object, metaclass=AbstractBase):
+    """ A source of spike times for a spike source array that can be read\
+        a time window at a time, so that the whole of a long spike train\
+        never has to be held in memory.
+    """
+
+    __slots__ = []
+
+    @abstractproperty
+    def n_neurons(self):
+        """ The number of neurons that spike times are provided for
+
+        :rtype: int
+        """
+
+    @abstractmethod
+    def get_spike_times(self, neuron_id, start_time=None, end_time=None):
+        """ Get the sorted spike times of a neuron in a window of time
+
+        :param int neuron_id: The neuron to get the spike times of
+        :param start_time:
+            The first time to include in ms, or None to start at the beginning
+        :type start_time: float or None
+        :param end_time:
+            The time in ms to stop before, or None to go to the end
+        :type end_time: float or None
+        :rtype: ~numpy.ndarray
+        """
+
+    @abstractmethod
+    def validate(self):
+        """ Check that the spike times can be played back
+
+        :raises ConfigurationException: If any of the spike times are invalid
+        """
+
+
+class SpikeTimeColumns(AbstractSpikeTimeProvider):
+    """ Spike times held in two arrays: the spike times of all the neurons\
+        one after the other, each sorted in time, and the index of the first\
+        spike time of each neuron followed by the total number of spikes.
+
+    The arrays can be memory-mapped from ``.npy`` files with\
+    :py:meth:`from_files`, in which case only the pages that hold the spike\
+    times of the window being played back are ever read.
+    """
+
+    __slots__ = [
+        "__chunk_size",
+        "__offsets",
+        "__times"]
+
+    def __init__(self, offsets, times, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        :param ~numpy.ndarray offsets:
+            The index into times of the first spike of each neuron, followed
+            by the total number of spikes
+        :param ~numpy.ndarray times: The spike times in ms
+        :param int chunk_size:
+            The number of spike times to look at in one go when validating
+        """
+        self.__offsets = offsets
+        self.__times = times
+        self.__chunk_size = chunk_size
+        if len(offsets) < 1 or offsets[0] != 0 or offsets[-1] != len(times):
+            raise ConfigurationException(
+                "The offsets must start at 0 and end at the number of spike "
+                "times ({})".format(len(times)))
+        if numpy.any(numpy.diff(offsets) < 0):
+            raise ConfigurationException("The offsets must not decrease")
+
+    @staticmethod
+    def from_files(offsets_file, times_file, chunk_size=DEFAULT_CHUNK_SIZE):
+        """ Memory-map the spike times from ``.npy`` files
+
+        :param str offsets_file: The file holding the offsets
+        :param str times_file: The file holding the spike times in ms
+        :param int chunk_size:
+            The number of spike times to look at in one go when validating
+        :rtype: SpikeTimeColumns
+        """
+        return SpikeTimeColumns(
+            numpy.load(offsets_file, mmap_mode="r"),
+            numpy.load(times_file, mmap_mode="r"), chunk_size)
+
+    @property
+    @overrides(AbstractSpikeTimeProvider.n_neurons)
+    def n_neurons(self):
+        return len(self.__offsets) - 1
+
+    @property
+    def n_spikes(self):
+        """ The total number of spike times
+
+        :rtype: int
+        """
+        return len(self.__times)
+
+    @overrides(AbstractSpikeTimeProvider.get_spike_times)
+    def get_spike_times(self, neuron_id, start_time=None, end_time=None):
+        times = self.__times[
+            self.__offsets[neuron_id]:self.__offsets[neuron_id + 1]]
+        lo = 0
+        hi = len(times)
+        if start_time is not None:
+            lo = numpy.searchsorted(times, start_time, side="left")
+        if end_time is not None:
+            hi = numpy.searchsorted(times, end_time, side="left")
+        # Copy so that only the window is held once the map is released
+        return numpy.array(times[lo:hi], dtype="float64")
+
+    @overrides(AbstractSpikeTimeProvider.validate)
+    def validate(self):
+        n_times = len(self.__times)
+        for start in range(0, n_times, self.__chunk_size):
+            end = min(start + self.__chunk_size, n_times)
+
+            # Include the last time of the previous chunk, so that the
+            # ordering across the boundary is also checked
+            first = max(start - 1, 0)
+            times = numpy.asarray(self.__times[first:end], dtype="float64")
+            if not numpy.all(numpy.isfinite(times)) or numpy.any(times < 0):
+                raise ConfigurationException(
+                    "Spike times must be finite and not negative")
+
+            # Times may go down only where a new neuron starts
+            decreasing = numpy.flatnonzero(numpy.diff(times) < 0) + first + 1
+            if len(decreasing):
+                starts = numpy.searchsorted(self.__offsets, decreasing)
+                is_start = (
+                    self.__offsets[numpy.minimum(
+                        starts, len(self.__offsets) - 1)] == decreasing)
+                if not numpy.all(is_start):
+                    raise ConfigurationException(
+                        "The spike times of each neuron must be sorted; "
+                        "spike time {} is out of order".format(
+                            decreasing[~is_start][0]))
+
+
+class SpikeTimeProviderTicks(object):
+    """ A read-only view of a spike time provider as one array of time\
+        steps per neuron, as used by a reverse IP tag multicast source to\
+        fill its send buffers.
+
+    The time steps of a neuron are only worked out when they are asked for,\
+    and only those in the window of the current run of the simulation are\
+    read, so the memory used on the host, both to size and to fill the send\
+    buffers, is bounded by the number of spikes in each run rather than the\
+    length of the whole spike train.
+    """
+
+    __slots__ = [
+        "__lo_atom",
+        "__n_atoms",
+        "__provider",
+        "__time_step"]
+
+    def __init__(self, provider, time_step, lo_atom=0, n_atoms=None):
+        """
+        :param AbstractSpikeTimeProvider provider:
+            The provider of the spike times
+        :param int time_step: The time step in microseconds
+        :param int lo_atom: The first neuron in the view
+        :param n_atoms: The number of neurons in the view, or None for all
+        :type n_atoms: int or None
+        """
+        self.__provider = provider
+        self.__time_step = time_step
+        self.__lo_atom = lo_atom
+        self.__n_atoms = n_atoms
+        if n_atoms is None:
+            self.__n_atoms = provider.n_neurons - lo_atom
+
+    @property
+    def provider(self):
+        """ The provider of the spike times
+
+        :rtype: AbstractSpikeTimeProvider
+        """
+        return self.__provider
+
+    def __len__(self):
+        return self.__n_atoms
+
+    def __iter__(self):
+        for neuron_id in range(self.__n_atoms):
+            yield self[neuron_id]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__n_atoms)
+            if step != 1:
+                raise IndexError("Only contiguous slices are supported")
+            return SpikeTimeProviderTicks(
+                self.__provider, self.__time_step, self.__lo_atom + start,
+                max(stop - start, 0))
+        if index < 0:
+            index += self.__n_atoms
+        if not 0 <= index < self.__n_atoms:
+            raise IndexError("Neuron {} is out of range".format(index))
+        # Times are rounded up to time steps, so read a step either side of
+        # the window and keep the time steps that are in it
+        start_time, end_time = get_simulator().run_window
+        step_ms = self.__time_step / MICRO_TO_MILLISECOND_CONVERSION
+        times = self.__provider.get_spike_times(
+            self.__lo_atom + index, start_time=start_time - step_ms,
+            end_time=None if end_time is None else end_time + step_ms)
+        ticks = _as_numpy_ticks(times, self.__time_step)
+        in_window = ticks >= int(round(start_time / step_ms))
+        if end_time is not None:
+            in_window &= ticks < int(round(end_time / step_ms))
+        return ticks[in_window]
+
+
+def _as_numpy_ticks(times, time_step):
+    """ Convert times in ms to time steps, rounding up
+
+    :param times: The times in ms
+    :param int time_step: The time step in microseconds
+    :rtype: ~numpy.ndarray
+    """
+    return numpy.ceil(
+        numpy.floor(numpy.array(times) * 1000.0) / time_step).astype("int64")
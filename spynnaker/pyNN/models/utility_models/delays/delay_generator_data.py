@@ -68,12 +68,8 @@ class DelayGeneratorData(object):
 
         :rtype: int
         """
-        connector = self.__synapse_information.connector
-
-        return (
-            self.BASE_SIZE + connector.gen_connector_params_size_in_bytes +
-            connector.gen_delay_params_size_in_bytes(
-                self.__synapse_information.delays))
+        # The connector parameters can depend on the slices, so are measured
+        return self.gen_data.nbytes
 
     @property
     def gen_data(self):
@@ -17,14 +17,18 @@ from spinn_utilities.socket_address import SocketAddress
 from pacman.model.graphs.application import ApplicationEdge
 from spinn_utilities.config_holder import (get_config_int, get_config_str)
 from spinnman.messages.eieio import EIEIOType
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.globals_variables import get_simulator
 from spinn_front_end_common.utility_models import (
     ReverseIpTagMultiCastSource)
 from spinn_front_end_common.utilities.utility_objs import (
     LivePacketGatherParameters)
 from spynnaker.pyNN.utilities.constants import (
-    LIVE_POISSON_CONTROL_PARTITION_ID, SPIKE_PARTITION_ID)
+    LIVE_POISSON_CONTROL_PARTITION_ID, MEANFIELD_STATE_PARTITION_ID,
+    SPIKE_PARTITION_ID)
 from spynnaker.pyNN.models.populations import Population
+from spynnaker.pyNN.models.neuron.implementations import (
+    MeanfieldImplStandard)
 
 
 class SpynnakerExternalDevicePluginManager(object):
@@ -153,6 +157,92 @@ class SpynnakerExternalDevicePluginManager(object):
                 database_notify_host, database_notify_port_num,
                 database_ack_port_num)
 
+    @staticmethod
+    def activate_live_state_output_for(
+            population, variables=None, interval=1,
+            database_notify_host=None, database_notify_port_num=None,
+            database_ack_port_num=None, port=None, host=None, tag=None,
+            strip_sdp=True, notify=True):
+        """ Output the state of a population of meanfields from SpiNNaker\
+            as the simulation runs.  Each value is sent as the payload of a\
+            packet whose key is the index of the variable times the number\
+            of meanfields plus the index of the meanfield, added to a base\
+            key, which can be received with a\
+            :py:class:`~spynnaker.pyNN.connections.SpynnakerMeanfieldStateConnection`
+
+        :param ~spynnaker.pyNN.models.populations.Population population:
+            The population of meanfields to activate the live output for
+        :param list(str) variables:
+            The variables to send, or None to send all that can be recorded
+        :param int interval: The number of time steps between each value
+        :param str database_notify_host:
+            The hostname for the device which is listening to the database
+            notification.
+        :param int database_notify_port_num:
+            The port number to which a external device will receive the
+            database is ready command
+        :param int database_ack_port_num:
+            The port number to which a external device will acknowledge that
+            they have finished reading the database and are ready for it to
+            start execution
+        :param int port:
+            The UDP port to which the state will be sent. If not specified,
+            the port will be taken from the "live_spike_port" parameter in
+            the "Recording" section of the sPyNNaker configuration file.
+        :param str host:
+            The host name or IP address to which the state will be sent. If
+            not specified, the host will be taken from the "live_spike_host"
+            parameter in the "Recording" section of the sPyNNaker
+            configuration file.
+        :param int tag:
+            The IP tag to be used. If not specified, one will be automatically
+            assigned
+        :param bool strip_sdp:
+            Determines if the SDP headers will be stripped from the
+            transmitted packet.
+        :param bool notify: adds to the notification protocol if set.
+        :raises ConfigurationException:
+            If the population is not made of meanfields whose model can send
+            its state, or the variables or interval are not valid
+        """
+        # pylint: disable=too-many-arguments, protected-access
+        vertex = population._vertex
+        neuron_impl = getattr(vertex, "neuron_impl", None)
+        if not isinstance(neuron_impl, MeanfieldImplStandard):
+            raise ConfigurationException(
+                "The state of {} cannot be sent live as it is not made of "
+                "meanfields".format(population.label))
+        if not neuron_impl.supports_live_output:
+            raise ConfigurationException(
+                "The state of {} cannot be sent live as its model {} does not "
+                "send it".format(population.label, neuron_impl.model_name))
+        recordables = neuron_impl.get_recordable_variables()
+        if variables is None:
+            variables = recordables
+        unknown = set(variables) - set(recordables)
+        if unknown:
+            raise ConfigurationException(
+                "Variables {} cannot be sent live; choose from {}".format(
+                    sorted(unknown), recordables))
+        if interval < 1:
+            raise ConfigurationException("The interval must be at least 1")
+        neuron_impl.set_state_output(variables, interval)
+
+        if port is None:
+            port = get_config_int("Recording", "live_spike_port")
+        if host is None:
+            host = get_config_str("Recording", "live_spike_host")
+        SpynnakerExternalDevicePluginManager.update_live_packet_gather_tracker(
+            vertex, "LiveMeanfieldStateReceiver", port, host, tag, strip_sdp,
+            message_type=EIEIOType.KEY_PAYLOAD_32_BIT,
+            payload_as_time_stamps=False, use_payload_prefix=False,
+            partition_ids=[MEANFIELD_STATE_PARTITION_ID])
+
+        if notify:
+            SpynnakerExternalDevicePluginManager.add_database_socket_address(
+                database_notify_host, database_notify_port_num,
+                database_ack_port_num)
+
     @staticmethod
     def activate_live_output_to(
             population, device, partition_id=SPIKE_PARTITION_ID):
@@ -203,9 +203,8 @@ def write_bitfield_init_data(
         in_edge = proj._projection_edge
         if in_edge not in seen_app_edges:
             seen_app_edges.add(in_edge)
-            for machine_edge in in_edge.machine_edges:
-                if machine_edge.post_vertex.vertex_slice == vertex_slice:
-                    machine_edges.append(machine_edge)
+            machine_edges.extend(
+                in_edge.get_machine_edges_for_post_slice(vertex_slice))
 
     # write n keys max atom map
     spec.write_value(len(machine_edges))
@@ -73,6 +73,12 @@ REWIRING = "rewiring"
 #: The partition ID used for Poisson live control data
 LIVE_POISSON_CONTROL_PARTITION_ID = "CONTROL"
 
+#: The partition ID used for rates sent from meanfields to Poisson sources
+MEANFIELD_RATE_PARTITION_ID = "MEANFIELD_RATE"
+
+#: The partition ID used for meanfield state sent live to the host
+MEANFIELD_STATE_PARTITION_ID = "MEANFIELD_STATE"
+
 #: The maximum row length of the master population table
 POP_TABLE_MAX_ROW_LENGTH = 256
 
@@ -81,3 +87,6 @@ SYNAPSE_SDRAM_PARTITION_ID = "SDRAM Synaptic Inputs"
 
 #: The conservative amount of write bandwidth available on a chip
 WRITE_BANDWIDTH_BYTES_PER_SECOND = 250 * 1024 * 1024
+
+#: The number of CPU cycles in a microsecond on a SpiNNaker core
+CPU_CYCLES_PER_US = 200
@@ -0,0 +1,177 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+from collections import defaultdict
+from spinn_utilities.log import FormatAdapter
+from pacman.model.constraints.placer_constraints import (
+    AbstractPlacerConstraint, ChipAndCoreConstraint)
+from spinn_front_end_common.abstract_models import AbstractChangableAfterRun
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+
+class MappingChangeTracker(object):
+    """ Tracks which application vertices are affected by the changes made\
+        between runs, so that the machine vertices of the rest can be put\
+        back on the cores they were placed on before.
+
+    The application vertices are still all split again, but the splitting\
+    of an unchanged vertex makes the same slices, so keeping the placements\
+    of those slices makes the routes and routing tables of the unchanged\
+    part of the network the same as before.  The placements of a vertex are\
+    only reused if it is split into exactly the same machine vertices as\
+    before, none are reused if the machine no longer has all the cores, and\
+    each set of placements is only used for the mapping that follows the\
+    run it was recorded at.
+    """
+
+    __slots__ = [
+        # The application vertices affected by the changes
+        "__affected_vertices",
+        # The application edges seen when the changes were last recorded
+        "__edges",
+        # app vertex -> (slice, label) -> (x, y, p) of the unaffected vertices
+        "__previous_placements"]
+
+    def __init__(self):
+        self.__affected_vertices = set()
+        self.__edges = set()
+        self.__previous_placements = dict()
+
+    @property
+    def affected_vertices(self):
+        """ The application vertices affected by the recorded changes
+
+        :rtype: set(~pacman.model.graphs.application.ApplicationVertex)
+        """
+        return self.__affected_vertices
+
+    def record_changes(self, app_graph, populations, projections, placements):
+        """ Find the application vertices affected by the changes since the\
+            last run and remember the placements of the others.
+
+        This must be done before the flags saying what has changed are reset.
+
+        :param ~pacman.model.graphs.application.ApplicationGraph app_graph:
+            The application graph of the simulation
+        :param list(~spynnaker.pyNN.models.populations.Population) populations:
+            The populations of the simulation
+        :param list(~spynnaker.pyNN.models.projection.Projection) projections:
+            The projections of the simulation
+        :param placements: The placements of the last run, if any
+        :type placements: ~pacman.model.placements.Placements or None
+        """
+        affected = set()
+        for population in populations:
+            if population.requires_mapping:
+                affected.add(population._vertex)
+        for projection in projections:
+            if projection.requires_mapping:
+                # Both ends of the projection hold its synapses or its keys,
+                # as does the delay extension of the source if there is one
+                edge = projection._projection_edge
+                affected.add(edge.pre_vertex)
+                affected.add(edge.post_vertex)
+                if edge.delay_edge is not None:
+                    affected.add(edge.delay_edge.pre_vertex)
+        for vertex in app_graph.vertices:
+            if (isinstance(vertex, AbstractChangableAfterRun) and
+                    vertex.requires_mapping):
+                affected.add(vertex)
+
+        # Edges added other than by projections, or changed, affect the
+        # vertices at both of their ends too
+        edges = set(app_graph.edges)
+        for edge in edges:
+            if edge not in self.__edges or (
+                    isinstance(edge, AbstractChangableAfterRun) and
+                    edge.requires_mapping):
+                affected.add(edge.pre_vertex)
+                affected.add(edge.post_vertex)
+        self.__edges = edges
+        self.__affected_vertices = affected
+
+        self.__previous_placements = dict()
+        if placements is None:
+            return
+        for placement in placements:
+            vertex = placement.vertex
+            if (vertex.app_vertex is not None and
+                    vertex.app_vertex not in affected):
+                self.__previous_placements.setdefault(
+                    vertex.app_vertex, dict())[self.__key(vertex)] = (
+                        placement.x, placement.y, placement.p)
+
+    def keep_unchanged_placements(self, machine_graph, machine):
+        """ Constrain the machine vertices of the unaffected application\
+            vertices to the cores they were placed on in the last run.
+
+        The placements recorded are forgotten once this is done, so that\
+        they are only used once.
+
+        :param ~pacman.model.graphs.machine.MachineGraph machine_graph:
+            The newly split machine graph
+        :param ~spinn_machine.Machine machine: The machine to be placed on
+        :return: The number of machine vertices constrained
+        :rtype: int
+        """
+        previous_placements = self.__previous_placements
+        self.__previous_placements = dict()
+        if not previous_placements:
+            return 0
+
+        # A machine without all the cores is not the machine that they were
+        # placed on, so everything is placed again
+        for locations in previous_placements.values():
+            for x, y, p in locations.values():
+                chip = machine.get_chip_at(x, y)
+                if chip is None or not chip.is_processor_with_id(p):
+                    logger.info(
+                        "The machine has changed since the last run, so no"
+                        " placements are kept")
+                    return 0
+
+        machine_vertices = defaultdict(list)
+        for vertex in machine_graph.vertices:
+            if vertex.app_vertex is not None:
+                machine_vertices[vertex.app_vertex].append(vertex)
+        n_kept = 0
+        for app_vertex, vertices in machine_vertices.items():
+            # A vertex split differently from before is placed again as a
+            # whole, as is one that has been constrained since
+            locations = previous_placements.get(app_vertex)
+            keys = [self.__key(vertex) for vertex in vertices]
+            if (locations is None or set(keys) != set(locations) or any(
+                    isinstance(constraint, AbstractPlacerConstraint)
+                    for vertex in vertices
+                    for constraint in vertex.constraints)):
+                continue
+            for vertex, key in zip(vertices, keys):
+                vertex.add_constraint(ChipAndCoreConstraint(*locations[key]))
+            n_kept += len(vertices)
+        logger.info(
+            "Keeping the placements of {} of {} machine vertices;"
+            " {} application vertices have changed", n_kept,
+            machine_graph.n_vertices, len(self.__affected_vertices))
+        return n_kept
+
+    @staticmethod
+    def __key(vertex):
+        """
+        :param ~pacman.model.graphs.machine.MachineVertex vertex:
+        :rtype: tuple
+        """
+        return vertex.vertex_slice, vertex.label
@@ -0,0 +1,113 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import ctypes
+import os
+import numpy
+from data_specification.enums.data_type import DataType
+from spynnaker.pyNN import model_binaries
+from spynnaker.pyNN.exceptions import SpynnakerException
+from spynnaker.pyNN.utilities.utility_calls import get_n_bits
+
+#: The host build of the synapse expander, made by
+#: ``make -C neural_modelling/makefiles/synapse_expander host``
+SYNAPSE_EXPANDER_LIBRARY = os.path.join(
+    os.path.dirname(model_binaries.__file__), "synapse_expander_host.so")
+
+# The region of the synaptic matrix in the regions given to the expander
+_SYNAPTIC_MATRIX_REGION = 0
+
+
+class SynapseExpanderEmulator(object):
+    """ Runs the synapse expander on the host, so that the data written for\
+        synapses to be generated on the machine can be expanded and checked\
+        without a board.
+    """
+    __slots__ = ["__run"]
+
+    def __init__(self, library=SYNAPSE_EXPANDER_LIBRARY):
+        """
+        :param str library: The path of the host build of the expander
+        :raises SpynnakerException: If the library has not been built
+        """
+        if not os.path.isfile(library):
+            raise SpynnakerException(
+                "The host build of the synapse expander is not at {}; build"
+                " it with \"make -C neural_modelling/makefiles/"
+                "synapse_expander host\"".format(library))
+        self.__run = ctypes.CDLL(library).synapse_expander_host_run
+        self.__run.argtypes = [
+            ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p]
+        self.__run.restype = ctypes.c_uint32
+
+    @staticmethod
+    def get_params(
+            generator_data, post_vertex_slice, n_synapse_types,
+            weight_scales):
+        """ Get the parameters of the expander, as they are written to the\
+            connection builder region of a core
+
+        :param list(GeneratorData) generator_data:
+            The data of each connector to be generated
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The slice of the post-vertex being generated for
+        :param int n_synapse_types: The number of synapse types
+        :param list(float) weight_scales:
+            The scaling of the weights for each synapse type
+        :rtype: ~numpy.ndarray(~numpy.uint32)
+        """
+        items = [numpy.array([
+            _SYNAPTIC_MATRIX_REGION, len(generator_data),
+            post_vertex_slice.lo_atom, post_vertex_slice.n_atoms,
+            n_synapse_types, get_n_bits(n_synapse_types),
+            get_n_bits(post_vertex_slice.n_atoms)], dtype="uint32")]
+        scales = [DataType.U3232.encode_as_int(min(w, DataType.U3232.max))
+                  for w in weight_scales]
+        items.append(numpy.array(scales, dtype="uint64").view("uint32"))
+        for data in generator_data:
+            items.extend(data.gen_data)
+        return numpy.concatenate(items).astype("uint32")
+
+    def expand(
+            self, generator_data, post_vertex_slice, n_synapse_types,
+            weight_scales, n_synaptic_matrix_words):
+        """ Generate the synaptic matrix of a core
+
+        :param list(GeneratorData) generator_data:
+            The data of each connector to be generated
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+            The slice of the post-vertex being generated for
+        :param int n_synapse_types: The number of synapse types
+        :param list(float) weight_scales:
+            The scaling of the weights for each synapse type
+        :param int n_synaptic_matrix_words:
+            The size of the synaptic matrix region in words
+        :return: The synaptic matrix region after expansion
+        :rtype: ~numpy.ndarray(~numpy.uint32)
+        :raises SpynnakerException:
+            If the expander stops with an error, as it would on the machine
+        """
+        params = self.get_params(
+            generator_data, post_vertex_slice, n_synapse_types,
+            weight_scales)
+        matrix = numpy.zeros(n_synaptic_matrix_words, dtype="uint32")
+        regions = (ctypes.c_void_p * (_SYNAPTIC_MATRIX_REGION + 1))()
+        regions[_SYNAPTIC_MATRIX_REGION] = matrix.ctypes.data
+        error = self.__run(regions, params.ctypes.data)
+        if error:
+            raise SpynnakerException(
+                "The synapse expander stopped with run-time error {}".format(
+                    error))
+        return matrix
@@ -39,7 +39,9 @@ from spynnaker.pyNN.models.utility_models.spike_injector import (
 from spynnaker.pyNN import model_binaries
 from spynnaker.pyNN.connections import (
     EthernetCommandConnection, EthernetControlConnection,
-    SpynnakerLiveSpikesConnection, SpynnakerPoissonControlConnection)
+    SpynnakerAsyncDatabaseConnection, SpynnakerAsyncEthernetControlConnection,
+    SpynnakerAsyncLiveConnection, SpynnakerLiveSpikesConnection,
+    SpynnakerMeanfieldStateConnection, SpynnakerPoissonControlConnection)
 from spynnaker.pyNN.external_devices_models.push_bot.control import (
     PushBotLifEthernet, PushBotLifSpinnakerLink)
 from spynnaker.pyNN.external_devices_models.push_bot.spinnaker_link import (
@@ -63,6 +65,7 @@ from spynnaker.pyNN.models.populations import Population
 add_database_socket_address = Plugins.add_database_socket_address
 activate_live_output_to = Plugins.activate_live_output_to
 activate_live_output_for = Plugins.activate_live_output_for
+activate_live_state_output_for = Plugins.activate_live_state_output_for
 add_poisson_live_rate_control = Plugins.add_poisson_live_rate_control
 
 AbstractSpiNNakerCommon.register_binary_search_path(
@@ -93,11 +96,16 @@ __all__ = [
     "PushBotSpiNNakerLinkSpeakerDevice", "PushBotSpiNNakerLinkRetinaDevice",
 
     # Connections
+    "SpynnakerAsyncDatabaseConnection",
+    "SpynnakerAsyncEthernetControlConnection",
+    "SpynnakerAsyncLiveConnection",
     "SpynnakerLiveSpikesConnection",
+    "SpynnakerMeanfieldStateConnection",
     "SpynnakerPoissonControlConnection",
 
     # Provided functions
     "activate_live_output_for",
+    "activate_live_state_output_for",
     "activate_live_output_to",
     "SpikeInjector",
     "register_database_notification_request",
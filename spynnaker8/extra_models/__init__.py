@@ -33,6 +33,7 @@ from spynnaker.pyNN.models.neuron.builds import (
     MeanfieldBase as Meanfield,
     MeanfieldAndSynBase as MeanfieldSyn)
 from spynnaker.pyNN.models.spike_source import SpikeSourcePoissonVariable
+from spynnaker.pyNN.models.rate_projection import RateProjection
 
 __all__ = [
     # sPyNNaker 8 models
@@ -47,4 +48,7 @@ __all__ = [
     'RecurrentRule', 'Vogels2011Rule',
 
     # Variable rate Poisson
-    'SpikeSourcePoissonVariable']
+    'SpikeSourcePoissonVariable',
+
+    # Poisson rates driven by meanfields
+    'RateProjection']
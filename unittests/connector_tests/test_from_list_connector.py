@@ -13,12 +13,16 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
+import tempfile
 import numpy
 import pytest
 from pacman.model.graphs.common.slice import Slice
 from spynnaker.pyNN.config_setup import unittest_setup
 from spynnaker.pyNN.models.neural_projections.connectors import (
     FromListConnector)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    from_list_connector)
 from spynnaker.pyNN.models.neural_projections import SynapseInformation
 from unittests.mocks import MockPopulation
 
@@ -195,3 +199,224 @@ def test_could_connect():
             else:
                 assert(not connector.could_connect(
                     None, pre_vertex, post_vertex))
+
+
+def test_structured_list():
+    unittest_setup()
+    conn_list = numpy.zeros(4, dtype=[
+        ("source", "uint32"), ("target", "uint32"), ("weight", "float64"),
+        ("delay", "float64"), ("extra", "float64")])
+    conn_list["source"] = [0, 1, 2, 3]
+    conn_list["target"] = [3, 2, 1, 0]
+    conn_list["weight"] = [0.5, 1.5, 2.5, 3.5]
+    conn_list["delay"] = [1, 2, 3, 4]
+    conn_list["extra"] = 7
+    connector = FromListConnector(conn_list)
+    assert connector.get_extra_parameter_names() == ["extra"]
+    assert numpy.array_equal(
+        connector.get_extra_parameters(), [[7], [7], [7], [7]])
+
+    pre_slices = [Slice(0, 1), Slice(2, 3)]
+    post_slices = [Slice(0, 1), Slice(2, 3)]
+    synapse_info = SynapseInformation(
+        connector=None, pre_population=MockPopulation(4, "Pre"),
+        post_population=MockPopulation(4, "Post"), prepop_is_view=False,
+        postpop_is_view=False, rng=None, synapse_dynamics=None,
+        synapse_type=None, is_virtual_machine=False, weights=0, delays=1)
+    block = connector.create_synaptic_block(
+        pre_slices, post_slices, pre_slices[0], post_slices[1], 0,
+        synapse_info)
+    assert numpy.array_equal(block["source"], [0, 1])
+    assert numpy.array_equal(block["target"], [3, 2])
+    assert numpy.array_equal(block["weight"], [0.5, 1.5])
+    assert numpy.array_equal(block["delay"], [1, 2])
+    assert not connector.get_n_connections(
+        pre_slices, post_slices, pre_slices[0].hi_atom,
+        post_slices[0].hi_atom)
+
+
+def _read_varints(data):
+    numbers = list()
+    number = 0
+    shift = 0
+    for byte in data:
+        number |= (int(byte) & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            numbers.append(number)
+            number = 0
+            shift = 0
+    return numbers
+
+
+def _read_gen_block(params, values):
+    """ Read the connections generated on the machine from the connector\
+        parameters of a block
+    """
+    n_rows, pre_lo, has_values, n_bytes = params[:4]
+    numbers = iter(_read_varints(params[4:].view("uint8")[:n_bytes]))
+    connections = list()
+    for row in range(n_rows):
+        target = 0
+        for _ in range(next(numbers)):
+            target += next(numbers)
+            value = values[next(numbers)] if has_values else None
+            connections.append((pre_lo + row, target, value))
+    assert next(numbers, None) is None
+    return connections
+
+
+def _read_s1615(params):
+    assert params[0] == len(params) - 1
+    return params[1:].view("int32") / 32768.0
+
+
+def test_generate_on_machine():
+    unittest_setup()
+    rng = numpy.random.RandomState(42)
+    n_connections = 5000
+    conn_list = numpy.zeros(n_connections, dtype=[
+        ("source", "uint32"), ("target", "uint32"), ("weight", "float64"),
+        ("delay", "float64")])
+    conn_list["source"] = rng.randint(0, 300, n_connections)
+    conn_list["target"] = rng.randint(0, 500, n_connections)
+    conn_list["weight"] = rng.choice([-0.5, 0.25, 1.0], n_connections)
+    conn_list["delay"] = rng.randint(1, 20, n_connections)
+    connector = FromListConnector(conn_list)
+    synapse_info = SynapseInformation(
+        connector=None, pre_population=MockPopulation(300, "Pre"),
+        post_population=MockPopulation(500, "Post"), prepop_is_view=False,
+        postpop_is_view=False, rng=None, synapse_dynamics=None,
+        synapse_type=None, is_virtual_machine=False, weights=0, delays=1)
+    assert connector.generate_on_machine(0, 1)
+
+    # Each block generates the connections of the host block, sorted by
+    # target, with delays that round down to the delays of the host block
+    pre_slices = [Slice(i, min(i + 63, 299)) for i in range(0, 300, 64)]
+    post_slices = [Slice(i, min(i + 99, 499)) for i in range(0, 500, 100)]
+    for post_slice in post_slices:
+        total = 0
+        for pre_slice in pre_slices:
+            params = connector.gen_connector_params(
+                pre_slices, post_slices, pre_slice, post_slice, 0,
+                synapse_info)
+            weight_params = connector.gen_weights_params(
+                0, pre_slice, post_slice)
+            delay_params = connector.gen_delay_params(
+                1, pre_slice, post_slice)
+            weights = _read_s1615(weight_params)
+            delays = _read_s1615(delay_params)
+            # The tables are counted with the connections, apart from the
+            # word holding the size of each
+            total += params.nbytes + (
+                weight_params.nbytes -
+                connector.gen_weight_params_size_in_bytes(0)) + (
+                delay_params.nbytes -
+                connector.gen_delay_params_size_in_bytes(1))
+            generated = [
+                (source, target + post_slice.lo_atom, weights[value],
+                 numpy.floor(delays[value]))
+                for source, target, value in _read_gen_block(
+                    params, range(len(weights)))]
+            block = connector.create_synaptic_block(
+                pre_slices, post_slices, pre_slice, post_slice, 0,
+                synapse_info)
+            block = block[numpy.lexsort((block["target"], block["source"]))]
+            assert generated == [
+                (item["source"], item["target"], item["weight"],
+                 item["delay"]) for item in block]
+        assert total <= connector.gen_connector_params_total_size_in_bytes(
+            synapse_info, len(pre_slices), post_vertex_slice=post_slice)
+
+
+def test_generate_on_machine_values():
+    unittest_setup()
+    rng = numpy.random.RandomState(42)
+    sources = numpy.arange(2000) % 100
+    targets = numpy.arange(2000) // 100
+
+    # Without weights or delays in the list, those of the projection are used
+    connector = FromListConnector(numpy.column_stack((sources, targets)))
+    assert connector.generate_on_machine(0.5, 2.0)
+    assert not connector.generate_on_machine(numpy.ones(2000), 2.0)
+    assert connector.gen_weights_id(0.5) == 0
+    params = connector.gen_connector_params(
+        [Slice(0, 99)], [Slice(0, 19)], Slice(0, 99), Slice(0, 19), 0, None)
+    assert len(_read_gen_block(params, None)) == 2000
+
+    # Weights that are not exact as s1615 values are quantised to s1615 on
+    # the host, and each block has a table of just its own distinct values,
+    # so any number of them can be generated
+    weights = rng.uniform(0, 1, 2000)
+    connector = FromListConnector(numpy.column_stack((
+        sources, targets, weights, numpy.ones(2000))))
+    assert connector.generate_on_machine(0, 1)
+    pre_slices = [Slice(0, 49), Slice(50, 99)]
+    post_slices = [Slice(0, 19)]
+    generated = list()
+    for pre_slice in pre_slices:
+        params = connector.gen_connector_params(
+            pre_slices, post_slices, pre_slice, post_slices[0], 0, None)
+        table = _read_s1615(connector.gen_weights_params(
+            0, pre_slice, post_slices[0]))
+        assert len(table) <= 1000
+        generated.extend(_read_gen_block(params, table))
+    generated.sort()
+    order = numpy.lexsort((targets, sources))
+    assert [(source, target) for source, target, _ in generated] == list(
+        zip(sources[order], targets[order]))
+    assert numpy.array_equal(
+        [weight for _, _, weight in generated],
+        numpy.round(weights[order] * 32768) / 32768)
+
+
+def test_chunked_statistics(monkeypatch):
+    unittest_setup()
+    rng = numpy.random.RandomState(5)
+    n_connections = 1000
+    conn_list = numpy.zeros(n_connections, dtype=[
+        ("source", "uint32"), ("target", "uint32"), ("weight", "float64"),
+        ("delay", "float64"), ("extra", "float64")])
+    conn_list["source"] = rng.randint(0, 50, n_connections)
+    conn_list["target"] = rng.randint(0, 70, n_connections)
+    conn_list["weight"] = rng.uniform(-2, 2, n_connections)
+    conn_list["delay"] = rng.uniform(0.5, 10, n_connections)
+    conn_list["extra"] = 3
+    filename = os.path.join(tempfile.mkdtemp(), "conns.npy")
+    numpy.save(filename, conn_list)
+    synapse_info = SynapseInformation(
+        connector=None, pre_population=MockPopulation(50, "Pre"),
+        post_population=MockPopulation(70, "Post"), prepop_is_view=False,
+        postpop_is_view=False, rng=None, synapse_dynamics=None,
+        synapse_type=None, is_virtual_machine=False, weights=0, delays=1)
+
+    # Memory-mapped lists are read in chunks, so make there be many of them
+    monkeypatch.setattr(from_list_connector, "_SPLIT_CHUNK_SIZE", 7)
+    connector = FromListConnector(numpy.load(filename, mmap_mode="r"))
+    weights = numpy.abs(conn_list["weight"])
+    delays = numpy.rint(conn_list["delay"])
+    assert numpy.isclose(
+        connector.get_weight_mean(0, synapse_info), numpy.mean(weights))
+    assert numpy.isclose(
+        connector.get_weight_variance(0, synapse_info), numpy.var(weights))
+    assert connector.get_weight_maximum(synapse_info) == numpy.max(weights)
+    assert numpy.isclose(
+        connector.get_delay_variance(1, synapse_info), numpy.var(delays))
+    assert connector.get_n_connections_to_post_vertex_maximum(
+        synapse_info) == numpy.max(numpy.bincount(conn_list["target"]))
+    post_slice = Slice(10, 39)
+    in_slice = ((conn_list["target"] >= 10) & (conn_list["target"] <= 39))
+    assert connector.get_n_connections_from_pre_vertex_maximum(
+        post_slice, synapse_info) == numpy.max(numpy.bincount(
+            conn_list["source"][in_slice]))
+    in_delays = in_slice & (delays >= 2) & (delays <= 5)
+    assert connector.get_n_connections_from_pre_vertex_maximum(
+        post_slice, synapse_info, 2, 5) == numpy.max(numpy.bincount(
+            conn_list["source"][in_delays]))
+    assert numpy.array_equal(
+        connector.get_extra_parameters(), numpy.full((n_connections, 1), 3))
+
+    # A differing extra value is found even if it is not in the first chunk
+    conn_list["extra"][500] = 4
+    with pytest.raises(ValueError):
+        FromListConnector(conn_list)
@@ -0,0 +1,160 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+import numpy
+from pyNN.random import NumpyRNG, RandomDistribution
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.extra_algorithms.spynnaker_data_specification_writer \
+    import _SynapticBlockMaker
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    FixedProbabilityConnector)
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from unittests.mocks import MockPopulation
+
+
+SLICE_PAIRS = [
+    (pre, post)
+    for pre in (Slice(0, 9), Slice(10, 19))
+    for post in (Slice(0, 9), Slice(10, 19))]
+
+
+def _make_blocks(connector, synapse_info, slice_pairs):
+    pre_slices = sorted({pre for pre, _ in slice_pairs})
+    post_slices = sorted({post for _, post in slice_pairs})
+    blocks = dict()
+    for pre_slice, post_slice in slice_pairs:
+        blocks[pre_slice, post_slice] = \
+            connector.create_synaptic_block_from_seed(
+                connector.get_slice_seed(synapse_info, pre_slice, post_slice),
+                pre_slices, post_slices, pre_slice, post_slice, 0,
+                synapse_info)
+    return blocks
+
+
+def _make_jobs(connector, synapse_info):
+    pre_slices = sorted({pre for pre, _ in SLICE_PAIRS})
+    post_slices = sorted({post for _, post in SLICE_PAIRS})
+    return [
+        (synapse_info, pre_slices, post_slices, pre, post,
+         connector.get_slice_seed(synapse_info, pre, post))
+        for pre, post in SLICE_PAIRS]
+
+
+def _make_connector():
+    connector = FixedProbabilityConnector(0.5, rng=NumpyRNG(seed=42))
+    weights = RandomDistribution(
+        "uniform", (0.0, 1.0), rng=NumpyRNG(seed=7))
+    synapse_info = SynapseInformation(
+        connector=None, pre_population=MockPopulation(20, "Pre"),
+        post_population=MockPopulation(20, "Post"), prepop_is_view=False,
+        postpop_is_view=False, rng=None, synapse_dynamics=None,
+        synapse_type=None, is_virtual_machine=False, weights=weights,
+        delays=1.0)
+    connector.set_projection_information(synapse_info)
+    return connector, synapse_info
+
+
+def test_slice_seeds_independent_of_order():
+    unittest_setup()
+    slice_pairs = SLICE_PAIRS
+
+    connector, synapse_info = _make_connector()
+    forward = _make_blocks(connector, synapse_info, slice_pairs)
+    connector, synapse_info = _make_connector()
+    backward = _make_blocks(connector, synapse_info, slice_pairs[::-1])
+
+    for pair in slice_pairs:
+        assert numpy.array_equal(forward[pair], backward[pair])
+
+    # Different pairs get different random numbers
+    assert len({connector.get_slice_seed(synapse_info, pre, post)
+                for pre, post in slice_pairs}) == len(slice_pairs)
+
+
+def test_slice_seed_restores_rng():
+    unittest_setup()
+    connector, synapse_info = _make_connector()
+    other, _ = _make_connector()
+    pre_slice = Slice(0, 9)
+    post_slice = Slice(0, 9)
+    connector.use_slice_seed(12345)
+    connector.create_synaptic_block(
+        [pre_slice], [post_slice], pre_slice, post_slice, 0, synapse_info)
+    connector.use_slice_seed(None)
+
+    # The connector carries on from where its own generator was
+    assert numpy.array_equal(
+        connector.create_synaptic_block(
+            [pre_slice], [post_slice], pre_slice, post_slice, 0,
+            synapse_info)["target"],
+        other.create_synaptic_block(
+            [pre_slice], [post_slice], pre_slice, post_slice, 0,
+            synapse_info)["target"])
+
+
+def test_slice_seed_only_in_thread():
+    unittest_setup()
+    connector, synapse_info = _make_connector()
+    other, _ = _make_connector()
+    pre_slice = Slice(0, 9)
+    post_slice = Slice(0, 9)
+    thread = threading.Thread(target=connector.use_slice_seed, args=(12345,))
+    thread.start()
+    thread.join()
+
+    # The seed given in the other thread is not used here
+    assert numpy.array_equal(
+        connector.create_synaptic_block(
+            [pre_slice], [post_slice], pre_slice, post_slice, 0,
+            synapse_info)["target"],
+        other.create_synaptic_block(
+            [pre_slice], [post_slice], pre_slice, post_slice, 0,
+            synapse_info)["target"])
+
+
+def test_block_maker_matches_serial():
+    unittest_setup()
+    connector, synapse_info = _make_connector()
+    expected = _make_blocks(connector, synapse_info, SLICE_PAIRS)
+
+    for n_threads in (1, 3):
+        connector, synapse_info = _make_connector()
+        maker = _SynapticBlockMaker(
+            _make_jobs(connector, synapse_info), n_threads)
+        try:
+            for pre, post in SLICE_PAIRS:
+                assert numpy.array_equal(
+                    synapse_info.pop_precomputed_block(pre, post),
+                    expected[pre, post])
+                # Each block is only given out once
+                assert synapse_info.pop_precomputed_block(pre, post) is None
+        finally:
+            maker.close()
+        assert synapse_info.pop_precomputed_block(*SLICE_PAIRS[0]) is None
+
+
+def test_block_maker_out_of_order():
+    unittest_setup()
+    connector, synapse_info = _make_connector()
+    maker = _SynapticBlockMaker(_make_jobs(connector, synapse_info), 1)
+    try:
+        # Only two blocks are made ahead, so the last is made by the caller,
+        # and the ones expected before it are dropped
+        assert synapse_info.pop_precomputed_block(*SLICE_PAIRS[3]) is None
+        assert synapse_info.pop_precomputed_block(*SLICE_PAIRS[0]) is None
+    finally:
+        maker.close()
@@ -0,0 +1,92 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from pacman.model.constraints.partitioner_constraints import (
+    MaxVertexAtomsConstraint)
+from spinn_front_end_common.utilities.globals_variables import get_simulator
+from spynnaker.pyNN.extra_algorithms import DelayPlanner
+from spynnaker.pyNN.extra_algorithms.splitter_components import (
+    SplitterAbstractPopulationVertexSlice)
+import spynnaker8 as sim
+
+
+def _population(n_neurons, label):
+    population = sim.Population(n_neurons, sim.IF_curr_exp(), label=label)
+    population._vertex.splitter = SplitterAbstractPopulationVertexSlice()
+    return population
+
+
+def test_plan_delays():
+    sim.setup(timestep=1.0)
+    source = sim.Population(10, sim.SpikeSourceArray(), label="source")
+    other = sim.Population(10, sim.SpikeSourceArray(), label="other")
+    tail = _population(50, "tail")
+    big = _population(1000, "big")
+    short = _population(50, "short")
+    sim.Projection(source, tail, sim.FromListConnector(
+        [(0, 0, 1.0, 1.0), (1, 1, 1.0, 60.0)]))
+    sim.Projection(other, big, sim.AllToAllConnector(),
+                   sim.StaticSynapse(delay=20.0))
+    sim.Projection(other, short, sim.AllToAllConnector(),
+                   sim.StaticSynapse(delay=5.0))
+    app_graph = get_simulator().original_application_graph
+
+    plans = {plan.app_vertices[0].label: plan
+             for plan in DelayPlanner().plan(app_graph)}
+    # Populations needing no delay extension are not planned
+    assert sorted(plans) == ["big", "tail"]
+
+    # A delay of 64 covers the one long delay without needing fewer neurons
+    # per core; the default delay would need three stages, two of them empty
+    plan = plans["tail"]
+    assert [option.delay_per_stage for option in plan.options] == [
+        16, 32, 64]
+    default, _, chosen = plan.options
+    assert default.n_delay_stages == 3
+    assert default.n_delayed_rows == 30
+    assert default.n_empty_delayed_rows == 20
+    assert default.n_post_cores + default.n_delay_cores == 2
+    assert plan.chosen == chosen
+    assert chosen.n_delay_cores == 0
+    assert chosen.n_atoms_per_core == [50]
+
+    # A delay of 32 would halve the neurons on each core of a large
+    # population, which costs more than one delay extension core
+    plan = plans["big"]
+    default, longer = plan.options
+    assert longer.n_atoms_per_core == [128]
+    assert longer.n_delay_cores == 0
+    assert plan.chosen == default
+    assert default.n_delay_stages == 1
+
+    for plan in plans.values():
+        DelayPlanner.apply(plan)
+    assert tail._vertex.splitter.max_support_delay() == 64
+    assert big._vertex.splitter.max_support_delay() == 16
+    assert short._vertex.splitter.max_support_delay() == 16
+    assert tail._vertex.splitter.max_delay_atoms_per_core is None
+
+    # A delay that needs fewer neurons per core limits the splitter rather
+    # than the population, so the limit goes when the splitter is reset
+    splitter = big._vertex.splitter
+    DelayPlanner.apply(plans["big"]._replace(chosen=longer))
+    assert splitter.max_support_delay() == 32
+    assert splitter.max_delay_atoms_per_core == 128
+    assert not any(isinstance(constraint, MaxVertexAtomsConstraint)
+                   for constraint in big._vertex.constraints)
+    splitter.reset_called()
+    assert splitter.max_support_delay() == 16
+    assert splitter.max_delay_atoms_per_core is None
+    sim.end()
@@ -0,0 +1,176 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_machine import MulticastRoutingEntry
+from pacman.model.constraints.key_allocator_constraints import (
+    ContiguousKeyRangeContraint, FixedKeyAndMaskConstraint)
+from pacman.model.routing_info import BaseKeyAndMask
+from pacman.model.routing_tables import (
+    MulticastRoutingTables, UnCompressedMulticastRoutingTable)
+from spynnaker.pyNN.extra_algorithms import (
+    KeyGrouper, compress_router_tables, count_key_group_routes)
+from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
+import spynnaker8 as sim
+
+# No unittest_setup as sim.setup must be called before making populations
+
+
+class _MachineVertex(object):
+    def __init__(self, app_vertex, constraints=()):
+        self.app_vertex = app_vertex
+        self.constraints = constraints
+
+
+class _Edge(object):
+    def __init__(self, post_vertex):
+        self.post_vertex = post_vertex
+
+
+class _Partition(object):
+    def __init__(self, pre_vertex, targets, identifier=SPIKE_PARTITION_ID):
+        self.pre_vertex = pre_vertex
+        self.edges = [_Edge(target) for target in targets]
+        self.identifier = identifier
+        self.constraints = ()
+
+
+class _AppGraph(object):
+    def __init__(self, vertices):
+        self.vertices = vertices
+
+
+class _MachineGraph(object):
+    def __init__(self):
+        self.outgoing_edge_partitions = list()
+
+    def add(self, app_vertex, *targets):
+        self.outgoing_edge_partitions.append(
+            _Partition(_MachineVertex(app_vertex), targets))
+
+
+def _vertex(n_neurons, label):
+    return sim.Population(n_neurons, sim.IF_curr_exp(), label=label)._vertex
+
+
+def test_group_small_populations():
+    sim.setup(timestep=1.0)
+    nodes = [_vertex(1, "node{}".format(i)) for i in range(5)]
+    pairs = [_vertex(3, "pair{}".format(i)) for i in range(2)]
+    big = _vertex(100, "big")
+    split = _vertex(10, "split")
+    lonely = _vertex(2, "lonely")
+    target = _MachineVertex(big)
+    other = _MachineVertex(big)
+    machine_graph = _MachineGraph()
+    for vertex in nodes:
+        machine_graph.add(vertex, target, other)
+    for vertex in pairs:
+        machine_graph.add(vertex, target)
+    machine_graph.add(big, target)
+    machine_graph.add(split, target)
+    machine_graph.add(split, other)
+    machine_graph.add(lonely, other)
+    app_graph = _AppGraph(nodes + pairs + [big, split, lonely])
+
+    key_groups = KeyGrouper(16).group(app_graph, machine_graph)
+
+    # The five nodes need a block of 8 keys and the two pairs one of 8, with
+    # the first block at the top of the key space
+    assert [group.members for group in key_groups] == [nodes, pairs]
+    node_group, pair_group = key_groups
+    assert node_group.key == 0xFFFFFFF8
+    assert node_group.mask == 0xFFFFFFF8
+    assert node_group.stride == 1
+    assert pair_group.key == 0xFFFFFFF0
+    assert pair_group.mask == 0xFFFFFFF8
+    assert pair_group.stride == 4
+    for vertex in nodes + pairs:
+        assert vertex.key_group is not None
+    for vertex in [big, split, lonely]:
+        assert vertex.key_group is None
+        constraints = vertex.get_outgoing_partition_constraints(
+            machine_graph.outgoing_edge_partitions[0])
+        assert isinstance(constraints[0], ContiguousKeyRangeContraint)
+
+    [constraint] = pairs[1].get_outgoing_partition_constraints(
+        machine_graph.outgoing_edge_partitions[0])
+    assert isinstance(constraint, FixedKeyAndMaskConstraint)
+    [key_and_mask] = constraint.keys_and_masks
+    assert key_and_mask.key == 0xFFFFFFF4
+    assert key_and_mask.mask == 0xFFFFFFFC
+
+    # Grouping again starts afresh
+    assert KeyGrouper(1).group(app_graph, machine_graph)[0].members == nodes
+    assert pairs[0].key_group is None
+    sim.end()
+
+
+def test_avoid_fixed_keys():
+    sim.setup(timestep=1.0)
+    nodes = [_vertex(1, "node{}".format(i)) for i in range(5)]
+    pairs = [_vertex(3, "pair{}".format(i)) for i in range(2)]
+    target = _MachineVertex(nodes[0])
+    machine_graph = _MachineGraph()
+    for vertex in nodes + pairs:
+        machine_graph.add(vertex, target)
+
+    # A device with a fixed key in the top block moves both blocks down
+    device = _MachineVertex(None, [FixedKeyAndMaskConstraint(
+        [BaseKeyAndMask(0xFFFFFFFA, 0xFFFFFFFE)])])
+    machine_graph.outgoing_edge_partitions.append(
+        _Partition(device, [target]))
+    app_graph = _AppGraph(nodes + pairs)
+    key_groups = KeyGrouper(16).group(app_graph, machine_graph)
+    assert [group.key for group in key_groups] == [0xFFFFFFF0, 0xFFFFFFE8]
+
+    # Keys fixed over the whole key space leave no room for any group
+    device.constraints = [FixedKeyAndMaskConstraint(
+        [BaseKeyAndMask(0, 0)])]
+    assert KeyGrouper(16).group(app_graph, machine_graph) == []
+    for vertex in nodes + pairs:
+        assert vertex.key_group is None
+    sim.end()
+
+
+def test_count_routes():
+    sim.setup(timestep=1.0)
+    nodes = [_vertex(1, "node{}".format(i)) for i in range(4)]
+    target = _MachineVertex(nodes[0])
+    machine_graph = _MachineGraph()
+    for vertex in nodes:
+        machine_graph.add(vertex, target)
+    [key_group] = KeyGrouper(16).group(_AppGraph(nodes), machine_graph)
+
+    # One chip has all the routes the same, which compress to one entry, and
+    # one has a member that goes elsewhere, which the compressor keeps apart
+    # from the default entry that the rest are merged into
+    same = UnCompressedMulticastRoutingTable(0, 0, [
+        MulticastRoutingEntry(key_group.key + i, 0xFFFFFFFF, [1], [], False)
+        for i in range(4)])
+    mixed = UnCompressedMulticastRoutingTable(1, 0, [
+        MulticastRoutingEntry(key_group.key + i, 0xFFFFFFFF, [], [i // 3],
+                              False)
+        for i in range(4)] + [
+        MulticastRoutingEntry(0, 0xFFFFFFF0, [], [0], False)])
+    other = UnCompressedMulticastRoutingTable(2, 0, [
+        MulticastRoutingEntry(0, 0xFFFFFFF0, [], [0], False)])
+    router_tables = MulticastRoutingTables([same, mixed, other])
+    compressed_tables = compress_router_tables(router_tables)
+    assert [len(compressed_tables[x, 0]) for x in range(3)] == [1, 2, 1]
+    routes = count_key_group_routes(
+        key_group, router_tables, compressed_tables)
+    assert [(r.x, r.y, r.n_entries, r.n_entries_compressed)
+            for r in routes] == [(0, 0, 4, 1), (1, 0, 4, 2)]
+    sim.end()
@@ -0,0 +1,144 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Checks that a master population table of 10000 entries sorted and\
+    packed with arrays matches one packed an entry at a time, as the table\
+    used to be packed, and (as an opt-in benchmark) compares the time taken\
+    by each.
+"""
+
+import time
+import numpy
+from pacman.model.routing_info import BaseKeyAndMask
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.master_pop_table import (
+    MasterPopTableAsBinarySearch)
+from unittests.benchmarks import benchmark
+
+N_ENTRIES = 10000
+MASK = 0xFFFFF800
+CORE_MASK = 0x1F
+CORE_SHIFT = 6
+N_NEURONS = 64
+
+
+class _Spec(object):
+    """ Keeps the words written to a data specification
+    """
+
+    def __init__(self):
+        self.words = list()
+
+    def reserve_memory_region(self, region, size, label, reference):
+        pass
+
+    def switch_write_focus(self, region):
+        pass
+
+    def write_value(self, value):
+        self.words.append(numpy.array([value], dtype="uint32"))
+
+    def write_array(self, array):
+        self.words.append(numpy.asarray(array, dtype="uint32"))
+
+
+def _make_adds(rng):
+    """ Make the additions to a table; one or two per key, with some\
+        application entries and some invalid entries
+    """
+    keys = rng.permutation(N_ENTRIES * 4)[:N_ENTRIES] << 11
+    adds = list()
+    for i, key in enumerate(keys):
+        is_app = i % 3 == 0
+        for _ in range(rng.randint(1, 3)):
+            adds.append((
+                int(key), is_app, rng.randint(5) == 0,
+                int(rng.randint(1000)) * 16, int(rng.randint(1, 256))))
+    return adds
+
+
+def _build_table(adds):
+    """ Build the table
+    """
+    table = MasterPopTableAsBinarySearch()
+    table.initialise_table()
+    for key, is_app, is_invalid, address, row_length in adds:
+        key_and_mask = BaseKeyAndMask(key, MASK)
+        if is_app and is_invalid:
+            table.add_invalid_application_entry(
+                key_and_mask, CORE_MASK, CORE_SHIFT, N_NEURONS)
+        elif is_app:
+            table.add_application_entry(
+                address, row_length, key_and_mask, CORE_MASK, CORE_SHIFT,
+                N_NEURONS)
+        elif is_invalid:
+            table.add_invalid_machine_entry(key_and_mask)
+        else:
+            table.add_machine_entry(address, row_length, key_and_mask)
+    spec = _Spec()
+    table.finish_master_pop_table(spec, 0, None)
+    return numpy.concatenate(spec.words)
+
+
+def _build_table_entry_by_entry(adds):
+    """ Build the table by packing each field of each entry in turn
+    """
+    entries = dict()
+    for key, is_app, is_invalid, address, row_length in adds:
+        _, addresses = entries.setdefault(key, (is_app, list()))
+        if is_invalid:
+            addresses.append((0x7FFFFF << 8))
+        else:
+            addresses.append(
+                (row_length - 1) | ((address // 16) << 8))
+    table = list()
+    address_list = list()
+    for key in sorted(entries):
+        is_app, addresses = entries[key]
+        table.extend([key, MASK, len(address_list) | (int(is_app) << 15) |
+                      (len(addresses) << 16)])
+        if is_app:
+            address_list.append(
+                CORE_MASK | (((N_NEURONS + 31) // 32) << 10) |
+                (CORE_SHIFT << 16) | (N_NEURONS << 21))
+        address_list.extend(addresses)
+    words = numpy.array(
+        [len(entries), len(address_list)] + table + address_list,
+        dtype="uint32")
+    return words
+
+
+def test_matches_entry_by_entry():
+    unittest_setup()
+    adds = _make_adds(numpy.random.RandomState(42))
+    assert numpy.array_equal(
+        _build_table(adds), _build_table_entry_by_entry(adds))
+
+
+@benchmark
+def test_build_throughput():
+    unittest_setup()
+    adds = _make_adds(numpy.random.RandomState(42))
+    start = time.perf_counter()
+    expected = _build_table_entry_by_entry(adds)
+    entry_by_entry_time = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = _build_table(adds)
+    table_time = time.perf_counter() - start
+
+    assert numpy.array_equal(actual, expected)
+    print("Built a table of {} entries and {} addresses: {:.4f}s entry by"
+          " entry, {:.4f}s with arrays".format(
+              N_ENTRIES, len(adds), entry_by_entry_time, table_time))
@@ -0,0 +1,89 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from spinn_utilities.config_holder import set_config
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.extra_algorithms.splitter_components import (
+    SplitterAbstractPopulationVertexSlice, SplitterMeanfieldVertexSlice,
+    SpynnakerSplitterSelector)
+from spynnaker.pyNN.models.neuron.implementations import MeanfieldCycleModel
+import spynnaker8 as sim
+from spynnaker8.extra_models import Meanfield
+
+
+def test_fit_cycle_model():
+    model = MeanfieldCycleModel(1000, 300, 11000)
+    assert model.get_n_cpu_cycles(10, 2) == 1000 + 10 * (300 + 2 * 11000)
+    assert model.get_max_units(2, 1000 + 3 * 22300) == 3
+    assert model.get_max_units(2, 1000 + 3 * 22300 - 1) == 2
+    assert model.get_max_units(1, 500) == 0
+
+    n_units = [1, 4, 16, 16, 8]
+    n_steps = [1, 1, 1, 4, 2]
+    n_cycles = [model.get_n_cpu_cycles(n, s)
+                for n, s in zip(n_units, n_steps)]
+    fitted = MeanfieldCycleModel.fit(n_units, n_steps, n_cycles)
+    assert fitted.cycles_per_timestep == pytest.approx(1000, abs=1)
+    assert fitted.cycles_per_unit == pytest.approx(300, abs=1)
+    assert fitted.cycles_per_step == pytest.approx(11000, abs=1)
+    with pytest.raises(ConfigurationException):
+        MeanfieldCycleModel.fit([1, 4, 16], [1, 1, 1], n_cycles[:3])
+
+
+def test_splitter_fits_budget():
+    sim.setup(timestep=1.0)
+    one_step = sim.Population(1000, Meanfield())
+    four_steps = sim.Population(
+        1000, Meanfield(), additional_parameters={"n_steps_per_timestep": 4})
+
+    max_atoms = list()
+    for population in (one_step, four_steps):
+        app_vertex = population._vertex
+        splitter = SplitterMeanfieldVertexSlice(cpu_fraction=0.5)
+        splitter.set_governed_app_vertex(app_vertex)
+        n_atoms = splitter.get_max_atoms_within_budget()
+
+        def cost(n):
+            vertex_slice = Slice(0, n - 1)
+            return (app_vertex.get_common_cpu() +
+                    app_vertex.get_neuron_cpu(vertex_slice) +
+                    app_vertex.get_synapse_cpu(vertex_slice))
+        assert splitter.cycle_budget == 100000
+        assert cost(n_atoms) <= splitter.cycle_budget < cost(n_atoms + 1)
+        max_atoms.append(n_atoms)
+
+    # Four times the transfer functions leaves room for fewer meanfields
+    assert max_atoms[1] < max_atoms[0] / 3
+
+    with pytest.raises(ConfigurationException):
+        SplitterMeanfieldVertexSlice(cpu_fraction=0)
+    sim.end()
+
+
+def test_selector_splits_by_cycles_only_when_asked():
+    sim.setup(timestep=1.0)
+    default = sim.Population(100, Meanfield())._vertex
+    by_cycles = sim.Population(100, Meanfield())._vertex
+
+    # The cycle model is not measured, so it is not used by default
+    SpynnakerSplitterSelector.abstract_pop_heuristic(default)
+    assert type(default.splitter) is SplitterAbstractPopulationVertexSlice
+
+    set_config("Simulation", "split_meanfields_by_cycles", True)
+    SpynnakerSplitterSelector.abstract_pop_heuristic(by_cycles)
+    assert isinstance(by_cycles.splitter, SplitterMeanfieldVertexSlice)
+    sim.end()
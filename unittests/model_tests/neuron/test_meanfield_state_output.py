@@ -0,0 +1,88 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.connections import MeanfieldStateBuffers
+import spynnaker8 as sim
+from spynnaker8.extra_models import Meanfield, MeanfieldSyn
+from spynnaker8.external_devices import activate_live_state_output_for
+
+_BASE_KEY = 0x20000
+
+
+def _events(variable_index, neuron_ids, values, n_neurons):
+    keys = _BASE_KEY + variable_index * n_neurons + numpy.asarray(neuron_ids)
+    payloads = numpy.round(numpy.asarray(values) * 32768).astype(
+        "int32").view("uint32")
+    return keys, payloads
+
+
+def test_ring_buffers():
+    buffers = MeanfieldStateBuffers(4, variables=["Ve", "w"], n_samples=3)
+    assert numpy.all(numpy.isnan(buffers.latest("Ve")))
+
+    # Vi is not kept, so is ignored; w is variable 2
+    buffers.add_events(*_events(0, [0, 1, 2, 3], [1.0, 2.0, 3.0, 4.0], 4))
+    buffers.add_events(*_events(1, [0, 1], [9.0, 9.0], 4))
+    buffers.add_events(*_events(2, [3], [-0.5], 4))
+    assert list(buffers.latest("Ve")) == [1.0, 2.0, 3.0, 4.0]
+    assert list(buffers.n_received("w")) == [0, 0, 0, 1]
+    assert buffers.latest("w")[3] == -0.5
+
+    # Two samples of neuron 0 in one batch go one after the other, and the
+    # oldest drop out of the ring
+    buffers.add_events(*_events(0, [0, 0, 1], [5.0, 6.0, 7.0], 4))
+    buffers.add_events(*_events(0, [0], [8.0], 4))
+    samples, values = buffers.history("Ve")
+    assert list(samples) == [1, 2, 3]
+    assert list(values[:, 0]) == [5.0, 6.0, 8.0]
+    assert values[0, 1] == 7.0 and numpy.all(numpy.isnan(values[1:, 1]))
+    assert list(buffers.latest("Ve")) == [8.0, 7.0, 3.0, 4.0]
+    with pytest.raises(ConfigurationException):
+        MeanfieldStateBuffers(4, variables=["v"])
+
+    # A population with no meanfields has no samples
+    samples, values = MeanfieldStateBuffers(0, variables=["Ve"]).history("Ve")
+    assert len(samples) == 0 and values.shape == (0, 0)
+
+
+def test_activate_live_state_output():
+    sim.setup(timestep=1.0)
+    meanfield = sim.Population(10, Meanfield(), label="meanfield")
+    activate_live_state_output_for(
+        meanfield, variables=["Ve", "w"], interval=10, port=19996,
+        host="localhost", notify=False)
+    neuron_impl = meanfield._vertex.neuron_impl
+    assert list(neuron_impl.get_state_output_data(
+        0x2000, Slice(5, 9), 10)) == [1, 0x2000, 5, 10, 10, 0b101]
+    assert list(neuron_impl.get_state_output_data(
+        None, Slice(5, 9), 10)) == [0] * 6
+
+    lif = sim.Population(10, sim.IF_curr_exp())
+    with pytest.raises(ConfigurationException):
+        activate_live_state_output_for(lif, notify=False)
+    # The binary of this model does not send its state
+    meanfield_syn = sim.Population(10, MeanfieldSyn())
+    with pytest.raises(ConfigurationException):
+        activate_live_state_output_for(meanfield_syn, notify=False)
+    with pytest.raises(ConfigurationException):
+        activate_live_state_output_for(
+            meanfield, variables=["v"], notify=False)
+    with pytest.raises(ConfigurationException):
+        activate_live_state_output_for(meanfield, interval=0, notify=False)
+    sim.end()
@@ -0,0 +1,184 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Checks that plastic rows encoded straight into the row matrix match\
+    those of a row-by-row encoder that concatenates the header, plastic and\
+    fixed-plastic parts of each row as the encoder used to, and (as an\
+    opt-in benchmark) compares their throughput.
+"""
+
+import time
+import numpy
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
+    TimingDependencePfisterSpikeTriplet, TimingDependenceSpikePair)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
+    WeightDependenceAdditive, WeightDependenceAdditiveTriplet)
+from spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis\
+    .elimination import RandomByWeightElimination
+from spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis\
+    .formation import DistanceDependentFormation
+from spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis\
+    .partner_selection import LastNeuronSelection
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsSTDP, SynapseDynamicsStructuralSTDP)
+from spynnaker.pyNN.models.neuron.synapse_io import _get_row_data
+from spynnaker.pyNN.utilities.utility_calls import get_n_bits
+import spynnaker8
+from unittests.benchmarks import benchmark
+
+# No unittest_setup as sim.setup must be called before making the dynamics
+
+PRE_SLICE = Slice(0, 999)
+POST_SLICE = Slice(256, 511)
+N_SYNAPSE_TYPES = 2
+MAX_N_SYNAPSES = 32
+
+N_HEADER_WORDS = 3
+
+
+def _encode_rows_one_by_one(
+        dynamics, connections, row_indices, n_rows, post_slice,
+        n_synapse_types, max_n_synapses, max_row_n_words):
+    """ Encode plastic rows a row at a time.
+    """
+    structure = dynamics.timing_dependence.synaptic_structure
+    n_half_words = structure.get_n_half_words_per_connection()
+    half_word = structure.get_weight_half_word()
+    n_neuron_id_bits = get_n_bits(post_slice.n_atoms)
+    n_synapse_type_bits = get_n_bits(n_synapse_types)
+    order = numpy.argsort(row_indices, kind="stable")
+    splits = numpy.cumsum(numpy.bincount(row_indices, minlength=n_rows))
+    data = numpy.zeros(
+        (n_rows, N_HEADER_WORDS + max_row_n_words), dtype="uint32")
+    for i, row in enumerate(numpy.split(connections[order], splits[:-1])):
+        row = row[:max_n_synapses]
+        plastic = numpy.zeros(len(row) * n_half_words, dtype="uint16")
+        plastic[half_word::n_half_words] = numpy.rint(
+            numpy.abs(row["weight"])).astype("uint16")
+        plastic_plastic = numpy.concatenate((
+            numpy.zeros(dynamics._n_header_bytes, dtype="uint8"),
+            plastic.view("uint8")))
+        plastic_plastic = numpy.concatenate((
+            plastic_plastic,
+            numpy.zeros(-len(plastic_plastic) % 4, dtype="uint8")))
+        fixed = (
+            (row["delay"].astype("uint16") <<
+             (n_neuron_id_bits + n_synapse_type_bits)) |
+            (row["synapse_type"].astype("uint16") << n_neuron_id_bits) |
+            (row["target"].astype("uint16") - post_slice.lo_atom))
+        fixed_plastic = numpy.concatenate((
+            fixed, numpy.zeros(len(fixed) % 2, dtype="uint16")))
+        words = numpy.concatenate((
+            [len(plastic_plastic) // 4], plastic_plastic.view("uint32"),
+            [0, len(fixed)], fixed_plastic.view("uint32")))
+        data[i, :len(words)] = words
+    return data.reshape(-1)
+
+
+def _make_connections(rng):
+    """ Connect about 10% of the pairs, in order of source as the connectors\
+        do; some rows will have more than the maximum number of synapses
+    """
+    sources, targets = numpy.nonzero(
+        rng.rand(PRE_SLICE.n_atoms, POST_SLICE.n_atoms) < 0.1)
+    connections = numpy.zeros(
+        len(sources), dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = sources
+    connections["target"] = targets + POST_SLICE.lo_atom
+    connections["weight"] = rng.randint(1, 1000, len(sources))
+    connections["delay"] = rng.randint(1, 16, len(sources))
+    connections["synapse_type"] = rng.randint(
+        0, N_SYNAPSE_TYPES, len(sources))
+    return connections
+
+
+def _encode(dynamics, connections):
+    """ Encode the rows into the matrix
+    """
+    return _get_row_data(
+        connections, connections["source"], PRE_SLICE.n_atoms, POST_SLICE,
+        N_SYNAPSE_TYPES, dynamics, MAX_N_SYNAPSES,
+        dynamics.get_n_words_for_plastic_connections(MAX_N_SYNAPSES))
+
+
+def _encode_one_by_one(dynamics, connections):
+    """ Encode the rows a row at a time
+    """
+    return _encode_rows_one_by_one(
+        dynamics, connections, connections["source"], PRE_SLICE.n_atoms,
+        POST_SLICE, N_SYNAPSE_TYPES, MAX_N_SYNAPSES,
+        dynamics.get_n_words_for_plastic_connections(MAX_N_SYNAPSES))
+
+
+def _check_encoding(dynamics):
+    rng = numpy.random.RandomState(42)
+    connections = _make_connections(rng)
+    assert numpy.array_equal(
+        _encode(dynamics, connections),
+        _encode_one_by_one(dynamics, connections))
+
+    # Connections out of row order must be encoded the same way
+    shuffled = connections[rng.permutation(len(connections))]
+    assert numpy.array_equal(
+        _encode(dynamics, shuffled), _encode_one_by_one(dynamics, shuffled))
+
+
+def _triplet_stdp():
+    return SynapseDynamicsSTDP(
+        timing_dependence=TimingDependencePfisterSpikeTriplet(
+            tau_plus=16.8, tau_minus=33.7, tau_x=101, tau_y=125,
+            A_plus=0.005, A_minus=0.005),
+        weight_dependence=WeightDependenceAdditiveTriplet())
+
+
+def _structural_stdp():
+    return SynapseDynamicsStructuralSTDP(
+        partner_selection=LastNeuronSelection(),
+        formation=DistanceDependentFormation(),
+        elimination=RandomByWeightElimination(0.5),
+        timing_dependence=TimingDependenceSpikePair(),
+        weight_dependence=WeightDependenceAdditive())
+
+
+def test_plastic_encoding():
+    spynnaker8.setup()
+    _check_encoding(_triplet_stdp())
+    _check_encoding(_structural_stdp())
+    spynnaker8.end()
+
+
+@benchmark
+def test_plastic_encoding_throughput():
+    spynnaker8.setup()
+    connections = _make_connections(numpy.random.RandomState(42))
+    for dynamics, label in (
+            (_triplet_stdp(), "triplet STDP"),
+            (_structural_stdp(), "structural STDP")):
+        start = time.perf_counter()
+        expected = _encode_one_by_one(dynamics, connections)
+        row_by_row_time = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = _encode(dynamics, connections)
+        matrix_time = time.perf_counter() - start
+
+        assert numpy.array_equal(actual, expected)
+        print("Encoded {} {} connections: {:.0f} per second row by row,"
+              " {:.0f} per second into the matrix".format(
+                  len(connections), label, len(connections) / row_by_row_time,
+                  len(connections) / matrix_time))
+    spynnaker8.end()
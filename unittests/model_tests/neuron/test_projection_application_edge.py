@@ -38,3 +38,25 @@ def test_slices():
     post2 = app_edge.post_slices
     assert post1 == post2
     assert id(post1) != id(post2)
+
+
+def test_machine_edges_for_post_slice():
+    unittest_setup()
+    app_edge = ProjectionApplicationEdge(None, None, None)
+    vertices = [
+        SimpleMachineVertex(None, None, None, None, Slice(lo, lo + 1))
+        for lo in range(0, 8, 2)]
+    for pre in vertices:
+        for post in reversed(vertices):
+            app_edge.remember_associated_machine_edge(MachineEdge(pre, post))
+
+    # The index must agree with filtering all the machine edges in order
+    for post in vertices:
+        assert app_edge.get_machine_edges_for_post_slice(
+            post.vertex_slice) == [
+                edge for edge in app_edge.machine_edges
+                if edge.post_vertex.vertex_slice == post.vertex_slice]
+    assert app_edge.get_machine_edges_for_post_slice(Slice(8, 9)) == []
+
+    app_edge.forget_machine_edges()
+    assert app_edge.get_machine_edges_for_post_slice(Slice(0, 1)) == []
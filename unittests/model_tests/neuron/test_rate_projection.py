@@ -0,0 +1,74 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utilities.globals_variables import get_simulator
+from spynnaker.pyNN.utilities.constants import MEANFIELD_RATE_PARTITION_ID
+import spynnaker8 as sim
+from spynnaker8.extra_models import Meanfield, MeanfieldSyn, RateProjection
+
+
+def test_rate_projection():
+    sim.setup(timestep=1.0)
+    meanfield = sim.Population(10, Meanfield(), label="meanfield")
+    poisson = sim.Population(
+        10, sim.SpikeSourcePoisson(rate=0), label="poisson")
+    projection = RateProjection(meanfield, poisson, rate_scale=2.0)
+    assert projection.rate_scale == 2.0
+
+    graph = get_simulator().original_application_graph
+    partition = graph.get_outgoing_edge_partition_starting_at_vertex(
+        meanfield._vertex, MEANFIELD_RATE_PARTITION_ID)
+    assert [edge.post_vertex for edge in partition.edges] == [
+        poisson._vertex]
+
+    # Only the meanfields on a core are sent, starting from the first
+    neuron_impl = meanfield._vertex.neuron_impl
+    assert list(neuron_impl.get_rate_output_data(
+        0x1000, Slice(5, 9))) == [1, 0x1000, 5, 2 << 15]
+    assert list(neuron_impl.get_rate_output_data(
+        None, Slice(5, 9))) == [0, 0, 0, 0]
+
+    # The scale is applied by the meanfields so can't vary by target
+    other = sim.Population(10, sim.SpikeSourcePoisson(rate=0))
+    with pytest.raises(ConfigurationException):
+        RateProjection(meanfield, other, rate_scale=3.0)
+    RateProjection(meanfield, other, rate_scale=2.0)
+    sim.end()
+
+
+def test_bad_rate_projections():
+    sim.setup(timestep=1.0)
+    meanfield = sim.Population(10, Meanfield())
+    meanfield_syn = sim.Population(10, MeanfieldSyn())
+    lif = sim.Population(10, sim.IF_curr_exp())
+    poisson = sim.Population(10, sim.SpikeSourcePoisson(rate=0))
+    small_poisson = sim.Population(5, sim.SpikeSourcePoisson(rate=0))
+    with pytest.raises(ConfigurationException):
+        RateProjection(lif, poisson)
+    # The binary of these meanfields doesn't send rates
+    with pytest.raises(ConfigurationException):
+        RateProjection(meanfield_syn, poisson)
+    with pytest.raises(ConfigurationException):
+        RateProjection(meanfield, lif)
+    with pytest.raises(ConfigurationException):
+        RateProjection(meanfield, small_poisson)
+    with pytest.raises(ConfigurationException):
+        RateProjection(meanfield[0:5], small_poisson)
+    with pytest.raises(ConfigurationException):
+        RateProjection(meanfield, poisson, rate_scale=0)
+    sim.end()
@@ -0,0 +1,122 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from data_specification.enums import DataType
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.spike_source import (
+    SpikeSourcePoissonMachineVertex)
+from spynnaker.pyNN.models.spike_source.rate_schedule import RateSchedule
+import spynnaker8
+
+MAX_TIMESTEP = 0xFFFFFFFF
+
+
+def _encode_source_by_source(rates, starts, durations, first_time_step):
+    """ Encode the rates region one source at a time, with the machine time\
+        step fixed at 1ms and no time to spike
+    """
+    data = list()
+    for r, s, d in zip(rates, starts, durations):
+        s = numpy.round(s).astype("uint32")
+        e = numpy.where(
+            numpy.isnan(d), MAX_TIMESTEP,
+            numpy.round(numpy.nan_to_num(d)).astype("uint32") + s)
+        n = numpy.append(s[1:], MAX_TIMESTEP)
+        spt = numpy.asarray(r) / 1000.0
+        fast = spt >= SpikeSourcePoissonMachineVertex.SLOW_RATE_PER_TICK_CUTOFF
+        faster = (
+            spt >= SpikeSourcePoissonMachineVertex.FAST_RATE_PER_TICK_CUTOFF)
+        exp_minus_lambda = DataType.U032.encode_as_numpy_int_array(
+            numpy.where(fast, numpy.exp(-spt), 0))
+        sqrt_lambda = DataType.S1615.encode_as_numpy_int_array(
+            numpy.where(faster, numpy.sqrt(spt), 0))
+        with numpy.errstate(divide="ignore"):
+            isi = numpy.where((spt > 0) & ~fast, 1.0 / spt, 0).astype(int)
+        index = numpy.argmax(e > first_time_step) if len(r) else 0
+        data.extend([len(r), index])
+        for values in zip(s, e, n, fast, exp_minus_lambda, sqrt_lambda, isi):
+            data.extend(values)
+            data.append(0)
+    return numpy.array(data, dtype="uint32")
+
+
+def test_single_rate_per_source():
+    schedule = RateSchedule.from_parameters(4, rate=[1, 2, 3, 4], start=5)
+    assert list(schedule.offsets) == [0, 1, 2, 3, 4]
+    assert list(schedule.rates) == [1, 2, 3, 4]
+    assert list(schedule.starts) == [5, 5, 5, 5]
+    assert numpy.all(numpy.isnan(schedule.durations))
+
+
+def test_shared_and_per_source_rates():
+    schedule = RateSchedule.from_parameters(
+        3, rates=[10, 20], starts=[0, 100], durations=[100, None])
+    assert list(schedule.offsets) == [0, 2, 4, 6]
+    assert list(schedule.rates) == [10, 20] * 3
+    assert numpy.isnan(schedule.durations[1])
+
+    schedule = RateSchedule.from_parameters(
+        3, rates=[[1], [2, 3], []], starts=[[0], [0, 10], []])
+    assert list(schedule.offsets) == [0, 1, 3, 3]
+    assert schedule.n_rates(Slice(1, 2)) == 2
+    assert list(schedule.get_slice_offsets(Slice(1, 2))) == [0, 2, 2]
+    assert list(schedule.max_rate_per_source()) == [1, 3, 0]
+    assert [list(r) for r in schedule.split(schedule.rates)] == [
+        [1], [2, 3], []]
+
+    schedule = RateSchedule.from_parameters(
+        2, rates=numpy.array([[1, 2], [3, 4]]),
+        starts=numpy.array([[0, 5], [0, 6]]))
+    assert list(schedule.starts) == [0, 5, 0, 6]
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    (dict(rate=1, rates=[1]), "Exactly one of rate and rates"),
+    (dict(), "One of rate or rates"),
+    (dict(rates=[[1], [2]]), "one rate for all neurons or one per neuron"),
+    (dict(rates=[1, 2]), "each must have a start"),
+    (dict(rates=[1, 2], starts=[0]), "Each rate must have a start"),
+    (dict(rates=[1, 2], starts=[0, None]), "Start must not be None"),
+    (dict(rates=[1, 2], starts=[0, 1], durations=[1]),
+     "Each rate must have its own duration")])
+def test_validation(kwargs, message):
+    with pytest.raises(Exception, match=message):
+        RateSchedule.from_parameters(3, **kwargs)
+
+
+def test_encoding_matches_source_by_source():
+    spynnaker8.setup(timestep=1.0)
+    rng = numpy.random.RandomState(42)
+    n_sources = 50
+    rates = [rng.uniform(0, 2000, rng.randint(0, 5))
+             for _ in range(n_sources)]
+    rates[12] = numpy.array([0.0, 5.0, 50.0, 30000.0])
+    starts = [numpy.cumsum(rng.randint(1, 100, len(r))).astype(float)
+              for r in rates]
+    durations = [numpy.where(rng.rand(len(r)) < 0.5, numpy.nan,
+                             rng.randint(1, 50, len(r)))
+                 for r in rates]
+    schedule = RateSchedule.from_parameters(
+        n_sources, rates=rates, starts=starts, durations=durations)
+    vertex_slice = Slice(10, 39)
+    for first_time_step in (0, 150):
+        actual = SpikeSourcePoissonMachineVertex._get_poisson_rates_data(
+            schedule, numpy.zeros(n_sources), vertex_slice, first_time_step)
+        expected = _encode_source_by_source(
+            rates[vertex_slice.as_slice], starts[vertex_slice.as_slice],
+            durations[vertex_slice.as_slice], first_time_step)
+        assert numpy.array_equal(actual, expected)
@@ -0,0 +1,123 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utilities.globals_variables import get_simulator
+from spynnaker.pyNN.models.spike_source import (
+    SpikeSourceArrayVertex, SpikeTimeColumns)
+from spynnaker.pyNN.models.spike_source.spike_time_provider import (
+    SpikeTimeProviderTicks)
+import spynnaker8
+
+
+def _save_columns(tmpdir, spike_times):
+    offsets = numpy.zeros(len(spike_times) + 1, dtype="int64")
+    numpy.cumsum([len(t) for t in spike_times], out=offsets[1:])
+    offsets_file = str(tmpdir.join("offsets.npy"))
+    times_file = str(tmpdir.join("times.npy"))
+    numpy.save(offsets_file, offsets)
+    numpy.save(times_file, numpy.concatenate(spike_times).astype("float64"))
+    return offsets_file, times_file
+
+
+def test_memory_mapped_windows(tmpdir):
+    spike_times = [[1.0, 5.0, 9.0], [], [2.0, 2.0, 30.0, 31.0]]
+    provider = SpikeTimeColumns.from_files(*_save_columns(tmpdir, spike_times))
+    assert provider.n_neurons == 3
+    assert provider.n_spikes == 7
+    provider.validate()
+    assert list(provider.get_spike_times(0)) == [1.0, 5.0, 9.0]
+    assert list(provider.get_spike_times(0, start_time=5.0)) == [5.0, 9.0]
+    assert list(provider.get_spike_times(2, 2.0, 31.0)) == [2.0, 2.0, 30.0]
+    assert len(provider.get_spike_times(1, 0.0, 100.0)) == 0
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+def test_validation_in_chunks(chunk_size):
+    offsets = numpy.array([0, 3, 5])
+    good = numpy.array([1.0, 2.0, 3.0, 0.5, 4.0])
+    SpikeTimeColumns(offsets, good, chunk_size).validate()
+
+    # Out of order within the second neuron, at a chunk boundary or not
+    bad = numpy.array([1.0, 2.0, 3.0, 4.0, 0.5])
+    with pytest.raises(ConfigurationException):
+        SpikeTimeColumns(offsets, bad, chunk_size).validate()
+    negative = numpy.array([1.0, 2.0, 3.0, -1.0, 4.0])
+    with pytest.raises(ConfigurationException):
+        SpikeTimeColumns(offsets, negative, chunk_size).validate()
+    with pytest.raises(ConfigurationException):
+        SpikeTimeColumns(numpy.array([0, 3, 4]), good, chunk_size)
+
+
+def test_ticks_view():
+    spynnaker8.setup(timestep=1.0)
+    spike_times = [[0.5, 2.0], [3.0], [], [4.0, 7.25]]
+    offsets = numpy.array([0, 2, 3, 3, 5])
+    provider = SpikeTimeColumns(offsets, numpy.concatenate(spike_times))
+    ticks = SpikeTimeProviderTicks(provider, 1000)
+    assert len(ticks) == 4
+    assert [list(t) for t in ticks] == [[1, 2], [3], [], [4, 8]]
+
+    # Slices are views of the same provider
+    sub = ticks[1:3]
+    assert len(sub) == 2
+    assert [list(t) for t in sub] == [[3], []]
+    assert list(ticks[-1]) == [4, 8]
+    spynnaker8.end()
+
+
+def test_ticks_view_window(monkeypatch):
+    spynnaker8.setup(timestep=1.0)
+    spike_times = [[0.5, 1.5, 2.0, 5.5, 6.0], [3.0, 9.0]]
+    offsets = numpy.array([0, 5, 7])
+    provider = SpikeTimeColumns(offsets, numpy.concatenate(spike_times))
+    ticks = SpikeTimeProviderTicks(provider, 1000)
+
+    # Only the spikes in the window of the run are read; those rounded up
+    # to the first time step of a run are sent in that run
+    simulator_class = type(get_simulator())
+    monkeypatch.setattr(
+        simulator_class, "run_window", property(lambda self: (2.0, 6.0)))
+    assert [list(t) for t in ticks] == [[2, 2], [3]]
+    monkeypatch.setattr(
+        simulator_class, "run_window", property(lambda self: (6.0, None)))
+    assert [list(t) for t in ticks] == [[6, 6], [9]]
+    spynnaker8.end()
+
+
+def test_vertex_with_provider():
+    spynnaker8.setup(timestep=1.0)
+    provider = SpikeTimeColumns(
+        numpy.array([0, 2, 3]), numpy.array([1.0, 2.0, 3.0]))
+    vertex = SpikeSourceArrayVertex(
+        n_neurons=2, spike_times=provider, constraints=None, label="test",
+        max_atoms_per_core=None, model=None, splitter=None)
+    assert vertex.spike_times is provider
+    assert [list(t) for t in vertex.send_buffer_times] == [[1, 2], [3]]
+    with pytest.raises(ConfigurationException):
+        vertex.set_value_by_selector([1], "spike_times", [1, 2])
+
+    # The provider must have times for each neuron
+    with pytest.raises(ConfigurationException):
+        SpikeSourceArrayVertex(
+            n_neurons=3, spike_times=provider, constraints=None,
+            label="test", max_atoms_per_core=None, model=None, splitter=None)
+
+    # Lists can still be set afterwards
+    vertex.spike_times = [[1], [2, 3]]
+    assert vertex.spike_times == [[1], [2, 3]]
+    spynnaker8.end()
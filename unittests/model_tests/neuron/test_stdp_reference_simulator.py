@@ -0,0 +1,301 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spynnaker.pyNN.exceptions import SynapticConfigurationException
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.common import (
+    STDP_FIXED_POINT_ONE, float_to_fixed, get_exp_dist_lut_array,
+    get_exp_lut_array)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.stdp_reference_simulator \
+    import STDPReferenceSimulator
+from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
+    TimingDependencePfisterSpikeTriplet, TimingDependenceRecurrent,
+    TimingDependenceSpikeNearestPair, TimingDependenceSpikePair,
+    TimingDependenceVogels2011)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
+    WeightDependenceAdditive, WeightDependenceAdditiveTriplet,
+    WeightDependenceMultiplicative)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import SynapseDynamicsSTDP
+import spynnaker8
+
+# No unittest_setup as sim.setup must be called before making the dynamics
+
+RING_BUFFER_SHIFT = 6
+WEIGHT_SCALE = 2.0 ** (16 - (RING_BUFFER_SHIFT + 1))
+
+# The initial weight of the hand-worked synapses, in fixed point
+WEIGHT = int(0.5 * WEIGHT_SCALE)
+A_PLUS = int(round(0.05 * WEIGHT_SCALE))
+A_MINUS = int(round(0.06 * WEIGHT_SCALE))
+
+
+def _lut(tau, shift=0):
+    return get_exp_lut_array(1.0, tau, shift).view("uint16")[2:].astype(
+        "int64")
+
+
+def _connections(sources, targets, weights, delays):
+    connections = numpy.zeros(
+        len(sources), dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = sources
+    connections["target"] = targets
+    connections["weight"] = weights
+    connections["delay"] = delays
+    return connections
+
+
+def _check_pair(backprop_delay):
+    dynamics = SynapseDynamicsSTDP(
+        timing_dependence=TimingDependenceSpikePair(
+            tau_plus=16.7, tau_minus=33.7, A_plus=0.05, A_minus=0.06),
+        weight_dependence=WeightDependenceAdditive(w_min=0.0, w_max=1.0),
+        backprop_delay=backprop_delay)
+    simulator = STDPReferenceSimulator(dynamics, [RING_BUFFER_SHIFT])
+    connections = _connections([0], [0], [0.5], [2.0])
+    learned = simulator.run(connections, [[10.0, 30.0]], [[15.0]])
+
+    # The first presynaptic spike has no postsynaptic spike before it; the
+    # second sees the postsynaptic spike delayed by the dendritic delay,
+    # and the traces after a single spike are exactly one
+    delay = 2 if backprop_delay else 0
+    potentiation = _lut(16.7)[15 + delay - 10]
+    depression = _lut(33.7)[30 - (15 + delay)]
+    a_plus = int(round(0.05 * WEIGHT_SCALE))
+    a_minus = int(round(0.06 * WEIGHT_SCALE))
+    expected = (int(0.5 * WEIGHT_SCALE) + ((potentiation * a_plus) >> 11) -
+                ((depression * a_minus) >> 11))
+    assert learned["weight"][0] == expected / WEIGHT_SCALE
+    assert connections["weight"][0] == 0.5
+
+
+def _learn(timing_dependence, weight_dependence, pre_times, post_times,
+           weight=0.5, seed=None):
+    """ Learn the weight of one synapse with no dendritic delay, in the\
+        fixed-point units of the machine
+    """
+    simulator = STDPReferenceSimulator(SynapseDynamicsSTDP(
+        timing_dependence=timing_dependence,
+        weight_dependence=weight_dependence, backprop_delay=False),
+        [RING_BUFFER_SHIFT], seed=seed)
+    learned = simulator.run(
+        _connections([0], [0], [weight], [1.0]), [pre_times], [post_times])
+    return learned["weight"][0] * WEIGHT_SCALE
+
+
+def _random_network(rng, n_pre, n_post, n_steps, rate):
+    sources, targets = numpy.nonzero(rng.rand(n_pre, n_post) < 0.5)
+    connections = _connections(
+        sources, targets, rng.uniform(0.1, 0.9, len(sources)),
+        rng.randint(1, 16, len(sources)))
+    pre_spikes = [numpy.nonzero(rng.rand(n_steps) < rate)[0]
+                  for _ in range(n_pre)]
+    post_spikes = [numpy.nonzero(rng.rand(n_steps) < rate)[0]
+                   for _ in range(n_post)]
+    return connections, pre_spikes, post_spikes
+
+
+def test_spike_pair():
+    spynnaker8.setup(timestep=1.0)
+    _check_pair(backprop_delay=True)
+    _check_pair(backprop_delay=False)
+    spynnaker8.end()
+
+
+def test_nearest_pair():
+    spynnaker8.setup(timestep=1.0)
+    learned = _learn(
+        TimingDependenceSpikeNearestPair(
+            tau_plus=16.7, tau_minus=33.7, A_plus=0.05, A_minus=0.06),
+        WeightDependenceAdditive(w_min=0.0, w_max=1.0),
+        [10.0, 30.0], [15.0, 18.0])
+
+    # Only the postsynaptic spike at 15 is the first after the presynaptic
+    # spike at 10, and the one at 30 is depressed by the nearest, at 18
+    assert learned == (WEIGHT + ((_lut(16.7)[5] * A_PLUS) >> 11) -
+                       ((_lut(33.7)[12] * A_MINUS) >> 11))
+    spynnaker8.end()
+
+
+def test_negative_weight():
+    spynnaker8.setup(timestep=1.0)
+    timing = TimingDependenceSpikeNearestPair(
+        tau_plus=16.7, tau_minus=33.7, A_plus=0.05, A_minus=0.06)
+    weights = WeightDependenceAdditive(w_min=0.0, w_max=1.0)
+
+    # The rule changes the magnitude of the weight, which keeps its sign
+    learned = _learn(timing, weights, [10.0, 30.0], [15.0, 18.0])
+    assert learned != WEIGHT
+    assert _learn(timing, weights, [10.0, 30.0], [15.0, 18.0],
+                  weight=-0.5) == -learned
+    spynnaker8.end()
+
+
+def test_pfister_triplet():
+    spynnaker8.setup(timestep=1.0)
+    learned = _learn(
+        TimingDependencePfisterSpikeTriplet(
+            tau_plus=16.8, tau_minus=33.7, tau_x=101, tau_y=125,
+            A_plus=0.05, A_minus=0.06),
+        WeightDependenceAdditiveTriplet(
+            w_min=0.0, w_max=1.0, A3_plus=0.1, A3_minus=0.02),
+        [10.0, 30.0], [15.0, 20.0])
+
+    # The slow traces are sampled before each spike and decay in steps of 4
+    # time steps, so the first spikes leave them at zero
+    plus, minus, x, y = (
+        _lut(16.8), _lut(33.7), _lut(101, 2), _lut(125, 2))
+    post_y_at_20 = y[5 >> 2]
+    pre_x_at_30 = x[20 >> 2]
+    post_trace_at_20 = minus[5] + STDP_FIXED_POINT_ONE
+    potentiation = plus[5] + plus[10]
+    potentiation_3 = (plus[10] * post_y_at_20) >> 11
+    depression = (post_trace_at_20 * minus[10]) >> 11
+    depression_3 = (depression * pre_x_at_30) >> 11
+    a3_plus = int(round(0.1 * WEIGHT_SCALE))
+    a3_minus = int(round(0.02 * WEIGHT_SCALE))
+    assert learned == (
+        WEIGHT + ((potentiation * A_PLUS) >> 11) -
+        ((depression * A_MINUS) >> 11) +
+        ((potentiation_3 * a3_plus) >> 11) -
+        ((depression_3 * a3_minus) >> 11))
+    spynnaker8.end()
+
+
+def test_additive_triplet_limit():
+    spynnaker8.setup(timestep=1.0)
+
+    # Only potentiation, which takes the weight past the maximum
+    learned = _learn(
+        TimingDependencePfisterSpikeTriplet(
+            tau_plus=16.8, tau_minus=33.7, tau_x=101, tau_y=125,
+            A_plus=0.05, A_minus=0.0),
+        WeightDependenceAdditiveTriplet(
+            w_min=0.0, w_max=1.0, A3_plus=0.1, A3_minus=0.0),
+        [10.0, 30.0], [15.0, 20.0], weight=0.99)
+    assert learned == WEIGHT_SCALE
+    spynnaker8.end()
+
+
+def test_vogels_2011():
+    spynnaker8.setup(timestep=1.0)
+    learned = _learn(
+        TimingDependenceVogels2011(
+            alpha=0.12, tau=20.0, A_plus=0.05, A_minus=0.05),
+        WeightDependenceAdditive(w_min=0.0, w_max=1.0),
+        [10.0, 30.0], [15.0])
+
+    # Both orders of spikes potentiate, and the presynaptic spike that
+    # follows a postsynaptic one takes alpha off
+    tau = _lut(20.0)
+    assert learned == WEIGHT + (
+        ((tau[5] + tau[15] - float_to_fixed(0.12)) * A_PLUS) >> 11)
+    spynnaker8.end()
+
+
+def _learn_recurrent(seed):
+    return _learn(
+        TimingDependenceRecurrent(
+            accumulator_depression=-1, accumulator_potentiation=1,
+            mean_pre_window=35.0, mean_post_window=35.0, dual_fsm=True,
+            A_plus=0.05, A_minus=0.06),
+        WeightDependenceAdditive(w_min=0.0, w_max=1.0),
+        [10.0, 30.0], [15.0], seed=seed)
+
+
+def _recurrent_windows(seed):
+    """ Draw the windows of the postsynaptic spike and then the first\
+        presynaptic spike, as the simulator does
+    """
+    rng = numpy.random.RandomState(seed)
+    windows = get_exp_dist_lut_array(35.0)
+    return [windows[rng.randint(0, STDP_FIXED_POINT_ONE, 1)][0]
+            for _ in range(2)]
+
+
+def test_recurrent():
+    spynnaker8.setup(timestep=1.0)
+
+    # With accumulators of one, a pairing inside its window changes the
+    # weight straight away; the pairings are 5 and 15 time steps apart
+    post_window, pre_window = _recurrent_windows(3)
+    assert post_window > 15 and pre_window > 5
+    assert _learn_recurrent(3) == WEIGHT + A_PLUS - A_MINUS
+
+    # Windows too short for either pairing leave the weight alone
+    post_window, pre_window = _recurrent_windows(13)
+    assert post_window <= 15 and pre_window <= 5
+    assert _learn_recurrent(13) == WEIGHT
+    spynnaker8.end()
+
+
+def test_multiplicative():
+    spynnaker8.setup(timestep=1.0)
+    learned = _learn(
+        TimingDependenceSpikePair(
+            tau_plus=16.7, tau_minus=33.7, A_plus=0.05, A_minus=0.06),
+        WeightDependenceMultiplicative(w_min=0.1, w_max=0.9),
+        [10.0, 30.0], [15.0])
+
+    # Each change is scaled by the distance to the limit it moves towards,
+    # from the weight left by the change before
+    w_min = int(round(0.1 * WEIGHT_SCALE))
+    w_max = int(round(0.9 * WEIGHT_SCALE))
+    shift = 16 - (RING_BUFFER_SHIFT + 1)
+    weight = WEIGHT + (
+        (((w_max - WEIGHT) * A_PLUS) >> shift) * _lut(16.7)[5] >> 11)
+    weight -= (((weight - w_min) * A_MINUS) >> shift) * _lut(33.7)[15] >> 11
+    assert learned == weight
+    spynnaker8.end()
+
+
+def test_independent_synapses():
+    spynnaker8.setup(timestep=1.0)
+    rng = numpy.random.RandomState(42)
+    connections, pre_spikes, post_spikes = _random_network(
+        rng, 1000, 500, 1000, 0.02)
+    simulator = STDPReferenceSimulator(SynapseDynamicsSTDP(
+        timing_dependence=TimingDependenceSpikePair(
+            tau_plus=16.7, tau_minus=33.7, A_plus=0.005, A_minus=0.006),
+        weight_dependence=WeightDependenceMultiplicative(
+            w_min=0.1, w_max=0.9)), [RING_BUFFER_SHIFT])
+
+    learned = simulator.run(connections, pre_spikes, post_spikes)
+
+    # Every synapse is learned independently of the others
+    shuffle = rng.permutation(len(connections))
+    assert numpy.array_equal(
+        simulator.run(connections[shuffle], pre_spikes, post_spikes),
+        learned[shuffle])
+    assert numpy.all(learned["weight"] >= 0.1 - 1.0 / WEIGHT_SCALE)
+    assert numpy.all(learned["weight"] <= 0.9 + 1.0 / WEIGHT_SCALE)
+    assert numpy.count_nonzero(learned["weight"] != numpy.rint(
+        connections["weight"] * WEIGHT_SCALE) / WEIGHT_SCALE) > 0
+
+    spynnaker8.end()
+
+
+def test_mismatched_terms():
+    spynnaker8.setup(timestep=1.0)
+    with pytest.raises(SynapticConfigurationException):
+        STDPReferenceSimulator(SynapseDynamicsSTDP(
+            timing_dependence=TimingDependencePfisterSpikeTriplet(
+                tau_plus=16.8, tau_minus=33.7, tau_x=101, tau_y=125,
+                A_plus=0.005, A_minus=0.005),
+            weight_dependence=WeightDependenceAdditive()),
+            [RING_BUFFER_SHIFT])
+    spynnaker8.end()
@@ -0,0 +1,332 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Checks the synapses generated by the host build of the synapse expander\
+    against those generated on the host, and against the numbers of synapses\
+    that each connector must make, and (as an opt-in benchmark) measures the\
+    rate at which each connector generates synapses.
+"""
+
+import os
+import time
+import numpy
+import pytest
+from pyNN.random import NumpyRNG
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.exceptions import SpynnakerException
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AllToAllConnector, FixedNumberPreConnector, FixedProbabilityConnector,
+    FromListConnector, OneToOneConnector)
+from spynnaker.pyNN.models.neuron.generator_data import (
+    GeneratorData, SYN_REGION_UNUSED)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic)
+from spynnaker.pyNN.models.neuron.synapse_io import (
+    get_max_row_info, get_synapses)
+from spynnaker.pyNN.utilities.synapse_expander_emulator import (
+    SYNAPSE_EXPANDER_LIBRARY, SynapseExpanderEmulator)
+from unittests.benchmarks import benchmark
+from unittests.mocks import MockPopulation
+import spynnaker8
+
+# No unittest_setup as sim.setup must be called before SynapseDynamicsStatic
+
+N_SYNAPSE_TYPES = 2
+WEIGHT_SCALES = [256.0, 256.0]
+MAX_DELAY = 16
+N_HEADER_WORDS = 3
+
+requires_library = pytest.mark.skipif(
+    not os.path.isfile(SYNAPSE_EXPANDER_LIBRARY),
+    reason="the host build of the synapse expander has not been made")
+
+
+class _Splitter(object):
+    def max_support_delay(self):
+        return MAX_DELAY
+
+
+class _Vertex(object):
+    splitter = _Splitter()
+
+
+class _Edge(object):
+    pre_vertex = _Vertex()
+    post_vertex = _Vertex()
+
+
+class _BadGeneratorData(object):
+    """ Generator data asking for a matrix generator that doesn't exist
+    """
+    def __init__(self, data):
+        self.__data = data
+
+    @property
+    def gen_data(self):
+        items = self.__data.gen_data
+        items[0][12] = 100
+        return items
+
+
+def _synapse_info(connector, n_pre, n_post, weights, delays):
+    synapse_info = SynapseInformation(
+        connector=connector, pre_population=MockPopulation(n_pre, "Pre"),
+        post_population=MockPopulation(n_post, "Post"), prepop_is_view=False,
+        postpop_is_view=False, rng=None,
+        synapse_dynamics=SynapseDynamicsStatic(), synapse_type=1,
+        is_virtual_machine=False, weights=weights, delays=delays)
+    connector.set_projection_information(synapse_info)
+    return synapse_info
+
+
+def _expand(emulator, synapse_info, pre_slice, post_slice):
+    """ Expand the synapses of a single connector on the emulator
+
+    :return: the rows and the maximum row information
+    """
+    max_row_info = get_max_row_info(synapse_info, post_slice, 0, _Edge())
+    data = GeneratorData(
+        0, SYN_REGION_UNUSED, max_row_info.undelayed_max_words, 0,
+        max_row_info.undelayed_max_n_synapses, 0, [pre_slice], [post_slice],
+        pre_slice, post_slice, synapse_info, 1, MAX_DELAY)
+    n_words = pre_slice.n_atoms * (
+        max_row_info.undelayed_max_words + N_HEADER_WORDS)
+    rows = emulator.expand(
+        [data], post_slice, N_SYNAPSE_TYPES, WEIGHT_SCALES, n_words)
+    return rows, max_row_info
+
+
+def _check_same_as_host(
+        connector, n_pre, n_post, weight=0.5, host_connector=None):
+    """ Check that the emulator expands the connector as the host does, or\
+        as the host does another connector if given
+    """
+    synapse_info = _synapse_info(connector, n_pre, n_post, weight, 3.0)
+    pre_slice = Slice(0, n_pre - 1)
+    post_slice = Slice(0, n_post - 1)
+    expanded, max_row_info = _expand(
+        SynapseExpanderEmulator(), synapse_info, pre_slice, post_slice)
+    if host_connector is not None:
+        synapse_info = _synapse_info(
+            host_connector, n_pre, n_post, weight, 3.0)
+    connections = synapse_info.connector.create_synaptic_block(
+        [pre_slice], [post_slice], pre_slice, post_slice, 1, synapse_info)
+    rows, _, _, _ = get_synapses(
+        connections, synapse_info, 0, N_SYNAPSE_TYPES, WEIGHT_SCALES,
+        _Edge(), pre_slice, post_slice, max_row_info, True, False)
+    assert numpy.array_equal(expanded, rows)
+
+
+def _from_list(n_pre, n_post, n_connections, weights=(0.25, 0.5, 1.0)):
+    """ A list of connections in order of source and target, with weights\
+        chosen from those given and delays of whole time steps
+    """
+    rng = numpy.random.RandomState(42)
+    pairs = numpy.unique(rng.randint(0, n_pre * n_post, n_connections))
+    sources, targets = numpy.divmod(pairs, n_post)
+    return FromListConnector(numpy.column_stack((
+        sources, targets, rng.choice(weights, len(pairs)),
+        rng.randint(1, MAX_DELAY, len(pairs)))))
+
+
+def _n_synapses(rows, max_row_info):
+    rows = rows.reshape(-1, max_row_info.undelayed_max_words + N_HEADER_WORDS)
+    return rows[:, 1]
+
+
+def _targets(rows, max_row_info, n_post):
+    """ The post-neuron of each synapse, from the bottom bits of its word
+    """
+    n_synapses = _n_synapses(rows, max_row_info)
+    rows = rows.reshape(len(n_synapses), -1)
+    words = numpy.concatenate([
+        row[N_HEADER_WORDS:N_HEADER_WORDS + n]
+        for row, n in zip(rows, n_synapses)])
+    return words & ((1 << int(n_post - 1).bit_length()) - 1)
+
+
+@requires_library
+def test_same_as_host():
+    spynnaker8.setup(timestep=1.0)
+    _check_same_as_host(AllToAllConnector(), 100, 50)
+    _check_same_as_host(OneToOneConnector(), 100, 100)
+    _check_same_as_host(_from_list(100, 50, 1000), 100, 50)
+    spynnaker8.end()
+
+
+@requires_library
+def test_rounded_weights():
+    spynnaker8.setup(timestep=1.0)
+
+    # Weights that don't scale to whole numbers round as on the host; 0.3
+    # scales to 76.8, which would be 76 if the fraction were dropped
+    _check_same_as_host(AllToAllConnector(), 100, 50, weight=0.3)
+    _check_same_as_host(OneToOneConnector(), 100, 100, weight=0.123456)
+
+    # List weights are exact as s1615 values, but not once scaled; these
+    # include ones that are half way between two scaled weights
+    rng = numpy.random.RandomState(7)
+    weights = numpy.concatenate((
+        rng.randint(0, 32768, 50), [64, 192, 320])) / 32768
+    connector = _from_list(100, 50, 1000, weights)
+    assert connector.generate_on_machine(0.5, 3.0)
+    _check_same_as_host(connector, 100, 50)
+
+    # Other list weights are quantised to s1615 on the host, and then round
+    # as the host rounds the quantised weights
+    weights = rng.uniform(0, 1, 50)
+    connector = _from_list(100, 50, 1000, weights)
+    assert connector.generate_on_machine(0.5, 3.0)
+    _check_same_as_host(connector, 100, 50, host_connector=_from_list(
+        100, 50, 1000, numpy.round(weights * 32768) / 32768))
+    spynnaker8.end()
+
+
+@requires_library
+def test_saturated_weights():
+    spynnaker8.setup(timestep=1.0)
+
+    # Weights that scale to more than the largest weight saturate as on the
+    # host, rather than wrapping around to small weights
+    for weight in (255.999, 300.0):
+        _check_same_as_host(AllToAllConnector(), 10, 10, weight=weight)
+        synapse_info = _synapse_info(AllToAllConnector(), 10, 10, weight, 3.0)
+        rows, max_row_info = _expand(
+            SynapseExpanderEmulator(), synapse_info, Slice(0, 9), Slice(0, 9))
+        rows = rows.reshape(10, -1)
+        assert numpy.all(rows[:, N_HEADER_WORDS:N_HEADER_WORDS + 10] >> 16 ==
+                         0xFFFF)
+    spynnaker8.end()
+
+
+@requires_library
+def test_fixed_number_pre():
+    spynnaker8.setup(timestep=1.0)
+    synapse_info = _synapse_info(
+        FixedNumberPreConnector(20, rng=NumpyRNG(seed=42)), 100, 50, 0.5, 3.0)
+    rows, max_row_info = _expand(
+        SynapseExpanderEmulator(), synapse_info, Slice(0, 99), Slice(0, 49))
+
+    # Every post-neuron gets exactly the number of pre-neurons asked for
+    targets = _targets(rows, max_row_info, 50)
+    assert numpy.array_equal(
+        numpy.bincount(targets, minlength=50), numpy.full(50, 20))
+    spynnaker8.end()
+
+
+@requires_library
+def test_run_time_error():
+    spynnaker8.setup(timestep=1.0)
+    synapse_info = _synapse_info(AllToAllConnector(), 10, 10, 0.5, 3.0)
+    pre_slice = Slice(0, 9)
+    post_slice = Slice(0, 9)
+    max_row_info = get_max_row_info(synapse_info, post_slice, 0, _Edge())
+    data = GeneratorData(
+        0, SYN_REGION_UNUSED, max_row_info.undelayed_max_words, 0,
+        max_row_info.undelayed_max_n_synapses, 0, [pre_slice], [post_slice],
+        pre_slice, post_slice, synapse_info, 1, MAX_DELAY)
+
+    with pytest.raises(SpynnakerException):
+        SynapseExpanderEmulator().expand(
+            [_BadGeneratorData(data)], post_slice, N_SYNAPSE_TYPES,
+            WEIGHT_SCALES,
+            pre_slice.n_atoms * (
+                max_row_info.undelayed_max_words + N_HEADER_WORDS))
+    spynnaker8.end()
+
+
+@requires_library
+def test_generation():
+    spynnaker8.setup(timestep=1.0)
+    emulator = SynapseExpanderEmulator()
+    pre_slice = Slice(0, 999)
+    post_slice = Slice(0, 255)
+
+    def expand(connector):
+        synapse_info = _synapse_info(connector, 1000, 256, 0.5, 3.0)
+        rows, max_row_info = _expand(
+            emulator, synapse_info, pre_slice, post_slice)
+        n_synapses = _n_synapses(rows, max_row_info)
+        assert numpy.all(
+            n_synapses <= max_row_info.undelayed_max_n_synapses)
+        return rows, max_row_info, n_synapses
+
+    # Every pre-neuron connects to every post-neuron
+    _, _, n_synapses = expand(AllToAllConnector())
+    assert numpy.all(n_synapses == 256)
+
+    # Only the first 256 pre-neurons have a post-neuron to connect to
+    _, _, n_synapses = expand(OneToOneConnector())
+    assert numpy.array_equal(n_synapses, numpy.arange(1000) < 256)
+
+    # About a tenth of the 256000 pairs; this is over 6 standard deviations
+    _, _, n_synapses = expand(
+        FixedProbabilityConnector(0.1, rng=NumpyRNG(seed=42)))
+    assert abs(int(numpy.sum(n_synapses)) - 25600) < 1000
+
+    # Every post-neuron gets exactly 100 synapses
+    rows, max_row_info, _ = expand(
+        FixedNumberPreConnector(100, rng=NumpyRNG(seed=42)))
+    assert numpy.array_equal(
+        numpy.bincount(_targets(rows, max_row_info, 256), minlength=256),
+        numpy.full(256, 100))
+
+    # Every connection in the list is made, in its row
+    connector = _from_list(1000, 256, 25600)
+    _, _, n_synapses = expand(connector)
+    assert numpy.array_equal(n_synapses, numpy.bincount(
+        connector.conn_list[:, 0].astype("int64"), minlength=1000))
+    spynnaker8.end()
+
+
+@requires_library
+@benchmark
+def test_synapses_per_second():
+    spynnaker8.setup(timestep=1.0)
+    emulator = SynapseExpanderEmulator()
+    pre_slice = Slice(0, 999)
+    post_slice = Slice(0, 255)
+    connectors = [
+        ("AllToAllConnector", AllToAllConnector),
+        ("OneToOneConnector", OneToOneConnector),
+        ("FixedProbabilityConnector",
+         lambda: FixedProbabilityConnector(0.1, rng=NumpyRNG(seed=42))),
+        ("FixedNumberPreConnector",
+         lambda: FixedNumberPreConnector(100, rng=NumpyRNG(seed=42))),
+        ("FromListConnector", lambda: _from_list(1000, 256, 25600))]
+    for name, make_connector in connectors:
+        synapse_info = _synapse_info(make_connector(), 1000, 256, 0.5, 3.0)
+        start = time.perf_counter()
+        rows, max_row_info = _expand(
+            emulator, synapse_info, pre_slice, post_slice)
+        expander_time = time.perf_counter() - start
+
+        # The host makes the same rows from the connections it generates
+        start = time.perf_counter()
+        connections = synapse_info.connector.create_synaptic_block(
+            [pre_slice], [post_slice], pre_slice, post_slice, 1,
+            synapse_info)
+        get_synapses(
+            connections, synapse_info, 0, N_SYNAPSE_TYPES, WEIGHT_SCALES,
+            _Edge(), pre_slice, post_slice, max_row_info, True, False)
+        host_time = time.perf_counter() - start
+
+        n_synapses = int(numpy.sum(_n_synapses(rows, max_row_info)))
+        print("{}: {} synapses, {:.0f} per second on the expander, {:.0f}"
+              " per second on the host".format(
+                  name, n_synapses, n_synapses / expander_time,
+                  len(connections) / host_time))
+    spynnaker8.end()
@@ -13,13 +13,18 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 import pytest
+from pacman.model.graphs.common import Slice
 from spynnaker.pyNN.exceptions import SynapseRowTooBigException
 from spynnaker.pyNN.models.neural_projections import (
     ProjectionApplicationEdge, SynapseInformation)
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     SynapseDynamicsStatic, SynapseDynamicsSTDP)
-from spynnaker.pyNN.models.neuron.synapse_io import _get_allowed_row_length
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron.synapse_io import (
+    _get_allowed_row_length, _get_row_data)
 from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
     WeightDependenceAdditive)
 from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
@@ -65,3 +70,27 @@ def test_get_allowed_row_length(
     else:
         actual_size = _get_allowed_row_length(size, dynamics, in_edge, size)
         assert actual_size == max_size
+
+
+def test_get_static_row_data():
+    spynnaker8.setup()
+    dynamics = SynapseDynamicsStatic()
+    connections = numpy.zeros(5, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = [2, 0, 2, 2, 0]
+    connections["target"] = [1, 2, 3, 0, 1]
+    connections["weight"] = [1, 2, 3, 4, 5]
+    connections["delay"] = 1
+    max_row_n_words = 4
+    row_data = _get_row_data(
+        connections, connections["source"], 3, Slice(0, 3), 2, dynamics,
+        max_row_n_synapses=2, max_row_n_words=max_row_n_words)
+    rows = row_data.reshape(3, -1)
+    assert rows.shape[1] == max_row_n_words + 3
+
+    # Rows are clipped to the maximum and keep the order of the connections
+    assert list(rows[:, 1]) == [2, 0, 2]
+    assert list(rows[0, 3:5] >> 16) == [2, 5]
+    assert list(rows[0, 3:5] & 0x3) == [2, 1]
+    assert list(rows[2, 3:5] >> 16) == [1, 3]
+    assert not rows[1].any()
+    assert not rows[:, 5:].any()
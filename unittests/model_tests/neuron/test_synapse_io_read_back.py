@@ -0,0 +1,145 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Compares reading back delayed rows with the vectorised decoder\
+    against a row-by-row decoder that works as the decoder used to, and\
+    (as an opt-in benchmark) compares their throughput.
+"""
+
+import time
+import numpy
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic)
+from spynnaker.pyNN.models.neuron.synapse_io import (
+    _get_row_data, _parse_static_data, _read_static_data)
+from spynnaker.pyNN.utilities.utility_calls import get_n_bits
+import spynnaker8
+from unittests.benchmarks import benchmark
+
+# No unittest_setup as sim.setup must be called before SynapseDynamicsStatic
+
+N_HEADER_WORDS = 3
+MAX_DELAY = 16
+
+
+def _read_rows_one_by_one(
+        row_data, pre_slice, post_slice, n_synapse_types):
+    """ Decode delayed static rows a row at a time.
+    """
+    n_rows = row_data.shape[0]
+    ff_size = row_data[:, 1]
+    ff_data = [row_data[row, N_HEADER_WORDS:N_HEADER_WORDS + ff_size[row]]
+               for row in range(n_rows)]
+    n_neuron_id_bits = get_n_bits(post_slice.n_atoms)
+    n_synapse_type_bits = get_n_bits(n_synapse_types)
+    data = numpy.concatenate(ff_data)
+    connections = numpy.zeros(
+        data.size, dtype=SynapseDynamicsStatic.NUMPY_CONNECTORS_DTYPE)
+    connections["source"] = numpy.concatenate(
+        [numpy.repeat(i, ff_size[i]) for i in range(n_rows)])
+    connections["target"] = (
+        (data & ((1 << n_neuron_id_bits) - 1)) + post_slice.lo_atom)
+    connections["weight"] = (data >> 16) & 0xFFFF
+    connections["delay"] = (data & 0xFFFF) >> (
+        n_neuron_id_bits + n_synapse_type_bits)
+    row_stage = numpy.array(
+        [i // pre_slice.n_atoms for i in range(n_rows)], dtype="uint32")
+    row_min_delay = (row_stage + 1) * MAX_DELAY
+    connections["source"] -= numpy.concatenate([
+        numpy.repeat(row_stage[i] * numpy.uint32(pre_slice.n_atoms),
+                     ff_size[i]) for i in range(n_rows)])
+    connections["source"] += pre_slice.lo_atom
+    connections["delay"] += numpy.concatenate([
+        numpy.repeat(row_min_delay[i], ff_size[i]) for i in range(n_rows)])
+    return connections
+
+
+def _make_delayed_rows(pre_slice, post_slice, n_synapse_types):
+    """ Make some delayed rows at random
+    """
+    dynamics = SynapseDynamicsStatic()
+    n_delay_stages = 4
+    max_row_n_synapses = 64
+    n_rows = pre_slice.n_atoms * n_delay_stages
+    rng = numpy.random.RandomState(42)
+    n_connections = n_rows * max_row_n_synapses // 2
+    connections = numpy.zeros(
+        n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    row_indices = rng.randint(0, n_rows, n_connections)
+    connections["source"] = (
+        pre_slice.lo_atom + row_indices % pre_slice.n_atoms)
+    connections["target"] = rng.randint(
+        post_slice.lo_atom, post_slice.hi_atom + 1, n_connections)
+    connections["weight"] = rng.randint(1, 1000, n_connections)
+    connections["delay"] = rng.randint(1, MAX_DELAY, n_connections)
+    return dynamics, _get_row_data(
+        connections, row_indices, n_rows, post_slice, n_synapse_types,
+        dynamics, max_row_n_synapses, max_row_n_synapses).reshape(
+            n_rows, -1)
+
+
+def test_delayed_read_back():
+    spynnaker8.setup()
+    pre_slice = Slice(1000, 1999)
+    post_slice = Slice(0, 255)
+    n_synapse_types = 2
+    dynamics, row_data = _make_delayed_rows(
+        pre_slice, post_slice, n_synapse_types)
+
+    expected = _read_rows_one_by_one(
+        row_data, pre_slice, post_slice, n_synapse_types)
+    actual = _read_static_data(
+        dynamics, pre_slice, post_slice, n_synapse_types, row_data, True,
+        MAX_DELAY)
+    assert numpy.array_equal(actual, expected)
+
+
+@benchmark
+def test_delayed_read_back_throughput():
+    spynnaker8.setup()
+    pre_slice = Slice(1000, 1999)
+    post_slice = Slice(0, 255)
+    n_synapse_types = 2
+    dynamics, row_data = _make_delayed_rows(
+        pre_slice, post_slice, n_synapse_types)
+
+    start = time.perf_counter()
+    expected = _read_rows_one_by_one(
+        row_data, pre_slice, post_slice, n_synapse_types)
+    row_by_row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = _read_static_data(
+        dynamics, pre_slice, post_slice, n_synapse_types, row_data, True,
+        MAX_DELAY)
+    vectorised_time = time.perf_counter() - start
+
+    assert numpy.array_equal(actual, expected)
+    print("Read back {} delayed connections: {:.0f} per second row by row,"
+          " {:.0f} per second vectorised".format(
+              len(actual), len(actual) / row_by_row_time,
+              len(actual) / vectorised_time))
+
+
+def test_read_back_no_rows():
+    spynnaker8.setup()
+    dynamics = SynapseDynamicsStatic()
+    ff_size, ff_data = _parse_static_data(
+        numpy.zeros((0, N_HEADER_WORDS), dtype="uint32"), dynamics)
+    assert len(ff_size) == 0
+    assert ff_data.shape == (0, 0)
@@ -0,0 +1,76 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from pacman.model.constraints.partitioner_constraints import (
+    MaxVertexAtomsConstraint)
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.extra_algorithms.splitter_components import (
+    SplitterAbstractPopulationVertexNeuronsSynapses,
+    SplitterAbstractPopulationVertexSlice, SpynnakerSplitterSelector,
+    SynapticLoadPlanner)
+import spynnaker8 as sim
+
+
+def test_plan_by_load():
+    sim.setup(timestep=1.0)
+    quiet = sim.Population(10, sim.SpikeSourcePoisson(rate=1.0))
+    busy = sim.Population(1000, sim.SpikeSourcePoisson(rate=100.0))
+    light = sim.Population(100, sim.IF_curr_exp(), label="light")
+    heavy = sim.Population(256, sim.IF_curr_exp(), label="heavy")
+    sim.Projection(quiet, light, sim.AllToAllConnector())
+    sim.Projection(busy, heavy, sim.AllToAllConnector())
+    planner = SynapticLoadPlanner(cpu_fraction=0.8, max_synapse_cores=4)
+    assert planner.cycle_budget == 160000
+
+    layout = planner.plan(light._vertex)
+    assert layout.n_synapse_cores == 0
+    assert layout.n_atoms_per_core == 100
+    assert layout.neuron_cycles + layout.synapse_cycles <= layout.budget
+
+    # 100 spikes of 256 synapses each time step need 5 synapse cores, but
+    # the spikes from each of the 2 source cores all go to one synapse core,
+    # so the neurons per core are halved until half the spikes fit on one
+    layout = planner.plan(heavy._vertex)
+    assert layout.n_atoms_per_core == 64
+    assert layout.n_synapse_cores == 2
+    assert layout.synapse_core_cycles <= layout.budget
+    assert layout.synapse_cycles > layout.budget
+    (load, ) = layout.projection_loads
+    assert load.rate == 100.0
+    assert load.spikes_per_step == pytest.approx(100)
+    assert load.synapses_per_step == pytest.approx(100 * 64)
+    assert "reduced from 256" in layout.reason
+    assert SynapticLoadPlanner.get_source_core_loads(
+        heavy._vertex, layout.projection_loads) == [load.cycles // 2] * 2
+
+    SpynnakerSplitterSelector.load_based_heuristic(light._vertex, planner)
+    assert isinstance(
+        light._vertex.splitter, SplitterAbstractPopulationVertexSlice)
+    SpynnakerSplitterSelector.load_based_heuristic(heavy._vertex, planner)
+    assert isinstance(
+        heavy._vertex.splitter,
+        SplitterAbstractPopulationVertexNeuronsSynapses)
+
+    # The limit is kept by the splitter rather than added to the population
+    assert heavy._vertex.get_max_atoms_per_core() == 256
+    assert not any(isinstance(constraint, MaxVertexAtomsConstraint)
+                   for constraint in heavy._vertex.constraints)
+    assert [vertex_slice.n_atoms for vertex_slice in
+            heavy._vertex.splitter.get_in_coming_slices()[0]] == [64] * 4
+
+    with pytest.raises(ConfigurationException):
+        SynapticLoadPlanner(cpu_fraction=0.8, max_synapse_cores=0)
+    sim.end()
@@ -0,0 +1,139 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import subprocess
+import sys
+import numpy
+from pyNN.random import NumpyRNG
+from spinn_utilities.config_holder import set_config
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    FixedProbabilityConnector, KernelConnector)
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.models.neuron.synaptic_matrix_cache import (
+    get_block_key, has_block, read_rows, write_rows)
+from unittests.mocks import MockPopulation
+
+
+def _synapse_info(p_connect, seed):
+    connector = FixedProbabilityConnector(p_connect, rng=NumpyRNG(seed=seed))
+    synapse_info = SynapseInformation(
+        connector=connector, pre_population=MockPopulation(20, "Pre"),
+        post_population=MockPopulation(20, "Post"), prepop_is_view=False,
+        postpop_is_view=False, rng=None, synapse_dynamics=None,
+        synapse_type=0, is_virtual_machine=False, weights=1.0, delays=1.0)
+    connector.set_projection_information(synapse_info)
+    return synapse_info
+
+
+def test_block_keys(tmpdir):
+    unittest_setup()
+    pre_slice = Slice(0, 9)
+    post_slice = Slice(10, 19)
+
+    # Nothing is cached unless there is a directory
+    assert get_block_key(_synapse_info(0.5, 1), pre_slice, post_slice) is None
+
+    set_config("Simulation", "synaptic_matrix_cache_directory", str(tmpdir))
+    key = get_block_key(_synapse_info(0.5, 1), pre_slice, post_slice)
+    assert key is not None
+    assert key == get_block_key(_synapse_info(0.5, 1), pre_slice, post_slice)
+    assert key != get_block_key(_synapse_info(0.6, 1), pre_slice, post_slice)
+    assert key != get_block_key(_synapse_info(0.5, 2), pre_slice, post_slice)
+    assert key != get_block_key(
+        _synapse_info(0.5, 1), pre_slice, Slice(0, 9))
+
+
+def test_kernel_block_key_before_and_after_block(tmpdir):
+    unittest_setup()
+    set_config("Simulation", "synaptic_matrix_cache_directory", str(tmpdir))
+    connector = KernelConnector([4, 4], [4, 4], [3, 3])
+    synapse_info = SynapseInformation(
+        connector=connector, pre_population=MockPopulation(16, "Pre"),
+        post_population=MockPopulation(16, "Post"), prepop_is_view=False,
+        postpop_is_view=False, rng=None, synapse_dynamics=None,
+        synapse_type=0, is_virtual_machine=False, weights=2.0, delays=1.0)
+    connector.set_projection_information(synapse_info)
+    pre_slice = Slice(0, 15)
+    post_slice = Slice(0, 15)
+
+    # Making a block fills in the kernels from the weights and delays, which
+    # must not change the key of the block
+    key = get_block_key(synapse_info, pre_slice, post_slice)
+    connector.create_synaptic_block(
+        [pre_slice], [post_slice], pre_slice, post_slice, 0, synapse_info)
+    assert key == get_block_key(synapse_info, pre_slice, post_slice)
+
+
+def test_read_write_rows(tmpdir):
+    unittest_setup()
+    set_config("Simulation", "synaptic_matrix_cache_directory", str(tmpdir))
+    key = get_block_key(_synapse_info(0.5, 1), Slice(0, 9), Slice(0, 9))
+    assert not has_block(key)
+    assert read_rows(key, "rows") is None
+
+    rows = (numpy.arange(10, dtype="uint32"), numpy.zeros(0, dtype="uint32"),
+            numpy.zeros(0, dtype="uint32"), numpy.zeros(0, dtype="uint32"))
+    write_rows(key, "rows", rows)
+    assert has_block(key)
+    for written, read in zip(rows, read_rows(key, "rows")):
+        assert numpy.array_equal(written, read)
+        assert written.dtype == read.dtype
+    assert read_rows(key, "other_rows") is None
+
+
+# Prints the keys of blocks of connectors without random numbers, made in a
+# process of its own
+_KEYS_SCRIPT = """
+from pacman.model.graphs.common.slice import Slice
+from spinn_utilities.config_holder import set_config
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AllToAllConnector, FromListConnector, OneToOneConnector)
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.models.neuron.synaptic_matrix_cache import get_block_key
+from unittests.mocks import MockPopulation
+
+unittest_setup()
+set_config("Simulation", "synaptic_matrix_cache_directory", {!r})
+for connector in (
+        AllToAllConnector(), OneToOneConnector(),
+        FromListConnector([(i, 19 - i, 0.5, 1.0) for i in range(20)])):
+    synapse_info = SynapseInformation(
+        connector=connector, pre_population=MockPopulation(20, "Pre"),
+        post_population=MockPopulation(20, "Post"), prepop_is_view=False,
+        postpop_is_view=False, rng=None, synapse_dynamics=None,
+        synapse_type=0, is_virtual_machine=False, weights=1.0, delays=1.0)
+    connector.set_projection_information(synapse_info)
+    print(get_block_key(synapse_info, Slice(0, 9), Slice(10, 19)))
+"""
+
+
+def _keys_in_new_process(tmpdir):
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__)))))
+    return subprocess.run(
+        [sys.executable, "-c", _KEYS_SCRIPT.format(str(tmpdir))], cwd=root,
+        check=True, stdout=subprocess.PIPE,
+        universal_newlines=True).stdout.split()
+
+
+def test_block_keys_without_random_numbers_across_processes(tmpdir):
+    keys = _keys_in_new_process(tmpdir)
+    assert len(keys) == 3
+    assert "None" not in keys
+    assert keys == _keys_in_new_process(tmpdir)
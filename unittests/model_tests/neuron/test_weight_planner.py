@@ -0,0 +1,131 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from scipy import stats
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.weight_planner import (
+    ProjectionInput, WeightPlanner)
+
+
+def _constant_input(n_connections, spikes_per_step, weight, synapse_type=0):
+    return ProjectionInput(
+        "Pre", synapse_type, n_connections, spikes_per_step, 1.0, weight,
+        weight ** 2, weight)
+
+
+def test_constant_weights():
+    unittest_setup()
+    planner = WeightPlanner(1e-7)
+    plan = planner.plan_inputs(
+        "Post", [_constant_input(100, 0.01, 1.0)], 2, 1.0, False)
+    type_plan = plan.synapse_type_plans[0]
+    assert type_plan.worst_case_input == 100.0
+    assert type_plan.expected_input == pytest.approx(1.0)
+
+    # Every shift up to the one that holds the worst case is considered
+    assert [o.shift for o in type_plan.options] == list(range(1, 8))
+    assert type_plan.options[-1].saturation_probability == 0
+
+    # The input is a Poisson number of spikes, and the bound is never less
+    # than the chance it is too big
+    for option in type_plan.options[:-1]:
+        exact = stats.poisson.sf(option.capacity - 1, 1.0)
+        assert exact <= option.saturation_probability <= 1
+    assert type_plan.chosen.saturation_probability <= 1e-7
+    assert type_plan.chosen.shift < 7
+    previous = type_plan.options[type_plan.options.index(
+        type_plan.chosen) - 1]
+    assert previous.saturation_probability > 1e-7
+
+    # Each bit of shift doubles the step between weights
+    for option in type_plan.options:
+        assert option.weight_step == 2.0 ** (option.shift - 15)
+        assert option.mean_weight_error == option.weight_step / 2
+
+    # The synapse type with no input needs no shift
+    assert plan.synapse_type_plans[1].chosen.shift == 0
+
+
+def test_signed_weights():
+    unittest_setup()
+    planner = WeightPlanner(1e-7)
+    inputs = [_constant_input(100, 0.01, 1.0)]
+    unsigned = planner.plan_inputs("Post", inputs, 1, 1.0, False)
+    signed = planner.plan_inputs("Post", inputs, 1, 1.0, True)
+    assert (signed.synapse_type_plans[0].chosen.shift ==
+            unsigned.synapse_type_plans[0].chosen.shift + 1)
+
+
+def test_worst_case():
+    unittest_setup()
+    inputs = [_constant_input(10, 0.5, 0.5), _constant_input(5, 0.1, 2.5)]
+
+    # Without any chance of saturation the worst case must fit
+    plan = WeightPlanner(0.0).plan_inputs("Post", inputs, 1, 1.0, False)
+    type_plan = plan.synapse_type_plans[0]
+    assert type_plan.worst_case_input == 17.5
+    assert type_plan.chosen.shift == 5
+    assert type_plan.chosen.saturation_probability == 0
+
+    # A single weight must always fit
+    plan = WeightPlanner(0.5).plan_inputs("Post", inputs, 1, 1.0, False)
+    assert plan.synapse_type_plans[0].chosen.shift >= 2
+
+
+def test_global_weight_scale():
+    unittest_setup()
+    planner = WeightPlanner(1e-7)
+    inputs = [_constant_input(100, 0.01, 1.0)]
+    plan = planner.plan_inputs("Post", inputs, 1, 1.0, False)
+    scaled = planner.plan_inputs("Post", inputs, 1, 4.0, False)
+    assert (scaled.synapse_type_plans[0].chosen.shift ==
+            plan.synapse_type_plans[0].chosen.shift + 2)
+
+
+def test_bad_probability():
+    unittest_setup()
+    with pytest.raises(ConfigurationException):
+        WeightPlanner(1.0)
+    with pytest.raises(ConfigurationException):
+        WeightPlanner(-0.1)
+
+
+def test_weight_too_big():
+    unittest_setup()
+    planner = WeightPlanner(1e-7)
+    with pytest.raises(ConfigurationException):
+        planner.plan_inputs(
+            "Post", [_constant_input(1, 0.01, 2.0 ** 31)], 1, 1.0, False)
+    with pytest.raises(ConfigurationException):
+        planner.plan_inputs(
+            "Post", [_constant_input(1, 0.01, 2.0 ** 30)], 1, 1.0, True)
+
+    # The largest weight that fits still has a plan
+    plan = planner.plan_inputs(
+        "Post", [_constant_input(1, 0.01, 2.0 ** 30)], 1, 1.0, False)
+    assert plan.synapse_type_plans[0].chosen.shift == 31
+
+
+def test_saturates_at_largest_shift():
+    unittest_setup()
+    inputs = [ProjectionInput(
+        "Pre", 0, 10 ** 6, 10.0, 10.0, 1000.0, 1000.0 ** 2, 1000.0)]
+    plan = WeightPlanner(1e-7).plan_inputs("Post", inputs, 1, 1.0, False)
+    type_plan = plan.synapse_type_plans[0]
+    assert type_plan.chosen.shift == 31
+    assert type_plan.chosen.saturation_probability > 1e-7
+    assert type_plan.reason.startswith("FAILED")
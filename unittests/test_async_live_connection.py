@@ -0,0 +1,315 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Runs the asyncio live connection against a local UDP stand-in for a\
+    board, which sends every event it is given straight back as if it had\
+    been through a live packet gatherer.
+"""
+
+import asyncio
+import statistics
+import time
+import numpy
+import pytest
+from spinnman.constants import EIEIO_COMMAND_IDS as CMDS
+from spinnman.exceptions import SpinnmanInvalidPacketException
+from spinnman.messages.eieio.command_messages import EIEIOCommandHeader
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.connections import (
+    SpynnakerAsyncDatabaseConnection, SpynnakerAsyncEthernetControlConnection,
+    SpynnakerAsyncLiveConnection)
+from unittests.benchmarks import benchmark
+
+# The padding and SDP header of packets sent to the board
+_SDP_HEADER_BYTES = 10
+_BASE_KEY = 0x10000
+_N_NEURONS = 1000
+
+
+class _EchoBoard(asyncio.DatagramProtocol):
+    """ Sends the EIEIO message of each packet back to the connection
+    """
+
+    def __init__(self, reply_address):
+        self.__reply_address = reply_address
+        self.transport = None
+        # The core that each packet was sent to
+        self.cores = list()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        # After the padding, the SDP header has the flags, the tag, then the
+        # destination port and core, ..., then the destination y and x
+        self.cores.append((data[7], data[6], data[4] & 0x1F))
+        self.transport.sendto(data[_SDP_HEADER_BYTES:], self.__reply_address)
+
+
+async def _connect(loop, connection_class=SpynnakerAsyncLiveConnection):
+    connection = connection_class(local_host="127.0.0.1")
+    await connection.open(loop)
+    board, _ = await loop.create_datagram_endpoint(
+        lambda: _EchoBoard(("127.0.0.1", connection.local_port)),
+        local_addr=("127.0.0.1", 0))
+    board_port = board.get_extra_info("sockname")[1]
+    keys = numpy.arange(_N_NEURONS, dtype="uint32") + _BASE_KEY
+    connection.add_send_target(
+        "input", 0, 0, 1, "127.0.0.1", keys, board_port=board_port)
+    connection.add_receive_label(
+        "input", {int(key): atom for atom, key in enumerate(keys)})
+    return connection, board
+
+
+class _DatabaseReader(object):
+    """ Gives the details of an input population on two cores
+    """
+
+    def get_placements(self, label):
+        return [(0, 0, 1), (1, 0, 2)] if label == "input" else []
+
+    def get_ip_address(self, x, y):
+        return "127.0.0.1"
+
+    def get_atom_id_to_key_mapping(self, label):
+        return {atom: _BASE_KEY + atom for atom in range(_N_NEURONS)}
+
+    def get_key_to_atom_id_mapping(self, label):
+        return {_BASE_KEY + atom: atom for atom in range(_N_NEURONS)}
+
+
+async def _receive_n(connection, n_events):
+    received = list()
+    count = 0
+    async for batch in connection:
+        received.append(batch.neuron_ids)
+        count += len(batch.neuron_ids)
+        if count >= n_events:
+            break
+    return numpy.concatenate(received)
+
+
+async def _count_until_quiet(connection, n_events, quiet_time):
+    count = 0
+    last_time = time.perf_counter()
+    while count < n_events:
+        try:
+            batch = await asyncio.wait_for(connection.__anext__(), quiet_time)
+        except asyncio.TimeoutError:
+            break
+        count += len(batch.neuron_ids)
+        last_time = time.perf_counter()
+    return count, last_time
+
+
+def _run(coroutine_function):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine_function(loop))
+    finally:
+        loop.close()
+
+
+def test_round_trip():
+    async def round_trip(loop):
+        connection, board = await _connect(loop)
+        neuron_ids = numpy.array([5, 0, 999, 5, 500])
+        await connection.send_spikes_array(
+            "input", neuron_ids, send_full_keys=True)
+        received = await asyncio.wait_for(
+            _receive_n(connection, len(neuron_ids)), 5)
+        await connection.set_rates_array("input", [1, 2], [10.0, 0.5])
+        batch = await asyncio.wait_for(connection.__anext__(), 5)
+        connection.close()
+        board.close()
+        return received, batch
+
+    received, batch = _run(round_trip)
+    assert list(received) == [5, 0, 999, 5, 500]
+    assert batch.label == "input"
+    assert list(batch.neuron_ids) == [1, 2]
+    assert list(batch.payloads) == [10 << 15, 1 << 14]
+
+
+@benchmark
+def test_latency_and_throughput():
+    async def measure(loop):
+        connection, board = await _connect(loop)
+
+        # Time single spikes going round one at a time
+        latencies = list()
+        for neuron_id in range(200):
+            start = time.perf_counter()
+            await connection.send_spikes_array(
+                "input", [neuron_id % _N_NEURONS], send_full_keys=True)
+            await asyncio.wait_for(connection.__anext__(), 5)
+            latencies.append(time.perf_counter() - start)
+
+        # Send batches of spikes and count what comes back; UDP may drop
+        # some packets under load, so stop when they stop coming
+        n_batches = 50
+        neuron_ids = numpy.arange(_N_NEURONS)
+        start = time.perf_counter()
+        for _ in range(n_batches):
+            await connection.send_spikes_array(
+                "input", neuron_ids, send_full_keys=True)
+            # Let the board and the receiver keep up
+            await asyncio.sleep(0)
+        n_received, end = await _count_until_quiet(
+            connection, n_batches * _N_NEURONS, 1.0)
+        elapsed = end - start
+        connection.close()
+        board.close()
+        return latencies, n_received, elapsed
+
+    latencies, n_received, elapsed = _run(measure)
+    print("Median round trip {:.1f}us; {} events back at {:.0f} per"
+          " second".format(
+              statistics.median(latencies) * 1e6, n_received,
+              n_received / elapsed))
+
+
+def test_read_database():
+    async def round_trip(loop):
+        connection = SpynnakerAsyncLiveConnection(local_host="127.0.0.1")
+        await connection.open(loop)
+        board, protocol = await loop.create_datagram_endpoint(
+            lambda: _EchoBoard(("127.0.0.1", connection.local_port)),
+            local_addr=("127.0.0.1", 0))
+        connection.read_database(
+            _DatabaseReader(), send_labels=["input"],
+            receive_labels=["input"],
+            board_port=board.get_extra_info("sockname")[1])
+
+        # Each packet goes to the next core
+        for neuron_id in (3, 4):
+            await connection.send_spikes_array(
+                "input", [neuron_id], send_full_keys=True)
+        received = await asyncio.wait_for(_receive_n(connection, 2), 5)
+
+        # Neuron IDs mean different neurons on each core
+        with pytest.raises(ConfigurationException):
+            await connection.send_spikes_array("input", [3])
+        connection.close()
+        board.close()
+        return received, protocol.cores
+
+    received, cores = _run(round_trip)
+    assert sorted(received) == [3, 4]
+    assert sorted(cores) == [(0, 0, 1), (1, 0, 2)]
+
+
+def test_read_database_missing_label():
+    connection = SpynnakerAsyncLiveConnection()
+    with pytest.raises(ConfigurationException):
+        connection.read_database(_DatabaseReader(), send_labels=["missing"])
+
+
+def test_local_port_before_open():
+    with pytest.raises(ConfigurationException):
+        SpynnakerAsyncLiveConnection().local_port
+    assert SpynnakerAsyncLiveConnection(local_port=12345).local_port == 12345
+
+
+class _Toolchain(asyncio.DatagramProtocol):
+    """ Queues the replies that the toolchain is sent
+    """
+
+    def __init__(self):
+        self.replies = asyncio.Queue()
+
+    def datagram_received(self, data, addr):
+        self.replies.put_nowait(data)
+
+
+def test_database_handshake():
+    async def handshake(loop):
+        notifications = SpynnakerAsyncDatabaseConnection(
+            local_host="127.0.0.1", local_port=None)
+        await notifications.open(loop)
+        address = ("127.0.0.1", notifications.local_port)
+        toolchain, protocol = await loop.create_datagram_endpoint(
+            _Toolchain, local_addr=("127.0.0.1", 0))
+        connection = SpynnakerAsyncLiveConnection()
+
+        # There is nothing to confirm before the database is written
+        with pytest.raises(ConfigurationException):
+            notifications.confirm_database_read()
+        toolchain.sendto(
+            EIEIOCommandHeader(CMDS.DATABASE_CONFIRMATION.value).bytestring,
+            address)
+        await asyncio.wait_for(
+            connection.read_database_when_ready(notifications), 5)
+        reply = await asyncio.wait_for(protocol.replies.get(), 5)
+
+        toolchain.sendto(
+            EIEIOCommandHeader(
+                CMDS.START_RESUME_NOTIFICATION.value).bytestring, address)
+        await asyncio.wait_for(notifications.wait_for_start(), 5)
+
+        # The simulation has to start before it can stop
+        toolchain.sendto(
+            EIEIOCommandHeader(
+                CMDS.START_RESUME_NOTIFICATION.value).bytestring, address)
+        with pytest.raises(SpinnmanInvalidPacketException):
+            await asyncio.wait_for(notifications.wait_for_stop(), 5)
+        notifications.close()
+        toolchain.close()
+        with pytest.raises(ConfigurationException):
+            await asyncio.wait_for(notifications.wait_for_stop(), 5)
+        return reply
+
+    reply = _run(handshake)
+    assert EIEIOCommandHeader.from_bytestring(reply, 0).command == (
+        CMDS.DATABASE_CONFIRMATION.value)
+
+
+class _Translator(object):
+    """ Keeps the commands that it is asked to translate
+    """
+
+    def __init__(self):
+        self.commands = list()
+
+    def translate_control_packet(self, multicast_packet):
+        self.commands.append(
+            (multicast_packet.key, multicast_packet.payload))
+
+
+async def _wait_for_commands(translator, n_commands):
+    while len(translator.commands) < n_commands:
+        await asyncio.sleep(0.01)
+
+
+def test_ethernet_control():
+    async def translate(loop):
+        connection, board = await _connect(
+            loop, SpynnakerAsyncEthernetControlConnection)
+        translator = _Translator()
+        connection.add_translator("input", translator)
+        translating = loop.create_task(connection.translate())
+        await connection.send_spikes_array(
+            "input", [3, 7], send_full_keys=True)
+        await connection.set_rates_array("input", [1], [2.0])
+        await asyncio.wait_for(_wait_for_commands(translator, 3), 5)
+        connection.close()
+        board.close()
+        await asyncio.wait_for(translating, 5)
+        return translator.commands
+
+    commands = _run(translate)
+    assert commands == [
+        (_BASE_KEY + 3, None), (_BASE_KEY + 7, None),
+        (_BASE_KEY + 1, 2 << 15)]
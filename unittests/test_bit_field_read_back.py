@@ -0,0 +1,179 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Checks reading back the bitfields of a core in bulk against reading\
+    back each header and each bitfield in turn, as the bitfields used to\
+    be read, using a stand-in for the transceiver, and (as an opt-in\
+    benchmark) compares the time taken by each.
+"""
+
+import struct
+import time
+import numpy
+from pacman.model.placements import Placement
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.extra_algorithms.on_chip_bit_field_generator import (
+    _percent, _read_bit_fields)
+from unittests.benchmarks import benchmark
+
+SDRAM_BASE = 0x60000000
+SDRAM_SIZE = 1024 * 1024
+N_BIT_FIELDS = 500
+FLAGS = 0xC0000000
+
+
+class _Transceiver(object):
+    """ Reads from a block of memory standing in for the SDRAM of a chip,\
+        counting the reads
+    """
+
+    def __init__(self):
+        self.sdram = bytearray(SDRAM_SIZE)
+        self.n_reads = 0
+
+    def write_memory(self, x, y, address, data):
+        self.sdram[address - SDRAM_BASE:
+                   address - SDRAM_BASE + len(data)] = data
+
+    def read_memory(self, x, y, address, length):
+        self.n_reads += 1
+        return bytes(self.sdram[address - SDRAM_BASE:
+                                address - SDRAM_BASE + length])
+
+
+class _Vertex(object):
+    """ A vertex with bitfields at a fixed address
+    """
+
+    label = "test"
+
+    def bit_field_base_address(self, transceiver, placement):
+        return SDRAM_BASE
+
+
+def _write_bit_fields(transceiver, rng):
+    """ Write a filter region with most bitfields after the headers, some\
+        empty, some with flags set, and some a long way away
+    """
+    n_words = rng.randint(0, 8, N_BIT_FIELDS)
+    keys = rng.permutation(N_BIT_FIELDS * 4)[:N_BIT_FIELDS] << 11
+    far = rng.rand(N_BIT_FIELDS) < 0.1
+    address = SDRAM_BASE + 12 + 12 * N_BIT_FIELDS
+    far_address = SDRAM_BASE + SDRAM_SIZE // 2
+    infos = list()
+    bit_fields = list()
+    for key, n, is_far in zip(keys, n_words, far):
+        words = rng.randint(0, 0xFFFFFFFF, n, dtype="uint32")
+        if is_far:
+            read_pointer = far_address
+            far_address += 4 * n
+        else:
+            read_pointer = address
+            address += 4 * n
+        transceiver.write_memory(0, 0, read_pointer, words.tobytes())
+        infos.append((int(key), int(n) | (FLAGS if key % 3 == 0 else 0),
+                      read_pointer))
+        bit_fields.append((int(key), int(n) * 32, words))
+    transceiver.write_memory(0, 0, SDRAM_BASE, struct.pack(
+        "<III", 0, 0, N_BIT_FIELDS))
+    transceiver.write_memory(0, 0, SDRAM_BASE + 12, b"".join(
+        struct.pack("<III", *info) for info in infos))
+    return bit_fields
+
+
+def _read_bit_fields_one_by_one(transceiver, placement):
+    """ Read each header and each bitfield in turn
+    """
+    address = placement.vertex.bit_field_base_address(
+        transceiver, placement)
+    _, _, total = struct.unpack("<III", transceiver.read_memory(
+        placement.x, placement.y, address, 12))
+    address += 12
+    bit_fields = list()
+    for _ in range(total):
+        key, n_words, read_pointer = struct.unpack(
+            "<III", transceiver.read_memory(
+                placement.x, placement.y, address, 12))
+        address += 12
+        n_words &= 0x3FFFFFFF
+        words = struct.unpack("<{}I".format(n_words), transceiver.read_memory(
+            placement.x, placement.y, read_pointer, n_words * 4))
+        bits = [(words[i // 32] >> (i % 32)) & 1
+                for i in range(n_words * 32)]
+        bit_fields.append((key, n_words * 32, bits))
+    return bit_fields
+
+
+def test_read_back():
+    unittest_setup()
+    transceiver = _Transceiver()
+    written = _write_bit_fields(transceiver, numpy.random.RandomState(42))
+    placement = Placement(_Vertex(), 0, 0, 1)
+
+    expected = _read_bit_fields_one_by_one(transceiver, placement)
+    assert transceiver.n_reads == 1 + 2 * N_BIT_FIELDS
+
+    transceiver.n_reads = 0
+    keys, n_bits, bits = _read_bit_fields(transceiver, placement)
+
+    # The header, the filter infos and the two blocks of bitfields
+    assert transceiver.n_reads == 4
+    assert keys.tolist() == [key for key, _, _ in written]
+    assert n_bits.tolist() == [n for _, n, _ in written]
+    assert bits.tolist() == [
+        bit for _, _, field_bits in expected for bit in field_bits]
+
+
+@benchmark
+def test_read_back_time():
+    unittest_setup()
+    transceiver = _Transceiver()
+    _write_bit_fields(transceiver, numpy.random.RandomState(42))
+    placement = Placement(_Vertex(), 0, 0, 1)
+
+    start = time.perf_counter()
+    _read_bit_fields_one_by_one(transceiver, placement)
+    one_by_one_time = time.perf_counter() - start
+    one_by_one_reads = transceiver.n_reads
+
+    transceiver.n_reads = 0
+    start = time.perf_counter()
+    _read_bit_fields(transceiver, placement)
+    bulk_time = time.perf_counter() - start
+
+    # The stand-in has no round trip time, so on a board each read costs
+    # more than is measured here
+    print("Read back {} bitfields: {} reads in {:.4f}s one by one,"
+          " {} reads in {:.4f}s in bulk".format(
+              N_BIT_FIELDS, one_by_one_reads, one_by_one_time,
+              transceiver.n_reads, bulk_time))
+
+
+def test_empty():
+    unittest_setup()
+    transceiver = _Transceiver()
+    keys, n_bits, bits = _read_bit_fields(
+        transceiver, Placement(_Vertex(), 0, 0, 1))
+    assert transceiver.n_reads == 1
+    assert len(keys) == len(n_bits) == len(bits) == 0
+
+
+def test_percent():
+    unittest_setup()
+    assert _percent(1, 4) == 25.0
+    assert _percent(1, 0) == 0.0
+    assert _percent(
+        numpy.array([1, 3, 0]), numpy.array([2, 0, 5])).tolist() == [
+            50.0, 0.0, 0.0]
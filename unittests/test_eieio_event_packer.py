@@ -0,0 +1,118 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Checks that packed events match those made one at a time by spinnman,\
+    and (as an opt-in benchmark) compares the rate at which each can be sent\
+    to a local UDP sink.
+"""
+
+import socket
+import time
+import numpy
+import pytest
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.data_messages import EIEIODataMessage
+from data_specification.enums import DataType
+from spynnaker.pyNN.connections.eieio_event_packer import EIEIOEventPacker
+from unittests.benchmarks import benchmark
+
+_MAX_EVENTS = {
+    EIEIOType.KEY_16_BIT: 127,
+    EIEIOType.KEY_32_BIT: 63,
+    EIEIOType.KEY_PAYLOAD_32_BIT: 31}
+
+
+def _pack_one_by_one(eieio_type, keys, payloads=None):
+    """ Make messages an event at a time, as the list-based methods do
+    """
+    messages = list()
+    max_events = _MAX_EVENTS[eieio_type]
+    for start in range(0, len(keys), max_events):
+        message = EIEIODataMessage.create(eieio_type)
+        for i in range(start, min(start + max_events, len(keys))):
+            if payloads is None:
+                message.add_key(int(keys[i]))
+            else:
+                message.add_key_and_payload(int(keys[i]), int(payloads[i]))
+        messages.append(message.bytestring)
+    return messages
+
+
+@pytest.mark.parametrize("n_events", [0, 1, 31, 63, 64, 127, 128, 1000])
+def test_matches_one_by_one(n_events):
+    packer = EIEIOEventPacker()
+    rng = numpy.random.RandomState(n_events)
+    half_keys = rng.randint(0, 0x10000, n_events)
+    full_keys = rng.randint(0, 0xFFFFFFFF, n_events, dtype="uint32")
+    payloads = DataType.S1615.encode_as_numpy_int_array(
+        rng.uniform(0, 1000, n_events)) & 0xFFFFFFFF
+
+    assert [m.bytestring for m in packer.pack(
+        half_keys, full_keys=False)] == _pack_one_by_one(
+            EIEIOType.KEY_16_BIT, half_keys)
+    assert [m.bytestring for m in packer.pack(full_keys)] == (
+        _pack_one_by_one(EIEIOType.KEY_32_BIT, full_keys))
+    assert [m.bytestring for m in packer.pack(full_keys, payloads)] == (
+        _pack_one_by_one(EIEIOType.KEY_PAYLOAD_32_BIT, full_keys, payloads))
+
+
+def test_rates_match_one_by_one():
+    # Rates encoded all at once, as a closed loop would set them
+    rng = numpy.random.RandomState(42)
+    keys = numpy.arange(1000, dtype="uint32") + 0x10000
+    rates = rng.uniform(0, 100, len(keys))
+    payloads = [DataType.S1615.encode_as_int(rate) for rate in rates]
+    packed = EIEIOEventPacker().pack(
+        keys, DataType.S1615.encode_as_numpy_int_array(rates))
+    assert [m.bytestring for m in packed] == _pack_one_by_one(
+        EIEIOType.KEY_PAYLOAD_32_BIT, keys, payloads)
+
+
+@benchmark
+def test_events_per_second_to_udp_sink():
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(("127.0.0.1", 0))
+    sink.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 22)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    address = sink.getsockname()
+
+    # 10000 rates updated 100 times, as for a closed loop every 10ms
+    n_rates = 10000
+    n_updates = 100
+    rng = numpy.random.RandomState(42)
+    keys = numpy.arange(n_rates, dtype="uint32") + 0x10000
+    rates = rng.uniform(0, 100, n_rates)
+
+    start = time.perf_counter()
+    for _ in range(n_updates // 10):
+        payloads = [DataType.S1615.encode_as_int(rate) for rate in rates]
+        for message in _pack_one_by_one(
+                EIEIOType.KEY_PAYLOAD_32_BIT, keys, payloads):
+            sender.sendto(message, address)
+    one_by_one_rate = n_rates * (n_updates // 10) / (
+        time.perf_counter() - start)
+
+    packer = EIEIOEventPacker()
+    start = time.perf_counter()
+    for _ in range(n_updates):
+        payloads = DataType.S1615.encode_as_numpy_int_array(rates)
+        for message in packer.pack(keys, payloads):
+            sender.sendto(message.bytestring, address)
+    packed_rate = n_rates * n_updates / (time.perf_counter() - start)
+
+    sender.close()
+    sink.close()
+    print("Sent {:.0f} rates per second one by one, {:.0f} rates per second"
+          " packed".format(one_by_one_rate, packed_rate))
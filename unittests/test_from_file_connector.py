@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 import tempfile
 import numpy
 import pytest
@@ -99,3 +100,46 @@ def test_connector(
         [pre_slice], [post_slice], pre_slice, post_slice, 1, synapse_info)
     assert(numpy.array_equal(block["weight"], numpy.array(expected_weights)))
     assert(numpy.array_equal(block["delay"], numpy.array(expected_delays)))
+
+
+def test_npy_connector():
+    spynnaker8.setup()
+    n_connections = 100
+    conn_list = numpy.zeros(n_connections, dtype=[
+        ("source", "uint32"), ("target", "uint32"), ("weight", "float64"),
+        ("delay", "float64")])
+    conn_list["source"] = numpy.arange(n_connections) % 10
+    conn_list["target"] = numpy.arange(n_connections) // 10
+    conn_list["weight"] = numpy.arange(n_connections)
+    conn_list["delay"] = 2
+    temp_dir = tempfile.mkdtemp()
+    filename = os.path.join(temp_dir, "conns.npy")
+    numpy.save(filename, conn_list)
+
+    pre_slices = [Slice(0, 4), Slice(5, 9)]
+    post_slices = [Slice(0, 4), Slice(5, 9)]
+    synapse_info = SynapseInformation(
+        connector=None, pre_population=MockPopulation(10, "Pre"),
+        post_population=MockPopulation(10, "Post"), prepop_is_view=False,
+        postpop_is_view=False, rng=None, synapse_dynamics=None,
+        synapse_type=None, is_virtual_machine=False, weights=0, delays=1)
+
+    # The second connector should reuse the order saved by the first
+    for _ in range(2):
+        connector = FromFileConnector(filename)
+        assert isinstance(connector.conn_list, numpy.memmap)
+        for pre_slice in pre_slices:
+            for post_slice in post_slices:
+                block = connector.create_synaptic_block(
+                    pre_slices, post_slices, pre_slice, post_slice, 0,
+                    synapse_info)
+                mask = ((conn_list["source"] >= pre_slice.lo_atom) &
+                        (conn_list["source"] <= pre_slice.hi_atom) &
+                        (conn_list["target"] >= post_slice.lo_atom) &
+                        (conn_list["target"] <= post_slice.hi_atom))
+                assert numpy.array_equal(
+                    block["weight"], conn_list["weight"][mask])
+                assert numpy.array_equal(block["delay"], [2] * sum(mask))
+        saved = [name for name in os.listdir(temp_dir)
+                 if name.endswith(".order.npy")]
+        assert len(saved) == 1
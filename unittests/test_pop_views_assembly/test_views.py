@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 import pytest
 from pyNN.random import RandomDistribution, NumpyRNG
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
@@ -101,6 +102,20 @@ class Test_IDMixin(BaseTestCase):
         self.assertEqual([2, 3, 2, 3], pop_1.get("tau_m"))
         sim.end()
 
+    def test_poisson_set(self):
+        sim.setup(timestep=1.0)
+        pop = sim.Population(4, sim.SpikeSourcePoisson(
+            rate=10, start=[0, 10, 20, 30], duration=100))
+
+        pop[1:3].set(start=50)
+        self.assertEqual(
+            [0, 50, 50, 30], [s[0] for s in pop._vertex.start])
+        pop[0:2].set(duration=None)
+        self.assertEqual(
+            [True, True, False, False],
+            [bool(numpy.isnan(d[0])) for d in pop._vertex.duration])
+        sim.end()
+
     def test_view_of_view(self):
         n_neurons = 10
         sim.setup(timestep=1.0)
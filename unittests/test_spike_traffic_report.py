@@ -0,0 +1,249 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import csv
+import os
+import numpy
+from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.extra_algorithms import (
+    SpikeTrafficReport, hot_spots, spike_traffic)
+from spynnaker.pyNN.extra_algorithms.spike_traffic_report import UNMATCHED
+from spynnaker.pyNN.models.neural_projections import (
+    ProjectionApplicationEdge)
+from spynnaker.pyNN.models.neuron import PopulationMachineVertex
+from spynnaker.pyNN.models.neuron.population_machine_synapses_provenance \
+    import PopulationMachineSynapsesProvenance as Provenance
+import spynnaker8
+
+
+class _AppVertex(object):
+    def __init__(self, label):
+        self.label = label
+
+
+class _MachineVertex(object):
+    def __init__(self, label, n_atoms=None):
+        self.label = label
+        self.app_vertex = _AppVertex(label)
+        if n_atoms is not None:
+            self.vertex_slice = Slice(0, n_atoms - 1)
+
+
+class _Edge(object):
+    def __init__(self, pre_vertex, post_vertex=None, app_edge=None):
+        self.pre_vertex = pre_vertex
+        self.post_vertex = post_vertex
+        self.app_edge = app_edge
+
+
+class _Splitter(object):
+    def __init__(self, n_atoms):
+        self.__slices = [Slice(0, n_atoms - 1)]
+
+    def get_out_going_slices(self):
+        return self.__slices, True
+
+    def get_in_coming_slices(self):
+        return self.__slices, True
+
+    def max_support_delay(self):
+        return 16
+
+
+class _SplitAppVertex(_AppVertex):
+    def __init__(self, label, n_atoms):
+        super().__init__(label)
+        self.splitter = _Splitter(n_atoms)
+
+
+class _Connector(object):
+    """ Connects the sources given, with the delays given, to neuron 0
+    """
+    def __init__(self, sources, delays, random=False):
+        self.__sources = sources
+        self.__delays = delays
+        self.__random = random
+
+    def uses_random_numbers(self, synapse_info):
+        return self.__random
+
+    def create_synaptic_block(
+            self, pre_slices, post_slices, pre_vertex_slice,
+            post_vertex_slice, synapse_type, synapse_info):
+        block = numpy.zeros(len(self.__sources), dtype=[
+            ("source", "uint32"), ("target", "uint32"), ("delay", "float64")])
+        block["source"] = self.__sources
+        block["delay"] = self.__delays
+        return block
+
+
+class _SynapseInfo(object):
+    def __init__(self, connector, on_machine=False):
+        self.connector = connector
+        self.synapse_type = 0
+        self.__on_machine = on_machine
+
+    def may_generate_on_machine(self):
+        return self.__on_machine
+
+
+class _Placement(object):
+    def __init__(self, vertex):
+        self.vertex = vertex
+
+
+class _Placements(object):
+    def __init__(self, vertices):
+        self.__vertices = vertices
+
+    def get_placement_on_processor(self, x, y, p):
+        return _Placement(self.__vertices[x, y, p])
+
+
+class _MachineGraph(object):
+    def __init__(self, edges):
+        self.__edges = edges
+
+    def get_edges_ending_at_vertex_with_partition_name(
+            self, vertex, partition_name):
+        return self.__edges.get(vertex, [])
+
+
+def _provenance(x, y, p, ghosts, invalid, filtered, processed, dmas):
+    names = ["vertex_{}_{}_{}_core".format(x, y, p)]
+    return [
+        ProvenanceDataItem(names + [Provenance.GHOST_SEARCHES], ghosts),
+        ProvenanceDataItem(
+            names + [Provenance.INVALID_MASTER_POP_HITS], invalid),
+        ProvenanceDataItem(
+            names + [Provenance.BIT_FIELD_FILTERED_PACKETS], filtered),
+        ProvenanceDataItem(
+            names + [PopulationMachineVertex.SPIKES_PROCESSED], processed),
+        ProvenanceDataItem(names + [PopulationMachineVertex.DMA_COMPLETE],
+                           dmas)]
+
+
+def _traffic():
+    # Two cores of a population receive from two sources of 30 and 10
+    # neurons, and one gets nothing that has a projection
+    big = _MachineVertex("big", 30)
+    small = _MachineVertex("small", 10)
+    post_0 = _MachineVertex("post")
+    post_1 = _MachineVertex("post")
+    lonely = _MachineVertex("lonely")
+    source = _MachineVertex("source")
+    placements = _Placements({
+        (0, 0, 1): post_0, (0, 0, 2): post_1, (1, 0, 1): lonely,
+        (2, 0, 1): source})
+    machine_graph = _MachineGraph({
+        post_0: [_Edge(big), _Edge(small)], post_1: [_Edge(big)]})
+    provenance = (
+        _provenance(0, 0, 1, 5, 0, 40, 160, 200) +
+        _provenance(0, 0, 2, 0, 0, 10, 90, 90) +
+        _provenance(1, 0, 1, 7, 0, 0, 0, 0) + [
+            ProvenanceDataItem(["vertex_2_0_1_source", "Other"], 3),
+            ProvenanceDataItem(["Router provenance", "Other"], 3)])
+    return spike_traffic(provenance, placements, machine_graph)
+
+
+def test_traffic_matrices():
+    unittest_setup()
+    traffic = _traffic()
+    assert traffic.pre_labels == ["big", "small", UNMATCHED]
+    assert traffic.post_labels == ["post", "post", "lonely"]
+    assert numpy.array_equal(
+        traffic.post_cores, [[0, 0, 1], [0, 0, 2], [1, 0, 1]])
+
+    # Without projections the silent sources can't be counted, so packets
+    # are shared by the neurons sent from; ghosts are unmatched
+    assert numpy.all(numpy.isnan(traffic.silent_sources))
+    assert numpy.array_equal(traffic.estimated_received, [
+        [150, 100, 0], [50, 0, 0], [5, 0, 7]])
+    assert numpy.array_equal(traffic.estimated_redundant, [
+        [30, 10, 0], [10, 0, 0], [5, 0, 7]])
+    assert numpy.array_equal(traffic.estimated_dmas, [
+        [150, 90, 0], [50, 0, 0], [0, 0, 0]])
+    assert numpy.array_equal(traffic.chip_received, [[305], [7]])
+    assert numpy.array_equal(traffic.chip_redundant, [[55], [7]])
+    assert traffic.estimated_received.sum() == traffic.chip_received.sum()
+
+
+def _silent_traffic(small_synapse_info):
+    """ The traffic to a core from a big population, of which ten neurons\
+        connect without a delay extension and one only with one, and a small\
+        population, all of which connect with the synapse information given
+    """
+    big = _SplitAppVertex("big", 30)
+    small = _SplitAppVertex("small", 10)
+    post = _SplitAppVertex("post", 5)
+    post_vertex = _MachineVertex("post", 5)
+    post_vertex.app_vertex = post
+    edges = list()
+    for pre, n_atoms, synapse_info in (
+            (big, 30, _SynapseInfo(_Connector(
+                list(range(11)), [1.0] * 10 + [20.0]))),
+            (small, 10, small_synapse_info)):
+        pre_vertex = _MachineVertex(pre.label, n_atoms)
+        pre_vertex.app_vertex = pre
+        app_edge = ProjectionApplicationEdge(pre, post, synapse_info)
+        edges.append(_Edge(pre_vertex, post_vertex, app_edge))
+    return spike_traffic(
+        _provenance(0, 0, 1, 0, 4, 36, 60, 60),
+        _Placements({(0, 0, 1): post_vertex}),
+        _MachineGraph({post_vertex: edges}))
+
+
+def test_silent_sources():
+    spynnaker8.setup(timestep=1.0)
+    sources = list(range(10))
+    delays = [1.0] * 10
+
+    # The redundant packets are shared by the silent sources, and the others
+    # by the neurons
+    traffic = _silent_traffic(_SynapseInfo(_Connector(sources, delays)))
+    assert numpy.array_equal(traffic.silent_sources[:2], [[20], [0]])
+    assert numpy.array_equal(traffic.estimated_redundant, [[40], [0], [0]])
+    assert numpy.array_equal(traffic.estimated_received, [[75], [25], [0]])
+
+    # Blocks generated on the machine or made from random numbers can't be
+    # made again to count from, so all packets are shared by the neurons
+    for synapse_info in (
+            _SynapseInfo(_Connector(sources, delays), on_machine=True),
+            _SynapseInfo(_Connector(sources, delays, random=True))):
+        traffic = _silent_traffic(synapse_info)
+        assert numpy.array_equal(
+            traffic.silent_sources[:2], [[20], [numpy.nan]], equal_nan=True)
+        assert numpy.array_equal(
+            traffic.estimated_redundant, [[30], [10], [0]])
+    spynnaker8.end()
+
+
+def test_hot_spots(tmpdir):
+    unittest_setup()
+    traffic = _traffic()
+    spots = hot_spots(traffic)
+    assert [(s.pre_label, s.p, s.estimated_redundant) for s in spots] == [
+        ("big", 1, 30), ("big", 2, 10), ("small", 1, 10), (UNMATCHED, 1, 7),
+        (UNMATCHED, 1, 5)]
+    assert spots[3].x == 1
+
+    file_name = os.path.join(str(tmpdir), "traffic.csv")
+    SpikeTrafficReport._write_csv(file_name, traffic)
+    with open(file_name) as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == list(spots[0]._fields)
+    assert [row[0] for row in rows[1:]] == [s.pre_label for s in spots]
@@ -0,0 +1,68 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.config_holder import set_config
+from pacman.model.constraints.placer_constraints import ChipAndCoreConstraint
+from spinn_front_end_common.utilities.globals_variables import get_simulator
+import spynnaker8 as sim
+from spinnaker_testbase import BaseTestCase
+
+
+def _cores(population):
+    """ The core of each machine vertex of a population
+    """
+    placements = get_simulator()._placements
+    cores = dict()
+    for vertex in population._vertex.machine_vertices:
+        placement = placements.get_placement_of_vertex(vertex)
+        cores[vertex.vertex_slice, vertex.label] = (
+            placement.x, placement.y, placement.p)
+    return cores
+
+
+class TestKeepUnchangedPlacements(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def test_remap_keeps_unchanged_population(self):
+        sim.setup(timestep=1.0)
+        set_config("Mapping", "keep_unchanged_placements", "True")
+        sim.set_number_of_neurons_per_core(sim.IF_curr_exp, 10)
+
+        input = sim.Population(
+            1, sim.SpikeSourceArray(spike_times=[0]), label="input")
+        pop_1 = sim.Population(30, sim.IF_curr_exp(), label="pop_1")
+        pop_2 = sim.Population(30, sim.IF_curr_exp(), label="pop_2")
+        sim.Projection(input, pop_1, sim.AllToAllConnector(),
+                       synapse_type=sim.StaticSynapse(weight=5, delay=1))
+        sim.run(10)
+        before = _cores(pop_1)
+
+        # Change the network away from pop_1
+        sim.reset()
+        pop_3 = sim.Population(50, sim.IF_curr_exp(), label="pop_3")
+        sim.Projection(pop_3, pop_2, sim.OneToOneConnector(),
+                       synapse_type=sim.StaticSynapse(weight=5, delay=1))
+        sim.run(10)
+        after = _cores(pop_1)
+        constrained = [
+            any(isinstance(constraint, ChipAndCoreConstraint)
+                for constraint in vertex.constraints)
+            for vertex in pop_1._vertex.machine_vertices]
+        sim.end()
+
+        self.assertGreater(len(before), 0)
+        self.assertEqual(before, after)
+        self.assertTrue(all(constrained))
@@ -0,0 +1,134 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_machine.virtual_machine import virtual_machine
+from pacman.model.constraints.placer_constraints import ChipAndCoreConstraint
+from pacman.model.graphs.common import Slice
+from pacman.model.graphs.machine import MachineGraph, SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from spinn_front_end_common.utilities.globals_variables import get_simulator
+from spynnaker.pyNN.utilities.mapping_change_tracker import (
+    MappingChangeTracker)
+import spynnaker8 as sim
+
+
+def _machine_graph(app_graph, populations, split=()):
+    """ Make a machine vertex for each population, or two for those split
+    """
+    machine_graph = MachineGraph("test", app_graph)
+    for population in populations:
+        if population in split:
+            half = population.size // 2
+            slices = [Slice(0, half - 1), Slice(half, population.size - 1)]
+        else:
+            slices = [Slice(0, population.size - 1)]
+        for vertex_slice in slices:
+            machine_graph.add_vertex(SimpleMachineVertex(
+                None, population.label, None, population._vertex,
+                vertex_slice))
+    return machine_graph
+
+
+def _mark_no_changes(populations, projections):
+    for population in populations:
+        population.mark_no_changes()
+        population._vertex.mark_no_changes()
+    for projection in projections:
+        projection.mark_no_changes()
+
+
+def _kept(machine_graph):
+    """ The cores that the machine vertices have been constrained to
+    """
+    return {
+        vertex.app_vertex: (constraint.x, constraint.y, constraint.p)
+        for vertex in machine_graph.vertices
+        for constraint in vertex.constraints
+        if isinstance(constraint, ChipAndCoreConstraint)}
+
+
+def test_keep_unchanged_placements():
+    sim.setup(timestep=1.0)
+    pop_a = sim.Population(10, sim.IF_curr_exp(), label="a")
+    pop_b = sim.Population(10, sim.IF_curr_exp(), label="b")
+    pop_c = sim.Population(10, sim.IF_curr_exp(), label="c")
+    populations = [pop_a, pop_b, pop_c]
+    projections = [sim.Projection(pop_a, pop_b, sim.OneToOneConnector())]
+    app_graph = get_simulator().original_application_graph
+    machine = virtual_machine(2, 2)
+    tracker = MappingChangeTracker()
+
+    # The first run has nothing to keep
+    tracker.record_changes(app_graph, populations, projections, None)
+    machine_graph = _machine_graph(app_graph, populations)
+    assert tracker.keep_unchanged_placements(machine_graph, machine) == 0
+    placements = Placements([
+        Placement(vertex, 0, 0, p + 1)
+        for p, vertex in enumerate(machine_graph.vertices)])
+
+    # Nothing has changed, so everything stays where it was, but only for
+    # the mapping after the changes were recorded
+    _mark_no_changes(populations, projections)
+    tracker.record_changes(app_graph, populations, projections, placements)
+    assert tracker.affected_vertices == set()
+    machine_graph = _machine_graph(app_graph, populations)
+    assert tracker.keep_unchanged_placements(machine_graph, machine) == 3
+    assert _kept(machine_graph) == {
+        pop_a._vertex: (0, 0, 1), pop_b._vertex: (0, 0, 2),
+        pop_c._vertex: (0, 0, 3)}
+    assert tracker.keep_unchanged_placements(
+        _machine_graph(app_graph, populations), machine) == 0
+
+    # A new projection moves only its ends
+    _mark_no_changes(populations, projections)
+    projections.append(
+        sim.Projection(pop_c, pop_b, sim.OneToOneConnector()))
+    tracker.record_changes(app_graph, populations, projections, placements)
+    assert tracker.affected_vertices == {pop_b._vertex, pop_c._vertex}
+    machine_graph = _machine_graph(app_graph, populations)
+    assert tracker.keep_unchanged_placements(machine_graph, machine) == 1
+    assert _kept(machine_graph) == {pop_a._vertex: (0, 0, 1)}
+    sim.end()
+
+
+def test_placements_not_kept_when_split_or_machine_changes():
+    sim.setup(timestep=1.0)
+    pop_a = sim.Population(10, sim.IF_curr_exp(), label="a")
+    pop_b = sim.Population(10, sim.IF_curr_exp(), label="b")
+    populations = [pop_a, pop_b]
+    app_graph = get_simulator().original_application_graph
+    tracker = MappingChangeTracker()
+    tracker.record_changes(app_graph, populations, [], None)
+    machine_graph = _machine_graph(app_graph, populations)
+    placements = Placements([
+        Placement(vertex, 1, 1, p + 1)
+        for p, vertex in enumerate(machine_graph.vertices)])
+
+    # A population split differently is placed again as a whole
+    _mark_no_changes(populations, [])
+    tracker.record_changes(app_graph, populations, [], placements)
+    machine_graph = _machine_graph(app_graph, populations, split=[pop_b])
+    assert tracker.keep_unchanged_placements(
+        machine_graph, virtual_machine(2, 2)) == 1
+    assert _kept(machine_graph) == {pop_a._vertex: (1, 1, 1)}
+
+    # A machine without the cores is a different machine
+    _mark_no_changes(populations, [])
+    tracker.record_changes(app_graph, populations, [], placements)
+    machine_graph = _machine_graph(app_graph, populations)
+    assert tracker.keep_unchanged_placements(
+        machine_graph, virtual_machine(2, 2, down_chips={(1, 1)})) == 0
+    assert _kept(machine_graph) == {}
+    sim.end()